@@ -15,6 +15,7 @@ from pathlib import Path
 
 from pathlib import Path
 from decouple import Config, RepositoryEnv, Csv
+from celery.schedules import crontab
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 ENV_FILE = BASE_DIR / ".env"
@@ -30,6 +31,21 @@ CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = 'America/Bogota'
+# Recarga de las listas restrictivas locales (core.listas); requiere `celery -A backend beat`
+CELERY_BEAT_SCHEDULE = {
+    # Revisión condicional (ETag / Last-Modified) de todas las listas descargables;
+    # los exportes masivos (OpenSanctions, ICIJ) una vez al día (`intervalo_h` en core.listas.frescura)
+    'listas-frescura': {
+        'task': 'core.task.actualizar_lista_local',
+        'schedule': crontab(minute=15),
+        'args': ('actualizar_listas',),
+    },
+    'lista-buscados': {
+        'task': 'core.task.actualizar_lista_local',
+        'schedule': crontab(minute=20, hour='*/12'),
+        'args': ('ingestar_buscados',),
+    },
+}
 
 from decouple import config, Csv
 
@@ -137,6 +153,27 @@ DATABASES = {
     }
 }
 
+# Modo de escritura concurrente de SQLite para producción (core.utils.sqlite):
+# journal WAL y PRAGMAs al abrir cada conexión y espera de hasta
+# SQLITE_BUSY_TIMEOUT_S por el candado. Los Resultados de los bots van siempre
+# por un solo hilo escritor por proceso (core.utils.bd.escribir).
+SQLITE_CONCURRENTE = config("SQLITE_CONCURRENTE", cast=bool, default=False)
+SQLITE_BUSY_TIMEOUT_S = config("SQLITE_BUSY_TIMEOUT_S", cast=float, default=30)
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    # Con WAL, NORMAL sólo sincroniza en los checkpoints: no corrompe, a lo sumo pierde la última transacción
+    'synchronous': 'NORMAL',
+    'cache_size': -64000,  # KiB: 64 MB por conexión
+    'temp_store': 'MEMORY',
+    'wal_autocheckpoint': 1000,
+}
+if SQLITE_CONCURRENTE:
+    DATABASES['default']['OPTIONS'] = {'timeout': SQLITE_BUSY_TIMEOUT_S}
+
+# Llave de la API del Banco Mundial (core.listas.multilaterales); sin ella la
+# lista de firmas inhabilitadas no se descarga y el bot corre en vivo.
+WORLDBANK_APIKEY = config("WORLDBANK_APIKEY", default="")
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -11,7 +11,7 @@ admin.site.register(models.TipoFuente)
 @admin.register(models.Fuente)
 class FuenteAdmin(admin.ModelAdmin):
     search_fields = ("nombre", "nombre_pila", "tipo__nombre")
-    list_display = ("id", "nombre", "nombre_pila", "tipo")  
+    list_display = ("id", "nombre", "nombre_pila", "tipo", "ttl_reutilizacion_h")
     
 from django.contrib import admin
 from .models import Resultado
@@ -47,4 +47,16 @@ class TipoConsolidadoAdmin(admin.ModelAdmin):
     list_display = ("id", "nombre", "descripcion")
 admin.site.register(models.Consolidado)
 admin.site.register(models.Candidato)
-admin.site.register(models.Perfil)
\ No newline at end of file
+admin.site.register(models.Perfil)
+
+
+@admin.register(models.ListaDataset)
+class ListaDatasetAdmin(admin.ModelAdmin):
+    list_display = ("id", "lista", "nombre", "titulo", "version", "total_entradas", "fecha_carga", "verificado")
+    search_fields = ("nombre", "titulo")
+
+
+@admin.register(models.DescargaLista)
+class DescargaListaAdmin(admin.ModelAdmin):
+    list_display = ("id", "nombre", "revisado", "descargado", "etag", "error")
+    search_fields = ("nombre", "url")
@@ -1,7 +1,7 @@
 # core/fallbacks/adres_bio.py
 import os, re, tempfile
 from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from core.resolver.captcha_img2 import resolver_captcha_imagen
 
 URL = "https://aplicaciones.adres.gov.co/bdua_internet/Pages/ConsultarAfiliadoWeb.aspx"
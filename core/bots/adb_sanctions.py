@@ -3,10 +3,10 @@ import os, re, asyncio, urllib.parse, unicodedata
 from datetime import datetime
 
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 NOMBRE_SITIO = "opensanctions_adb"  # pon este mismo nombre en tu tabla Fuente
 URL_SEARCH = "https://www.opensanctions.org/search/?scope=adb_sanctions&q={q}"
@@ -35,9 +35,9 @@ async def consultar_opensanctions_adb(consulta_id: int, nombre: str, apellido: s
 
     # 1) Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=1,
             estado="Sin Validar",
             mensaje=f"No se encontró la Fuente '{NOMBRE_SITIO}': {e}",
@@ -46,7 +46,7 @@ async def consultar_opensanctions_adb(consulta_id: int, nombre: str, apellido: s
         return
 
     if not full_name:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj, score=1,
             estado="Sin Validar",
             mensaje="Nombre y/o apellido vacíos para la consulta.",
@@ -149,7 +149,7 @@ async def consultar_opensanctions_adb(consulta_id: int, nombre: str, apellido: s
 
         # 7) Guardar resultado
         if success:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id, fuente=fuente_obj,
                 score=score_final,
                 estado="Validada",
@@ -157,7 +157,7 @@ async def consultar_opensanctions_adb(consulta_id: int, nombre: str, apellido: s
                 archivo=relative_png
             )
         else:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id, fuente=fuente_obj,
                 score=1, estado="Sin Validar",
                 mensaje=last_error or "No fue posible obtener resultados.",
@@ -166,7 +166,7 @@ async def consultar_opensanctions_adb(consulta_id: int, nombre: str, apellido: s
 
     except Exception as e:
         try:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id, fuente=fuente_obj,
                 score=1, estado="Sin Validar",
                 mensaje=str(e), archivo=""
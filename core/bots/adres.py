@@ -1,11 +1,13 @@
 import os
 from datetime import datetime
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
 from asgiref.sync import sync_to_async
 import traceback
 
-from core.models import Consulta, Resultado, Fuente
+from core.models import Consulta
+from core.utils.fuentes import abuscar_fuente
+from core.utils.resultados import crear_resultado
 from core.resolver.captcha_img import resolver_captcha_imagen
 
 url = "https://www.adres.gov.co/consulte-su-eps"
@@ -21,10 +23,10 @@ TIPO_DOC_MAP = {
 # ====================================================================
 
 async def _get_fuente_by_nombre(nombre: str):
-    return await sync_to_async(lambda: Fuente.objects.filter(nombre=nombre).first())()
+    return await abuscar_fuente(nombre)
 
 async def _crear_resultado_ok_con_score(consulta_id: int, fuente, relative_path: str, mensaje: str, score: int):
-    await sync_to_async(Resultado.objects.create)(
+    await crear_resultado(
         consulta_id=consulta_id,
         fuente=fuente,
         estado="Validada",
@@ -34,7 +36,7 @@ async def _crear_resultado_ok_con_score(consulta_id: int, fuente, relative_path:
     )
 
 async def _crear_resultado_error(consulta_id: int, fuente, mensaje: str):
-    await sync_to_async(Resultado.objects.create)(
+    await crear_resultado(
         consulta_id=consulta_id,
         fuente=fuente,
         estado="Sin validar",
@@ -3,11 +3,13 @@ import re
 from datetime import datetime
 from typing import Optional, Tuple
 
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
 from asgiref.sync import sync_to_async
 
-from core.models import Consulta, Resultado, Fuente
+from core.models import Consulta
+from core.utils.fuentes import abuscar_fuente
+from core.utils.resultados import crear_resultado
 
 url = "https://aplicaciones.adres.gov.co/SII_PRE_WEB/Formularios/frmReportes.aspx"
 nombre_sitio = "adres_transito"
@@ -122,10 +124,10 @@ async def _extraer_frase_y_monto_preciso(pagina) -> Tuple[str, Optional[float]]:
 
 async def consultar_adres_transito(consulta_id: int, cedula: str):
     async def _get_fuente_by_nombre(nombre: str):
-        return await sync_to_async(lambda: Fuente.objects.filter(nombre=nombre).first())()
+        return await abuscar_fuente(nombre)
 
     async def _crear_resultado(consulta_id: int, fuente, estado: str, mensaje: str, archivo: str, score: int):
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente,
             estado=estado,
@@ -8,10 +8,10 @@ import random
 from datetime import datetime
 
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 # --- Solver (CapSolver) ---
 import capsolver
@@ -267,9 +267,9 @@ async def _wait_for_manual_resolution(page, abs_png, absolute_folder, timeout_se
 # ----------------- BOT principal -----------------
 async def consultar_afdb(consulta_id: int, nombre: str, apellido: str, debug: bool = False):
     try:
-        fuente = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=0,
             estado="Sin validar", mensaje=f"No se encontró la Fuente '{NOMBRE_SITIO}': {e}", archivo=""
         )
@@ -360,7 +360,7 @@ async def consultar_afdb(consulta_id: int, nombre: str, apellido: str, debug: bo
                         pass
                     manual_ok = await _wait_for_manual_resolution(page, abs_png, absolute_folder, timeout_seconds=MANUAL_WAIT_MAX, poll_interval=MANUAL_POLL_INTERVAL, debug=debug)
                     if not manual_ok:
-                        await sync_to_async(Resultado.objects.create)(
+                        await crear_resultado(
                             consulta_id=consulta_id, fuente=fuente, score=0,
                             estado="Sin validar",
                             mensaje="Apareció un desafío (Cloudflare/Turnstile/Recaptcha) y no se resolvió en el tiempo de espera",
@@ -384,7 +384,7 @@ async def consultar_afdb(consulta_id: int, nombre: str, apellido: str, debug: bo
                     if debug: print("No encontrado selector:", sel)
             if not found:
                 await _save_screenshot_safe(page, abs_png)
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id, fuente=fuente, score=0,
                     estado="Sin validar", mensaje="No se encontró el campo de búsqueda en la página", archivo=rel_png if os.path.exists(abs_png) else ""
                 )
@@ -425,7 +425,7 @@ async def consultar_afdb(consulta_id: int, nombre: str, apellido: str, debug: bo
                     await _save_screenshot_safe(page, abs_png)
                 except Exception:
                     pass
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id, fuente=fuente, score=score,
                     estado="Validado", mensaje=mensaje, archivo=rel_png if os.path.exists(abs_png) else ""
                 )
@@ -470,7 +470,7 @@ async def consultar_afdb(consulta_id: int, nombre: str, apellido: str, debug: bo
             except Exception:
                 pass
 
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id, fuente=fuente, score=score,
                 estado="Validado", mensaje=mensaje, archivo=rel_png if os.path.exists(abs_png) else ""
             )
@@ -484,7 +484,7 @@ async def consultar_afdb(consulta_id: int, nombre: str, apellido: str, debug: bo
         except Exception:
             pass
         err = "".join(traceback.format_exception_only(type(e), e)).strip()
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=0,
             estado="Sin validar", mensaje=err, archivo=""
         )
@@ -4,11 +4,14 @@ import traceback
 from datetime import datetime
 from typing import Optional
 
-from playwright.async_api import async_playwright, Page, Dialog, TimeoutError as PlaywrightTimeoutError
+from playwright.async_api import Page, Dialog, TimeoutError as PlaywrightTimeoutError
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
 from asgiref.sync import sync_to_async
 
-from core.models import Consulta, Resultado, Fuente
+from core.models import Consulta, Fuente
+from core.utils.fuentes import abuscar_fuente
+from core.utils.resultados import crear_resultado
 
 # Intento de "captura antes de aceptar alert" mediante:
 # 1) capturar el texto del dialog cuando aparece,
@@ -41,10 +44,10 @@ async def consultar_afiliados_eps(consulta_id: int, cedula: str, tipo_doc: str):
     Bot para consultar afiliados EPS con captura "simulada" de la alerta antes de aceptarla.
     """
     async def _get_fuente(nombre: str) -> Optional[Fuente]:
-        return await sync_to_async(lambda: Fuente.objects.filter(nombre=nombre).first())()
+        return await abuscar_fuente(nombre)
 
     async def _crear_resultado(estado: str, archivo: str, mensaje: str, fuente, score: float = 0):
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente,
             estado=estado,
@@ -1,7 +1,7 @@
 # core/bots/antecedentes_fiscales.py
 import os
 from datetime import datetime
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
 
 url = "https://www.contraloria.gov.co/web/guest/persona-natural"
@@ -2,11 +2,11 @@
 import os
 import re
 from datetime import datetime
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
-from asgiref.sync import sync_to_async
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 nombre_sitio = "atf_noticias"
 
@@ -58,9 +58,9 @@ async def consultar_atf_noticias(consulta_id: int, nombre: str):
 
     # Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=nombre_sitio)
+        fuente_obj = await aobtener_fuente(nombre_sitio)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=None,
             score=0,
@@ -183,7 +183,7 @@ async def consultar_atf_noticias(consulta_id: int, nombre: str):
             navegador = None
 
         # Registrar
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=score,
@@ -194,7 +194,7 @@ async def consultar_atf_noticias(consulta_id: int, nombre: str):
 
     except Exception as e:
         try:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente=fuente_obj,
                 score=0,
@@ -1,10 +1,10 @@
 # core/bots/atf_recompensas.py
 import os, re
 from datetime import datetime
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 nombre_sitio = "atf_recompensas"
 
@@ -50,7 +50,7 @@ async def consultar_atf_recompensas(consulta_id: int, nombre: str):
     fuente_obj = None
 
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=nombre_sitio)
+        fuente_obj = await aobtener_fuente(nombre_sitio)
     except Exception:
         fuente_obj = None  # igual registramos el resultado
 
@@ -152,7 +152,7 @@ async def consultar_atf_recompensas(consulta_id: int, nombre: str):
             navegador = None
 
         # Registrar en BD
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=score,
@@ -163,7 +163,7 @@ async def consultar_atf_recompensas(consulta_id: int, nombre: str):
 
     except Exception as e:
         try:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente=fuente_obj,
                 score=0,
@@ -3,10 +3,10 @@ import os
 from datetime import datetime
 
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright, TimeoutError as PWTimeout
-
-from core.models import Resultado, Fuente
+from playwright.async_api import TimeoutError as PWTimeout
+from core.utils.browser_pool import async_playwright
+from core.utils.fuentes import abuscar_fuente
+from core.utils.resultados import crear_resultado
 from core.resolver.captcha_v2 import resolver_captcha_v2
 
 # Página home con el iframe que tapa todo
@@ -29,7 +29,7 @@ TIPO_DOC_LABEL = {
 
 async def _crear_resultado(consulta_id, fuente, estado, mensaje, archivo, score=1):
     rel = archivo.replace("\\", "/") if archivo else ""
-    await sync_to_async(Resultado.objects.create)(
+    await crear_resultado(
         consulta_id=consulta_id,
         fuente=fuente,
         estado=estado,
@@ -47,7 +47,7 @@ async def consultar_quien_consulto(consulta_id: int, numero: str, tipo_doc: str)
       envía, captura mensaje (growl) o datos (codigoprint), y guarda screenshot full-page.
     - Score = 1 en todos los casos (según requerimiento del usuario).
     """
-    fuente = await sync_to_async(lambda: Fuente.objects.filter(nombre=NOMBRE_SITIO).first())()
+    fuente = await abuscar_fuente(NOMBRE_SITIO)
     if not fuente:
         await _crear_resultado(consulta_id, None, "Sin Validar",
                                f"No existe Fuente con nombre='{NOMBRE_SITIO}'", "", score=0)
@@ -1,11 +1,12 @@
 # core/bots/bicibogota.py
 import os
 from datetime import datetime
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
 from asgiref.sync import sync_to_async
 
-from core.models import Consulta, Resultado, Fuente, TipoFuente  # ajusta 'core' si tu app se llama distinto
+from core.models import Consulta, Fuente, TipoFuente  # ajusta 'core' si tu app se llama distinto
+from core.utils.resultados import crear_resultado
 import traceback
 
 url = "https://registrobicibogota.movilidadbogota.gov.co/rdbici/#/consultarEstado"
@@ -42,7 +43,7 @@ async def consultar_bicibogota(consulta_id: int, cedula: str, tipo_doc: str):
         return await sync_to_async(_get_or_create)()
 
     async def _crear_resultado(estado: str, archivo: str, mensaje: str, fuente, score: float):
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente,
             estado=estado,
@@ -4,9 +4,9 @@ import re
 import asyncio
 from datetime import datetime
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
-from core.models import Resultado, Fuente
+from core.utils.browser_pool import async_playwright
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 NOMBRE_SITIO = "biologia_consulta"
 URL = "https://consejoprofesionaldebiologia.gov.co/servicios/consulta-estado-matricula-profesional/"
@@ -27,9 +27,9 @@ async def consultar_biologia_consulta(consulta_id: int, cedula: str):
     browser = None
 
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=0,
             estado="Sin Validar", mensaje=f"No se encontró la Fuente '{NOMBRE_SITIO}': {e}", archivo=""
         )
@@ -78,7 +78,7 @@ async def consultar_biologia_consulta(consulta_id: int, cedula: str):
             browser = None
 
         # Guardar en BD
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
@@ -89,7 +89,7 @@ async def consultar_biologia_consulta(consulta_id: int, cedula: str):
 
     except Exception as e:
         try:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente=fuente_obj,
                 score=0,
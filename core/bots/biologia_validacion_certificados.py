@@ -5,10 +5,10 @@ import asyncio
 from datetime import datetime
 
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 NOMBRE_SITIO = "biologia_validacion_certificados"
 URL = "https://consejoprofesionaldebiologia.gov.co/servicios/validacion-certificados/"
@@ -44,9 +44,9 @@ async def consultar_biologia_validacion_certificados(
 
     # 1) Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=0,
             estado="Sin Validar",
             mensaje=f"No se encontró la Fuente '{NOMBRE_SITIO}': {e}",
@@ -153,7 +153,7 @@ async def consultar_biologia_validacion_certificados(
             browser = None
 
         # 10) Registro OK
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
@@ -164,7 +164,7 @@ async def consultar_biologia_validacion_certificados(
 
     except Exception as e:
         try:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente=fuente_obj,
                 score=0,
@@ -2,10 +2,10 @@
 import os, re, asyncio
 from datetime import datetime
 from urllib.parse import urlencode
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 URL_START = "https://www.bis.doc.gov/index.php/the-denied-persons-list"
 URL_SEARCH_FALLBACK = "https://www.bis.doc.gov/index.php"
@@ -40,10 +40,10 @@ SEARCH_INPUT = "#mod-search-searchword69"  # buscador del sitio
 async def consultar_bis_dpl_legacy_pdf(consulta_id: int, cedula: str):
     """Busca en el DPL por cédula, genera PDF y PNG. Si hay bloqueo/error → Sin Validar, score=0."""
     cedula = (cedula or "").strip()
-    fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+    fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
 
     if not cedula:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj,
             score=0, estado="Sin Validar",
             mensaje="La cédula llegó vacía.", archivo=""
@@ -128,7 +128,7 @@ async def consultar_bis_dpl_legacy_pdf(consulta_id: int, cedula: str):
                     except Exception:
                         pass
                     await browser.close()
-                    await sync_to_async(Resultado.objects.create)(
+                    await crear_resultado(
                         consulta_id=consulta_id, fuente=fuente_obj,
                         score=0, estado="Sin Validar",
                         mensaje="La fuente BIS bloqueó el acceso (página de error/bloqueo).",
@@ -193,7 +193,7 @@ async def consultar_bis_dpl_legacy_pdf(consulta_id: int, cedula: str):
                     except Exception:
                         pass
                     await browser.close()
-                    await sync_to_async(Resultado.objects.create)(
+                    await crear_resultado(
                         consulta_id=consulta_id, fuente=fuente_obj,
                         score=0, estado="Sin Validar",
                         mensaje="La fuente BIS bloqueó el acceso (página de error/bloqueo).",
@@ -240,7 +240,7 @@ async def consultar_bis_dpl_legacy_pdf(consulta_id: int, cedula: str):
 
         # ---------- Registrar en BD (usar PNG como 'archivo' para el consolidado) ----------
         msg_out = message_text or "Consulta generada (revisar evidencia)."
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=score_val,
@@ -251,7 +251,7 @@ async def consultar_bis_dpl_legacy_pdf(consulta_id: int, cedula: str):
 
     except Exception as e:
         # Error: dejar Sin Validar + PNG si lo hubo
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj,
             score=0, estado="Sin Validar",
             mensaje=f"La fuente está presentando problemas para la consulta: {e}",
@@ -2,10 +2,10 @@
 import os, re, unicodedata
 from datetime import datetime
 from urllib.parse import urlencode
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 URL_START    = "https://www.bis.gov/regulations/ear/part-744/supplement-6-744/unverified-list"
 URL_SEARCH   = "https://www.bis.gov/search"
@@ -51,16 +51,16 @@ async def consultar_bis_unverified_pdf(consulta_id: int, nombre: str):
 
     # Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=0,
             estado="Sin Validar", mensaje=f"No se encontró la Fuente '{NOMBRE_SITIO}': {e}", archivo=""
         )
         return
 
     if not nombre:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj, score=0,
             estado="Sin Validar", mensaje="El término de búsqueda llegó vacío.", archivo=""
         )
@@ -222,7 +222,7 @@ async def consultar_bis_unverified_pdf(consulta_id: int, nombre: str):
 
         # Guardar: prioriza PNG; si falló, usa PDF
         archivo_rel = out_png_rel if os.path.exists(out_png_abs) else out_pdf_rel
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj,
             score=score,
             estado="Validada",
@@ -231,7 +231,7 @@ async def consultar_bis_unverified_pdf(consulta_id: int, nombre: str):
         )
 
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj, score=0,
             estado="Sin Validar", mensaje=str(e), archivo=""
         )
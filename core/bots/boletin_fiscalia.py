@@ -3,10 +3,10 @@ import os
 import re
 import unicodedata
 from datetime import datetime
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from core.models import Fuente, Resultado
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 nombre_sitio = "boletin_fiscalia"
 
@@ -107,11 +107,11 @@ async def consultar_boletin_fiscalia(cedula: str, consulta_id: int, nombre: str)
 
             # Guardar en BD
             try:
-                fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=nombre_sitio)
+                fuente_obj = await aobtener_fuente(nombre_sitio)
             except Exception:
                 fuente_obj = None
 
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente=fuente_obj,
                 score=score,
@@ -125,10 +125,10 @@ async def consultar_boletin_fiscalia(cedula: str, consulta_id: int, nombre: str)
 
     except Exception as e:
         try:
-            fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=nombre_sitio)
+            fuente_obj = await aobtener_fuente(nombre_sitio)
         except Exception:
             fuente_obj = None
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
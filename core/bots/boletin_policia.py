@@ -3,11 +3,11 @@ import os
 import re
 import unicodedata
 from datetime import datetime
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
-from asgiref.sync import sync_to_async
 
-from core.models import Fuente, Resultado
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 nombre_sitio = "boletin_policia"
 
@@ -70,12 +70,12 @@ async def consultar_boletin_policia(cedula: str, consulta_id: int, nombre: str):
                 score = 0
 
             try:
-                fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=nombre_sitio)
+                fuente_obj = await aobtener_fuente(nombre_sitio)
             except Exception:
                 fuente_obj = None
 
             # guardar único resultado resumen
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente=fuente_obj,
                 score=score,
@@ -89,11 +89,11 @@ async def consultar_boletin_policia(cedula: str, consulta_id: int, nombre: str):
 
     except Exception as e:
         try:
-            fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=nombre_sitio)
+            fuente_obj = await aobtener_fuente(nombre_sitio)
         except Exception:
             fuente_obj = None
 
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
@@ -9,11 +9,14 @@ from datetime import datetime
 from typing import Optional, List
 from urllib.parse import quote_plus, urlparse
 
-from playwright.async_api import async_playwright, Browser, BrowserContext, Page
+from playwright.async_api import Browser, BrowserContext, Page
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
 from asgiref.sync import sync_to_async
 
-from core.models import Fuente, Resultado
+from core.models import Fuente
+from core.utils.fuentes import buscar_fuente
+from core.utils.resultados import crear_resultado
 
 NOMBRE_SITIO = "boletin_procuraduria"
 
@@ -63,12 +66,11 @@ def _score_por_coincidencias(n: int) -> int:
 
 @sync_to_async
 def _get_fuente(nombre: str) -> Optional[Fuente]:
-    return Fuente.objects.filter(nombre=nombre).first()
+    return buscar_fuente(nombre)
 
 
-@sync_to_async
-def _crear_resultado(consulta_id, fuente, score, estado, mensaje, archivo):
-    return Resultado.objects.create(
+async def _crear_resultado(consulta_id, fuente, score, estado, mensaje, archivo):
+    return await crear_resultado(
         consulta_id=consulta_id,
         fuente=fuente,
         score=score,
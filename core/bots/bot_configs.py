@@ -1,186 +1,212 @@
-﻿from .adres import consultar_adres
-from.mediacion_policia import consultar_mediacion
-from .adres_transito import consultar_adres_transito
-from .afiliados_eps import consultar_afiliados_eps
-from .antecedentes_fiscales import consultar_antecedentes_fiscales
-from .atf_noticias import consultar_atf_noticias
-from .atf_recompensas import consultar_atf_recompensas
-from .bicibogota import consultar_bicibogota
-from .bis_dpl_legacy_pdf import consultar_bis_dpl_legacy_pdf
-from .bis_unverified_pdf import consultar_bis_unverified_pdf
-from .canada_sema_search_png import consultar_canada_sema_search_png
-from .comprobador_derechos import consultar_comprobador_derechos
-from .contraloria import consultar_contraloria
-from .csl_search_pdf_falla import consultar_csl_search_pdf
-from .dea import consultar_dea
-from .departament_justice import consultar_departament_justice
-from .departament_state import consultar_departament_state
-from .departament_state_2 import consultar_departament_state2
-from .dfat_consolidated_pdf import consultar_dfat_consolidated_pdf
-from .doj_fcpa_search_pdf import consultar_doj_fcpa_search_pdf
-from .ecfr_part744_appendix_pdf import consultar_ecfr_part744_appendix_pdf
-from .ecfr_search_pdf import consultar_ecfr_search_pdf
-from .eo_13224_findit import consultar_eo_13224_findit
-from .epa_fugitives_search_pdf import consultar_epa_fugitives_search_pdf
-from .eris import consultar_eris
-from .estado_cedula import consultar_estado_cedula
-from .eu_fin_sanctions import consultar_eu_fin_sanctions
-from .eu_most_wanted_pdf import consultar_eu_most_wanted_pdf
-from .eu_sanctions_tracker import consultar_eu_sanctions_tracker
-from .eu_taric import consultar_eu_taric
-from .eu_travelban_pdf import consultar_eu_travelban_pdf
-from .fbi import consultar_fbi
-from .fbi_news import consultar_fbi_news
-from .garantias_mobiliarias_nooficial import consultar_garantias_mobiliarias_nooficial
-from .garantias_mobiliarias_oficial import consultar_garantias_mobiliarias_oficial
-from .guardia_civil_buscados_pdf import consultar_guardia_civil_buscados_pdf
-from .ice_most_wanted_pdf import consultar_ice_most_wanted_pdf
-from .idb_sanctioned_pdf import consultar_idb_sanctioned_png
-from .inhabilidades import consultar_inhabilidades
-from .inpec import consultar_inpec
-from .insightcrime_search_pdf import consultar_insightcrime_search_pdf
-from .interpol import consultar_interpol
-from .interpol_red_notices import consultar_interpol_red_notices
-from .jurados_votacion import consultar_jurados_votacion
-from .libreta_militar import consultar_libreta_militar
-from .mas_buscados_policia_colombia import consultar_mas_buscados_policia_colombia
-from .medicaldevices import consultar_medical_devices
-from .medidas_correctivas import consultar_medidas_correctivas
-from .mha_individual_terrorists_pdf import consultar_mha_individual_terrorists_pdf
-from .mincit import consultar_mintic
-from .nca_most_wanted_pdf import consultar_nca_most_wanted_pdf
-from .nevis_fsrc_pdf_search import consultar_nevis_fsrc_pdf_search
-from .ofac_programs_site_search_pdf import consultar_ofac_programs_site_search_pdf
-from .ofac_search_pdf import consultar_ofac_pdf
-from .ofac_treas_gov_pdf import consultar_ofac_treas_pdf
-from .offshore import consultar_offshore
-from .offshore_bahamas import consultar_offshore_bahamas
-from .offshore_offshoreleaks import consultar_offshore_offshoreleaks
-from .offshore_panama import consultar_offshore_panama
-from .offshore_paradise import consultar_offshore_paradise
-from .ofsi_conlist_html import consultar_ofsi_conlist_html
-from .ofsi_sanctions_pdf import consultar_ofsi_pdf
-from .opensanctions_us_ofac_cons_pdf import consultar_opensanctions_us_ofac_cons_pdf
-from .osfi_search_pdf import consultar_osfi_search_pdf
-from .pandora_papers import consultar_pandora_papers
-from .personeria import consultar_personeria
-from .policia_busqueda_general_pdf import consultar_policia_busqueda_general_shot
-from .policia_memorial_search_pdf import consultar_policia_memorial_search_pdf
-from .procuraduria import consultar_procuraduria
-from .rama_judicial import consultar_rama_judicial
-from .registro_civil import consultar_registro_civil
-from .rethus import consultar_rethus
-from .ruaf import consultar_ruaf
-from .rues import consultar_rues
-from .runt import consultar_runt
-from .samm import consultar_samm
-from .samm_policy_memo import consultar_samm_policy_memo
-from .samm_rcg import consultar_samm_rcg
-from .sanctions_map import consultar_sanctions_map
-from .secretservice_mostwanted_pdf import consultar_secretservice_mostwanted_pdf
-from .simit import consultar_simit
-from .sisben import consultar_sisben
-from .state_designation_cartels_pdf import consultar_state_designation_cartels_pdf
-from .state_dss_mostwanted_pdf import consultar_state_dss_mostwanted_pdf
-from .state_section_353_pdf import consultar_state_section_353_pdf
-from .state_terrorist_orgs import consultar_state_terrorist_orgs
-from .ugpp import consultar_ugpp
-from .usa_drug import consultar_usa_drug
-from .worldbank_debarred_pdf import consultar_worldbank_debarred_pdf
-from .lugar_votacion import consultar_lugar_votacion
-from .movilidad_bogota import consultar_movilidad_bogota
-from .ramajudicial_juzgados import consultar_ramajudicial_juzgados
-from .tyba import consultar_tyba
-from .rnmc import consultar_rnmc
-from .policia_nacional import consultar_policia_nacional
-from .icfes import consultar_pruebas_icfes
-from .boletin_fiscalia import consultar_boletin_fiscalia
-from .boletin_policia import consultar_boletin_policia
-from .boletin_procuraduria import consultar_boletin_procuraduria
-from .compliance import consultar_compliance
-from .dian_formalizacion_personas import consultar_dian_formalizacion_personas
-from .cpae_certificado import consultar_cpae_certificado
-from .cpae_verify_licensure import consultar_cpae_verify_licensure
-from.cpae_verify_certification import consultar_cpae_verify_certification
-from.rama_vigencias_pdf import consultar_rama_vigencias_pdf
-from.colombiacompra_boletin_digital import consultar_colombiacompra_boletin_digital
-from.secop_consulta_aacs import consultar_secop_consulta_aacs
-from.paco_contratista import consultar_paco_contratista
-from.superfinanciera_busqueda import consultar_superfinanciera_busqueda_pdf
-from.supersociedades_boletines import consultar_supersociedades_boletines
-from.supersolidaria_noticias import consultar_supersolidaria_noticias
-from.sigep2_directorio import consultar_sigep2_directorio
-from.cne_magistrados_busqueda_pdf import consultar_cne_magistrados_busqueda_pdf
-from.ramajudicial_consejo_estado_magistrados import consultar_ramajudicial_corte_constitucional_magistrados
-from.ramajudicial_corte_constitucional_magistrados_anteriores import consultar_ramajudicial_corte_constitucional_magistrados_anteriores
-from.presidencia_gabinete_busqueda import consultar_presidencia_gabinete_busqueda
-from .copnia_certificado import consultar_copnia_certificado
-from.cgfm_mas_buscados import consultar_cgfm_mas_buscados
-from.colombiacompra_procesos import consultar_colombiacompra_procesos
-from.fac_busqueda_pdf import consultar_fac_busqueda_pdf
-from. mintransporte_capacitaciones import consultar_mintransporte_capacitaciones
-from.scj_mas_buscados_pdf import consultar_scj_mas_buscados_pdf
-from.wikipedia_busqueda import consultar_wikipedia_busqueda
-from.defunciones import consultar_defunciones
-from .plantilla import consultar_fuentes
-from.adb_sanctions import consultar_opensanctions_adb
-from.opensanctions_ebrd_ineligible import consultar_opensanctions_ebrd_ineligible 
-from.opensanctions_eu_fsf import consultar_opensanctions_eu_fsf
-from.eur_lex_2014_833 import consultar_eur_lex_2014_833
-from.eur_lex_2022_398 import consultar_eur_lex_2022_398
-from.eur_lex_2022_399 import consultar_eur_lex_2022_399
-from.un_sc_consolidated import consultar_un_sc_consolidated
-from.mofa_bh_cte import consultar_mofa_bh_cte
-from.opensanctions_be_fod import consultar_opensanctions_be_fod
-from.homeaffairs_search import consultar_homeaffairs_search
-from.dgtresor_gels import consultar_dgtresor_gels
-from.nbctf import consultar_nbctf
-from.nbctf_downloads import consultar_nbctf_downloads
-from.cssf import consultar_cssf
-from.opensanctions_nl_terrorism import consultar_opensanctions_nl_terrorism
-from.opensanctions_ps_local_freezing import consultar_opensanctions_ps_local_freezing
-from.opensanctions_pl_mswia import consultar_opensanctions_pl_mswia
-from.moci_qatar_search import consultar_moci_qatar_search
-from.opensanctions_za_fic import consultar_opensanctions_za_fic
-from.opensanctions_seco import consultar_opensanctions_seco
-from.mindev import consultar_mindev
-from.sca_search import consultar_sca_search
-from.ofsi_govuk import consultar_ofsi_govuk
-from.ofsi_ukraine_govuk import consultar_ofsi_ukraine_govuk
-from.govuk_article_exactname import consultar_govuk_article_exactname
-from.repet import consultar_repet
-from.portal_transparencia_leniencia import consultar_portal_transparencia_leniencia
-from.portal_transparencia_ceis import consultar_portal_transparencia_ceis
-from.portal_transparencia_cepim import consultar_portal_transparencia_cepim
-from.portal_transparencia_busca import consultar_portal_transparencia_busca
-from.opensanctions_au_dfat import consultar_opensanctions_au_dfat
-from.opensanctions_us_ddtc import consultar_opensanctions_us_ddtc_debarred
-from.opensanctions_us_ofac_sdn import consultar_opensanctions_us_ofac_sdn
-from.opensanctions_us_cuba import consultar_opensanctions_us_cuba
-from.opensanctions_bis_denied import consultar_opensanctions_bis_denied
-from.opensanctions_us_bis_denied import consultar_opensanctions_us_bis_denied
-from.opensanctions_az_fiu import consultar_opensanctions_az_fiu
-from.afdb import consultar_afdb
-from.ebrd import consultar_ebrd
-from.eeas import consultar_eeas
-from.opensanctions_th_designated_person import  consultar_opensanctions_th_designated_person
-from.mfat_sanctions import consultar_mfat_sanctions
-from.opensanctions_jp_meti_eul import consultar_opensanctions_jp_meti_eul
-from.opensanctions_us_occ_enfact import consultar_opensanctions_us_occ_enfact
-from.opensanctions_au_dfat_search import consultar_opensanctions_au_dfat
-from.apgml_search import consultar_apgml_search
-from.dhs_search import consultar_dhs_search
-from.porvenir_cert_afiliacion import consultar_porvenir_cert_afiliacion
-from.colpensiones_rpm import consultar_colpensiones_rpm
-from.bancoproveedores_quien_consulto import consultar_quien_consulto
-from.procuraduria_generar_certificado import generar_certificado_procuraduria
-from.sideap_comprobante import consultar_sideap_comprobante
+﻿# Los módulos de bots se importan al ejecutarse (ver core/bots/registro.py)
+from .registro import perezoso
+
+consultar_adres = perezoso(".adres", "consultar_adres")
+consultar_mediacion = perezoso(".mediacion_policia", "consultar_mediacion")
+consultar_adres_transito = perezoso(".adres_transito", "consultar_adres_transito")
+consultar_afiliados_eps = perezoso(".afiliados_eps", "consultar_afiliados_eps")
+consultar_antecedentes_fiscales = perezoso(".antecedentes_fiscales", "consultar_antecedentes_fiscales")
+consultar_atf_noticias = perezoso(".atf_noticias", "consultar_atf_noticias")
+consultar_atf_recompensas = perezoso(".atf_recompensas", "consultar_atf_recompensas")
+consultar_bicibogota = perezoso(".bicibogota", "consultar_bicibogota")
+consultar_bis_dpl_legacy_pdf = perezoso(".bis_dpl_legacy_pdf", "consultar_bis_dpl_legacy_pdf")
+consultar_bis_unverified_pdf = perezoso(".bis_unverified_pdf", "consultar_bis_unverified_pdf")
+consultar_canada_sema_search_png = perezoso(".canada_sema_search_png", "consultar_canada_sema_search_png")
+consultar_comprobador_derechos = perezoso(".comprobador_derechos", "consultar_comprobador_derechos")
+consultar_contraloria = perezoso(".contraloria", "consultar_contraloria")
+consultar_csl_search_pdf = perezoso(".csl_search_pdf_falla", "consultar_csl_search_pdf")
+consultar_dea = perezoso(".dea", "consultar_dea")
+consultar_departament_justice = perezoso(".departament_justice", "consultar_departament_justice")
+consultar_departament_state = perezoso(".departament_state", "consultar_departament_state")
+consultar_departament_state2 = perezoso(".departament_state_2", "consultar_departament_state2")
+consultar_dfat_consolidated_pdf = perezoso(".dfat_consolidated_pdf", "consultar_dfat_consolidated_pdf")
+consultar_doj_fcpa_search_pdf = perezoso(".doj_fcpa_search_pdf", "consultar_doj_fcpa_search_pdf")
+consultar_ecfr_part744_appendix_pdf = perezoso(".ecfr_part744_appendix_pdf", "consultar_ecfr_part744_appendix_pdf")
+consultar_ecfr_search_pdf = perezoso(".ecfr_search_pdf", "consultar_ecfr_search_pdf")
+consultar_eo_13224_findit = perezoso(".eo_13224_findit", "consultar_eo_13224_findit")
+consultar_epa_fugitives_search_pdf = perezoso(".epa_fugitives_search_pdf", "consultar_epa_fugitives_search_pdf")
+consultar_eris = perezoso(".eris", "consultar_eris")
+consultar_estado_cedula = perezoso(".estado_cedula", "consultar_estado_cedula")
+consultar_eu_fin_sanctions = perezoso(".eu_fin_sanctions", "consultar_eu_fin_sanctions")
+consultar_eu_most_wanted_pdf = perezoso(".eu_most_wanted_pdf", "consultar_eu_most_wanted_pdf")
+consultar_eu_sanctions_tracker = perezoso(".eu_sanctions_tracker", "consultar_eu_sanctions_tracker")
+consultar_eu_taric = perezoso(".eu_taric", "consultar_eu_taric")
+consultar_eu_travelban_pdf = perezoso(".eu_travelban_pdf", "consultar_eu_travelban_pdf")
+consultar_fbi = perezoso(".fbi", "consultar_fbi")
+consultar_fbi_news = perezoso(".fbi_news", "consultar_fbi_news")
+consultar_garantias_mobiliarias_nooficial = perezoso(".garantias_mobiliarias_nooficial", "consultar_garantias_mobiliarias_nooficial")
+consultar_garantias_mobiliarias_oficial = perezoso(".garantias_mobiliarias_oficial", "consultar_garantias_mobiliarias_oficial")
+consultar_guardia_civil_buscados_pdf = perezoso(".guardia_civil_buscados_pdf", "consultar_guardia_civil_buscados_pdf")
+consultar_ice_most_wanted_pdf = perezoso(".ice_most_wanted_pdf", "consultar_ice_most_wanted_pdf")
+consultar_idb_sanctioned_png = perezoso(".idb_sanctioned_pdf", "consultar_idb_sanctioned_png")
+consultar_inhabilidades = perezoso(".inhabilidades", "consultar_inhabilidades")
+consultar_inpec = perezoso(".inpec", "consultar_inpec")
+consultar_insightcrime_search_pdf = perezoso(".insightcrime_search_pdf", "consultar_insightcrime_search_pdf")
+consultar_interpol = perezoso(".interpol", "consultar_interpol")
+consultar_interpol_red_notices = perezoso(".interpol_red_notices", "consultar_interpol_red_notices")
+consultar_jurados_votacion = perezoso(".jurados_votacion", "consultar_jurados_votacion")
+consultar_libreta_militar = perezoso(".libreta_militar", "consultar_libreta_militar")
+consultar_mas_buscados_policia_colombia = perezoso(".mas_buscados_policia_colombia", "consultar_mas_buscados_policia_colombia")
+consultar_medical_devices = perezoso(".medicaldevices", "consultar_medical_devices")
+consultar_medidas_correctivas = perezoso(".medidas_correctivas", "consultar_medidas_correctivas")
+consultar_mha_individual_terrorists_pdf = perezoso(".mha_individual_terrorists_pdf", "consultar_mha_individual_terrorists_pdf")
+consultar_mintic = perezoso(".mincit", "consultar_mintic")
+consultar_nca_most_wanted_pdf = perezoso(".nca_most_wanted_pdf", "consultar_nca_most_wanted_pdf")
+consultar_nevis_fsrc_pdf_search = perezoso(".nevis_fsrc_pdf_search", "consultar_nevis_fsrc_pdf_search")
+consultar_ofac_programs_site_search_pdf = perezoso(".ofac_programs_site_search_pdf", "consultar_ofac_programs_site_search_pdf")
+consultar_ofac_pdf = perezoso(".ofac_search_pdf", "consultar_ofac_pdf")
+consultar_ofac_treas_pdf = perezoso(".ofac_treas_gov_pdf", "consultar_ofac_treas_pdf")
+consultar_offshore = perezoso(".offshore", "consultar_offshore")
+consultar_offshore_bahamas = perezoso(".offshore_bahamas", "consultar_offshore_bahamas")
+consultar_offshore_offshoreleaks = perezoso(".offshore_offshoreleaks", "consultar_offshore_offshoreleaks")
+consultar_offshore_panama = perezoso(".offshore_panama", "consultar_offshore_panama")
+consultar_offshore_paradise = perezoso(".offshore_paradise", "consultar_offshore_paradise")
+consultar_ofsi_conlist_html = perezoso(".ofsi_conlist_html", "consultar_ofsi_conlist_html")
+consultar_ofsi_pdf = perezoso(".ofsi_sanctions_pdf", "consultar_ofsi_pdf")
+consultar_opensanctions_us_ofac_cons_pdf = perezoso(".opensanctions_us_ofac_cons_pdf", "consultar_opensanctions_us_ofac_cons_pdf")
+consultar_osfi_search_pdf = perezoso(".osfi_search_pdf", "consultar_osfi_search_pdf")
+consultar_pandora_papers = perezoso(".pandora_papers", "consultar_pandora_papers")
+consultar_personeria = perezoso(".personeria", "consultar_personeria")
+consultar_policia_busqueda_general_shot = perezoso(".policia_busqueda_general_pdf", "consultar_policia_busqueda_general_shot")
+consultar_policia_memorial_search_pdf = perezoso(".policia_memorial_search_pdf", "consultar_policia_memorial_search_pdf")
+consultar_procuraduria = perezoso(".procuraduria", "consultar_procuraduria")
+consultar_rama_judicial = perezoso(".rama_judicial", "consultar_rama_judicial")
+consultar_registro_civil = perezoso(".registro_civil", "consultar_registro_civil")
+consultar_rethus = perezoso(".rethus", "consultar_rethus")
+consultar_ruaf = perezoso(".ruaf", "consultar_ruaf")
+consultar_rues = perezoso(".rues", "consultar_rues")
+consultar_runt = perezoso(".runt", "consultar_runt")
+consultar_samm = perezoso(".samm", "consultar_samm")
+consultar_samm_policy_memo = perezoso(".samm_policy_memo", "consultar_samm_policy_memo")
+consultar_samm_rcg = perezoso(".samm_rcg", "consultar_samm_rcg")
+consultar_sanctions_map = perezoso(".sanctions_map", "consultar_sanctions_map")
+consultar_secretservice_mostwanted_pdf = perezoso(".secretservice_mostwanted_pdf", "consultar_secretservice_mostwanted_pdf")
+consultar_simit = perezoso(".simit", "consultar_simit")
+consultar_sisben = perezoso(".sisben", "consultar_sisben")
+consultar_state_designation_cartels_pdf = perezoso(".state_designation_cartels_pdf", "consultar_state_designation_cartels_pdf")
+consultar_state_dss_mostwanted_pdf = perezoso(".state_dss_mostwanted_pdf", "consultar_state_dss_mostwanted_pdf")
+consultar_state_section_353_pdf = perezoso(".state_section_353_pdf", "consultar_state_section_353_pdf")
+consultar_state_terrorist_orgs = perezoso(".state_terrorist_orgs", "consultar_state_terrorist_orgs")
+consultar_ugpp = perezoso(".ugpp", "consultar_ugpp")
+consultar_usa_drug = perezoso(".usa_drug", "consultar_usa_drug")
+consultar_worldbank_debarred_pdf = perezoso(".worldbank_debarred_pdf", "consultar_worldbank_debarred_pdf")
+consultar_lugar_votacion = perezoso(".lugar_votacion", "consultar_lugar_votacion")
+consultar_movilidad_bogota = perezoso(".movilidad_bogota", "consultar_movilidad_bogota")
+consultar_ramajudicial_juzgados = perezoso(".ramajudicial_juzgados", "consultar_ramajudicial_juzgados")
+consultar_tyba = perezoso(".tyba", "consultar_tyba")
+consultar_rnmc = perezoso(".rnmc", "consultar_rnmc")
+consultar_policia_nacional = perezoso(".policia_nacional", "consultar_policia_nacional")
+consultar_pruebas_icfes = perezoso(".icfes", "consultar_pruebas_icfes")
+consultar_boletin_fiscalia = perezoso(".boletin_fiscalia", "consultar_boletin_fiscalia")
+consultar_boletin_policia = perezoso(".boletin_policia", "consultar_boletin_policia")
+consultar_boletin_procuraduria = perezoso(".boletin_procuraduria", "consultar_boletin_procuraduria")
+consultar_compliance = perezoso(".compliance", "consultar_compliance")
+consultar_dian_formalizacion_personas = perezoso(".dian_formalizacion_personas", "consultar_dian_formalizacion_personas")
+consultar_cpae_certificado = perezoso(".cpae_certificado", "consultar_cpae_certificado")
+consultar_cpae_verify_licensure = perezoso(".cpae_verify_licensure", "consultar_cpae_verify_licensure")
+consultar_cpae_verify_certification = perezoso(".cpae_verify_certification", "consultar_cpae_verify_certification")
+consultar_rama_vigencias_pdf = perezoso(".rama_vigencias_pdf", "consultar_rama_vigencias_pdf")
+consultar_colombiacompra_boletin_digital = perezoso(".colombiacompra_boletin_digital", "consultar_colombiacompra_boletin_digital")
+consultar_secop_consulta_aacs = perezoso(".secop_consulta_aacs", "consultar_secop_consulta_aacs")
+consultar_paco_contratista = perezoso(".paco_contratista", "consultar_paco_contratista")
+consultar_superfinanciera_busqueda_pdf = perezoso(".superfinanciera_busqueda", "consultar_superfinanciera_busqueda_pdf")
+consultar_supersociedades_boletines = perezoso(".supersociedades_boletines", "consultar_supersociedades_boletines")
+consultar_supersolidaria_noticias = perezoso(".supersolidaria_noticias", "consultar_supersolidaria_noticias")
+consultar_sigep2_directorio = perezoso(".sigep2_directorio", "consultar_sigep2_directorio")
+consultar_cne_magistrados_busqueda_pdf = perezoso(".cne_magistrados_busqueda_pdf", "consultar_cne_magistrados_busqueda_pdf")
+consultar_ramajudicial_corte_constitucional_magistrados = perezoso(".ramajudicial_consejo_estado_magistrados", "consultar_ramajudicial_corte_constitucional_magistrados")
+consultar_ramajudicial_corte_constitucional_magistrados_anteriores = perezoso(".ramajudicial_corte_constitucional_magistrados_anteriores", "consultar_ramajudicial_corte_constitucional_magistrados_anteriores")
+consultar_presidencia_gabinete_busqueda = perezoso(".presidencia_gabinete_busqueda", "consultar_presidencia_gabinete_busqueda")
+consultar_copnia_certificado = perezoso(".copnia_certificado", "consultar_copnia_certificado")
+consultar_cgfm_mas_buscados = perezoso(".cgfm_mas_buscados", "consultar_cgfm_mas_buscados")
+consultar_colombiacompra_procesos = perezoso(".colombiacompra_procesos", "consultar_colombiacompra_procesos")
+consultar_fac_busqueda_pdf = perezoso(".fac_busqueda_pdf", "consultar_fac_busqueda_pdf")
+consultar_mintransporte_capacitaciones = perezoso(".mintransporte_capacitaciones", "consultar_mintransporte_capacitaciones")
+consultar_scj_mas_buscados_pdf = perezoso(".scj_mas_buscados_pdf", "consultar_scj_mas_buscados_pdf")
+consultar_wikipedia_busqueda = perezoso(".wikipedia_busqueda", "consultar_wikipedia_busqueda")
+consultar_defunciones = perezoso(".defunciones", "consultar_defunciones")
+consultar_fuentes = perezoso(".plantilla", "consultar_fuentes")
+consultar_opensanctions_adb = perezoso(".adb_sanctions", "consultar_opensanctions_adb")
+consultar_opensanctions_ebrd_ineligible = perezoso(".opensanctions_ebrd_ineligible", "consultar_opensanctions_ebrd_ineligible")
+consultar_opensanctions_eu_fsf = perezoso(".opensanctions_eu_fsf", "consultar_opensanctions_eu_fsf")
+consultar_eur_lex_2014_833 = perezoso(".eur_lex_2014_833", "consultar_eur_lex_2014_833")
+consultar_eur_lex_2022_398 = perezoso(".eur_lex_2022_398", "consultar_eur_lex_2022_398")
+consultar_eur_lex_2022_399 = perezoso(".eur_lex_2022_399", "consultar_eur_lex_2022_399")
+consultar_un_sc_consolidated = perezoso(".un_sc_consolidated", "consultar_un_sc_consolidated")
+consultar_mofa_bh_cte = perezoso(".mofa_bh_cte", "consultar_mofa_bh_cte")
+consultar_opensanctions_be_fod = perezoso(".opensanctions_be_fod", "consultar_opensanctions_be_fod")
+consultar_homeaffairs_search = perezoso(".homeaffairs_search", "consultar_homeaffairs_search")
+consultar_dgtresor_gels = perezoso(".dgtresor_gels", "consultar_dgtresor_gels")
+consultar_nbctf = perezoso(".nbctf", "consultar_nbctf")
+consultar_nbctf_downloads = perezoso(".nbctf_downloads", "consultar_nbctf_downloads")
+consultar_cssf = perezoso(".cssf", "consultar_cssf")
+consultar_opensanctions_nl_terrorism = perezoso(".opensanctions_nl_terrorism", "consultar_opensanctions_nl_terrorism")
+consultar_opensanctions_ps_local_freezing = perezoso(".opensanctions_ps_local_freezing", "consultar_opensanctions_ps_local_freezing")
+consultar_opensanctions_pl_mswia = perezoso(".opensanctions_pl_mswia", "consultar_opensanctions_pl_mswia")
+consultar_moci_qatar_search = perezoso(".moci_qatar_search", "consultar_moci_qatar_search")
+consultar_opensanctions_za_fic = perezoso(".opensanctions_za_fic", "consultar_opensanctions_za_fic")
+consultar_opensanctions_seco = perezoso(".opensanctions_seco", "consultar_opensanctions_seco")
+consultar_mindev = perezoso(".mindev", "consultar_mindev")
+consultar_sca_search = perezoso(".sca_search", "consultar_sca_search")
+consultar_ofsi_govuk = perezoso(".ofsi_govuk", "consultar_ofsi_govuk")
+consultar_ofsi_ukraine_govuk = perezoso(".ofsi_ukraine_govuk", "consultar_ofsi_ukraine_govuk")
+consultar_govuk_article_exactname = perezoso(".govuk_article_exactname", "consultar_govuk_article_exactname")
+consultar_repet = perezoso(".repet", "consultar_repet")
+consultar_portal_transparencia_leniencia = perezoso(".portal_transparencia_leniencia", "consultar_portal_transparencia_leniencia")
+consultar_portal_transparencia_ceis = perezoso(".portal_transparencia_ceis", "consultar_portal_transparencia_ceis")
+consultar_portal_transparencia_cepim = perezoso(".portal_transparencia_cepim", "consultar_portal_transparencia_cepim")
+consultar_portal_transparencia_busca = perezoso(".portal_transparencia_busca", "consultar_portal_transparencia_busca")
+consultar_opensanctions_au_dfat = perezoso(".opensanctions_au_dfat", "consultar_opensanctions_au_dfat")
+consultar_opensanctions_us_ddtc_debarred = perezoso(".opensanctions_us_ddtc", "consultar_opensanctions_us_ddtc_debarred")
+consultar_opensanctions_us_ofac_sdn = perezoso(".opensanctions_us_ofac_sdn", "consultar_opensanctions_us_ofac_sdn")
+consultar_opensanctions_us_cuba = perezoso(".opensanctions_us_cuba", "consultar_opensanctions_us_cuba")
+consultar_opensanctions_bis_denied = perezoso(".opensanctions_bis_denied", "consultar_opensanctions_bis_denied")
+consultar_opensanctions_us_bis_denied = perezoso(".opensanctions_us_bis_denied", "consultar_opensanctions_us_bis_denied")
+consultar_opensanctions_az_fiu = perezoso(".opensanctions_az_fiu", "consultar_opensanctions_az_fiu")
+consultar_afdb = perezoso(".afdb", "consultar_afdb")
+consultar_ebrd = perezoso(".ebrd", "consultar_ebrd")
+consultar_eeas = perezoso(".eeas", "consultar_eeas")
+consultar_opensanctions_th_designated_person = perezoso(".opensanctions_th_designated_person", "consultar_opensanctions_th_designated_person")
+consultar_mfat_sanctions = perezoso(".mfat_sanctions", "consultar_mfat_sanctions")
+consultar_opensanctions_jp_meti_eul = perezoso(".opensanctions_jp_meti_eul", "consultar_opensanctions_jp_meti_eul")
+consultar_opensanctions_us_occ_enfact = perezoso(".opensanctions_us_occ_enfact", "consultar_opensanctions_us_occ_enfact")
+consultar_opensanctions_au_dfat = perezoso(".opensanctions_au_dfat_search", "consultar_opensanctions_au_dfat")
+consultar_apgml_search = perezoso(".apgml_search", "consultar_apgml_search")
+consultar_dhs_search = perezoso(".dhs_search", "consultar_dhs_search")
+consultar_porvenir_cert_afiliacion = perezoso(".porvenir_cert_afiliacion", "consultar_porvenir_cert_afiliacion")
+consultar_colpensiones_rpm = perezoso(".colpensiones_rpm", "consultar_colpensiones_rpm")
+consultar_quien_consulto = perezoso(".bancoproveedores_quien_consulto", "consultar_quien_consulto")
+generar_certificado_procuraduria = perezoso(".procuraduria_generar_certificado", "generar_certificado_procuraduria")
+consultar_sideap_comprobante = perezoso(".sideap_comprobante", "consultar_sideap_comprobante")
 nro_bien="123456"
 empresa ="SCS SOLUCIONES GROUP"
 nit = "830512262-1"
 
+# Límite de tiempo por bot (segundos) si la entrada no trae 'timeout_s'
+TIMEOUT_BOT_S = 150
+
+
+def con_timeouts(configs, defecto=TIMEOUT_BOT_S):
+    """Garantiza que cada entrada traiga 'timeout_s'; el runner lo hace cumplir."""
+    for bot in configs:
+        bot.setdefault('timeout_s', defecto)
+    return configs
+
+
+# Claves opcionales de cada entrada:
+#   'block': perfil de bloqueo de red de core.utils.bloqueo_red.PERFILES
+#            ('rastreo' por defecto, 'ligero', 'texto', 'ninguno') o un dict
+#            {'tipos': [...], 'dominios': [...]}
+#   'timeout_s': segundos antes de cancelar el bot y registrarlo como offline
+#   'limite': {'en_vuelo': n, 'por_minuto': m} carga máxima contra la fuente en
+#            todo el clúster (core.utils.limite_fuente); saturada, el bot se reencola
+#   'lista_local': 'lista:dataset' de core.listas (o varios, en orden de preferencia);
+#            si está cargado, se consulta la copia local en vez de abrir el navegador.
+#            Con '#etiqueta' ('ue:fsf#2014/833') sólo cuentan las entradas de ese acto/régimen
+#   'lista_aproximada': False para no reportar nombres parecidos (score 3) cuando
+#            no hay coincidencia exacta; por defecto sí se reportan
 def get_bot_configs(consulta_id, datos):
-    return [
+    return con_timeouts([
 
         {
              'name':'defunciones',
@@ -219,6 +245,8 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             'name':'policia_nacional',
+            'limite': {'en_vuelo': 4, 'por_minuto': 20},
+            'timeout_s': 300,
             'func': consultar_policia_nacional,
             'kwargs': {
                 'consulta_id':consulta_id,
@@ -228,6 +256,7 @@ def get_bot_configs(consulta_id, datos):
         },
         {
              'name':'rnmc',
+             'timeout_s': 240,
             'func': consultar_rnmc,
             'kwargs': {
                 'cedula': datos['cedula'],
@@ -249,6 +278,7 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             'name':'ramajudicial_juzgados', 
+            'limite': {'en_vuelo': 4, 'por_minuto': 20},
             'func': consultar_ramajudicial_juzgados,
             'kwargs': {
                 'cedula': datos['cedula'],
@@ -285,6 +315,7 @@ def get_bot_configs(consulta_id, datos):
         {
              'func': consultar_inhabilidades,
                 'name':'inhabilidades',
+                'timeout_s': 240,
                 'kwargs': {
                    'consulta_id': consulta_id,
                     'cedula': datos['cedula'],
@@ -296,6 +327,7 @@ def get_bot_configs(consulta_id, datos):
          },
          {
              'name':"adres",
+             'timeout_s': 200,
              "func": consultar_adres,
              "kwargs": {
                  "consulta_id": consulta_id,   # ID numÃ©rico
@@ -322,6 +354,7 @@ def get_bot_configs(consulta_id, datos):
         },
          {
              'name':'antecedentes_fiscales',
+             'timeout_s': 240,
             'func': consultar_antecedentes_fiscales,
             'kwargs': {
                'consulta_id': consulta_id,
@@ -332,6 +365,7 @@ def get_bot_configs(consulta_id, datos):
         },
          {
             'name':'atf_noticias',
+            'block': 'ligero',
             'func': consultar_atf_noticias,
                 'kwargs': {
                    'consulta_id': consulta_id,
@@ -340,6 +374,7 @@ def get_bot_configs(consulta_id, datos):
          },
          {
              'name':'atf_recompensas',
+             'block': 'ligero',
              'func': consultar_atf_recompensas,
                 'kwargs': {
                    'consulta_id': consulta_id,
@@ -373,6 +408,8 @@ def get_bot_configs(consulta_id, datos):
         },
           {
              'name':'contraloria',
+             'limite': {'en_vuelo': 4, 'por_minuto': 20},
+             'timeout_s': 240,
              'func': consultar_contraloria,   
              "kwargs": {
                  "consulta_id": consulta_id,
@@ -390,14 +427,18 @@ def get_bot_configs(consulta_id, datos):
          },
          {
              'name':'dea',
+             'lista_local': 'buscados:dea',
+             'block': 'ligero',
              'func': consultar_dea,
                  'kwargs': {
                     'consulta_id': consulta_id,
-                    'cedula':datos["cedula"]
+                    'cedula':datos["cedula"],
+                    'nombre': f"{datos.get('nombre', '')} {datos.get('apellido', '')}".strip(),
                  }
          },
          {
              'name':'departament_justice',
+             'block': 'ligero',
              'func': consultar_departament_justice,
                  'kwargs': {
                     'consulta_id': consulta_id,
@@ -406,6 +447,7 @@ def get_bot_configs(consulta_id, datos):
          },
          {
              'name':'doj_fcpa_search_pdf',
+             'block': 'ligero',
              'func': consultar_doj_fcpa_search_pdf,
                  'kwargs': {
                     'consulta_id': consulta_id,
@@ -415,6 +457,7 @@ def get_bot_configs(consulta_id, datos):
 
          {
              'name':'epa_fugitives_search_pdf',
+             'block': 'ligero',
              'func': consultar_epa_fugitives_search_pdf,
                  'kwargs': {
                     'consulta_id': consulta_id,
@@ -441,6 +484,8 @@ def get_bot_configs(consulta_id, datos):
          },
          {
              'name':'eu_fin_sanctions',
+             'block': 'ligero',
+             'lista_local': 'ue:fsf',
              'func': consultar_eu_fin_sanctions,
                  'kwargs': {
                      'consulta_id':consulta_id,
@@ -449,6 +494,8 @@ def get_bot_configs(consulta_id, datos):
          },
          {
              'name':'eu_most_wanted_pdf',
+             'lista_local': 'buscados:europol',
+             'block': 'ligero',
              'func': consultar_eu_most_wanted_pdf,
                  'kwargs': {
                     'consulta_id': consulta_id,
@@ -457,6 +504,8 @@ def get_bot_configs(consulta_id, datos):
          },
          {
              'name':'eu_sanctions_tracker',
+             'block': 'ligero',
+             'lista_local': 'ue:fsf',
              'func': consultar_eu_sanctions_tracker,
                  'kwargs': {
                     'consulta_id': consulta_id,
@@ -473,6 +522,8 @@ def get_bot_configs(consulta_id, datos):
           },
          {
              'name':'fbi',
+             'lista_local': 'buscados:fbi',
+             'block': 'ligero',
              'func': consultar_fbi,
                 'kwargs': {
                    'consulta_id': consulta_id,
@@ -481,6 +532,7 @@ def get_bot_configs(consulta_id, datos):
          },
          {
             'name':'fbi_news',
+            'block': 'ligero',
             'func': consultar_fbi_news,
             'kwargs': {
                'consulta_id': consulta_id,
@@ -506,6 +558,8 @@ def get_bot_configs(consulta_id, datos):
          },
          {
              'name':'guardia_civil_buscados_pdf',
+             'lista_local': 'buscados:guardia_civil',
+             'block': 'ligero',
              'func': consultar_guardia_civil_buscados_pdf,
                  'kwargs': {
                     'consulta_id': consulta_id,
@@ -514,6 +568,7 @@ def get_bot_configs(consulta_id, datos):
          },
          {
              'name':'idb_sanctioned_png',
+             'lista_local': 'multilaterales:idb',
              'func': consultar_idb_sanctioned_png,
                  'kwargs': {
                     'consulta_id': consulta_id,
@@ -522,6 +577,7 @@ def get_bot_configs(consulta_id, datos):
          },
         {
             'name':'inpec',
+            'limite': {'en_vuelo': 4, 'por_minuto': 20},
              'func': consultar_inpec,
              'kwargs': {
                'consulta_id': consulta_id,
@@ -531,6 +587,7 @@ def get_bot_configs(consulta_id, datos):
          },
          {
              'name':'insightcrime_search_pdf',
+             'block': 'ligero',
              'func': consultar_insightcrime_search_pdf,
                  'kwargs': {
                      'consulta_id':consulta_id,
@@ -547,6 +604,7 @@ def get_bot_configs(consulta_id, datos):
         # },
         {
             'name':'interpol_red_notices',
+            'block': 'ligero',
             'func': consultar_interpol_red_notices,
             'kwargs': {
                    'consulta_id': consulta_id,
@@ -573,6 +631,8 @@ def get_bot_configs(consulta_id, datos):
         },
          {
              'name':'mas_buscados_policia_colombia',
+             'lista_local': 'buscados:policia_colombia',
+             'block': 'ligero',
              'func': consultar_mas_buscados_policia_colombia,
                 'kwargs': {
                    'consulta_id': consulta_id,
@@ -600,6 +660,8 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             'name':'nca_most_wanted',
+            'lista_local': 'buscados:nca',
+            'block': 'ligero',
             'func': consultar_nca_most_wanted_pdf,
             'kwargs': {
        'consulta_id': consulta_id,
@@ -609,6 +671,8 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             'name':'ofac',
+            'lista_local': ['ofac:sdn', 'opensanctions:us_ofac_sdn'],
+            'block': 'ligero',
             'func': consultar_ofac_pdf,
             'kwargs': {
                 'consulta_id': consulta_id,
@@ -618,6 +682,8 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             'name':'ofac_treas',
+            'lista_local': ['ofac:sdn', 'opensanctions:us_ofac_sdn'],
+            'timeout_s': 300,
             'func': consultar_ofac_treas_pdf,
             'kwargs': {
        'consulta_id': consulta_id,
@@ -627,6 +693,8 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             'name':'offshore',
+            'block': 'ligero',
+            'lista_local': 'icij:offshoreleaks',
             'func': consultar_offshore,
             'kwargs': {
        'consulta_id': consulta_id,
@@ -636,6 +704,8 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             'name':'offshore_bahamas',
+            'block': 'ligero',
+            'lista_local': 'icij:offshoreleaks#bahamas',
             'func': consultar_offshore_bahamas,
             'kwargs': {
        'consulta_id': consulta_id,
@@ -655,6 +725,8 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             'name':'procuraduria',
+            'limite': {'en_vuelo': 3, 'por_minuto': 15},
+            'timeout_s': 240,
             'func': consultar_procuraduria,
             'kwargs': {
        'consulta_id': consulta_id,
@@ -664,6 +736,8 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             'name':'rama_judicial',
+            'limite': {'en_vuelo': 4, 'por_minuto': 20},
+            'timeout_s': 240,
             'func': consultar_rama_judicial,
             'kwargs': {
        'consulta_id': consulta_id,
@@ -674,6 +748,7 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             'name':'registro_civil',
+            'timeout_s': 240,
             'func': consultar_registro_civil,
             'kwargs': {
        'consulta_id': consulta_id,
@@ -682,6 +757,8 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             'name':'runt',
+            'limite': {'en_vuelo': 3, 'por_minuto': 12},
+            'timeout_s': 240,
             'func': consultar_runt,
             'kwargs': {
                 'consulta_id': consulta_id,
@@ -691,6 +768,7 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             'name':'samm',
+            'block': 'ligero',
             'func': consultar_samm,
             'kwargs': {
         'consulta_id': consulta_id,
@@ -728,6 +806,8 @@ def get_bot_configs(consulta_id, datos):
 
         {
             'name':'offshore_offshoreleaks',
+            'block': 'ligero',
+            'lista_local': 'icij:offshoreleaks#offshore_leaks',
             'func': consultar_offshore_offshoreleaks,
             'kwargs': {
        'consulta_id': consulta_id,
@@ -737,6 +817,8 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             'name':'offshore_panama',
+            'block': 'ligero',
+            'lista_local': 'icij:offshoreleaks#panama',
             'func': consultar_offshore_panama,
             'kwargs': {
        'consulta_id': consulta_id,
@@ -746,6 +828,8 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             'name':'offshore_paradise',
+            'block': 'ligero',
+            'lista_local': 'icij:offshoreleaks#paradise',
             'func': consultar_offshore_paradise,
             'kwargs': {
        'consulta_id': consulta_id,
@@ -755,6 +839,8 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             'name':'ofsi_conlist_html',
+            'block': 'ligero',
+            'lista_local': 'ofsi:conlist',
             'func': consultar_ofsi_conlist_html,
             'kwargs': {
        'consulta_id': consulta_id,
@@ -764,6 +850,8 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             'name':'ofsi_pdf',
+            'block': 'ligero',
+            'lista_local': 'ofsi:conlist',
             'func': consultar_ofsi_pdf,
             'kwargs': {
        'consulta_id': consulta_id,
@@ -773,6 +861,8 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             'name':'opensanctions_us_ofac_cons',
+            'lista_local': ['ofac:consolidated', 'opensanctions:us_ofac_cons'],
+            'block': 'texto',
             'func': consultar_opensanctions_us_ofac_cons_pdf,
             'kwargs': {
        'consulta_id': consulta_id,
@@ -791,6 +881,8 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             'name':'pandora_papers',
+            'block': 'ligero',
+            'lista_local': 'icij:offshoreleaks#pandora',
             'func': consultar_pandora_papers,
             'kwargs': {
        'consulta_id': consulta_id,
@@ -810,6 +902,7 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             'name':'policia_memorial_search',            
+            'block': 'ligero',
             'func': consultar_policia_memorial_search_pdf,
             'kwargs': {
        'consulta_id': consulta_id,
@@ -830,6 +923,7 @@ def get_bot_configs(consulta_id, datos):
     #     },
         {
             'name':"ruaf",
+            'timeout_s': 200,
             'func': consultar_ruaf,
             'kwargs': {
        'consulta_id': consulta_id,
@@ -848,6 +942,7 @@ def get_bot_configs(consulta_id, datos):
         }, 
         {
             'name':"samm_policy_memo",
+            'block': 'ligero',
             'func': consultar_samm_policy_memo,
             'kwargs': {
        'consulta_id': consulta_id,
@@ -857,6 +952,7 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             'name':"samm_rcg",
+            'block': 'ligero',
             'func': consultar_samm_rcg,
             'kwargs': {
        'consulta_id': consulta_id,
@@ -866,6 +962,7 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             'name':"sanctions_map",
+            'block': 'ligero',
             'func': consultar_sanctions_map,
             'kwargs': {
        'consulta_id': consulta_id,
@@ -874,6 +971,8 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             'name':"secretservice_mostwanted",
+            'lista_local': 'buscados:secretservice',
+            'block': 'ligero',
             'func': consultar_secretservice_mostwanted_pdf,
             'kwargs': {
        'consulta_id': consulta_id,
@@ -883,6 +982,7 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             'name':"simit",
+            'timeout_s': 240,
             'func': consultar_simit,
             'kwargs': {
        'consulta_id': consulta_id,
@@ -891,6 +991,7 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             'name':"sisben",
+            'timeout_s': 200,
             'func': consultar_sisben,
             'kwargs': {
        'consulta_id': consulta_id,
@@ -900,6 +1001,7 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             'name':"state_designation_cartels",
+            'block': 'ligero',
             'func': consultar_state_designation_cartels_pdf,
             'kwargs': {
        'consulta_id': consulta_id,
@@ -909,6 +1011,9 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             'name':'worldbank_debarred',
+            'lista_local': 'multilaterales:worldbank',
+            'timeout_s': 240,
+            'block': 'ligero',
             'func': consultar_worldbank_debarred_pdf,
             'kwargs': {
               'consulta_id': consulta_id,
@@ -955,6 +1060,7 @@ def get_bot_configs(consulta_id, datos):
         },
         {
              'name':'supersolidaria_noticias',
+             'block': 'ligero',
             "func": consultar_supersolidaria_noticias,
             "kwargs": {
                 "consulta_id": consulta_id,
@@ -1000,6 +1106,7 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             'name':'presidencia_gabinete_busqueda',
+            'block': 'ligero',
             "func": consultar_presidencia_gabinete_busqueda,
             "kwargs": {
                 "consulta_id": consulta_id,
@@ -1009,6 +1116,8 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             'name':'cgfm_mas_buscados',
+            'lista_local': 'buscados:cgfm',
+            'block': 'ligero',
             "func": consultar_cgfm_mas_buscados,
             "kwargs": {
                 "consulta_id": consulta_id,
@@ -1045,6 +1154,7 @@ def get_bot_configs(consulta_id, datos):
 
         {
             'name':'wikipedia_busqueda',
+            'block': 'ligero',
             "func": consultar_wikipedia_busqueda,
             "kwargs": {
                 "consulta_id": consulta_id,
@@ -1054,6 +1164,8 @@ def get_bot_configs(consulta_id, datos):
         },
                 {
             'name':"consultar_fuentes",
+            'timeout_s': 600,
+            'block': 'texto',
             'func': consultar_fuentes,
             'kwargs': {
                'consulta_id': consulta_id,
@@ -1063,6 +1175,7 @@ def get_bot_configs(consulta_id, datos):
         },
             {
             "name": "dhs_search",
+            "block": "ligero",
             "func": consultar_dhs_search,
             "kwargs": {
                 "consulta_id": consulta_id,
@@ -1072,6 +1185,7 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             "name": "apgml_search",
+            "block": "ligero",
             "func": consultar_apgml_search,
             "kwargs": {
                 "consulta_id": consulta_id,
@@ -1081,6 +1195,8 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             "name": "opensanctions_au_dfat_search",
+            "lista_local": "opensanctions:au_dfat_sanctions",
+            "block": "texto",
             "func": consultar_opensanctions_au_dfat,
             "kwargs": {
                 "consulta_id": consulta_id,
@@ -1090,6 +1206,8 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             "name": "opensanctions_us_occ_enfact",
+            "lista_local": "opensanctions:us_occ_enfact",
+            "block": "texto",
             "func": consultar_opensanctions_us_occ_enfact,
             "kwargs": {
                 "consulta_id": consulta_id,
@@ -1099,6 +1217,8 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             "name": "opensanctions_jp_meti_eul",
+            "lista_local": "opensanctions:jp_meti_eul",
+            "block": "texto",
             "func": consultar_opensanctions_jp_meti_eul,
             "kwargs": {
                 "consulta_id": consulta_id,
@@ -1108,6 +1228,7 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             "name": "mfat_sanctions",
+            "block": "ligero",
             "func": consultar_mfat_sanctions,
             "kwargs": {
                 "consulta_id": consulta_id,
@@ -1117,6 +1238,8 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             "name": "opensanctions_th_designated_person",
+            "lista_local": "opensanctions:th_designated_person",
+            "block": "texto",
             "func": consultar_opensanctions_th_designated_person,
             "kwargs": {
                 "consulta_id": consulta_id,
@@ -1126,6 +1249,7 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             "name": "eeas",
+            "block": "ligero",
             "func": consultar_eeas,
             "kwargs": {
                 "consulta_id": consulta_id,
@@ -1135,6 +1259,8 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             "name": "ebrd",
+            "lista_local": "multilaterales:ebrd",
+            "block": "ligero",
             "func": consultar_ebrd,
             "kwargs": {
                 "consulta_id": consulta_id,
@@ -1144,6 +1270,8 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             "name": "afdb",
+            "lista_local": "multilaterales:afdb",
+            "block": "ligero",
             "func": consultar_afdb,
             "kwargs": {
                 "consulta_id": consulta_id,
@@ -1153,6 +1281,8 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             "name": "opensanctions_az_fiu",
+            "lista_local": "opensanctions:az_fiu_sanctions",
+            "block": "texto",
             "func": consultar_opensanctions_az_fiu,
             "kwargs": {
                 "consulta_id": consulta_id,
@@ -1162,6 +1292,8 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             "name": "opensanctions_us_bis_denied",
+            "lista_local": "opensanctions:us_bis_denied",
+            "block": "texto",
             "func": consultar_opensanctions_us_bis_denied,
             "kwargs": {
                 "consulta_id": consulta_id,
@@ -1171,6 +1303,8 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             "name": "opensanctions_bis_denied",
+            "lista_local": "opensanctions:us_bis_denied",
+            "block": "texto",
             "func": consultar_opensanctions_bis_denied,
             "kwargs": {
                 "consulta_id": consulta_id,
@@ -1180,6 +1314,8 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             "name": "opensanctions_us_cuba",
+            "lista_local": "opensanctions:us_cuba_sanctions",
+            "block": "texto",
             "func": consultar_opensanctions_us_cuba,
             "kwargs": {
                 "consulta_id": consulta_id,
@@ -1189,6 +1325,8 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             "name": "opensanctions_us_ofac_sdn",
+            "lista_local": ["ofac:sdn", "opensanctions:us_ofac_sdn"],
+            "block": "texto",
             "func": consultar_opensanctions_us_ofac_sdn,
             "kwargs": {
                 "consulta_id": consulta_id,
@@ -1198,6 +1336,8 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             "name": "opensanctions_us_ddtc_debarred",
+            "lista_local": "opensanctions:us_ddtc_debarred",
+            "block": "texto",
             "func": consultar_opensanctions_us_ddtc_debarred,
             "kwargs": {
                 "consulta_id": consulta_id,
@@ -1207,6 +1347,8 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             "name": "opensanctions_au_dfat",
+            "lista_local": "opensanctions:au_dfat_sanctions",
+            "block": "texto",
             "func": consultar_opensanctions_au_dfat,
             "kwargs": {
                 "consulta_id": consulta_id,
@@ -1261,6 +1403,7 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             "name": "govuk_article_exactname",
+            "block": "ligero",
             "func": consultar_govuk_article_exactname,
             "kwargs": {
                 "consulta_id": consulta_id,
@@ -1270,6 +1413,8 @@ def get_bot_configs(consulta_id, datos):
         },
         {
         "name": "ofsi_ukraine_govuk",
+        "block": "ligero",
+        "lista_local": "ofsi:conlist#Russia,Ukraine",
         "func": consultar_ofsi_ukraine_govuk,
         "kwargs": {
             "consulta_id": consulta_id,
@@ -1297,6 +1442,8 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             "name": "opensanctions_seco",
+            "lista_local": "opensanctions:ch_seco_sanctions",
+            "block": "texto",
             "func": consultar_opensanctions_seco,
             "kwargs": {
                 "consulta_id": consulta_id,
@@ -1306,6 +1453,8 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             "name": "opensanctions_za_fic",
+            "lista_local": "opensanctions:za_fic_sanctions",
+            "block": "texto",
             "func": consultar_opensanctions_za_fic,
             "kwargs": {
                 "consulta_id": consulta_id,
@@ -1324,6 +1473,8 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             "name": "opensanctions_pl_mswia",
+            "lista_local": "opensanctions:pl_mswia_sanctions",
+            "block": "texto",
             "func": consultar_opensanctions_pl_mswia,
             "kwargs": {
                 "consulta_id": consulta_id,
@@ -1333,6 +1484,8 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             "name": "opensanctions_ps_local_freezing",
+            "lista_local": "opensanctions:ps_local_freezing",
+            "block": "texto",
             "func": consultar_opensanctions_ps_local_freezing,
             "kwargs": {
                 "consulta_id": consulta_id,
@@ -1342,6 +1495,8 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             "name": "opensanctions_nl_terrorism",
+            "lista_local": "opensanctions:nl_terrorism_list",
+            "block": "texto",
             "func": consultar_opensanctions_nl_terrorism,
             "kwargs": {
                 "consulta_id": consulta_id,
@@ -1387,6 +1542,7 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             "name": "homeaffairs_search",
+            "block": "ligero",
             "func": consultar_homeaffairs_search,
             "kwargs": {
                 "consulta_id": consulta_id,
@@ -1396,6 +1552,8 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             "name": "opensanctions_be_fod",
+            "lista_local": "opensanctions:be_fod_sanctions",
+            "block": "texto",
             "func": consultar_opensanctions_be_fod,
             "kwargs": {
                 "consulta_id": consulta_id,
@@ -1414,6 +1572,9 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             "name": "un_sc_consolidated",
+            "timeout_s": 240,
+            "block": "ligero",
+            "lista_local": "onu:consolidada",
             "func": consultar_un_sc_consolidated,
             "kwargs": {
                 "consulta_id": consulta_id,
@@ -1423,6 +1584,8 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             "name": "eur_lex_2022_399",
+            "block": "texto",
+            "lista_local": "ue:fsf#2022/399",
             "func": consultar_eur_lex_2022_399,
             "kwargs": {
                 "consulta_id": consulta_id,
@@ -1432,6 +1595,8 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             "name": "eur_lex_2022_398",
+            "block": "texto",
+            "lista_local": "ue:fsf#2022/398",
             "func": consultar_eur_lex_2022_398,
             "kwargs": {
                 "consulta_id": consulta_id,
@@ -1441,6 +1606,8 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             "name": "eur_lex_2014_833",
+            "block": "texto",
+            "lista_local": "ue:fsf#2014/833",
             "func": consultar_eur_lex_2014_833,
             "kwargs": {
                 "consulta_id": consulta_id,
@@ -1450,6 +1617,8 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             "name": "opensanctions_eu_fsf",
+            "lista_local": ["ue:fsf", "opensanctions:eu_fsf"],
+            "block": "texto",
             "func": consultar_opensanctions_eu_fsf,
             "kwargs": {
                 "consulta_id": consulta_id,
@@ -1459,6 +1628,8 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             "name": "opensanctions_ebrd_ineligible",
+            "lista_local": ["multilaterales:ebrd", "opensanctions:ebrd_ineligible"],
+            "block": "texto",
             "func": consultar_opensanctions_ebrd_ineligible,
             "kwargs": {
                 "consulta_id": consulta_id,
@@ -1468,6 +1639,8 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             "name": "opensanctions_adb",
+            "lista_local": ["multilaterales:adb", "opensanctions:adb_sanctions"],
+            "block": "texto",
             "func": consultar_opensanctions_adb,
             "kwargs": {
                 "consulta_id": consulta_id,
@@ -1515,6 +1688,8 @@ def get_bot_configs(consulta_id, datos):
         },
         {
             'name':'procuraduria_certificado',
+            'limite': {'en_vuelo': 3, 'por_minuto': 15},
+            'timeout_s': 240,
             'func': generar_certificado_procuraduria,
             'kwargs': {
             'consulta_id': consulta_id,
@@ -1523,4 +1698,4 @@ def get_bot_configs(consulta_id, datos):
             }
         },
 
-]
+])
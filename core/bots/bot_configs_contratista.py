@@ -1,66 +1,72 @@
-﻿from .cpae_certificado import consultar_cpae_certificado
-from .cpae_verify_licensure import consultar_cpae_verify_licensure
-from.cpae_verify_certification import consultar_cpae_verify_certification
-from.rama_vigencias_pdf import consultar_rama_vigencias_pdf
-from .cpqcol_verificar import consultar_cpqcol_verificar
-from.sirna_inscritos_png import consultar_sirna_inscritos_png
-from.sirna_sanciones_png import consultar_sirna_sanciones_png
-from.cpiq_certificado_vigencia import consultar_cpiq_certificado_vigencia
-from.cpiq_validacion_matricula import consultar_cpiq_validacion_matricula
-from.cpiq_validacion_tarjeta import consultar_cpiq_validacion_tarjeta
-from .cpiq_validacion_certificado_vigencia import consultar_cpiq_validacion_certificado_vigencia
-from .copnia_certificado import consultar_copnia_certificado
-from.cpqcol_antecedentes import consultar_cpqcol_antecedentes
-from.conalpe_consulta_inscritos import consultar_conalpe_consulta_inscritos
-from.conalpe_certificado import consultar_conalpe_certificado
-from.colpsic_verificacion_tarjetas import consultar_colpsic_verificacion_tarjetas
-from.colpsic_validar_documento import consultar_colpsic_validar_documento
-from.cnb_carnet_afiliacion import consultar_cnb_carnet_afiliacion
-from.cnb_consulta_matriculados import consultar_cnb_consulta_matriculados
-from.colelectro_directorio import consultar_colelectro_directorio
-from.conpucol_verificacion_colegiados import consultar_conpucol_verificacion_colegiados
-from.conpucol_certificados import consultar_conpucol_certificados
-from.cp_validar_matricula import consultar_cp_validar_matricula
-from.cp_validar_certificado import consultar_cp_validar_certificado
-from.cp_certificado_busqueda import consultar_cp_certificado_busqueda
-from.cpip_verif_matricula import consultar_cpip_verif_matricula
-from.conte_consulta_vigencia import consultar_conte_consulta_vigencia
-from.conte_consulta_matricula import consultar_conte_consulta_matricula
-from.cpnt_vigenciapdf import consultar_cpnt_vigenciapdf
-from.cpnt_vigencia_externa_form import consultar_cpnt_vigencia_externa_form
-from.cpnt_consulta_licencia import consultar_cpnt_consulta_licencia
-from.cpnaa_matricula_arquitecto import consultar_cpnaa_matricula_arquitecto
-from.cpnaa_certificado_vigencia import consultar_cpnaa_certificado_vigencia
-from.conaltel_consulta_matriculados import consultar_conaltel_consulta_matriculados
-from.cpaa_generar_certificado import consultar_cpaa_generar_certificado
-from.ccap_validate_identity import consultar_ccap_validate_identity
-from.biologia_consulta import consultar_biologia_consulta
-from.biologia_validacion_certificados import consultar_biologia_validacion_certificados
-from.secop_consulta_aacs import consultar_secop_consulta_aacs
-from.colombiacompra_procesos import consultar_colombiacompra_procesos
-from .ruaf import consultar_ruaf
-from .adres import consultar_adres
-from .procuraduria import consultar_procuraduria
-from .personeria import consultar_personeria
-from .policia_nacional import consultar_policia_nacional
-from .rnmc import consultar_rnmc
-from .inhabilidades import consultar_inhabilidades
-from .libreta_militar import consultar_libreta_militar
-from.porvenir_cert_afiliacion import consultar_porvenir_cert_afiliacion
-from.colpensiones_rpm import consultar_colpensiones_rpm
-from.bancoproveedores_quien_consulto import consultar_quien_consulto
-from.procuraduria_generar_certificado import generar_certificado_procuraduria
-from .contraloria import consultar_contraloria
-from.rama_abogado_certificado import consultar_rama_abogado_certificado
-from.sideap_comprobante import consultar_sideap_comprobante
+﻿# Los módulos de bots se importan al ejecutarse (ver core/bots/registro.py)
+from .registro import perezoso
+
+consultar_cpae_certificado = perezoso(".cpae_certificado", "consultar_cpae_certificado")
+consultar_cpae_verify_licensure = perezoso(".cpae_verify_licensure", "consultar_cpae_verify_licensure")
+consultar_cpae_verify_certification = perezoso(".cpae_verify_certification", "consultar_cpae_verify_certification")
+consultar_rama_vigencias_pdf = perezoso(".rama_vigencias_pdf", "consultar_rama_vigencias_pdf")
+consultar_cpqcol_verificar = perezoso(".cpqcol_verificar", "consultar_cpqcol_verificar")
+consultar_sirna_inscritos_png = perezoso(".sirna_inscritos_png", "consultar_sirna_inscritos_png")
+consultar_sirna_sanciones_png = perezoso(".sirna_sanciones_png", "consultar_sirna_sanciones_png")
+consultar_cpiq_certificado_vigencia = perezoso(".cpiq_certificado_vigencia", "consultar_cpiq_certificado_vigencia")
+consultar_cpiq_validacion_matricula = perezoso(".cpiq_validacion_matricula", "consultar_cpiq_validacion_matricula")
+consultar_cpiq_validacion_tarjeta = perezoso(".cpiq_validacion_tarjeta", "consultar_cpiq_validacion_tarjeta")
+consultar_cpiq_validacion_certificado_vigencia = perezoso(".cpiq_validacion_certificado_vigencia", "consultar_cpiq_validacion_certificado_vigencia")
+consultar_copnia_certificado = perezoso(".copnia_certificado", "consultar_copnia_certificado")
+consultar_cpqcol_antecedentes = perezoso(".cpqcol_antecedentes", "consultar_cpqcol_antecedentes")
+consultar_conalpe_consulta_inscritos = perezoso(".conalpe_consulta_inscritos", "consultar_conalpe_consulta_inscritos")
+consultar_conalpe_certificado = perezoso(".conalpe_certificado", "consultar_conalpe_certificado")
+consultar_colpsic_verificacion_tarjetas = perezoso(".colpsic_verificacion_tarjetas", "consultar_colpsic_verificacion_tarjetas")
+consultar_colpsic_validar_documento = perezoso(".colpsic_validar_documento", "consultar_colpsic_validar_documento")
+consultar_cnb_carnet_afiliacion = perezoso(".cnb_carnet_afiliacion", "consultar_cnb_carnet_afiliacion")
+consultar_cnb_consulta_matriculados = perezoso(".cnb_consulta_matriculados", "consultar_cnb_consulta_matriculados")
+consultar_colelectro_directorio = perezoso(".colelectro_directorio", "consultar_colelectro_directorio")
+consultar_conpucol_verificacion_colegiados = perezoso(".conpucol_verificacion_colegiados", "consultar_conpucol_verificacion_colegiados")
+consultar_conpucol_certificados = perezoso(".conpucol_certificados", "consultar_conpucol_certificados")
+consultar_cp_validar_matricula = perezoso(".cp_validar_matricula", "consultar_cp_validar_matricula")
+consultar_cp_validar_certificado = perezoso(".cp_validar_certificado", "consultar_cp_validar_certificado")
+consultar_cp_certificado_busqueda = perezoso(".cp_certificado_busqueda", "consultar_cp_certificado_busqueda")
+consultar_cpip_verif_matricula = perezoso(".cpip_verif_matricula", "consultar_cpip_verif_matricula")
+consultar_conte_consulta_vigencia = perezoso(".conte_consulta_vigencia", "consultar_conte_consulta_vigencia")
+consultar_conte_consulta_matricula = perezoso(".conte_consulta_matricula", "consultar_conte_consulta_matricula")
+consultar_cpnt_vigenciapdf = perezoso(".cpnt_vigenciapdf", "consultar_cpnt_vigenciapdf")
+consultar_cpnt_vigencia_externa_form = perezoso(".cpnt_vigencia_externa_form", "consultar_cpnt_vigencia_externa_form")
+consultar_cpnt_consulta_licencia = perezoso(".cpnt_consulta_licencia", "consultar_cpnt_consulta_licencia")
+consultar_cpnaa_matricula_arquitecto = perezoso(".cpnaa_matricula_arquitecto", "consultar_cpnaa_matricula_arquitecto")
+consultar_cpnaa_certificado_vigencia = perezoso(".cpnaa_certificado_vigencia", "consultar_cpnaa_certificado_vigencia")
+consultar_conaltel_consulta_matriculados = perezoso(".conaltel_consulta_matriculados", "consultar_conaltel_consulta_matriculados")
+consultar_cpaa_generar_certificado = perezoso(".cpaa_generar_certificado", "consultar_cpaa_generar_certificado")
+consultar_ccap_validate_identity = perezoso(".ccap_validate_identity", "consultar_ccap_validate_identity")
+consultar_biologia_consulta = perezoso(".biologia_consulta", "consultar_biologia_consulta")
+consultar_biologia_validacion_certificados = perezoso(".biologia_validacion_certificados", "consultar_biologia_validacion_certificados")
+consultar_secop_consulta_aacs = perezoso(".secop_consulta_aacs", "consultar_secop_consulta_aacs")
+consultar_colombiacompra_procesos = perezoso(".colombiacompra_procesos", "consultar_colombiacompra_procesos")
+consultar_ruaf = perezoso(".ruaf", "consultar_ruaf")
+consultar_adres = perezoso(".adres", "consultar_adres")
+consultar_procuraduria = perezoso(".procuraduria", "consultar_procuraduria")
+consultar_personeria = perezoso(".personeria", "consultar_personeria")
+consultar_policia_nacional = perezoso(".policia_nacional", "consultar_policia_nacional")
+consultar_rnmc = perezoso(".rnmc", "consultar_rnmc")
+consultar_inhabilidades = perezoso(".inhabilidades", "consultar_inhabilidades")
+consultar_libreta_militar = perezoso(".libreta_militar", "consultar_libreta_militar")
+consultar_porvenir_cert_afiliacion = perezoso(".porvenir_cert_afiliacion", "consultar_porvenir_cert_afiliacion")
+consultar_colpensiones_rpm = perezoso(".colpensiones_rpm", "consultar_colpensiones_rpm")
+consultar_quien_consulto = perezoso(".bancoproveedores_quien_consulto", "consultar_quien_consulto")
+generar_certificado_procuraduria = perezoso(".procuraduria_generar_certificado", "generar_certificado_procuraduria")
+consultar_contraloria = perezoso(".contraloria", "consultar_contraloria")
+consultar_rama_abogado_certificado = perezoso(".rama_abogado_certificado", "consultar_rama_abogado_certificado")
+consultar_sideap_comprobante = perezoso(".sideap_comprobante", "consultar_sideap_comprobante")
 
 
 nro_bien="123456"
 empresa ="SCS SOLUCIONES GROUP"
 nit = "830512262-1"
 
+from .bot_configs import con_timeouts
+
+
 def get_bot_configs_contratista(consulta_id, datos):
-    return [
+    return con_timeouts([
         {
             'name': 'sideap_comprobante',
             'func': consultar_sideap_comprobante,
@@ -396,6 +402,7 @@ def get_bot_configs_contratista(consulta_id, datos):
          },
         {
             'name':'policia_nacional',
+            'limite': {'en_vuelo': 4, 'por_minuto': 20},
             'func': consultar_policia_nacional,
             'kwargs': {
                 'consulta_id':consulta_id,
@@ -521,6 +528,7 @@ def get_bot_configs_contratista(consulta_id, datos):
         },
         {
              'name':'contraloria',
+             'limite': {'en_vuelo': 4, 'por_minuto': 20},
              'func': consultar_contraloria,   
              "kwargs": {
                  "consulta_id": consulta_id,
@@ -536,4 +544,4 @@ def get_bot_configs_contratista(consulta_id, datos):
                 "numero": datos["cedula"],
             }
         },
-]
+])
@@ -3,12 +3,12 @@ import os
 import re
 import zipfile
 from datetime import datetime
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
-from asgiref.sync import sync_to_async
 
 # Ajusta a tu app real
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 URL = "https://www.international.gc.ca/world-monde/assets/pdfs/international_relations-relations_internationales/sanctions/sema-lmes.pdf"
 NOMBRE_SITIO = "canada_sema_search_png"
@@ -31,9 +31,9 @@ async def consultar_canada_sema_search_png(consulta_id: int, nombre: str, max_hi
 
     # Buscar fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=None,
             score=0,
@@ -143,7 +143,7 @@ async def consultar_canada_sema_search_png(consulta_id: int, nombre: str, max_hi
                 for fpath in archivos_abs:
                     zf.write(fpath, arcname=os.path.basename(fpath))
 
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente=fuente_obj,
                 score=0,
@@ -152,7 +152,7 @@ async def consultar_canada_sema_search_png(consulta_id: int, nombre: str, max_hi
                 archivo=rel_zip_path,
             )
         else:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente=fuente_obj,
                 score=0,
@@ -163,7 +163,7 @@ async def consultar_canada_sema_search_png(consulta_id: int, nombre: str, max_hi
 
     except Exception as e:
         try:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente=fuente_obj,
                 score=0,
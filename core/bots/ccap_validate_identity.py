@@ -5,10 +5,10 @@ import asyncio
 from datetime import datetime
 
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 from core.resolver.captcha_v2 import resolver_captcha_v2  # tu helper (capsolver)
 
 NOMBRE_SITIO = "ccap_validate_identity"
@@ -54,9 +54,9 @@ async def consultar_ccap_validate_identity(consulta_id: int, numero: str):
 
     # 1) Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=0,
             estado="Sin Validar",
             mensaje=f"No se encontró la Fuente '{NOMBRE_SITIO}': {e}",
@@ -197,7 +197,7 @@ async def consultar_ccap_validate_identity(consulta_id: int, numero: str):
             context = None
 
         # 11) Guardar resultado
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=score_final,
@@ -233,7 +233,7 @@ async def consultar_ccap_validate_identity(consulta_id: int, numero: str):
         except Exception:
             pass
 
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
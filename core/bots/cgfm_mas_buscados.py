@@ -5,10 +5,10 @@ import unicodedata
 from datetime import datetime
 
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 NOMBRE_SITIO = "cgfm_mas_buscados"
 URL = "https://www.cgfm.mil.co/es/taxonomy/term/4070"
@@ -99,7 +99,7 @@ async def _contar_coincidencias_y_mensaje(page, query_text: str):
 
 
 async def _guardar_resultado(consulta_id, fuente_obj, estado, mensaje, rel_path, score: int):
-    await sync_to_async(Resultado.objects.create)(
+    await crear_resultado(
         consulta_id=consulta_id,
         fuente=fuente_obj,
         score=score,
@@ -183,9 +183,9 @@ async def consultar_cgfm_mas_buscados(
 
     # 1) Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=0,
             estado="Sin Validar", mensaje=f"No se encontró la Fuente '{NOMBRE_SITIO}': {e}", archivo=""
         )
@@ -5,10 +5,10 @@ import asyncio
 from datetime import datetime
 
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout
-
-from core.models import Resultado, Fuente
+from playwright.async_api import TimeoutError as PlaywrightTimeout
+from core.utils.browser_pool import async_playwright
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 NOMBRE_SITIO = "cne_magistrados_busqueda_pdf"
 URL = "https://www.cne.gov.co/la-entidad/magistrados"
@@ -46,7 +46,7 @@ async def _goto_with_retries(page, url: str) -> None:
 
 
 async def _guardar_resultado(consulta_id, fuente_obj, estado, mensaje, rel_path, score: int = 0):
-    await sync_to_async(Resultado.objects.create)(
+    await crear_resultado(
         consulta_id=consulta_id,
         fuente=fuente_obj,
         score=score,
@@ -64,7 +64,7 @@ async def consultar_cne_magistrados_busqueda_pdf(
     browser = None
 
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
         await _guardar_resultado(
             consulta_id, None, "Sin Validar",
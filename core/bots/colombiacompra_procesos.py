@@ -6,10 +6,10 @@ import traceback
 from datetime import datetime, timedelta
 import fitz
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright, TimeoutError as PWTimeout
-
-from core.models import Resultado, Fuente
+from playwright.async_api import TimeoutError as PWTimeout
+from core.utils.browser_pool import async_playwright
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 NOMBRE_SITIO = "colombiacompra_procesos"
 URL = "https://consultaprocesos.colombiacompra.gov.co/"
@@ -57,7 +57,7 @@ def _dbg(consulta_id, msg):
 async def _registrar(consulta_id, fuente, estado, mensaje, archivo, score: int = 0):
     try:
         _dbg(consulta_id, f"Registrando resultado -> estado='{estado}', score={score}, archivo='{archivo[:120]}'")
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente,
             score=score,
@@ -198,7 +198,7 @@ async def consultar_colombiacompra_procesos(
     # Fuente
     try:
         _dbg(consulta_id, "Buscando Fuente en BD…")
-        fuente = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente = await aobtener_fuente(NOMBRE_SITIO)
         _dbg(consulta_id, f"Fuente encontrada: id={fuente.id}")
     except Exception as e:
         err = f"Fuente '{NOMBRE_SITIO}' no encontrada: {e}"
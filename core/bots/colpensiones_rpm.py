@@ -8,10 +8,10 @@ from datetime import datetime
 from pathlib import Path
 
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright, TimeoutError
-
-from core.models import Resultado, Fuente
+from playwright.async_api import TimeoutError
+from core.utils.browser_pool import async_playwright
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 logger = logging.getLogger(__name__)
 
@@ -190,7 +190,7 @@ async def consultar_colpensiones_rpm(consulta_id: int, cedula: str, tipo_doc: st
     if tipo_doc not in TIPO_DOC_MAP:
         return "Tipo de documento inválido."
 
-    fuente = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+    fuente = await aobtener_fuente(NOMBRE_SITIO)
 
     folder = Path(settings.MEDIA_ROOT) / "resultados" / str(consulta_id)
     folder.mkdir(parents=True, exist_ok=True)
@@ -327,7 +327,7 @@ async def consultar_colpensiones_rpm(consulta_id: int, cedula: str, tipo_doc: st
                 await browser.close()
 
                 # ---------------- GUARDAR EN BD ----------------
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id,
                     fuente=fuente,
                     estado="Validada" if score > 0 else "Sin Validar",
@@ -358,7 +358,7 @@ async def consultar_colpensiones_rpm(consulta_id: int, cedula: str, tipo_doc: st
                 if intento == MAX_RETRIES:
                     error_msg = f"Error después de {MAX_RETRIES} intentos: {str(e)}"
                     logger.error(error_msg)
-                    await sync_to_async(Resultado.objects.create)(
+                    await crear_resultado(
                         consulta_id=consulta_id,
                         fuente=fuente,
                         estado="Sin Validar",
@@ -1,8 +1,8 @@
 import os
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from core.models import Fuente, Resultado
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 nombre_sitio = "compliance"
 
@@ -33,7 +33,7 @@ async def consultar_compliance(nombre: str, consulta_id: int, cedula: str):
 
             # Buscar contenedores de resultados
             contenedores = await pagina.query_selector_all("div.col-md-8.col-sm-12")
-            fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=nombre_sitio)
+            fuente_obj = await aobtener_fuente(nombre_sitio)
             hallazgo = False
 
             for idx, cont in enumerate(contenedores, start=1):
@@ -52,7 +52,7 @@ async def consultar_compliance(nombre: str, consulta_id: int, cedula: str):
                     await cont.screenshot(path=screenshot_path)
 
                     # Guardar hallazgo en BD
-                    await sync_to_async(Resultado.objects.create)(
+                    await crear_resultado(
                         consulta_id=consulta_id,
                         fuente=fuente_obj,
                         score=1,
@@ -67,7 +67,7 @@ async def consultar_compliance(nombre: str, consulta_id: int, cedula: str):
                 screenshot_path = os.path.join(absolute_folder, screenshot_name)
                 await pagina.screenshot(path=screenshot_path)
 
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id,
                     fuente=fuente_obj,
                     score=0,
@@ -2,20 +2,22 @@
 import os
 from datetime import datetime
 from django.conf import settings
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from asgiref.sync import sync_to_async
 
-from core.models import Consulta, Resultado, Fuente
+from core.models import Consulta
+from core.utils.fuentes import abuscar_fuente
+from core.utils.resultados import crear_resultado
 
 url = "https://appb.saludcapital.gov.co/comprobadordederechos/Consulta.aspx"
 nombre_sitio = "comprobador_derechos"
 
 async def consultar_comprobador_derechos(consulta_id: int, cedula: str):
     async def _get_fuente():
-        return await sync_to_async(lambda: Fuente.objects.filter(nombre=nombre_sitio).first())()
+        return await abuscar_fuente(nombre_sitio)
 
     async def _crear_resultado(estado: str, mensaje: str, score: int, archivo: str = ""):
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=await _get_fuente(),
             estado=estado,
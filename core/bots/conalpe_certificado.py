@@ -5,10 +5,10 @@ import asyncio
 from datetime import datetime
 
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 from core.resolver.captcha_v2 import resolver_captcha_v2
 
 NOMBRE_SITIO = "conalpe_certificado"
@@ -77,9 +77,9 @@ async def _inject_recaptcha_token(page, token: str):
 async def consultar_conalpe_certificado(consulta_id: int, numero: str):
     browser = None
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=0,
             estado="Sin Validar", mensaje=f"No se encontró la Fuente '{NOMBRE_SITIO}': {e}", archivo=""
         )
@@ -184,7 +184,7 @@ async def consultar_conalpe_certificado(consulta_id: int, numero: str):
             await browser.close()
             browser = None
 
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj, score=0,
             estado="Validada",
             mensaje="",  # ya queda visible el snackbar si apareció
@@ -193,7 +193,7 @@ async def consultar_conalpe_certificado(consulta_id: int, numero: str):
 
     except Exception as e:
         try:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id, fuente=fuente_obj, score=0,
                 estado="Sin Validar", mensaje=str(e), archivo=""
             )
@@ -6,11 +6,11 @@ from datetime import datetime
 from pathlib import Path
 
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 import aiohttp
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import abuscar_fuente
+from core.utils.resultados import crear_resultado
 
 PAGE_URL = "https://cfiscal.contraloria.gov.co/certificados/certificadopersonanatural.aspx"
 SITE_KEY = "6LcfnjwUAAAAAIyl8ehhox7ZYqLQSVl_w1dmYIle"
@@ -159,7 +159,7 @@ async def consultar_contraloria(consulta_id: int, cedula: str, tipo_doc: str, **
     - Texto: pypdf -> pdfminer -> PyMuPDF -> OCR (fallback).
     - Guarda Resultado con el PNG.
     """
-    fuente_obj = await sync_to_async(lambda: Fuente.objects.filter(nombre=NOMBRE_SITIO).first())()
+    fuente_obj = await abuscar_fuente(NOMBRE_SITIO)
     if not fuente_obj:
         raise RuntimeError(f"No existe Fuente con nombre='{NOMBRE_SITIO}'")
 
@@ -262,7 +262,7 @@ async def consultar_contraloria(consulta_id: int, cedula: str, tipo_doc: str, **
             msg, score = _decidir(ocr_text)
 
         # 7) Guardar Resultado
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             estado="Validada",
@@ -285,7 +285,7 @@ async def consultar_contraloria(consulta_id: int, cedula: str, tipo_doc: str, **
                 await browser.close()
         except Exception:
             pass
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             estado="Sin Validar",
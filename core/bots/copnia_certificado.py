@@ -5,10 +5,10 @@ import base64
 from datetime import datetime
 
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 URL = "https://tramites.copnia.gov.co/Copnia_Microsite/CertificateOfGoodStanding/CertificateOfGoodStandingStart"
 NOMBRE_SITIO = "copnia_certificado"
@@ -33,7 +33,7 @@ LONG   = 5000
 XLONG  = 9000
 
 async def _guardar_resultado(consulta_id, fuente_obj, estado, mensaje, rel_path, score=0):
-    await sync_to_async(Resultado.objects.create)(
+    await crear_resultado(
         consulta_id=consulta_id,
         fuente=fuente_obj,
         score=score,
@@ -207,7 +207,7 @@ async def consultar_copnia_certificado(consulta_id: int, cedula: str, tipo_doc:
 
     # Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
         await _guardar_resultado(consulta_id, None, "Sin Validar",
                                  f"No se encontró la Fuente '{NOMBRE_SITIO}': {e}", "", score=0)
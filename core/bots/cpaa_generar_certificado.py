@@ -5,10 +5,10 @@ import asyncio
 from datetime import datetime
 
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 NOMBRE_SITIO = "cpaa_generar_certificado"
 URL = "https://app1.cpaa.gov.co/generar_certificado.php"
@@ -181,9 +181,9 @@ async def consultar_cpaa_generar_certificado(consulta_id: int, tipo_doc: str, nu
 
     # 1) Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=1,
             estado="Sin Validar", mensaje=f"No se encontró la Fuente '{NOMBRE_SITIO}': {e}", archivo=""
         )
@@ -264,7 +264,7 @@ async def consultar_cpaa_generar_certificado(consulta_id: int, tipo_doc: str, nu
                 # No hay certificado para descargar → evidencia de la página con el mensaje que muestre
                 await page.screenshot(path=abs_png, full_page=True)
                 await ctx.close(); await browser.close(); browser = None
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id,
                     fuente=fuente_obj,
                     score=1,
@@ -291,7 +291,7 @@ async def consultar_cpaa_generar_certificado(consulta_id: int, tipo_doc: str, nu
                     # si aún no, evidencia
                     await page.screenshot(path=abs_png, full_page=True)
                     await ctx.close(); await browser.close(); browser = None
-                    await sync_to_async(Resultado.objects.create)(
+                    await crear_resultado(
                         consulta_id=consulta_id,
                         fuente=fuente_obj,
                         score=1,
@@ -318,7 +318,7 @@ async def consultar_cpaa_generar_certificado(consulta_id: int, tipo_doc: str, nu
             await ctx.close(); await browser.close(); browser = None
 
         # 11) Registrar OK con mensaje del PDF
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=1,
@@ -329,7 +329,7 @@ async def consultar_cpaa_generar_certificado(consulta_id: int, tipo_doc: str, nu
 
     except Exception as e:
         try:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente=fuente_obj,
                 score=1,
@@ -5,10 +5,10 @@ import asyncio
 from datetime import datetime
 
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 URL = "https://tramites.cpae.gov.co/public?show=generateCertification"
 NOMBRE_SITIO = "cpae_certificado"
@@ -121,9 +121,9 @@ async def consultar_cpae_certificado(consulta_id: int, tipo_doc: str, cedula: st
 
     # Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=None,
             score=1,
@@ -224,7 +224,7 @@ async def consultar_cpae_certificado(consulta_id: int, tipo_doc: str, cedula: st
                     # No se pudo abrir el desplegable
                     await page.screenshot(path=abs_png, full_page=True)
                     await browser.close(); browser = None
-                    await sync_to_async(Resultado.objects.create)(
+                    await crear_resultado(
                         consulta_id=consulta_id,
                         fuente=fuente_obj,
                         score=1,
@@ -257,7 +257,7 @@ async def consultar_cpae_certificado(consulta_id: int, tipo_doc: str, cedula: st
                 await page.screenshot(path=abs_png, full_page=True)
 
                 await browser.close(); browser = None
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id,
                     fuente=fuente_obj,
                     score=1,
@@ -278,7 +278,7 @@ async def consultar_cpae_certificado(consulta_id: int, tipo_doc: str, cedula: st
                 # Nada para elegir → evidencia y salir
                 await page.screenshot(path=abs_png, full_page=True)
                 await browser.close(); browser = None
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id,
                     fuente=fuente_obj,
                     score=1,
@@ -326,7 +326,7 @@ async def consultar_cpae_certificado(consulta_id: int, tipo_doc: str, cedula: st
                     await page.wait_for_timeout(XLONG)
                     await page.screenshot(path=abs_png, full_page=True)
                     await browser.close(); browser = None
-                    await sync_to_async(Resultado.objects.create)(
+                    await crear_resultado(
                         consulta_id=consulta_id,
                         fuente=fuente_obj,
                         score=1,
@@ -349,7 +349,7 @@ async def consultar_cpae_certificado(consulta_id: int, tipo_doc: str, cedula: st
             await browser.close(); browser = None
 
         # Registrar OK apuntando al PNG (evidencia del PDF)
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=1,
@@ -364,7 +364,7 @@ async def consultar_cpae_certificado(consulta_id: int, tipo_doc: str, cedula: st
                 await browser.close()
         except Exception:
             pass
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=1,
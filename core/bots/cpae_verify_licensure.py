@@ -4,10 +4,10 @@ import re
 import asyncio
 from datetime import datetime
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 URL = "https://tramites.cpae.gov.co/public?show=verifyLicensure"
 NOMBRE_SITIO = "cpae_verify_licensure"
@@ -38,9 +38,9 @@ async def consultar_cpae_verify_licensure(consulta_id: int, tipo_doc: str, cedul
 
     # Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=0,
             estado="Sin Validar", mensaje=f"No se encontró la Fuente '{NOMBRE_SITIO}': {e}", archivo=""
         )
@@ -128,7 +128,7 @@ async def consultar_cpae_verify_licensure(consulta_id: int, tipo_doc: str, cedul
             browser = None
 
         # Guardar en BD
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
@@ -139,7 +139,7 @@ async def consultar_cpae_verify_licensure(consulta_id: int, tipo_doc: str, cedul
 
     except Exception as e:
         try:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente=fuente_obj,
                 score=0,
@@ -3,10 +3,10 @@ import os, re, asyncio, unicodedata
 from datetime import datetime
 from urllib.parse import urlencode
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 HOME_URL = "https://www.trade.gov/"
 SEARCH_FALLBACK = "https://www.trade.gov/trade-search"
@@ -42,16 +42,16 @@ async def consultar_csl_search_pdf(consulta_id: int, nombre: str):
 
     # Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=0,
             estado="Sin Validar", mensaje=f"No se encontró la Fuente '{NOMBRE_SITIO}': {e}", archivo=""
         )
         return
 
     if not nombre:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj, score=0,
             estado="Sin Validar", mensaje="El nombre llegó vacío.", archivo=""
         )
@@ -175,13 +175,13 @@ async def consultar_csl_search_pdf(consulta_id: int, nombre: str):
         # Preferimos guardar el PNG como archivo; si falló, guardamos el PDF
         archivo_rel = out_png_rel if os.path.exists(out_png_abs) else out_pdf_rel
 
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj, score=score,
             estado="Validada", mensaje=mensaje, archivo=archivo_rel
         )
 
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj, score=0,
             estado="Sin Validar", mensaje=str(e), archivo=""
         )
@@ -3,10 +3,10 @@ import os, re, urllib.parse, unicodedata
 from datetime import datetime
 
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 NOMBRE_SITIO = "cssf"  # crea/asegura esta Fuente en tu BD
 URL_SEARCH   = "https://www.cssf.lu/fr/search/{q}"
@@ -32,9 +32,9 @@ async def consultar_cssf(consulta_id: int, nombre: str, apellido: str):
 
     # 1) Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=1,
             estado="Sin Validar",
             mensaje=f"No se encontró la Fuente '{NOMBRE_SITIO}': {e}",
@@ -43,7 +43,7 @@ async def consultar_cssf(consulta_id: int, nombre: str, apellido: str):
         return
 
     if not full_name:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj, score=1,
             estado="Sin Validar",
             mensaje="Nombre y/o apellido vacíos para la consulta.",
@@ -173,7 +173,7 @@ async def consultar_cssf(consulta_id: int, nombre: str, apellido: str):
 
         # 7) Guardado de Resultado
         if success:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id, fuente=fuente_obj,
                 score=score_final,
                 estado="Validada",
@@ -181,7 +181,7 @@ async def consultar_cssf(consulta_id: int, nombre: str, apellido: str):
                 archivo=relative_png
             )
         else:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id, fuente=fuente_obj,
                 score=1, estado="Sin Validar",
                 mensaje=last_error or "No fue posible obtener resultados.",
@@ -190,7 +190,7 @@ async def consultar_cssf(consulta_id: int, nombre: str, apellido: str):
 
     except Exception as e:
         try:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id, fuente=fuente_obj,
                 score=1, estado="Sin Validar",
                 mensaje=str(e), archivo=""
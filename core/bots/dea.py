@@ -6,11 +6,10 @@ import traceback
 from datetime import datetime
 from typing import Optional, List
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
-from django.core.files import File as DjangoFile
+from core.utils.browser_pool import async_playwright
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 URL = "https://www.dea.gov/es/node/11286"
 NOMBRE_SITIO = "dea"
@@ -31,7 +30,7 @@ def _is_blocked_html(html: str, current_url: str) -> bool:
     return False
 
 
-def _guardar_resultado_adaptativo(
+async def _guardar_resultado_adaptativo(
     consulta_id: int,
     fuente_obj,
     score: int,
@@ -40,29 +39,17 @@ def _guardar_resultado_adaptativo(
     absolute_path: Optional[str],
     relative_path: Optional[str],
 ):
-    resultado = Resultado(
+    # La evidencia sólo se enlaza si el archivo quedó en disco
+    archivo = (relative_path or "") if absolute_path and os.path.exists(absolute_path) else ""
+    return await crear_resultado(
         consulta_id=consulta_id,
         fuente=fuente_obj,
         score=score,
         estado=estado,
         mensaje=mensaje,
+        archivo=archivo,
     )
 
-    if absolute_path and os.path.exists(absolute_path):
-        archivo_attr = getattr(resultado, "archivo", None)
-        filename = os.path.basename(absolute_path)
-        if archivo_attr is not None and hasattr(archivo_attr, "save"):
-            with open(absolute_path, "rb") as f:
-                django_file = DjangoFile(f)
-                resultado.archivo.save(filename, django_file, save=True)
-        else:
-            resultado.archivo = relative_path or ""
-            resultado.save()
-    else:
-        resultado.save()
-
-    return resultado
-
 
 async def _human_type(page, selector, text):
     await page.focus(selector)
@@ -83,6 +70,7 @@ async def _human_move_mouse(page, width=1366, height=768):
 async def consultar_dea(
     consulta_id: int,
     cedula: str,
+    nombre: str = "",
     headless: bool = False,
     max_intentos: int = 3,
     proxies: Optional[List[str]] = None,
@@ -94,13 +82,14 @@ async def consultar_dea(
     - Timeouts reducidos, manejo automático de diálogos y popups.
     - Captura condicional: distinta para 'sin resultados' y 'con resultados'.
     - Parámetros opcionales: proxies (lista), user_agents (lista).
+    - `nombre` sólo lo usa la copia local de la lista (core.listas.buscados).
     """
     navegador = None
 
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=None,
             score=0,
@@ -121,7 +110,7 @@ async def consultar_dea(
 
     cedula = (cedula or "").strip()
     if not cedula:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
@@ -242,7 +231,7 @@ async def consultar_dea(
                         except Exception:
                             pass
                         navegador = None
-                        await sync_to_async(_guardar_resultado_adaptativo)(
+                        await _guardar_resultado_adaptativo(
                             consulta_id,
                             fuente_obj,
                             0,
@@ -304,7 +293,7 @@ async def consultar_dea(
                         except Exception:
                             pass
                         navegador = None
-                        await sync_to_async(_guardar_resultado_adaptativo)(
+                        await _guardar_resultado_adaptativo(
                             consulta_id,
                             fuente_obj,
                             0,
@@ -385,7 +374,7 @@ async def consultar_dea(
                 navegador = None
 
                 # guardar resultado adaptativo
-                await sync_to_async(_guardar_resultado_adaptativo)(
+                await _guardar_resultado_adaptativo(
                     consulta_id,
                     fuente_obj,
                     score,
@@ -419,7 +408,7 @@ async def consultar_dea(
                 await asyncio.sleep(2 ** intento + random.uniform(0.5, 1.5))
                 continue
 
-            await sync_to_async(_guardar_resultado_adaptativo)(
+            await _guardar_resultado_adaptativo(
                 consulta_id,
                 fuente_obj,
                 0,
@@ -431,7 +420,7 @@ async def consultar_dea(
             return
 
     # fallback si no se completó
-    await sync_to_async(_guardar_resultado_adaptativo)(
+    await _guardar_resultado_adaptativo(
         consulta_id,
         fuente_obj,
         0,
@@ -4,11 +4,11 @@ import random
 import asyncio
 import logging
 from datetime import datetime
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
-from asgiref.sync import sync_to_async
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 logger = logging.getLogger(__name__)
 
@@ -78,9 +78,9 @@ async def consultar_defunciones(consulta_id: int, cedula: str):
 
     # Buscar la fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=0,
             estado="Sin Validar", mensaje=f"No se encontró la Fuente '{NOMBRE_SITIO}': {e}", archivo=""
         )
@@ -208,7 +208,7 @@ async def consultar_defunciones(consulta_id: int, cedula: str):
                 await navegador.close()
 
                 # 6) Guardar en BD
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id,
                     fuente=fuente_obj,
                     score=score_final,
@@ -246,7 +246,7 @@ async def consultar_defunciones(consulta_id: int, cedula: str):
                 if intento == MAX_RETRIES:
                     error_msg = f"Error después de {MAX_RETRIES} intentos: {str(e)}"
                     logger.error(error_msg)
-                    await sync_to_async(Resultado.objects.create)(
+                    await crear_resultado(
                         consulta_id=consulta_id,
                         fuente=fuente_obj,
                         score=0,
@@ -5,10 +5,10 @@ import asyncio
 from datetime import datetime
 
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 nombre_sitio = "departament_justice"
 
@@ -27,9 +27,9 @@ async def consultar_departament_justice(consulta_id: int, nombre: str):
 
     # Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=nombre_sitio)
+        fuente_obj = await aobtener_fuente(nombre_sitio)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=None,
             score=0,
@@ -97,7 +97,7 @@ async def consultar_departament_justice(consulta_id: int, nombre: str):
             navegador = None
 
         # Registrar OK
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=score,
@@ -108,7 +108,7 @@ async def consultar_departament_justice(consulta_id: int, nombre: str):
 
     except Exception as e:
         try:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente=fuente_obj,
                 score=0,
@@ -5,10 +5,10 @@ import asyncio
 from datetime import datetime
 
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 nombre_sitio = "departament_state"
 
@@ -24,9 +24,9 @@ async def consultar_departament_state(consulta_id: int, nombre: str):
 
     # 1) Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=nombre_sitio)
+        fuente_obj = await aobtener_fuente(nombre_sitio)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=0,
             estado="Sin Validar",
             mensaje=f"No se encontró la Fuente '{nombre_sitio}': {e}",
@@ -88,7 +88,7 @@ async def consultar_departament_state(consulta_id: int, nombre: str):
             navegador = None
 
         # 4) Registrar OK
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=score,
@@ -100,7 +100,7 @@ async def consultar_departament_state(consulta_id: int, nombre: str):
     except Exception as e:
         # Registrar error y cerrar navegador si quedó abierto
         try:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente=fuente_obj,
                 score=0,
@@ -3,8 +3,7 @@ from bs4 import BeautifulSoup
 from PIL import Image, ImageDraw, ImageFont
 import os
 from django.conf import settings
-from core.models import Resultado
-from asgiref.sync import sync_to_async
+from core.utils.resultados import crear_resultado
 
 NOMBRE_SITIO = "dfat_consolidated_pdf"
 
@@ -29,7 +28,7 @@ async def consultar_dfat_consolidated_pdf(consulta_id, nombre, cedula):
         ) as client:
             resp = await client.get(url)
             if resp.status_code != 200:
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id,
                     fuente_id=None,
                     estado="error",
@@ -41,7 +40,7 @@ async def consultar_dfat_consolidated_pdf(consulta_id, nombre, cedula):
             resultados_html = soup.select(".search-results .search-result")
 
             if not resultados_html:
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id,
                     fuente_id=None,
                     estado="validado",
@@ -77,7 +76,7 @@ async def consultar_dfat_consolidated_pdf(consulta_id, nombre, cedula):
             ruta_archivo = os.path.join(settings.MEDIA_ROOT, nombre_archivo)
             img.save(ruta_archivo)
 
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente_id=None,
                 estado="validado",
@@ -88,7 +87,7 @@ async def consultar_dfat_consolidated_pdf(consulta_id, nombre, cedula):
             return ruta_archivo
 
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente_id=None,
             estado="offline",
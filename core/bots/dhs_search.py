@@ -3,10 +3,10 @@ import os, re, urllib.parse, unicodedata
 from datetime import datetime
 
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 NOMBRE_SITIO = "dhs_search"
 URL_SEARCH = "https://www.dhs.gov/search?goog={q}"
@@ -31,9 +31,9 @@ async def consultar_dhs_search(consulta_id: int, nombre: str, apellido: str):
 
     # 1) Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=1,
             estado="Sin Validar",
             mensaje=f"No se encontró la Fuente '{NOMBRE_SITIO}': {e}",
@@ -42,7 +42,7 @@ async def consultar_dhs_search(consulta_id: int, nombre: str, apellido: str):
         return
 
     if not full_name:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj, score=1,
             estado="Sin Validar",
             mensaje="Nombre y/o apellido vacíos para la consulta.",
@@ -159,7 +159,7 @@ async def consultar_dhs_search(consulta_id: int, nombre: str, apellido: str):
             navegador = None
 
         # 7) Persistir Resultado
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj,
             score=score_final,
             estado="Validada" if success else "Sin Validar",
@@ -169,7 +169,7 @@ async def consultar_dhs_search(consulta_id: int, nombre: str, apellido: str):
 
     except Exception as e:
         try:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id, fuente=fuente_obj,
                 score=1, estado="Sin Validar",
                 mensaje=str(e), archivo=""
@@ -3,10 +3,10 @@ import os
 import asyncio
 from datetime import datetime
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 NOMBRE_SITIO = "dian_formalizacion_personas"
 URL = ("https://muisca.dian.gov.co/WebArquitectura/DefFormalizacionPersonas.faces"
@@ -41,9 +41,9 @@ async def consultar_dian_formalizacion_personas(
 
     # Buscar fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=None,
             score=0,
@@ -150,7 +150,7 @@ async def consultar_dian_formalizacion_personas(
             browser = None
 
         # Guardar en BD
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=score,
@@ -161,7 +161,7 @@ async def consultar_dian_formalizacion_personas(
 
     except Exception as e:
         try:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente=fuente_obj,
                 score=0,
@@ -6,10 +6,10 @@ import unicodedata
 from datetime import datetime
 from urllib.parse import urlencode
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 URL = "https://www.justice.gov/criminal/criminal-fraud/foreign-corrupt-practices-act"
 NOMBRE_SITIO = "doj_fcpa_search_pdf"
@@ -82,16 +82,16 @@ async def consultar_doj_fcpa_search_pdf(consulta_id: int, cedula: str):
 
     # Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=0,
             estado="Sin Validar", mensaje=f"No se encontró la Fuente '{NOMBRE_SITIO}': {e}", archivo=""
         )
         return
 
     if not cedula:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj, score=0,
             estado="Sin Validar", mensaje="La cédula llegó vacía.", archivo=""
         )
@@ -135,7 +135,7 @@ async def consultar_doj_fcpa_search_pdf(consulta_id: int, cedula: str):
                 try: await page.screenshot(path=out_png_abs, full_page=True)
                 except Exception: pass
                 await browser.close()
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id, fuente=fuente_obj,
                     score=0, estado="Sin Validar",
                     mensaje="403 ERROR – The request could not be satisfied (bloqueo de acceso DOJ).",
@@ -173,7 +173,7 @@ async def consultar_doj_fcpa_search_pdf(consulta_id: int, cedula: str):
                 try: await page.screenshot(path=out_png_abs, full_page=True)
                 except Exception: pass
                 await browser.close()
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id, fuente=fuente_obj,
                     score=0, estado="Sin Validar",
                     mensaje="403 ERROR – The request could not be satisfied (bloqueo tras la búsqueda).",
@@ -253,7 +253,7 @@ async def consultar_doj_fcpa_search_pdf(consulta_id: int, cedula: str):
 
         # Guardar priorizando PNG (si existe); si no, PDF
         archivo_rel = out_png_rel if os.path.exists(out_png_abs) else out_pdf_rel
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj,
             score=score, estado=estado, mensaje=mensaje, archivo=archivo_rel
         )
@@ -264,7 +264,7 @@ async def consultar_doj_fcpa_search_pdf(consulta_id: int, cedula: str):
                 _fallback_blank_pdf(out_pdf_abs, f"DOJ Search – error: {e}")
         except Exception:
             pass
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj, score=0,
             estado="Sin Validar", mensaje=str(e),
             archivo=out_pdf_rel if os.path.exists(out_pdf_abs) else ""
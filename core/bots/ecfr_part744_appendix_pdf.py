@@ -3,10 +3,10 @@ import os, re, asyncio
 from datetime import datetime
 from urllib.parse import urlencode
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 URL_PAGE = "https://www.ecfr.gov/current/title-15/subtitle-B/chapter-VII/subchapter-C/part-744/appendix-Supplement%20No.%204%20to%20Part%20744"
 URL_SEARCH_FALLBACK = "https://www.ecfr.gov/search"
@@ -58,9 +58,9 @@ async def consultar_ecfr_part744_appendix_pdf(consulta_id: int, nombre: str):
 
     # Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=0,
             estado="Sin Validar", mensaje=f"No se encontró la Fuente '{NOMBRE_SITIO}': {e}", archivo=""
         )
@@ -68,7 +68,7 @@ async def consultar_ecfr_part744_appendix_pdf(consulta_id: int, nombre: str):
 
     nombre = (nombre or "").strip()
     if not nombre:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj, score=0,
             estado="Sin Validar", mensaje="El nombre a buscar llegó vacío.", archivo=""
         )
@@ -112,7 +112,7 @@ async def consultar_ecfr_part744_appendix_pdf(consulta_id: int, nombre: str):
                 except Exception:
                     pass
                 await navegador.close(); navegador = None
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id, fuente=fuente_obj,
                     score=0, estado="Sin Validar",
                     mensaje=("Acceso bloqueado por eCFR/FederalRegister (Request Access). "
@@ -158,7 +158,7 @@ async def consultar_ecfr_part744_appendix_pdf(consulta_id: int, nombre: str):
                     except Exception:
                         pass
                     await navegador.close(); navegador = None
-                    await sync_to_async(Resultado.objects.create)(
+                    await crear_resultado(
                         consulta_id=consulta_id, fuente=fuente_obj,
                         score=0, estado="Sin Validar",
                         mensaje=("Acceso bloqueado por eCFR/FederalRegister (Request Access) durante la búsqueda. "
@@ -224,7 +224,7 @@ async def consultar_ecfr_part744_appendix_pdf(consulta_id: int, nombre: str):
                 except Exception:
                     pass
                 await browser.close()
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id, fuente=fuente_obj,
                     score=0, estado="Sin Validar",
                     mensaje=("Acceso bloqueado por eCFR/FederalRegister (Request Access) en la página de resultados."),
@@ -262,7 +262,7 @@ async def consultar_ecfr_part744_appendix_pdf(consulta_id: int, nombre: str):
             await browser.close()
 
         # Registrar (flujo normal)
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=score_final,
@@ -273,7 +273,7 @@ async def consultar_ecfr_part744_appendix_pdf(consulta_id: int, nombre: str):
 
     except Exception as e:
         try:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id, fuente=fuente_obj, score=0,
                 estado="Sin Validar", mensaje=str(e), archivo=""
             )
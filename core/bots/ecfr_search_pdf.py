@@ -5,10 +5,10 @@ import asyncio
 from datetime import datetime
 from urllib.parse import urlencode
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 URL_BASE     = "https://www.ecfr.gov"
 URL_SEARCH   = f"{URL_BASE}/search"
@@ -61,9 +61,9 @@ async def consultar_ecfr_search_pdf(consulta_id: int, nombre: str):
 
     # Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=0,
             estado="Sin Validar", mensaje=f"No se encontró la Fuente '{NOMBRE_SITIO}': {e}", archivo=""
         )
@@ -71,7 +71,7 @@ async def consultar_ecfr_search_pdf(consulta_id: int, nombre: str):
 
     nombre = (nombre or "").strip()
     if not nombre:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj, score=0,
             estado="Sin Validar", mensaje="El nombre a buscar llegó vacío.", archivo=""
         )
@@ -117,7 +117,7 @@ async def consultar_ecfr_search_pdf(consulta_id: int, nombre: str):
                 try: await page.screenshot(path=out_png_abs, full_page=True)
                 except Exception: pass
                 await navegador.close(); navegador = None
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id, fuente=fuente_obj,
                     score=0, estado="Sin Validar",
                     mensaje=("Acceso bloqueado por eCFR/FederalRegister (Request Access). "
@@ -154,7 +154,7 @@ async def consultar_ecfr_search_pdf(consulta_id: int, nombre: str):
                 try: await page.screenshot(path=out_png_abs, full_page=True)
                 except Exception: pass
                 await navegador.close(); navegador = None
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id, fuente=fuente_obj,
                     score=0, estado="Sin Validar",
                     mensaje=("Acceso bloqueado por eCFR/FederalRegister (Request Access) durante la búsqueda."),
@@ -231,7 +231,7 @@ async def consultar_ecfr_search_pdf(consulta_id: int, nombre: str):
                 try: await page.screenshot(path=out_png_abs, full_page=True)
                 except Exception: pass
                 await browser.close()
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id, fuente=fuente_obj,
                     score=0, estado="Sin Validar",
                     mensaje=("Acceso bloqueado por eCFR/FederalRegister (Request Access) en la página de resultados."),
@@ -279,7 +279,7 @@ async def consultar_ecfr_search_pdf(consulta_id: int, nombre: str):
             await browser.close()
 
         # Guardar (flujo normal)
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj,
             score=score_final, estado=estado_final,
             mensaje=mensaje_final, archivo=out_png_rel if os.path.exists(out_png_abs) else ""
@@ -288,7 +288,7 @@ async def consultar_ecfr_search_pdf(consulta_id: int, nombre: str):
     except Exception as e:
         # Error general: Sin Validar + si hay PNG ya tomado, adjúntalo
         try:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id, fuente=fuente_obj, score=0,
                 estado="Sin Validar", mensaje=str(e),
                 archivo=out_png_rel if os.path.exists(out_png_abs) else ""
@@ -7,10 +7,10 @@ import urllib.parse
 from datetime import datetime
 
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright, TimeoutError as PWTimeout
-
-from core.models import Resultado, Fuente
+from playwright.async_api import TimeoutError as PWTimeout
+from core.utils.browser_pool import async_playwright
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 NOMBRE_SITIO = "eeas"  # Asegúrate de tener esta Fuente creada en tu BD
 
@@ -46,9 +46,9 @@ async def consultar_eeas(consulta_id: int, nombre: str, apellido: str):
 
     # ------ 1) Obtener Fuente ------
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=0,
             estado="Sin Validar",
             mensaje=f"No se encontró la Fuente '{NOMBRE_SITIO}': {e}",
@@ -60,7 +60,7 @@ async def consultar_eeas(consulta_id: int, nombre: str, apellido: str):
     apellido = (apellido or "").strip()
     nombre_completo = f"{nombre} {apellido}".strip()
     if not nombre_completo:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj, score=0,
             estado="Sin Validar",
             mensaje="Nombre y/o apellido vacíos para la consulta.",
@@ -166,7 +166,7 @@ async def consultar_eeas(consulta_id: int, nombre: str, apellido: str):
 
         # ------ 4) Persistencia en BD ------
         if success:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente=fuente_obj,
                 score=score_final,                 # siempre 1
@@ -175,7 +175,7 @@ async def consultar_eeas(consulta_id: int, nombre: str, apellido: str):
                 archivo=relative_png
             )
         else:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente=fuente_obj,
                 score=0,
@@ -186,7 +186,7 @@ async def consultar_eeas(consulta_id: int, nombre: str, apellido: str):
 
     except Exception as e:
         try:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente=fuente_obj,
                 score=0,
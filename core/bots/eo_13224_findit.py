@@ -2,10 +2,10 @@
 import os, re, urllib.parse, random, asyncio
 from datetime import datetime
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 UA = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
       "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36")
@@ -59,9 +59,9 @@ async def consultar_eo_13224_findit(consulta_id: int, cedula: str):
 
     # 1) Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=0,
             estado="Sin Validar", mensaje=f"No se encontró la Fuente '{NOMBRE_SITIO}': {e}",
             archivo=""
@@ -69,7 +69,7 @@ async def consultar_eo_13224_findit(consulta_id: int, cedula: str):
         return
 
     if not cedula:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj, score=0,
             estado="Sin Validar", mensaje="Cédula vacía para la consulta.", archivo=""
         )
@@ -200,14 +200,14 @@ async def consultar_eo_13224_findit(consulta_id: int, cedula: str):
 
         # 3) Registrar en BD
         if success:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id, fuente=fuente_obj,
                 score=score_final, estado="Validada",
                 mensaje=mensaje_final,
                 archivo=relative_png
             )
         else:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id, fuente=fuente_obj, score=0,
                 estado="Sin Validar",
                 mensaje=last_error or "No fue posible obtener resultados (todas las URLs fallaron).",
@@ -216,7 +216,7 @@ async def consultar_eo_13224_findit(consulta_id: int, cedula: str):
 
     except Exception as e:
         try:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id, fuente=fuente_obj, score=0,
                 estado="Sin Validar", mensaje=str(e), archivo=""
             )
@@ -4,10 +4,10 @@ import re
 import asyncio
 from datetime import datetime
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 URL = "https://www.epa.gov/enforcement/epa-fugitives"
 NOMBRE_SITIO = "epa_fugitives_search_pdf"
@@ -63,9 +63,9 @@ async def consultar_epa_fugitives_search_pdf(consulta_id: int, nombre: str):
 
     # Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=0,
             estado="Sin Validar", mensaje=f"No se encontró la Fuente '{NOMBRE_SITIO}': {e}", archivo=""
         )
@@ -73,7 +73,7 @@ async def consultar_epa_fugitives_search_pdf(consulta_id: int, nombre: str):
 
     nombre = (nombre or "").strip()
     if not nombre:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj, score=0,
             estado="Sin Validar", mensaje="El nombre llegó vacío.", archivo=""
         )
@@ -239,7 +239,7 @@ async def consultar_epa_fugitives_search_pdf(consulta_id: int, nombre: str):
             _fallback_blank_pdf(out_pdf_abs, f"EPA – sin datos visibles para: {nombre}")
 
         # Registrar (GUARDANDO EL PNG en 'archivo')
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj,
             score=score_final, estado="Validada",
             mensaje=mensaje_final, archivo=out_png_rel
@@ -257,7 +257,7 @@ async def consultar_epa_fugitives_search_pdf(consulta_id: int, nombre: str):
             except Exception:
                 pass
 
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj, score=0,
             estado="Sin Validar", mensaje=str(e), archivo=""
         )
@@ -6,11 +6,13 @@ from datetime import datetime
 from urllib.parse import parse_qs, urlparse
 
 from django.conf import settings
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from asgiref.sync import sync_to_async
 
 from core.resolver.captcha_v2 import resolver_captcha_v2
-from core.models import Consulta, Resultado, Fuente
+from core.models import Consulta
+from core.utils.fuentes import abuscar_fuente
+from core.utils.resultados import crear_resultado
 
 url = "https://eris.contaduria.gov.co/BDME/"
 nombre_sitio = "eris"
@@ -32,10 +34,10 @@ TIPO_DOC_MAP = {
 
 async def consultar_eris(consulta_id: int, cedula: str, tipo_doc: str):
     async def _get_fuente():
-        return await sync_to_async(lambda: Fuente.objects.filter(nombre=nombre_sitio).first())()
+        return await abuscar_fuente(nombre_sitio)
 
     async def _crear_resultado_ok(relative_path: str, mensaje: str, score: int):
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=await _get_fuente(),
             estado="Validada",
@@ -45,7 +47,7 @@ async def consultar_eris(consulta_id: int, cedula: str, tipo_doc: str):
         )
 
     async def _crear_resultado_error(mensaje: str):
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=await _get_fuente(),
             estado="Sin Validar",
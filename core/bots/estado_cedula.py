@@ -7,8 +7,7 @@ from datetime import datetime, date
 from typing import Optional
 
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 import fitz  # PyMuPDF
 
 # Optional OCR libs
@@ -19,7 +18,8 @@ try:
 except Exception:
     OCR_AVAILABLE = False
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 URL = "https://certvigenciacedula.registraduria.gov.co/Datos.aspx"
 NOMBRE_SITIO = "estado_cedula"
@@ -190,9 +190,9 @@ async def consultar_estado_cedula(
     """
     # Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=None,
             score=0,
@@ -381,7 +381,7 @@ async def consultar_estado_cedula(
         mensaje = _mensaje_datos(datos)
 
         # Guardar resultado (PNG en archivo)
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
@@ -398,7 +398,7 @@ async def consultar_estado_cedula(
         except Exception:
             pass
 
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
@@ -2,10 +2,10 @@
 import os, re, asyncio, unicodedata
 from datetime import datetime
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 URL = ("https://data.europa.eu/data/datasets/"
        "consolidated-list-of-persons-groups-and-entities-subject-to-eu-financial-sanctions?locale=en")
@@ -125,9 +125,9 @@ async def consultar_eu_fin_sanctions(consulta_id: int, nombre_completo: str):
 
     # Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=0,
             estado="Sin Validar", mensaje=f"No se encontró la Fuente '{NOMBRE_SITIO}': {e}", archivo=""
         )
@@ -135,7 +135,7 @@ async def consultar_eu_fin_sanctions(consulta_id: int, nombre_completo: str):
 
     nombre_completo = (nombre_completo or "").strip()
     if not nombre_completo:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj, score=0,
             estado="Sin Validar", mensaje="Nombre vacío para la consulta.", archivo=""
         )
@@ -285,7 +285,7 @@ async def consultar_eu_fin_sanctions(consulta_id: int, nombre_completo: str):
             archivo_rel = out_pdf_rel
 
         estado = "Validada" if archivo_rel else "Sin Validar"
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj,
             score=score_final, estado=estado,
             mensaje=mensaje_final, archivo=archivo_rel
@@ -297,7 +297,7 @@ async def consultar_eu_fin_sanctions(consulta_id: int, nombre_completo: str):
                 await navegador.close()
         except Exception:
             pass
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj, score=0,
             estado="Sin Validar", mensaje="ocurrio un error", archivo=""
         )
@@ -5,10 +5,10 @@ import unicodedata
 import asyncio
 from datetime import datetime
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 URL = "https://eumostwanted.eu/es/"
 NOMBRE_SITIO = "eu_most_wanted_pdf"
@@ -109,16 +109,16 @@ async def consultar_eu_most_wanted_pdf(consulta_id: int, nombre: str):
 
     # Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=0,
             estado="Sin Validar", mensaje=f"No se encontró la Fuente '{NOMBRE_SITIO}': {e}", archivo=""
         )
         return
 
     if not nombre:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj, score=0,
             estado="Sin Validar", mensaje="El nombre llegó vacío.", archivo=""
         )
@@ -321,7 +321,7 @@ async def consultar_eu_most_wanted_pdf(consulta_id: int, nombre: str):
             _fallback_blank_png(selected_png, f"EU Most Wanted – evidencia: {mensaje_final} – {nombre}")
 
         archivo_rel = os.path.join(rel_folder, os.path.basename(selected_png))
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=score_final,
@@ -337,7 +337,7 @@ async def consultar_eu_most_wanted_pdf(consulta_id: int, nombre: str):
                 _fallback_blank_png(out_png_list, f"EU Most Wanted – error: {e}")
         except Exception:
             pass
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj, score=0,
             estado="Sin Validar", mensaje=str(e),
             archivo=os.path.join(rel_folder, os.path.basename(out_png_list)) if os.path.exists(out_png_list) else ""
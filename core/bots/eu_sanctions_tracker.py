@@ -6,10 +6,10 @@ import random
 import logging
 from datetime import datetime
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 logger = logging.getLogger(__name__)
 
@@ -98,16 +98,16 @@ async def consultar_eu_sanctions_tracker(consulta_id: int, nombre_completo: str)
 
     # 1) Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=0,
             estado="Sin Validar", mensaje=f"No se encontró la Fuente '{NOMBRE_SITIO}': {e}", archivo=""
         )
         return
 
     if not nombre_completo:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj, score=0,
             estado="Sin Validar", mensaje="Nombre vacío para la consulta.", archivo=""
         )
@@ -219,7 +219,7 @@ async def consultar_eu_sanctions_tracker(consulta_id: int, nombre_completo: str)
                     navegador = None
                     
                     if intento == MAX_RETRIES:
-                        await sync_to_async(Resultado.objects.create)(
+                        await crear_resultado(
                             consulta_id=consulta_id, fuente=fuente_obj, score=0,
                             estado="Sin Validar", mensaje="No se encontró el campo de búsqueda del tracker.", archivo=""
                         )
@@ -279,7 +279,7 @@ async def consultar_eu_sanctions_tracker(consulta_id: int, nombre_completo: str)
                         await context.close()
                         await navegador.close()
                         
-                        await sync_to_async(Resultado.objects.create)(
+                        await crear_resultado(
                             consulta_id=consulta_id, fuente=fuente_obj, score=0,
                             estado="Validada", mensaje="No results found", archivo=relative_path
                         )
@@ -339,13 +339,13 @@ async def consultar_eu_sanctions_tracker(consulta_id: int, nombre_completo: str)
 
                 # Registrar según se hayan encontrado hallazgos
                 if found:
-                    await sync_to_async(Resultado.objects.create)(
+                    await crear_resultado(
                         consulta_id=consulta_id, fuente=fuente_obj, score=10,
                         estado="Validada", mensaje="Se han encontrado hallazgos", archivo=relative_path
                     )
                     logger.info("Resultado guardado: Se han encontrado hallazgos")
                 else:
-                    await sync_to_async(Resultado.objects.create)(
+                    await crear_resultado(
                         consulta_id=consulta_id, fuente=fuente_obj, score=0,
                         estado="Validada", mensaje="No results found", archivo=relative_path
                     )
@@ -380,7 +380,7 @@ async def consultar_eu_sanctions_tracker(consulta_id: int, nombre_completo: str)
                 if intento == MAX_RETRIES:
                     error_msg = f"Error después de {MAX_RETRIES} intentos: {str(e)}"
                     logger.error(error_msg)
-                    await sync_to_async(Resultado.objects.create)(
+                    await crear_resultado(
                         consulta_id=consulta_id, fuente=fuente_obj, score=0,
                         estado="Sin Validar", mensaje=error_msg, archivo=""
                     )
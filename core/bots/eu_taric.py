@@ -2,10 +2,10 @@
 import os, re, asyncio, html
 from datetime import datetime
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 URL = "https://ec.europa.eu/taxation_customs/dds2/taric/taric_consultation.jsp?Lang=en"
 NOMBRE_SITIO = "eu_taric"
@@ -15,9 +15,9 @@ async def consultar_eu_taric(consulta_id: int, nombre_completo: str):
 
     # 1) Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=0,
             estado="Sin Validar", mensaje=f"No se encontró la Fuente '{NOMBRE_SITIO}': {e}", archivo=""
         )
@@ -25,7 +25,7 @@ async def consultar_eu_taric(consulta_id: int, nombre_completo: str):
 
     nombre_completo = (nombre_completo or "").strip()
     if not nombre_completo:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj, score=0,
             estado="Sin Validar", mensaje="Nombre vacío para la consulta.", archivo=""
         )
@@ -148,7 +148,7 @@ async def consultar_eu_taric(consulta_id: int, nombre_completo: str):
             navegador = None
 
         # 4) Registrar
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj, score=score_final,
             estado="Validada", mensaje=mensaje_final, archivo=relative_path
         )
@@ -159,7 +159,7 @@ async def consultar_eu_taric(consulta_id: int, nombre_completo: str):
                 await navegador.close()
         except Exception:
             pass
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj, score=0,
             estado="Sin Validar", mensaje=str(e), archivo=""
         )
@@ -5,10 +5,10 @@ from urllib.parse import urlparse
 from datetime import datetime
 
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 from core.utils.pdf_preview import pdf_first_page_to_png  # <- IMPORTANTE
 
 URL = "https://www.sanctionsmap.eu/#/main/travel/ban"
@@ -38,9 +38,9 @@ async def consultar_eu_travelban_pdf(consulta_id: int, nombre_completo: str):
 
     # 1) Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=10,
             estado="Sin Validar", mensaje="el pdf no pudo ser descargado", archivo=""
         )
@@ -82,7 +82,7 @@ async def consultar_eu_travelban_pdf(consulta_id: int, nombre_completo: str):
             href = await link.get_attribute("href")
             if not href:
                 await navegador.close(); navegador = None
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id, fuente=fuente_obj, score=10,
                     estado="Sin Validar", mensaje="el pdf no pudo ser descargado", archivo=""
                 )
@@ -92,7 +92,7 @@ async def consultar_eu_travelban_pdf(consulta_id: int, nombre_completo: str):
             resp = await context.request.get(href, headers={"Accept": "application/pdf"})
             if not resp.ok:
                 await navegador.close(); navegador = None
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id, fuente=fuente_obj, score=10,
                     estado="Sin Validar", mensaje="el pdf no pudo ser descargado", archivo=""
                 )
@@ -141,20 +141,20 @@ async def consultar_eu_travelban_pdf(consulta_id: int, nombre_completo: str):
                 png_abs, png_rel = pdf_first_page_to_png(pdf_abs, max_width=1400)
 
                 # Registrar OK: archivo = PNG (para consolidado), mensaje = ruta del PDF
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id, fuente=fuente_obj, score=0,
                     estado="Validada", mensaje=f"PDF: {pdf_rel}", archivo=png_rel
                 )
             except Exception as e:
                 # Si falla el preview pero el PDF existe, registramos el PDF como evidencia (fallback)
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id, fuente=fuente_obj, score=0,
                     estado="Validada",
                     mensaje=f"PDF sin preview ({e}). PDF: {pdf_rel}",
                     archivo=pdf_rel
                 )
         else:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id, fuente=fuente_obj, score=10,
                 estado="Sin Validar", mensaje="el pdf no pudo ser descargado", archivo=""
             )
@@ -165,7 +165,7 @@ async def consultar_eu_travelban_pdf(consulta_id: int, nombre_completo: str):
                 await navegador.close()
         except Exception:
             pass
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj, score=10,
             estado="Sin Validar", mensaje="el pdf no pudo ser descargado", archivo=""
         )
@@ -3,10 +3,10 @@ import os, re, asyncio, urllib.parse, unicodedata, time
 from datetime import datetime
 
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 NOMBRE_SITIO = "eur_lex_2014_833"  # crea/usa esta Fuente en tu tabla
 URL_SEARCH = ("https://eur-lex.europa.eu/search.html"
@@ -49,9 +49,9 @@ async def consultar_eur_lex_2014_833(consulta_id: int, nombre: str, apellido: st
 
     # 1) Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=1,
             estado="Sin Validar",
             mensaje=f"No se encontró la Fuente '{NOMBRE_SITIO}': {e}",
@@ -60,7 +60,7 @@ async def consultar_eur_lex_2014_833(consulta_id: int, nombre: str, apellido: st
         return
 
     if not full_name:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj, score=1,
             estado="Sin Validar",
             mensaje="Nombre y/o apellido vacíos para la consulta.",
@@ -183,7 +183,7 @@ async def consultar_eur_lex_2014_833(consulta_id: int, nombre: str, apellido: st
 
         # 7) Guardar resultado
         if success:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id, fuente=fuente_obj,
                 score=score_final,
                 estado="Validada",
@@ -191,7 +191,7 @@ async def consultar_eur_lex_2014_833(consulta_id: int, nombre: str, apellido: st
                 archivo=relative_png
             )
         else:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id, fuente=fuente_obj,
                 score=1, estado="Sin Validar",
                 mensaje=last_error or "No fue posible obtener resultados.",
@@ -200,7 +200,7 @@ async def consultar_eur_lex_2014_833(consulta_id: int, nombre: str, apellido: st
 
     except Exception as e:
         try:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id, fuente=fuente_obj,
                 score=1, estado="Sin Validar",
                 mensaje=str(e), archivo=""
@@ -6,10 +6,10 @@ from datetime import datetime
 from urllib.parse import quote_plus
 
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 NOMBRE_SITIO = "fac_busqueda_pdf"
 BASE_URL = "https://www.fac.mil.co/"
@@ -49,7 +49,7 @@ def _norm(s: str) -> str:
 
 
 async def _guardar_resultado(consulta_id, fuente_obj, estado, mensaje, rel_path, score: int = 0):
-    await sync_to_async(Resultado.objects.create)(
+    await crear_resultado(
         consulta_id=consulta_id,
         fuente=fuente_obj,
         score=score,
@@ -76,7 +76,7 @@ async def consultar_fac_busqueda_pdf(
     page = None
 
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
         await _guardar_resultado(
             consulta_id, None, "Sin Validar",
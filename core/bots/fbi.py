@@ -1,14 +1,14 @@
 # consulta/fbi_topten.py (versión async adaptada a BD)
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 import os
 import re
 import asyncio
 import unicodedata
 from datetime import datetime
 from django.conf import settings
-from asgiref.sync import sync_to_async
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 NOMBRE_SITIO = "fbi"
 URL = "https://www.fbi.gov/wanted/topten"
@@ -35,9 +35,9 @@ async def consultar_fbi(consulta_id: int, nombre: str):
 
     # Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=None,
             score=0,
@@ -49,7 +49,7 @@ async def consultar_fbi(consulta_id: int, nombre: str):
 
     nombre = (nombre or "").strip()
     if not nombre:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
@@ -178,7 +178,7 @@ async def consultar_fbi(consulta_id: int, nombre: str):
             context = None
 
         # Registrar en BD
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=score_final,
@@ -201,7 +201,7 @@ async def consultar_fbi(consulta_id: int, nombre: str):
             pass
 
         # Registrar error
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
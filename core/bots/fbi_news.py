@@ -7,10 +7,10 @@ import logging
 import unicodedata
 from datetime import datetime
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 logger = logging.getLogger(__name__)
 
@@ -82,9 +82,9 @@ async def consultar_fbi_news(consulta_id: int, nombre_completo: str):
     """
     # 1) Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=0,
             estado="Sin Validar", mensaje=f"No se encontró la Fuente '{NOMBRE_SITIO}': {e}", archivo=""
         )
@@ -92,7 +92,7 @@ async def consultar_fbi_news(consulta_id: int, nombre_completo: str):
 
     nombre_completo = (nombre_completo or "").strip()
     if not nombre_completo:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj, score=0,
             estado="Sin Validar", mensaje="Nombre vacío para la consulta.", archivo=""
         )
@@ -330,7 +330,7 @@ async def consultar_fbi_news(consulta_id: int, nombre_completo: str):
                 await navegador.close()
 
                 # 6) Registrar
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id, fuente=fuente_obj, score=score_final,
                     estado="Validada", mensaje=mensaje_final, archivo=relative_path
                 )
@@ -364,7 +364,7 @@ async def consultar_fbi_news(consulta_id: int, nombre_completo: str):
                 if intento == MAX_RETRIES:
                     error_msg = f"Error después de {MAX_RETRIES} intentos: {str(e)}"
                     logger.error(error_msg)
-                    await sync_to_async(Resultado.objects.create)(
+                    await crear_resultado(
                         consulta_id=consulta_id, fuente=fuente_obj, score=0,
                         estado="Sin Validar", mensaje=error_msg, archivo=""
                     )
@@ -2,9 +2,10 @@ import os
 import asyncio
 from urllib.parse import quote_plus
 from django.conf import settings
-from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
-from asgiref.sync import sync_to_async
-from core.models import Resultado, Fuente
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from core.utils.browser_pool import async_playwright
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 NOMBRE_SITIO = "garantias_mobiliarias_nooficial"
 
@@ -15,11 +16,11 @@ async def consultar_garantias_mobiliarias_nooficial(consulta_id, nombre, nro_bie
 
     # Buscar fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre="garantias_mobiliarias_nooficial")
+        fuente_obj = await aobtener_fuente("garantias_mobiliarias_nooficial")
         print(f"[RGM] Fuente encontrada: {getattr(fuente_obj, 'id', None)}")
     except Exception as e:
         print(f"[RGM][ERROR] No se encontró la fuente: {e}")
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=None,
             score=0,
@@ -105,7 +106,7 @@ async def consultar_garantias_mobiliarias_nooficial(consulta_id, nombre, nro_bie
                         pass
                     # guardar resultado
                     try:
-                        await sync_to_async(Resultado.objects.create)(
+                        await crear_resultado(
                             consulta_id=consulta_id,
                             fuente=fuente_obj,
                             score=score,
@@ -180,7 +181,7 @@ async def consultar_garantias_mobiliarias_nooficial(consulta_id, nombre, nro_bie
                     print("[RGM] HTML de debug guardado en:", html_debug_path)
                 except Exception as e2:
                     print(f"[RGM][WARN] No se pudo guardar HTML de debug: {e2}")
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id,
                     fuente=fuente_obj,
                     score=0,
@@ -251,7 +252,7 @@ async def consultar_garantias_mobiliarias_nooficial(consulta_id, nombre, nro_bie
                 except Exception as e:
                     print(f"[RGM][WARN] No se pudo guardar HTML de debug: {e}")
 
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id,
                     fuente=fuente_obj,
                     score=0,
@@ -263,7 +264,7 @@ async def consultar_garantias_mobiliarias_nooficial(consulta_id, nombre, nro_bie
                 return
             except Exception as e:
                 print(f"[RGM][ERROR] Error al llenar el campo de nombre: {e}")
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id,
                     fuente=fuente_obj,
                     score=0,
@@ -307,7 +308,7 @@ async def consultar_garantias_mobiliarias_nooficial(consulta_id, nombre, nro_bie
                         raise RuntimeError("No se encontró el botón Consultar.")
                 except Exception as exc:
                     print(f"[RGM][ERROR] Error al intentar hacer clic en Consultar: {exc}")
-                    await sync_to_async(Resultado.objects.create)(
+                    await crear_resultado(
                         consulta_id=consulta_id,
                         fuente=fuente_obj,
                         score=0,
@@ -319,7 +320,7 @@ async def consultar_garantias_mobiliarias_nooficial(consulta_id, nombre, nro_bie
                     return
             except Exception as e:
                 print(f"[RGM][ERROR] Error buscando o clickeando el botón Consultar: {e}")
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id,
                     fuente=fuente_obj,
                     score=0,
@@ -388,7 +389,7 @@ async def consultar_garantias_mobiliarias_nooficial(consulta_id, nombre, nro_bie
 
             # 8 Registrar resultado (protegido)
             try:
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id,
                     fuente=fuente_obj,
                     score=score,
@@ -401,7 +402,7 @@ async def consultar_garantias_mobiliarias_nooficial(consulta_id, nombre, nro_bie
                 print(f"[RGM][ERROR] Falló guardar Resultado para {consulta_id}: {save_exc}")
                 # intentar guardar sin fuente si falla
                 try:
-                    await sync_to_async(Resultado.objects.create)(
+                    await crear_resultado(
                         consulta_id=consulta_id,
                         fuente=None,
                         score=score,
@@ -420,7 +421,7 @@ async def consultar_garantias_mobiliarias_nooficial(consulta_id, nombre, nro_bie
         # CHANGED: asegurar que fuente_obj puede no existir
         fuente_para_guardar = locals().get('fuente_obj', None)
         try:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente=fuente_para_guardar,
                 score=0,
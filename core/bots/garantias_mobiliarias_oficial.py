@@ -2,10 +2,11 @@ import os
 import asyncio
 from datetime import datetime
 from django.conf import settings
-from playwright.async_api import async_playwright, TimeoutError as PWTimeoutError
-from asgiref.sync import sync_to_async
+from playwright.async_api import TimeoutError as PWTimeoutError
+from core.utils.browser_pool import async_playwright
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 nombre_sitio = "garantias_mobiliarias_oficial"
 
@@ -39,9 +40,9 @@ async def consultar_garantias_mobiliarias_oficial(consulta_id, cedula):
 
     # Buscar fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=nombre_sitio)
+        fuente_obj = await aobtener_fuente(nombre_sitio)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=0,
             estado="Sin Validar", mensaje=f"No se encontró la Fuente '{nombre_sitio}': {e}", archivo=""
         )
@@ -91,7 +92,7 @@ async def consultar_garantias_mobiliarias_oficial(consulta_id, cedula):
             await pagina.screenshot(path=absolute_path, full_page=True)
 
             # Registrar resultado
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente=fuente_obj,
                 score=score,
@@ -105,7 +106,7 @@ async def consultar_garantias_mobiliarias_oficial(consulta_id, cedula):
 
     except (PWTimeoutError, Exception) as e:
         try:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente=fuente_obj,
                 score=0,
@@ -5,10 +5,10 @@ import unicodedata
 import asyncio
 from datetime import datetime
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 URL = "https://web.guardiacivil.es/es/colaboracion/Buscados/buscados/"
 NOMBRE_SITIO = "guardia_civil_buscados_pdf"
@@ -84,16 +84,16 @@ async def consultar_guardia_civil_buscados_pdf(consulta_id: int, nombre: str):
 
     # Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=0,
             estado="Sin Validar", mensaje=f"No se encontró la Fuente '{NOMBRE_SITIO}': {e}", archivo=""
         )
         return
 
     if not nombre:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj, score=0,
             estado="Sin Validar", mensaje="El nombre llegó vacío.", archivo=""
         )
@@ -308,7 +308,7 @@ async def consultar_guardia_civil_buscados_pdf(consulta_id: int, nombre: str):
 
         selected_png_rel = os.path.join(rel_folder, os.path.basename(selected_png_abs))
 
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=score_final,
@@ -325,7 +325,7 @@ async def consultar_guardia_civil_buscados_pdf(consulta_id: int, nombre: str):
         except Exception:
             pass
 
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj, score=0,
             estado="Sin Validar", mensaje=str(e),
             archivo=os.path.join(rel_folder, os.path.basename(out_png_lista_abs)) if os.path.exists(out_png_lista_abs) else ""
@@ -9,10 +9,10 @@ import json
 from datetime import datetime
 
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
-
-from core.models import Resultado, Fuente
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from core.utils.browser_pool import async_playwright
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 NOMBRE_SITIO = "homeaffairs_search"
 URL_SEARCH = "https://www.homeaffairs.gov.au/sitesearch?k={q}"
@@ -124,11 +124,11 @@ async def consultar_homeaffairs_search(consulta_id: int, nombre: str, apellido:
 
     # 1) Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
         print(f"[RGM] Fuente encontrada id={getattr(fuente_obj, 'id', None)}")
     except Exception as e:
         print(f"[RGM][ERROR] No se encontró la Fuente '{NOMBRE_SITIO}': {e}")
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=1,
             estado="Sin Validar",
             mensaje=f"No se encontró la Fuente '{NOMBRE_SITIO}': {e}",
@@ -138,7 +138,7 @@ async def consultar_homeaffairs_search(consulta_id: int, nombre: str, apellido:
 
     if not full_name:
         print("[RGM][ERROR] Nombre y/o apellido vacíos")
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj, score=1,
             estado="Sin Validar",
             mensaje="Nombre y/o apellido vacíos para la consulta.",
@@ -344,7 +344,7 @@ async def consultar_homeaffairs_search(consulta_id: int, nombre: str, apellido:
                 archivo_para_bd = ",".join(evidencia)
                 mensaje_final = "Bloqueo detectado. Se adjunta evidencia (HTML/PNG) para diagnóstico."
                 last_error = mensaje_final
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id, fuente=fuente_obj,
                     score=1,
                     estado="Sin Validar",
@@ -490,7 +490,7 @@ async def consultar_homeaffairs_search(consulta_id: int, nombre: str, apellido:
             mensaje_bd = mensaje_final
             if es_bloqueo:
                 mensaje_bd = "La página parece estar bloqueada o no muestra resultados. Se adjunta evidencia (HTML/PNG) para diagnóstico. " + (mensaje_final or "Bloqueo detectado.")
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj,
             score=score_final if success and not es_bloqueo else 1,
             estado=estado_bd,
@@ -503,7 +503,7 @@ async def consultar_homeaffairs_search(consulta_id: int, nombre: str, apellido:
         print(f"[RGM][ERROR] Excepción general: {e}")
 
         try:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id, fuente=fuente_obj,
                 score=1,
                 estado="Sin Validar",
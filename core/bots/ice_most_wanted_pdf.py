@@ -2,9 +2,9 @@
 import os, re
 from datetime import datetime
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
-from core.models import Resultado, Fuente
+from core.utils.browser_pool import async_playwright
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 URL = "https://www.ice.gov/most-wanted"
 NOMBRE_SITIO = "ice_most_wanted_pdf"
@@ -55,9 +55,9 @@ async def consultar_ice_most_wanted_pdf(consulta_id: int, nombre: str):
 
     # Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=0,
             estado="Sin Validar", mensaje=f"No se encontró la Fuente '{NOMBRE_SITIO}': {e}", archivo=""
         )
@@ -65,7 +65,7 @@ async def consultar_ice_most_wanted_pdf(consulta_id: int, nombre: str):
 
     nombre = (nombre or "").strip()
     if not nombre:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj, score=0,
             estado="Sin Validar", mensaje="El nombre llegó vacío.", archivo=""
         )
@@ -140,7 +140,7 @@ async def consultar_ice_most_wanted_pdf(consulta_id: int, nombre: str):
         if not os.path.exists(out_pdf_abs) or os.path.getsize(out_pdf_abs) < 500:
             _fallback_blank_pdf(out_pdf_abs, f"ICE – sin datos visibles para: {nombre}")
 
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj, score=score_final,
             estado="Validada", mensaje=mensaje_final, archivo=out_pdf_rel
         )
@@ -150,7 +150,7 @@ async def consultar_ice_most_wanted_pdf(consulta_id: int, nombre: str):
             _fallback_blank_pdf(out_pdf_abs, f"ICE – error: {e}")
         if ctx: await ctx.close()
         if navegador: await navegador.close()
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj, score=0,
             estado="Sin Validar", mensaje=str(e), archivo=""
         )
\ No newline at end of file
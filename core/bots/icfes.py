@@ -1,11 +1,11 @@
 # consulta/pruebas_icfes.py
 import os
 from datetime import datetime
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
-from asgiref.sync import sync_to_async
 
-from core.models import Fuente, Resultado
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 from core.resolver.captcha_v2 import resolver_captcha_v2
 import urllib.parse
 
@@ -30,9 +30,9 @@ async def consultar_pruebas_icfes(tipo_doc: str, consulta_id: int, fecha_nacimie
 
     # 0) Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=None,
             score=0,
@@ -166,7 +166,7 @@ async def consultar_pruebas_icfes(tipo_doc: str, consulta_id: int, fecha_nacimie
             navegador = None
 
             # Registrar en BD (siempre “Validada” porque el flujo corrió)
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente=fuente_obj,
                 score=score_final,
@@ -183,7 +183,7 @@ async def consultar_pruebas_icfes(tipo_doc: str, consulta_id: int, fecha_nacimie
             pass
 
         # Error de ejecución del bot
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
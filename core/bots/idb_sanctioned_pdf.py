@@ -2,10 +2,10 @@
 import os, re, base64, unicodedata
 from datetime import datetime
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 URL = "https://www.iadb.org/es/quienes-somos/transparencia/sistema-de-sanciones/empresas-e-individuos-sancionados"
 NOMBRE_SITIO = "idb_sanctioned_png"
@@ -97,9 +97,9 @@ async def consultar_idb_sanctioned_png(consulta_id: int, nombre: str):
 
     # 1) Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=0,
             estado="Sin Validar", mensaje=f"No se encontró la Fuente '{NOMBRE_SITIO}': {e}", archivo=""
         )
@@ -107,7 +107,7 @@ async def consultar_idb_sanctioned_png(consulta_id: int, nombre: str):
 
     nombre = (nombre or "").strip()
     if not nombre:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj, score=0,
             estado="Sin Validar", mensaje="El nombre llegó vacío.", archivo=""
         )
@@ -238,7 +238,7 @@ async def consultar_idb_sanctioned_png(consulta_id: int, nombre: str):
             _fallback_png(out_png_abs, f"BID – evidencia de búsqueda: {nombre}")
 
         # 4) Registrar
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj, score=score_final,
             estado="Validada", mensaje=mensaje_final, archivo=out_png_rel
         )
@@ -260,7 +260,7 @@ async def consultar_idb_sanctioned_png(consulta_id: int, nombre: str):
         except Exception:
             pass
 
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj, score=0,
             estado="Sin Validar",
             mensaje="No fue posible consultar la fuente del BID. Se adjunta evidencia.",
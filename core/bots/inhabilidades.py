@@ -1,11 +1,12 @@
 # consulta/inhabilidades_async.py
 import os
 from datetime import datetime, date
-from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout  # ★
+from playwright.async_api import TimeoutError as PlaywrightTimeout  # ★
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
-from asgiref.sync import sync_to_async
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 from core.resolver.captcha_v2 import resolver_captcha_v2  # async
 
 PAGE_URL = "https://inhabilidades.policia.gov.co:8080/"
@@ -40,9 +41,9 @@ async def consultar_inhabilidades(
 
     # Buscar fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=None,
             score=0,
@@ -90,7 +91,7 @@ async def consultar_inhabilidades(
                     await page.screenshot(path=absolute_path, full_page=True)
                 except Exception:
                     pass
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id,
                     fuente=fuente_obj,
                     score=0,
@@ -236,7 +237,7 @@ async def consultar_inhabilidades(
             browser = None
 
         # Registrar OK
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=score_final,
@@ -254,7 +255,7 @@ async def consultar_inhabilidades(
                 pass
         except Exception:
             pass
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
@@ -3,11 +3,11 @@ import random
 import asyncio
 import logging
 from datetime import datetime
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
-from asgiref.sync import sync_to_async
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 from core.resolver.captcha_img2 import resolver_captcha_imagen  # async
 
 logger = logging.getLogger(__name__)
@@ -72,9 +72,9 @@ async def consultar_inpec(consulta_id: int, cedula: str, apellidos: str):
     """
     # Buscar la fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=nombre_sitio)
+        fuente_obj = await aobtener_fuente(nombre_sitio)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=None,
             score=0,
@@ -245,7 +245,7 @@ async def consultar_inpec(consulta_id: int, cedula: str, apellidos: str):
                 await navegador.close()
 
                 # Guardar resultado en BD
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id,
                     fuente=fuente_obj,
                     score=score_final,
@@ -284,7 +284,7 @@ async def consultar_inpec(consulta_id: int, cedula: str, apellidos: str):
                     logger.error(error_msg)
                     
                     # Guardar error en BD
-                    await sync_to_async(Resultado.objects.create)(
+                    await crear_resultado(
                         consulta_id=consulta_id,
                         fuente=fuente_obj,
                         score=0,
@@ -5,10 +5,10 @@ import unicodedata
 from datetime import datetime
 
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 URL = "https://insightcrime.org/es/investigaciones/"
 NOMBRE_SITIO = "insightcrime_search_pdf"
@@ -78,9 +78,9 @@ async def consultar_insightcrime_search_pdf(consulta_id: int, nombre: str):
 
     # Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=0,
             estado="Sin Validar", mensaje=f"No se encontró la Fuente '{NOMBRE_SITIO}': {e}", archivo=""
         )
@@ -88,7 +88,7 @@ async def consultar_insightcrime_search_pdf(consulta_id: int, nombre: str):
 
     nombre = (nombre or "").strip()
     if not nombre:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj, score=0,
             estado="Sin Validar", mensaje="El nombre llegó vacío.", archivo=""
         )
@@ -295,7 +295,7 @@ async def consultar_insightcrime_search_pdf(consulta_id: int, nombre: str):
             normalized_query = _normalize(nombre)
 
             if total == 0:
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id, fuente=fuente_obj, score=0,
                     estado="Validada",
                     mensaje="No results found, try a different search.",
@@ -331,7 +331,7 @@ async def consultar_insightcrime_search_pdf(consulta_id: int, nombre: str):
                     else:
                         mensaje = f"Ítem sin coincidencia explícita con '{nombre}'"
 
-                    await sync_to_async(Resultado.objects.create)(
+                    await crear_resultado(
                         consulta_id=consulta_id, fuente=fuente_obj, score=score,
                         estado="Validada", mensaje=mensaje, archivo=out_png_rel
                     )
@@ -365,7 +365,7 @@ async def consultar_insightcrime_search_pdf(consulta_id: int, nombre: str):
             except Exception:
                 pass
 
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj, score=0,
             estado="Sin Validar", mensaje=str(e), archivo=err_rel
         )
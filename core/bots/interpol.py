@@ -6,11 +6,14 @@ import json
 from datetime import datetime
 from typing import Optional, List
 
-from playwright.async_api import async_playwright, Page, BrowserContext
+from playwright.async_api import Page, BrowserContext
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
 from asgiref.sync import sync_to_async
 
-from core.models import Resultado, Fuente
+from core.models import Fuente
+from core.utils.fuentes import buscar_fuente
+from core.utils.resultados import crear_resultado
 
 INTERPOL_URL = "https://www.interpol.int/es/Como-trabajamos/Notificaciones/Notificaciones-rojas/Ver-las-notificaciones-rojas"
 NOMBRE_SITIO = "interpol"
@@ -33,11 +36,10 @@ SEL_COOKIE_BTN = "button#onetrust-accept-btn-handler, button:has-text('Aceptar')
 # DB helpers
 @sync_to_async
 def _get_fuente(nombre: str) -> Optional[Fuente]:
-    return Fuente.objects.filter(nombre=nombre).first()
+    return buscar_fuente(nombre)
 
-@sync_to_async
-def _crear_resultado(consulta_id, fuente, score, estado, mensaje, archivo):
-    return Resultado.objects.create(
+async def _crear_resultado(consulta_id, fuente, score, estado, mensaje, archivo):
+    return await crear_resultado(
         consulta_id=consulta_id,
         fuente=fuente,
         score=score,
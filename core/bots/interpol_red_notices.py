@@ -5,10 +5,12 @@ import urllib.parse
 from datetime import datetime
 from typing import Optional
 
-from playwright.async_api import async_playwright, Page, BrowserContext
+from playwright.async_api import Page, BrowserContext
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
 from asgiref.sync import sync_to_async
-from core.models import Resultado, Fuente
+from core.utils.fuentes import buscar_fuente
+from core.utils.resultados import crear_resultado
 
 NOMBRE_SITIO = "interpol_red_notices"
 
@@ -19,11 +21,10 @@ INTERPOL_SEARCH_BASE = "https://www.interpol.int/es/Pagina-de-busqueda?search={q
 # DB helpers
 @sync_to_async
 def _get_fuente(nombre: str):
-    return Fuente.objects.filter(nombre=nombre).first()
+    return buscar_fuente(nombre)
 
-@sync_to_async
-def _crear_resultado(consulta_id, fuente, score, estado, mensaje, archivo):
-    return Resultado.objects.create(
+async def _crear_resultado(consulta_id, fuente, score, estado, mensaje, archivo):
+    return await crear_resultado(
         consulta_id=consulta_id,
         fuente=fuente,
         score=score,
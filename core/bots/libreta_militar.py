@@ -2,11 +2,11 @@
 from datetime import datetime
 from pathlib import Path
 
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
-from asgiref.sync import sync_to_async
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 url = "https://www.libretamilitar.mil.co/modules/consult/militarycardcertificate"
 nombre_sitio = "libreta_militar"
@@ -95,9 +95,9 @@ async def consultar_libreta_militar(consulta_id: int, cedula: str, tipo_doc: str
 
     # Buscar la fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=nombre_sitio)
+        fuente_obj = await aobtener_fuente(nombre_sitio)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=None,
             score=0,
@@ -111,7 +111,7 @@ async def consultar_libreta_militar(consulta_id: int, cedula: str, tipo_doc: str
         # Validar tipo de documento
         tipo_doc_val = TIPO_DOC_MAP.get((tipo_doc or "").upper())
         if not tipo_doc_val:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente=fuente_obj,
                 score=0,
@@ -339,7 +339,7 @@ async def consultar_libreta_militar(consulta_id: int, cedula: str, tipo_doc: str
             ctx = None
 
         # Registrar resultado (apuntamos SIEMPRE al PNG generado)
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=score_final,
@@ -349,7 +349,7 @@ async def consultar_libreta_militar(consulta_id: int, cedula: str, tipo_doc: str
         )
 
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
@@ -4,11 +4,12 @@ import asyncio
 from datetime import datetime
 from typing import Optional
 
-from playwright.async_api import async_playwright, Page, Response
+from playwright.async_api import Page, Response
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
-from asgiref.sync import sync_to_async
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 from core.resolver.captcha_v2 import resolver_captcha_v2  # versión async que devuelve token
 
 URL = "https://wsp.registraduria.gov.co/censo/consultar/"
@@ -52,9 +53,9 @@ async def consultar_lugar_votacion(consulta_id: int, cedula: str):
 
     # Buscar la fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=None,
             score=0,
@@ -341,7 +342,7 @@ async def consultar_lugar_votacion(consulta_id: int, cedula: str):
             navegador = None
 
         # Registrar OK (usando el score y mensaje calculados)
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=score_final,
@@ -360,7 +361,7 @@ async def consultar_lugar_votacion(consulta_id: int, cedula: str):
             pass
 
         try:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente=fuente_obj,
                 score=0,
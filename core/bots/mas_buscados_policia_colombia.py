@@ -1,12 +1,12 @@
 import os
 from datetime import datetime
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
-from asgiref.sync import sync_to_async
 import zipfile
 
 # Ajusta a tu app real
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 url = "https://www.policia.gov.co/los-mas-buscados-colombia"
 nombre_sitio = "mas_buscados_policia_colombia"
@@ -18,9 +18,9 @@ async def consultar_mas_buscados_policia_colombia(consulta_id: int, cedula: str,
 
     # Buscar la fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=nombre_sitio)
+        fuente_obj = await aobtener_fuente(nombre_sitio)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=None,
             score=0,
@@ -139,7 +139,7 @@ async def consultar_mas_buscados_policia_colombia(consulta_id: int, cedula: str,
                     for abs_path in encontrados_paths_abs:
                         zf.write(abs_path, arcname=os.path.basename(abs_path))
 
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente=fuente_obj,
                 score=10,  # hay hallazgos
@@ -149,7 +149,7 @@ async def consultar_mas_buscados_policia_colombia(consulta_id: int, cedula: str,
             )
         else:
             # sin hallazgos -> adjuntamos la captura
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente=fuente_obj,
                 score=0,  # sin hallazgos
@@ -161,7 +161,7 @@ async def consultar_mas_buscados_policia_colombia(consulta_id: int, cedula: str,
     except Exception as e:
         # Registrar error
         try:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente=fuente_obj,
                 score=0,
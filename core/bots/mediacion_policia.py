@@ -3,10 +3,11 @@ import os
 import re
 import asyncio
 from datetime import datetime, date
-from playwright.async_api import async_playwright, TimeoutError as PWTimeoutError
+from playwright.async_api import TimeoutError as PWTimeoutError
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 URL_MEDIACION = "https://srvcnpc.policia.gov.co/PSC/frm_consultaMediacion.aspx"
 NOMBRE_SITIO = "consulta_mediacion"
@@ -55,9 +56,9 @@ async def consultar_mediacion(consulta_id, cedula, tipo_doc, fecha_expedicion):
     ts = datetime.now().strftime("%Y%m%d_%H%M%S")
 
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=0,
             estado="Sin validar", mensaje=f"No se encontró la Fuente '{NOMBRE_SITIO}': {e}", archivo=""
         )
@@ -183,7 +184,7 @@ async def consultar_mediacion(consulta_id, cedula, tipo_doc, fecha_expedicion):
                     score = 5
                     mensaje = "Registra información diferente a 'NO TIENE MEDIACIONES POLICIALES POR ASISTIR.' (ver captura)."
 
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id, fuente=fuente_obj,
                     score=score, estado="Validado", mensaje=mensaje, archivo=rel_png
                 )
@@ -207,7 +208,7 @@ async def consultar_mediacion(consulta_id, cedula, tipo_doc, fecha_expedicion):
             except Exception:
                 pass
             if intento == MAX_INTENTOS:
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id, fuente=fuente_obj, score=0,
                     estado="Sin validar", mensaje=f"Error tras {MAX_INTENTOS} intentos: {str(e)}",
                     archivo=err if err else ""
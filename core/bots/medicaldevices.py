@@ -22,10 +22,10 @@ import argparse
 from datetime import datetime
 
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 # -------------------------
 # Config / utilitarios
@@ -81,9 +81,9 @@ async def consultar_medical_devices(consulta_id: int, nombre_empresa: str, headl
 
     # 1) Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=0,
             estado="Sin Validar", mensaje=f"No se encontró la Fuente '{NOMBRE_SITIO}': {e}", archivo=""
         )
@@ -211,7 +211,7 @@ async def consultar_medical_devices(consulta_id: int, nombre_empresa: str, headl
                     _ = await _save_screenshot_only(page, absolute_folder, "after_goto_headful", full_page=True)
 
                     mensaje_final = "Bloqueo detectado en modo headless. Artefactos generados para revisión humana."
-                    await sync_to_async(Resultado.objects.create)(
+                    await crear_resultado(
                         consulta_id=consulta_id, fuente=fuente_obj,
                         score=0, estado="Sin Validar",
                         mensaje=mensaje_final,
@@ -335,7 +335,7 @@ async def consultar_medical_devices(consulta_id: int, nombre_empresa: str, headl
             navegador = None
 
         # Guardar resultado en BD
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj,
             score=score_final, estado="Validada",
             mensaje=mensaje_final, archivo=rel_png
@@ -343,7 +343,7 @@ async def consultar_medical_devices(consulta_id: int, nombre_empresa: str, headl
 
     except Exception as e:
         try:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id, fuente=fuente_obj,
                 score=0, estado="Sin Validar",
                 mensaje=str(e), archivo=""
@@ -373,7 +373,7 @@ async def main_async(args):
     if bot == "medicaldevices":
         await consultar_medical_devices(consulta_id=args.consulta_id, nombre_empresa=args.nombre, headless=args.headless)
     else:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=args.consulta_id, fuente=None, score=0,
             estado="Sin Validar", mensaje=f"No hay implementación para el bot '{args.bot}'", archivo=""
         )
@@ -2,11 +2,12 @@ import os
 import asyncio
 import random
 from datetime import datetime
-from playwright.async_api import async_playwright, TimeoutError as PWTimeoutError
+from playwright.async_api import TimeoutError as PWTimeoutError
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
-from asgiref.sync import sync_to_async
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 from core.resolver.captcha_v2 import resolver_captcha_v2
 
 PAGE_URL = "https://cfiscal.contraloria.gov.co/certificados/certificadopersonanatural.aspx"
@@ -34,9 +35,9 @@ async def consultar_medidas_correctivas(consulta_id: int, cedula: str, tipo_doc:
 
     # Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=0,
             estado="Sin Validar", mensaje=f"No se encontró la Fuente '{NOMBRE_SITIO}': {e}", archivo=""
         )
@@ -142,7 +143,7 @@ async def consultar_medidas_correctivas(consulta_id: int, cedula: str, tipo_doc:
             browser = None
 
         # ⬇️ AQUÍ EL CAMBIO DE MENSAJE Y SCORE
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
@@ -156,7 +157,7 @@ async def consultar_medidas_correctivas(consulta_id: int, cedula: str, tipo_doc:
         absolute_path = locals().get('absolute_path', 'error_screenshot.png')
         relative_path = locals().get('relative_path', '')
         try:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id, fuente=fuente_obj, score=0,
                 estado="Sin Validar", mensaje=err, archivo=relative_path
             )
@@ -8,11 +8,11 @@ import logging
 from datetime import datetime
 
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 import fitz  # PyMuPDF
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import abuscar_fuente
+from core.utils.resultados import crear_resultado
 
 logger = logging.getLogger(__name__)
 
@@ -115,9 +115,9 @@ async def consultar_mha_individual_terrorists_pdf(consulta_id: int, nombre: str,
     - Retry logic con 3 intentos
     """
     # Fuente
-    fuente_obj = await sync_to_async(lambda: Fuente.objects.filter(nombre=NOMBRE_SITIO).first())()
+    fuente_obj = await abuscar_fuente(NOMBRE_SITIO)
     if not fuente_obj:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=None,
             score=0,
@@ -346,7 +346,7 @@ async def consultar_mha_individual_terrorists_pdf(consulta_id: int, nombre: str,
                 logger.info(f"PNG generado: {abs_png}")
 
             # Guardar Resultado apuntando al PNG
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente=fuente_obj,
                 score=0,
@@ -403,7 +403,7 @@ async def consultar_mha_individual_terrorists_pdf(consulta_id: int, nombre: str,
                 error_msg = f"Error después de {MAX_INTENTOS} intentos: {str(e)}"
                 logger.error(error_msg)
                 
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id,
                     fuente=fuente_obj,
                     score=0,
@@ -1,11 +1,11 @@
 import os
 from datetime import datetime
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
-from asgiref.sync import sync_to_async
 
 # Ajusta a tu app real
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 nombre_sitio = "mincit"
 URL = "https://web.mincit.gov.co/disenoindustrial/index.php"
@@ -17,9 +17,9 @@ async def consultar_mintic(consulta_id: int, cedula: str):
 
     # Buscar la fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=nombre_sitio)
+        fuente_obj = await aobtener_fuente(nombre_sitio)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=None,
             score=0,
@@ -61,7 +61,7 @@ async def consultar_mintic(consulta_id: int, cedula: str):
             navegador = None
 
         # Registrar OK
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
@@ -75,7 +75,7 @@ async def consultar_mintic(consulta_id: int, cedula: str):
         absolute_path = locals().get('absolute_path', 'error_screenshot.png')
         relative_path = locals().get('relative_path', '')
         try:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente=fuente_obj,
                 score=0,
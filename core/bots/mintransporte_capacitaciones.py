@@ -5,10 +5,10 @@ import asyncio
 from datetime import datetime
 
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright, TimeoutError as PWTimeout
-
-from core.models import Resultado, Fuente
+from playwright.async_api import TimeoutError as PWTimeout
+from core.utils.browser_pool import async_playwright
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 NOMBRE_SITIO = "mintransporte_capacitaciones"
 URL = "https://web.mintransporte.gov.co/sisconmp2/consultascapacitaciones/"
@@ -41,7 +41,7 @@ EXTRA_RESULT_SLEEP   = 2000
 DOC_TYPE_MAP = {"CC": "CC", "CE": "CE", "TI": "TI", "PA": "PA", "NIT": "NIT"}
 
 async def _registrar(consulta_id, fuente, estado, mensaje, archivo, score: int = 0):
-    await sync_to_async(Resultado.objects.create)(
+    await crear_resultado(
         consulta_id=consulta_id,
         fuente=fuente,
         score=score,
@@ -59,7 +59,7 @@ async def consultar_mintransporte_capacitaciones(
 
     # 1) Fuente
     try:
-        fuente = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
         await _registrar(consulta_id, None, "Sin Validar",
                          f"No se encontró Fuente '{NOMBRE_SITIO}': {e}", "", score=0)
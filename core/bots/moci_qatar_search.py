@@ -8,10 +8,10 @@ import json
 from datetime import datetime
 
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
-
-from core.models import Resultado, Fuente
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from core.utils.browser_pool import async_playwright
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 NOMBRE_SITIO = "moci_qatar_search"
 URL_SEARCH = "https://www.moci.gov.qa/en/?s={q}"
@@ -79,16 +79,16 @@ async def consultar_moci_qatar_search(consulta_id: int, nombre: str, apellido: s
 
     # Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=1,
             estado="Sin Validar", mensaje=f"No se encontró la Fuente '{NOMBRE_SITIO}': {e}", archivo=""
         )
         return
 
     if not full_name:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj, score=1,
             estado="Sin Validar", mensaje="Nombre y/o apellido vacíos para la consulta.", archivo=""
         )
@@ -228,14 +228,14 @@ async def consultar_moci_qatar_search(consulta_id: int, nombre: str, apellido: s
                     mensaje_final = "Bloqueo detectado (headless). Evidencia capturada en modo headful."
                     # Si se guardó la captura, marcar como Validada
                     if evidencia_png:
-                        await sync_to_async(Resultado.objects.create)(
+                        await crear_resultado(
                             consulta_id=consulta_id, fuente=fuente_obj,
                             score=1, estado="Validada",
                             mensaje=mensaje_final,
                             archivo=os.path.join(relative_folder, os.path.basename(evidencia_png)).replace("\\", "/")
                         )
                     else:
-                        await sync_to_async(Resultado.objects.create)(
+                        await crear_resultado(
                             consulta_id=consulta_id, fuente=fuente_obj,
                             score=1, estado="Sin Validar",
                             mensaje=mensaje_final,
@@ -290,13 +290,13 @@ async def consultar_moci_qatar_search(consulta_id: int, nombre: str, apellido: s
 
         # Persistencia
         if success:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id, fuente=fuente_obj,
                 score=score_final, estado="Validada",
                 mensaje=mensaje_final, archivo=relative_png
             )
         else:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id, fuente=fuente_obj,
                 score=1, estado="Sin Validar",
                 mensaje=last_error or "No fue posible obtener resultados.", archivo=relative_png
@@ -304,7 +304,7 @@ async def consultar_moci_qatar_search(consulta_id: int, nombre: str, apellido: s
 
     except Exception as e:
         try:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id, fuente=fuente_obj,
                 score=1, estado="Sin Validar",
                 mensaje=str(e), archivo=""
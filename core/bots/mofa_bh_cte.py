@@ -7,10 +7,10 @@ import unicodedata
 from datetime import datetime
 
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 NOMBRE_SITIO = "mofa_bh_cte"
 URL_SEARCH = "https://www.mofa.gov.bh/en/search?keyword={q}"
@@ -187,9 +187,9 @@ async def consultar_mofa_bh_cte(consulta_id: int, nombre: str, apellido: str, he
 
     # Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=1,
             estado="Sin Validar",
             mensaje=f"No se encontró la Fuente '{NOMBRE_SITIO}': {e}",
@@ -198,7 +198,7 @@ async def consultar_mofa_bh_cte(consulta_id: int, nombre: str, apellido: str, he
         return
 
     if not full_name:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj, score=1,
             estado="Sin Validar",
             mensaje="Nombre y/o apellido vacíos para la consulta.",
@@ -335,14 +335,14 @@ async def consultar_mofa_bh_cte(consulta_id: int, nombre: str, apellido: str, he
                     mensaje_final = "Bloqueo detectado (headless). Evidencia capturada en modo headful."
                     # If screenshot was saved, treat as valid evidence
                     if evidencia_png:
-                        await sync_to_async(Resultado.objects.create)(
+                        await crear_resultado(
                             consulta_id=consulta_id, fuente=fuente_obj,
                             score=1, estado="Validada",
                             mensaje=mensaje_final,
                             archivo=os.path.join(relative_folder, os.path.basename(evidencia_png)).replace("\\", "/")
                         )
                     else:
-                        await sync_to_async(Resultado.objects.create)(
+                        await crear_resultado(
                             consulta_id=consulta_id, fuente=fuente_obj,
                             score=1, estado="Sin Validar",
                             mensaje=mensaje_final,
@@ -404,13 +404,13 @@ async def consultar_mofa_bh_cte(consulta_id: int, nombre: str, apellido: str, he
 
         # 8) Persistencia
         if success:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id, fuente=fuente_obj,
                 score=score_final, estado="Validada",
                 mensaje=mensaje_final, archivo=relative_png
             )
         else:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id, fuente=fuente_obj,
                 score=1, estado="Sin Validar",
                 mensaje=last_error or "No fue posible obtener resultados.", archivo=relative_png
@@ -418,7 +418,7 @@ async def consultar_mofa_bh_cte(consulta_id: int, nombre: str, apellido: str, he
 
     except Exception as e:
         try:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id, fuente=fuente_obj,
                 score=1, estado="Sin Validar",
                 mensaje=str(e), archivo=""
@@ -3,11 +3,11 @@ import re
 from datetime import datetime
 from urllib.parse import urlparse, parse_qs
 
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
-from asgiref.sync import sync_to_async
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 from core.resolver.captcha_v2 import resolver_captcha_v2
 
 url = "https://webfenix.movilidadbogota.gov.co/#/consulta-pagos"
@@ -130,9 +130,9 @@ async def consultar_movilidad_bogota(consulta_id: int, cedula: str, tipo_doc: st
 
     # Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=nombre_sitio)
+        fuente_obj = await aobtener_fuente(nombre_sitio)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=0,
             estado="Sin Validar", mensaje=f"No se encontró la Fuente '{nombre_sitio}': {e}", archivo=""
         )
@@ -141,7 +141,7 @@ async def consultar_movilidad_bogota(consulta_id: int, cedula: str, tipo_doc: st
     try:
         tipo_doc_val = TIPO_DOC_MAP.get((tipo_doc or "").upper())
         if not tipo_doc_val:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id, fuente=fuente_obj, score=0,
                 estado="Sin Validar", mensaje=f"Tipo de documento no soportado: {tipo_doc}", archivo=""
             )
@@ -242,7 +242,7 @@ async def consultar_movilidad_bogota(consulta_id: int, cedula: str, tipo_doc: st
             navegador = None
 
         # Registrar
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=score_final,
@@ -255,7 +255,7 @@ async def consultar_movilidad_bogota(consulta_id: int, cedula: str, tipo_doc: st
         absolute_path = locals().get('absolute_path', 'error_screenshot.png')
         relative_path = locals().get('relative_path', '')
         try:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente=fuente_obj,
                 score=0,
@@ -1,12 +1,13 @@
 # bots/nbctf_downloads.py
-import os, re, urllib.parse, unicodedata
+import os, re, urllib.parse
 from datetime import datetime
 
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
+from core.matching import similitud
 
 NOMBRE_SITIO   = "nbctf_downloads"
 # Restringimos la búsqueda a la página que pediste (u=)
@@ -22,22 +23,15 @@ SEL_NORES             = "div.ms-textLarge.ms-srch-result-noResultsTitle"  # "Not
 SEL_ITEM_BODY_STRICT  = "div#ctl00_ctl81_g_1363b887_176a_4e5a_aafb_40a57fcdc3de_csr2_item_itemBody"
 SEL_ITEM_BODY_LOOSE   = "div[id$='_csr2_item_itemBody']"  # fallback robusto
 
-def _norm(s: str) -> str:
-    """Normaliza: minúsculas, sin tildes, espacios comprimidos."""
-    s = (s or "").strip().lower()
-    s = "".join(c for c in unicodedata.normalize("NFD", s) if unicodedata.category(c) != "Mn")
-    s = re.sub(r"\s+", " ", s)
-    return s
-
 async def consultar_nbctf_downloads(consulta_id: int, nombre: str, apellido: str):
     navegador = None
     full_name = f"{(nombre or '').strip()} {(apellido or '').strip()}".strip()
 
     # 1) Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=1,
             estado="Sin Validar",
             mensaje=f"No se encontró la Fuente '{NOMBRE_SITIO}': {e}",
@@ -46,7 +40,7 @@ async def consultar_nbctf_downloads(consulta_id: int, nombre: str, apellido: str
         return
 
     if not full_name:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj, score=1,
             estado="Sin Validar",
             mensaje="Nombre y/o apellido vacíos para la consulta.",
@@ -69,7 +63,6 @@ async def consultar_nbctf_downloads(consulta_id: int, nombre: str, apellido: str
     success = False
     last_error = None
     score_final = 1
-    norm_query = _norm(full_name)
 
     try:
         async with async_playwright() as p:
@@ -117,7 +110,7 @@ async def consultar_nbctf_downloads(consulta_id: int, nombre: str, apellido: str
                     items = page.locator(SEL_ITEM_BODY_LOOSE)
 
                 n = await items.count()
-                exact_hit = False
+                lineas = []
 
                 for i in range(n):
                     item = items.nth(i)
@@ -126,20 +119,15 @@ async def consultar_nbctf_downloads(consulta_id: int, nombre: str, apellido: str
                     except Exception:
                         blob = ""
 
-                    if not blob:
-                        continue
-
-                    # Búsqueda exacta por líneas (título/encabezado suele ir en su propia línea)
-                    for line in re.split(r"[\r\n]+", blob):
-                        if _norm(line) == norm_query:
-                            exact_hit = True
-                            break
-                    if exact_hit:
-                        break
+                    # Comparación por líneas (título/encabezado suele ir en su propia línea)
+                    lineas.extend(re.split(r"[\r\n]+", blob))
 
-                if exact_hit:
-                    score_final = 5
+                linea, sim = similitud.mejor(full_name, lineas)
+                score_final = similitud.a_score(sim)
+                if score_final == 5:
                     mensaje_final = f"Coincidencia exacta con el nombre buscado: '{full_name}'."
+                elif score_final == 3:
+                    mensaje_final = f"Posible coincidencia con '{full_name}': '{linea.strip()}' (similitud {sim:.2f})."
                 else:
                     score_final = 1
                     mensaje_final = "Se encontraron resultados, pero sin coincidencia exacta del nombre."
@@ -160,7 +148,7 @@ async def consultar_nbctf_downloads(consulta_id: int, nombre: str, apellido: str
 
         # 7) Guardar Resultado
         if success:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id, fuente=fuente_obj,
                 score=score_final,
                 estado="Validada",
@@ -168,7 +156,7 @@ async def consultar_nbctf_downloads(consulta_id: int, nombre: str, apellido: str
                 archivo=relative_png
             )
         else:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id, fuente=fuente_obj,
                 score=1, estado="Sin Validar",
                 mensaje=last_error or "No fue posible obtener resultados.",
@@ -177,7 +165,7 @@ async def consultar_nbctf_downloads(consulta_id: int, nombre: str, apellido: str
 
     except Exception as e:
         try:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id, fuente=fuente_obj,
                 score=1, estado="Sin Validar",
                 mensaje=str(e), archivo=""
@@ -1,10 +1,10 @@
 import os
 import re
 from datetime import datetime
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 URL = "https://www.nationalcrimeagency.gov.uk/most-wanted"
 NOMBRE_SITIO = "nca_most_wanted"
@@ -42,8 +42,8 @@ COOKIE_BTN = "#ccc-recommended-settings"
 async def consultar_nca_most_wanted_pdf(consulta_id: int, nombre: str, cedula):
     nombre = (nombre or "").strip()
     if not nombre:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
-        await sync_to_async(Resultado.objects.create)(
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
@@ -124,8 +124,8 @@ async def consultar_nca_most_wanted_pdf(consulta_id: int, nombre: str, cedula):
             await browser.close()
 
         # Guardar en BD
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
-        await sync_to_async(Resultado.objects.create)(
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=score,
@@ -139,8 +139,8 @@ async def consultar_nca_most_wanted_pdf(consulta_id: int, nombre: str, cedula):
             await _screenshot_page(page, screenshot_abs)
         except Exception:
             pass
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
-        await sync_to_async(Resultado.objects.create)(
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
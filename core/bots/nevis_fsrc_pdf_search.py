@@ -1,10 +1,10 @@
 # core/bots/nevis_fsrc_pdf_search.py
 import os
 from datetime import datetime
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 URL = (
     "https://www.nevisfsrc.com/themencode-pdf-viewer-sc/"
@@ -96,8 +96,8 @@ async def consultar_nevis_fsrc_pdf_search(consulta_id: int, cedula, nombre: str,
                 archivos.append(rel_path)
 
                 # Crear un Resultado por cada captura
-                fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
-                await sync_to_async(Resultado.objects.create)(
+                fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
+                await crear_resultado(
                     consulta_id=consulta_id,
                     fuente=fuente_obj,
                     score=0,
@@ -113,8 +113,8 @@ async def consultar_nevis_fsrc_pdf_search(consulta_id: int, cedula, nombre: str,
 
     except Exception as e:
         # Guardar error único
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
-        await sync_to_async(Resultado.objects.create)(
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
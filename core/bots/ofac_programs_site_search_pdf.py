@@ -4,12 +4,12 @@ import re
 import unicodedata
 from datetime import datetime
 
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
-from asgiref.sync import sync_to_async
 import fitz  # PyMuPDF
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import abuscar_fuente
+from core.utils.resultados import crear_resultado
 
 URL = "https://ofac.treasury.gov/sanctions-programs-and-country-information"
 NOMBRE_SITIO = "ofac_programs_sactions"  # Asegúrate que coincide con Fuente.nombre en BD
@@ -71,9 +71,9 @@ async def consultar_ofac_programs_site_search_pdf(consulta_id: int, nombre: str,
     - Si hay 403/CloudFront, deja mensaje y estado 'Sin validar'.
     """
     # Fuente
-    fuente_obj = await sync_to_async(lambda: Fuente.objects.filter(nombre=NOMBRE_SITIO).first())()
+    fuente_obj = await abuscar_fuente(NOMBRE_SITIO)
     if not fuente_obj:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=None,
             score=0,
@@ -175,7 +175,7 @@ async def consultar_ofac_programs_site_search_pdf(consulta_id: int, nombre: str,
             estado = "Sin validar"
 
         # Guardar resultado apuntando al PNG
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
@@ -199,7 +199,7 @@ async def consultar_ofac_programs_site_search_pdf(consulta_id: int, nombre: str,
         except Exception:
             pass
 
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
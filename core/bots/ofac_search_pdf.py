@@ -2,10 +2,10 @@ import os
 import datetime
 import aiohttp
 from bs4 import BeautifulSoup
-from asgiref.sync import sync_to_async
 from django.conf import settings
 from PIL import Image, ImageDraw, ImageFont
-from core.models import Resultado, Fuente  # ajusta según tu app
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 
 nombre_sitio="ofac"
@@ -59,10 +59,10 @@ async def consultar_ofac_pdf(consulta_id: int, cedula: str, nombre: str):
     img.save(imagen_path)
 
     # Guardar resultado en BD
-    fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=nombre_sitio)  # ajusta si usas otra lógica
+    fuente_obj = await aobtener_fuente(nombre_sitio)  # ajusta si usas otra lógica
     archivo_relativo = os.path.join(relative_folder, "resultado.png")
 
-    await sync_to_async(Resultado.objects.create)(
+    await crear_resultado(
         consulta_id=consulta_id,
         fuente=fuente_obj,
         score=score,
@@ -5,10 +5,10 @@ import unicodedata
 import urllib.parse
 import asyncio
 from datetime import datetime
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 URL = "https://offshoreleaks.icij.org/"
 NOMBRE_SITIO = "offshore"
@@ -340,10 +340,10 @@ async def consultar_offshore(consulta_id: int, nombre: str, cedula, headless=Tru
                     await browser.close()
                 except Exception:
                     pass
-            fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+            fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
             score = 5 if found_exact else 1
             mensaje = "Coincidencia exacta encontrada" if score == 5 else "Sin coincidencia exacta en resultados"
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente=fuente_obj,
                 score=score,
@@ -369,8 +369,8 @@ async def consultar_offshore(consulta_id: int, nombre: str, cedula, headless=Tru
             if intentos < max_intentos:
                 await asyncio.sleep(1.0)
                 continue
-    fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
-    await sync_to_async(Resultado.objects.create)(
+    fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
+    await crear_resultado(
         consulta_id=consulta_id,
         fuente=fuente_obj,
         score=0,
@@ -4,10 +4,10 @@ import re
 import unicodedata
 import asyncio
 from datetime import datetime
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 URL = "https://offshoreleaks.icij.org/investigations/bahamas-leaks"
 NOMBRE_SITIO = "offshore_bahamas"
@@ -41,9 +41,9 @@ async def consultar_offshore_bahamas(consulta_id: int, nombre: str, cedula):
 
     # Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=None,
             score=0,
@@ -54,7 +54,7 @@ async def consultar_offshore_bahamas(consulta_id: int, nombre: str, cedula):
         return
 
     if not nombre:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
@@ -196,7 +196,7 @@ async def consultar_offshore_bahamas(consulta_id: int, nombre: str, cedula):
                     pass
 
             # Guardar resultado exitoso (con mensaje)
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente=fuente_obj,
                 score=score,
@@ -227,7 +227,7 @@ async def consultar_offshore_bahamas(consulta_id: int, nombre: str, cedula):
 
             # Último intento => registrar error
             if intento == 3:
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id,
                     fuente=fuente_obj,
                     score=0,
@@ -3,10 +3,10 @@ import os
 import re
 import asyncio
 from datetime import datetime
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 URL = "https://offshoreleaks.icij.org/investigations/offshore-leaks"
 NOMBRE_SITIO = "offshore_offshoreleaks"
@@ -25,7 +25,7 @@ async def consultar_offshore_offshoreleaks(consulta_id: int, nombre: str, cedula
     safe = re.sub(r"\s+", "_", (nombre or "consulta").strip()) or "consulta"
     ts = datetime.now().strftime("%Y%m%d_%H%M%S")
 
-    fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+    fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
 
     for intento in range(1, 4):
         try:
@@ -99,7 +99,7 @@ async def consultar_offshore_offshoreleaks(consulta_id: int, nombre: str, cedula
                 await browser.close()
 
             # ✅ Si llegó hasta aquí, guardamos resultado y salimos del bucle
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente=fuente_obj,
                 score=0,
@@ -123,7 +123,7 @@ async def consultar_offshore_offshoreleaks(consulta_id: int, nombre: str, cedula
 
             # Si es el tercer intento → guardar error en BD
             if intento == 3:
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id,
                     fuente=fuente_obj,
                     score=0,
@@ -4,10 +4,10 @@ import re
 import unicodedata
 import asyncio
 from datetime import datetime
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 URL = "https://offshoreleaks.icij.org/investigations/panama-papers"
 NOMBRE_SITIO = "offshore_panama"
@@ -45,9 +45,9 @@ async def consultar_offshore_panama(consulta_id: int, cedula: str, nombre: str):
 
     # Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=None,
             score=0,
@@ -58,7 +58,7 @@ async def consultar_offshore_panama(consulta_id: int, cedula: str, nombre: str):
         return
 
     if not nombre:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
@@ -199,7 +199,7 @@ async def consultar_offshore_panama(consulta_id: int, cedula: str, nombre: str):
                     pass
 
             # Guardar resultado exitoso
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente=fuente_obj,
                 score=score,
@@ -230,7 +230,7 @@ async def consultar_offshore_panama(consulta_id: int, cedula: str, nombre: str):
 
             # Último intento → guardar error
             if intento == 3:
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id,
                     fuente=fuente_obj,
                     score=0,
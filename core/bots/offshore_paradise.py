@@ -3,10 +3,10 @@ import os
 import re
 import unicodedata
 from datetime import datetime
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 URL = "https://offshoreleaks.icij.org/investigations/paradise-papers"
 NOMBRE_SITIO = "offshore_paradise"
@@ -44,9 +44,9 @@ async def consultar_offshore_paradise(consulta_id: int, cedula: str, nombre: str
 
     # Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=None,
             score=0,
@@ -57,7 +57,7 @@ async def consultar_offshore_paradise(consulta_id: int, cedula: str, nombre: str
         return
 
     if not nombre:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
@@ -192,7 +192,7 @@ async def consultar_offshore_paradise(consulta_id: int, cedula: str, nombre: str
                     pass
 
             # Guardar resultado exitoso
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente=fuente_obj,
                 score=score,
@@ -224,7 +224,7 @@ async def consultar_offshore_paradise(consulta_id: int, cedula: str, nombre: str
                     pass
 
             if intento == 3:
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id,
                     fuente=fuente_obj,
                     score=0,
@@ -1,10 +1,10 @@
 import os
 import re
 from datetime import datetime
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 URL = "https://ofsistorage.blob.core.windows.net/publishlive/2022format/ConList.html"
 NOMBRE_SITIO = "ofsi_consolidated_html"
@@ -94,8 +94,8 @@ async def consultar_ofsi_conlist_html(consulta_id: int, cedula: str, nombre: str
                     archivos.append(os.path.join(relative_folder, os.path.basename(out_abs)))
                     await browser.close()
 
-                    fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
-                    await sync_to_async(Resultado.objects.create)(
+                    fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
+                    await crear_resultado(
                         consulta_id=consulta_id,
                         fuente=fuente_obj,
                         score=0,
@@ -166,8 +166,8 @@ async def consultar_ofsi_conlist_html(consulta_id: int, cedula: str, nombre: str
                 await browser.close()
 
             # Guardar resultado si salió bien
-            fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
-            await sync_to_async(Resultado.objects.create)(
+            fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente=fuente_obj,
                 score=0 if total == 0 else 10,
@@ -196,8 +196,8 @@ async def consultar_ofsi_conlist_html(consulta_id: int, cedula: str, nombre: str
 
     # Si llegó aquí es porque falló en los 3 intentos → Guardar en BD como error
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
-        await sync_to_async(Resultado.objects.create)(
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
@@ -2,10 +2,10 @@
 import os
 import re
 from datetime import datetime
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 URL = "https://sanctionssearchapp.ofsi.hmtreasury.gov.uk/"
 NOMBRE_SITIO = "ofsi_sanctions"
@@ -174,8 +174,8 @@ async def consultar_ofsi_pdf(consulta_id: int, nombre: str, cedula):
                 estado = "Sin validar"
 
     # Guardar en la BD
-    fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
-    await sync_to_async(Resultado.objects.create)(
+    fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
+    await crear_resultado(
         consulta_id=consulta_id,
         fuente=fuente_obj,
         score=score,
@@ -3,10 +3,10 @@ import os, re, urllib.parse, unicodedata
 from datetime import datetime
 
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 NOMBRE_SITIO = "opensanctions_au_dfat"  # Asegúrate de crear esta Fuente en tu BD
 URL_SEARCH   = "https://www.opensanctions.org/search/?scope=au_dfat_sanctions&q={q}"
@@ -30,9 +30,9 @@ async def consultar_opensanctions_au_dfat(consulta_id: int, nombre: str, apellid
 
     # 1) Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=1,
             estado="Sin Validar",
             mensaje=f"No se encontró la Fuente '{NOMBRE_SITIO}': {e}",
@@ -41,7 +41,7 @@ async def consultar_opensanctions_au_dfat(consulta_id: int, nombre: str, apellid
         return
 
     if not full_name:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj, score=1,
             estado="Sin Validar",
             mensaje="Nombre y/o apellido vacíos para la consulta.",
@@ -141,7 +141,7 @@ async def consultar_opensanctions_au_dfat(consulta_id: int, nombre: str, apellid
 
         # 7) Persistencia Resultado
         if success:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id, fuente=fuente_obj,
                 score=score_final,
                 estado="Validada",
@@ -149,7 +149,7 @@ async def consultar_opensanctions_au_dfat(consulta_id: int, nombre: str, apellid
                 archivo=relative_png
             )
         else:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id, fuente=fuente_obj,
                 score=1, estado="Sin Validar",
                 mensaje="No fue posible obtener resultados.",
@@ -158,7 +158,7 @@ async def consultar_opensanctions_au_dfat(consulta_id: int, nombre: str, apellid
 
     except Exception as e:
         try:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id, fuente=fuente_obj,
                 score=1, estado="Sin Validar",
                 mensaje=str(e), archivo=""
@@ -1,10 +1,10 @@
 # bots/opensanctions_us_ofac_cons_img.py
 import os
 from datetime import datetime
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 URL = "https://www.opensanctions.org/datasets/us_ofac_cons/"
 NOMBRE_SITIO = "opensanctions_us_ofac_cons"
@@ -82,10 +82,10 @@ async def _run_scraper(nombre, cedula, out_img_abs):
 
 async def consultar_opensanctions_us_ofac_cons_pdf(consulta_id: int, nombre: str, cedula):
     nombre = (nombre or "").strip()
-    fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+    fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
 
     if not nombre:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
@@ -117,7 +117,7 @@ async def consultar_opensanctions_us_ofac_cons_pdf(consulta_id: int, nombre: str
             score = 0
 
     # Guardar resultado
-    await sync_to_async(Resultado.objects.create)(
+    await crear_resultado(
         consulta_id=consulta_id,
         fuente=fuente_obj,
         score=score if success else 0,
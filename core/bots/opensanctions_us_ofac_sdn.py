@@ -1,12 +1,13 @@
 # bots/opensanctions_us_ofac_sdn.py
-import os, re, asyncio, urllib.parse, unicodedata
+import os, re, asyncio, urllib.parse
 from datetime import datetime
 
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
+from core.matching import similitud
 
 NOMBRE_SITIO = "opensanctions_us_ofac_sdn"  # Asegúrate de tener esta Fuente en BD
 URL_SEARCH = "https://www.opensanctions.org/search/?scope=us_ofac_sdn&q={q}"
@@ -18,22 +19,15 @@ SEL_LIST        = "ul[class*='Search_resultList']"
 SEL_ITEM        = "li[class*='Search_resultItem']"
 SEL_TITLE_A     = "div[class*='Search_resultTitle'] a"
 
-def _norm(s: str) -> str:
-    """Normaliza para comparación exacta: quita tildes, minúsculas y comprime espacios."""
-    s = (s or "").strip().lower()
-    s = "".join(c for c in unicodedata.normalize("NFD", s) if unicodedata.category(c) != "Mn")
-    s = re.sub(r"\s+", " ", s)
-    return s
-
 async def consultar_opensanctions_us_ofac_sdn(consulta_id: int, nombre: str, apellido: str):
     navegador = None
     full_name = f"{(nombre or '').strip()} {(apellido or '').strip()}".strip()
 
     # 1) Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=1,
             estado="Sin Validar",
             mensaje=f"No se encontró la Fuente '{NOMBRE_SITIO}': {e}",
@@ -42,7 +36,7 @@ async def consultar_opensanctions_us_ofac_sdn(consulta_id: int, nombre: str, ape
         return
 
     if not full_name:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj, score=1,
             estado="Sin Validar",
             mensaje="Nombre y/o apellido vacíos para la consulta.",
@@ -64,9 +58,7 @@ async def consultar_opensanctions_us_ofac_sdn(consulta_id: int, nombre: str, ape
     mensaje_final = "No hay coincidencias."
     success = False
     last_error = None
-    score_final = 1  # por defecto 1; sube a 5 si hay match exacto
-
-    norm_query = _norm(full_name)
+    score_final = 1  # por defecto 1; 5 si coincide el nombre, 3 si es parecido
 
     try:
         async with async_playwright() as p:
@@ -105,25 +97,24 @@ async def consultar_opensanctions_us_ofac_sdn(consulta_id: int, nombre: str, ape
                 success = True  # consulta válida sin hallazgos (score=1)
 
             else:
-                # 5) Hay lista de resultados: iterar y chequear match exacto del título
+                # 5) Hay lista de resultados: puntuar los títulos contra el nombre buscado
                 items = page.locator(f"{SEL_LIST} {SEL_ITEM}")
                 n = await items.count()
-                exact_hit = False
+                titulos = []
 
                 for i in range(n):
                     item = items.nth(i)
                     try:
-                        title = (await item.locator(SEL_TITLE_A).first.inner_text(timeout=3_000)).strip()
+                        titulos.append((await item.locator(SEL_TITLE_A).first.inner_text(timeout=3_000)).strip())
                     except Exception:
-                        title = ""
-
-                    if title and _norm(title) == norm_query:
-                        exact_hit = True
-                        break
+                        pass
 
-                if exact_hit:
-                    score_final = 5
+                titulo, sim = similitud.mejor(full_name, titulos)
+                score_final = similitud.a_score(sim)
+                if score_final == 5:
                     mensaje_final = f"Coincidencia exacta con el nombre buscado: '{full_name}'."
+                elif score_final == 3:
+                    mensaje_final = f"Posible coincidencia con '{full_name}': '{titulo}' (similitud {sim:.2f})."
                 else:
                     # Hay resultados pero sin coincidencia exacta
                     score_final = 1
@@ -145,7 +136,7 @@ async def consultar_opensanctions_us_ofac_sdn(consulta_id: int, nombre: str, ape
 
         # 7) Persistir Resultado
         if success:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id, fuente=fuente_obj,
                 score=score_final,
                 estado="Validada",
@@ -153,7 +144,7 @@ async def consultar_opensanctions_us_ofac_sdn(consulta_id: int, nombre: str, ape
                 archivo=relative_png
             )
         else:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id, fuente=fuente_obj,
                 score=1, estado="Sin Validar",
                 mensaje=last_error or "No fue posible obtener resultados.",
@@ -162,7 +153,7 @@ async def consultar_opensanctions_us_ofac_sdn(consulta_id: int, nombre: str, ape
 
     except Exception as e:
         try:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id, fuente=fuente_obj,
                 score=1, estado="Sin Validar",
                 mensaje=str(e), archivo=""
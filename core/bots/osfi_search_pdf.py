@@ -4,10 +4,10 @@ import re
 import asyncio
 from datetime import datetime
 from urllib.parse import urlencode
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 import PyPDF2  # <--- para leer el PDF
 
 URL = "https://www.osfi-bsif.gc.ca/en"
@@ -136,7 +136,7 @@ async def consultar_osfi_search_pdf(consulta_id: int, nombre: str, cedula: str):
     out_pdf_abs = os.path.join(absolute_folder, f"{NOMBRE_SITIO}_{cedula}_{ts}.pdf")
     out_pdf_rel = os.path.join(relative_folder, os.path.basename(out_pdf_abs))
 
-    fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+    fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
 
     intentos = 0
     exito = False
@@ -152,7 +152,7 @@ async def consultar_osfi_search_pdf(consulta_id: int, nombre: str, cedula: str):
 
             texto = _leer_pdf(out_pdf_abs)
             if "NO REGISTRA SANCIONES NI INHABILIDADES VIGENTES" in texto.upper():
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id,
                     fuente=fuente_obj,
                     score=0,
@@ -161,7 +161,7 @@ async def consultar_osfi_search_pdf(consulta_id: int, nombre: str, cedula: str):
                     archivo=out_pdf_rel
                 )
             else:
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id,
                     fuente=fuente_obj,
                     score=10,
@@ -175,7 +175,7 @@ async def consultar_osfi_search_pdf(consulta_id: int, nombre: str, cedula: str):
             error_final = str(e)
             if intentos >= 3:  # al tercer intento falla definitivo
                 _fallback_blank_pdf(out_pdf_abs, f"OSFI – error: {e}")
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id,
                     fuente=fuente_obj,
                     score=0,
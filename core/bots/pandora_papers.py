@@ -1,9 +1,9 @@
 import os
 from datetime import datetime
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 nombre_sitio = "pandora_papers"
 
@@ -18,7 +18,7 @@ async def consultar_pandora_papers(consulta_id: int, nombre: str, apellido: str,
     absolute_path = os.path.join(absolute_folder, file_name)
     relative_path = os.path.join(relative_folder, file_name)
 
-    fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=nombre_sitio)
+    fuente_obj = await aobtener_fuente(nombre_sitio)
 
     intentos = 0
     exito = False
@@ -60,7 +60,7 @@ async def consultar_pandora_papers(consulta_id: int, nombre: str, apellido: str,
                 raise Exception("El pantallazo parece vacío o muy pequeño.")
 
             # Guardar en BD como éxito
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente=fuente_obj,
                 score=0,
@@ -85,7 +85,7 @@ async def consultar_pandora_papers(consulta_id: int, nombre: str, apellido: str,
 
     # Si fallaron los 3 intentos
     if not exito:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
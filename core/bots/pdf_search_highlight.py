@@ -1,24 +1,12 @@
 # core/bots/pdf_search_highlight.py
 import os
 from typing import Optional
-import re
-import unicodedata
-from datetime import datetime
 import fitz  # PyMuPDF
 from django.conf import settings
 
-NOMBRE_SITIO = "pdf_search_highlight"
-
-def _normalize(s: str) -> str:
-    if not s:
-        return ""
-    s = unicodedata.normalize("NFKD", s)
-    s = "".join(ch for ch in s if not unicodedata.combining(ch))
-    return s.lower().strip()
+from core.utils import pdf_texto
 
-def _tokenize(q: str):
-    # tokens de 3+ letras (quita signos y múltiple espacio)
-    return [t for t in re.split(r"\W+", _normalize(q)) if len(t) >= 3]
+NOMBRE_SITIO = "pdf_search_highlight"
 
 def _buscar_en_pdf_y_resaltar_core(
     pdf_path: str,
@@ -27,98 +15,40 @@ def _buscar_en_pdf_y_resaltar_core(
     export_first_if_none: bool = True,
     dpi: int = 150,
     stop_on_first: bool = False,   # corta en la primera página con match
-    page_limit: int | None = None  # limitar páginas para pruebas / performance
     page_limit: Optional[int] = None  # limitar páginas para pruebas / performance
+):
     """
-    IMPLEMENTACIÓN ORIGINAL (sin cambios de lógica):
     Busca 'query' en pdf_path de forma tolerante (sin acentos, case-insensitive y
-    permitiendo variaciones de espacios). Si no hay match exacto del nombre completo,
-    busca por tokens (nombres/apellidos) y resalta lo encontrado.
+    permitiendo variaciones de espacios). Si no hay match del nombre completo en
+    una página, busca por tokens (nombres/apellidos de 3+ letras) y resalta lo
+    encontrado. La búsqueda sale del índice de texto (core.utils.pdf_texto), que
+    extrae cada PDF una sola vez; sólo se pintan las páginas con match.
     Exporta PNGs con annots=True. Si no hay matches, exporta la página 1 como preview.
     Retorna lista de PNGs generados.
     """
     os.makedirs(out_folder, exist_ok=True)
-    resultados = []
-
-    q_norm = _normalize(query)
-    tokens = _tokenize(query)
-    full_pat = re.compile(r"\b" + re.sub(r"\s+", r"[\s\-]+", re.escape(q_norm)) + r"\b", re.IGNORECASE)
+    base = os.path.splitext(os.path.basename(pdf_path))[0]
 
     try:
-        doc = fitz.open(pdf_path)
+        coincidencias = pdf_texto.buscar(pdf_path, query, por_tokens=True, limite_paginas=page_limit)
     except Exception as e:
         print(f"[PDF] Error abriendo PDF: {e}")
-        return resultados
-
-    total_pages = len(doc)
-    print(f"[PDF] Abierto {pdf_path} con {total_pages} páginas")
-
-    flags = 0
-    for name in ("TEXT_IGNORECASE", "TEXT_DEHYPHENATE", "TEXT_PRESERVELIGATURES"):
-        val = getattr(fitz, name, None)
-        if isinstance(val, int):
-            flags |= val
-
-    last_page = total_pages if page_limit is None else min(page_limit, total_pages)
-    hits_total = 0
-
-    for i in range(last_page):
-        page = doc[i]
-        page_text = page.get_text("text") or ""
-        page_text_norm = _normalize(page_text)
-
-        full_match_found = False
-        if q_norm:
-            if full_pat.search(page_text_norm):
-                full_match_found = True
-
-        rects = []
-
-        if full_match_found:
-            r_full = page.search_for(query, hit_max=200, quads=False, flags=flags) if query else []
-            if not r_full:
-                q_simple = re.sub(r"\s+", " ", (query or "").strip())
-                r_full = page.search_for(q_simple, hit_max=200, quads=False, flags=flags)
-            rects.extend(r_full)
-
-        if not rects and tokens:
-            for tok in tokens:
-                r_tok = page.search_for(tok, hit_max=200, quads=False, flags=flags)
-                if not r_tok and tok != tok.title():
-                    r_tok = page.search_for(tok.title(), hit_max=200, quads=False, flags=flags)
-                if r_tok:
-                    rects.extend(r_tok)
+        return []
+
+    if stop_on_first:
+        coincidencias = coincidencias[:1]
+    for i, cajas in coincidencias:
+        print(f"[PDF] Match en página {i+1}: {len(cajas)} hits")
+    resultados = pdf_texto.resaltar(pdf_path, coincidencias, out_folder, dpi=dpi, prefijo=base)
+
+    if not coincidencias and export_first_if_none:
+        with fitz.open(pdf_path) as doc:
+            if len(doc) > 0:
+                print("[PDF] Sin coincidencias, exportando preview de la p.1")
+                out_png0 = os.path.join(out_folder, f"{base}_p1_preview.png")
+                doc[0].get_pixmap(dpi=dpi, annots=True).save(out_png0)
+                resultados.append(out_png0)
 
-        if rects:
-            print(f"[PDF] Match en página {i+1}: {len(rects)} hits")
-            hits_total += len(rects)
-            for r in rects:
-                try:
-                    page.add_highlight_annot(r)
-                except Exception:
-                    pass
-
-            pix = page.get_pixmap(dpi=dpi, annots=True)
-            base = os.path.splitext(os.path.basename(pdf_path))[0]
-            out_png = os.path.join(out_folder, f"{base}_match_p{i+1}.png")
-            pix.save(out_png)
-            resultados.append(out_png)
-
-            if stop_on_first:
-                break
-        else:
-            if (i + 1) % 50 == 0 or i in (0, 1):
-                print(f"[PDF] Página {i+1} sin match...")
-
-    if hits_total == 0 and export_first_if_none and total_pages > 0:
-        print("[PDF] Sin coincidencias, exportando preview de la p.1")
-        pix0 = doc[0].get_pixmap(dpi=dpi, annots=True)
-        base = os.path.splitext(os.path.basename(pdf_path))[0]
-        out_png0 = os.path.join(out_folder, f"{base}_p1_preview.png")
-        pix0.save(out_png0)
-        resultados.append(out_png0)
-
-    doc.close()
     return resultados
 
 
@@ -133,7 +63,7 @@ def consultar_buscar_en_pdf_y_resaltar_dj(
     export_first_if_none: bool = True,
     dpi: int = 150,
     page_limit: Optional[int] = None,
-    page_limit: int | None = None,
+    stop_on_first: bool = False,
 ):
     """
     Wrapper estilo plantilla (nombre con 'consultar'):
@@ -152,7 +82,7 @@ def consultar_buscar_en_pdf_y_resaltar_dj(
             out_folder=absolute_folder,
             export_first_if_none=export_first_if_none,
             dpi=dpi,
-            page_limit=page_limit,
+            stop_on_first=stop_on_first,
             page_limit=page_limit,
         )
 
@@ -193,7 +123,7 @@ def consultar_buscar_en_pdf_y_resaltar(
     export_first_if_none: bool = True,
     dpi: int = 150,
     page_limit: Optional[int] = None,
-    page_limit: int | None = None,
+    stop_on_first: bool = False,
 ):
     """
     Versión “cruda” con nombre 'consultar*' para uso directo.
@@ -205,7 +135,7 @@ def consultar_buscar_en_pdf_y_resaltar(
         out_folder=out_folder,
         export_first_if_none=export_first_if_none,
         dpi=dpi,
-        page_limit=page_limit,
+        stop_on_first=stop_on_first,
         page_limit=page_limit,
     )
 
@@ -221,7 +151,6 @@ def buscar_en_pdf_y_resaltar_dj(
     page_limit: Optional[int] = None,
     dpi: int = 150,
     stop_on_first: bool = False,
-    page_limit: int | None = None,
 ):
     """Alias legacy que llama al nuevo nombre con 'consultar'."""
     return consultar_buscar_en_pdf_y_resaltar_dj(
@@ -231,7 +160,6 @@ def buscar_en_pdf_y_resaltar_dj(
         page_limit=page_limit,
         dpi=dpi,
         stop_on_first=stop_on_first,
-        page_limit=page_limit,
     )
 
 
@@ -242,7 +170,6 @@ def buscar_en_pdf_y_resaltar(
     page_limit: Optional[int] = None,
     dpi: int = 150,
     stop_on_first: bool = False,
-    page_limit: int | None = None,
 ):
     """Alias legacy que llama al nuevo nombre con 'consultar'."""
     return consultar_buscar_en_pdf_y_resaltar(
@@ -252,5 +179,4 @@ def buscar_en_pdf_y_resaltar(
         page_limit=page_limit,
         dpi=dpi,
         stop_on_first=stop_on_first,
-        page_limit=page_limit,
     )
@@ -6,10 +6,11 @@ import asyncio
 from datetime import datetime
 from typing import Optional
 
-from playwright.async_api import async_playwright, Page, Browser, BrowserContext
+from playwright.async_api import Page, Browser, BrowserContext
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 import PyPDF2
 import fitz  # PyMuPDF
@@ -140,10 +141,10 @@ async def consultar_personeria(
         msg = f"Fecha inválida: {fecha_expedicion}. Usa YYYY-MM-DD o DD/MM/YYYY o DD-MM-YYYY."
         print(f"[PERSONERIA][ERROR] {msg}")
         try:
-            fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+            fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
         except Exception:
             fuente_obj = None
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
@@ -162,10 +163,10 @@ async def consultar_personeria(
         msg = f"Tipo de documento no soportado: {tipo_doc}"
         print(f"[PERSONERIA][ERROR] {msg}")
         try:
-            fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+            fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
         except Exception:
             fuente_obj = None
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
@@ -187,7 +188,7 @@ async def consultar_personeria(
     relative_png = os.path.join(relative_folder, png_name).replace("\\", "/")
 
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
         print(f"[PERSONERIA][WARN] No se encontró Fuente '{NOMBRE_SITIO}': {e}")
         fuente_obj = None
@@ -484,7 +485,7 @@ async def consultar_personeria(
                 print("[PERSONERIA] Resultado: HALLAZGOS detectados (score=10)")
 
             # save result
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente=fuente_obj,
                 score=score,
@@ -524,7 +525,7 @@ async def consultar_personeria(
     if not exito:
         msg = f"Ocurrió un problema al obtener la información de la fuente: {last_exception}"
         print(f"[PERSONERIA][ERROR] {msg}")
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
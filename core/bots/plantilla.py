@@ -1,9 +1,11 @@
 import os
 from datetime import datetime
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from core.models import Resultado, Fuente
+from core.utils import bd
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
+from core.listas import consulta as listas_locales, opensanctions
 
 # 🌍 URL principal
 BASE_URL = "https://www.opensanctions.org/datasets/default/"
@@ -55,13 +57,30 @@ FUENTES = {
 
 
 async def consultar_fuentes(consulta_id: int, cedula: str, nombre_persona: str):
+    # Los datasets con copia local (manage.py ingestar_opensanctions) se resuelven sin navegador
+    pendientes = {}
+    cargados = await bd.ejecutar(listas_locales.datasets_por_titulo, opensanctions.LISTA, FUENTES)
+    for clave_web, nombre_bd in FUENTES.items():
+        dataset = cargados.get(clave_web.lower())
+        if dataset is None or not nombre_persona:
+            pendientes[clave_web] = nombre_bd
+            continue
+        try:
+            resultado = await listas_locales.registrar(consulta_id, nombre_bd, nombre_persona, dataset, aproximado=True)
+            print(f"✅ Guardado resultado local de {clave_web} - {resultado.mensaje}")
+        except Exception as e:
+            print(f"⚠️ Error en la lista local de {clave_web}: {e}")
+            pendientes[clave_web] = nombre_bd
+    if not pendientes:
+        return
+
     async with async_playwright() as p:
         browser = await p.chromium.launch(headless=True)
         page = await browser.new_page()
         await page.goto(BASE_URL)
 
         # Recorremos las fuentes
-        for clave_web, nombre_bd in FUENTES.items():
+        for clave_web, nombre_bd in pendientes.items():
             try:
                 # Buscar el link por el texto (ej: "Austria Public Officials")
                 link = await page.query_selector(f'a:has-text("{clave_web}")')
@@ -110,8 +129,8 @@ async def consultar_fuentes(consulta_id: int, cedula: str, nombre_persona: str):
                 await new_page.screenshot(path=absolute_png, full_page=True)
 
                 # Guardar en BD
-                fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=nombre_bd)
-                await sync_to_async(Resultado.objects.create)(
+                fuente_obj = await aobtener_fuente(nombre_bd)
+                await crear_resultado(
                     consulta_id=consulta_id,
                     fuente=fuente_obj,
                     score=score,
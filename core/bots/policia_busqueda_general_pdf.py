@@ -2,10 +2,10 @@
 import os
 import re
 from datetime import datetime
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from core.models import Fuente, Resultado
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 URL = "https://www.policia.es/_es/busqueda_gral.php"
 NOMBRE_SITIO = "policia_busqueda_general"
@@ -18,10 +18,10 @@ def _safe_name(s: str) -> str:
 
 async def consultar_policia_busqueda_general_shot(consulta_id: int, nombre: str, cedula):
     nombre = (nombre or "").strip()
-    fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+    fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
 
     if not nombre:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
@@ -137,7 +137,7 @@ async def consultar_policia_busqueda_general_shot(consulta_id: int, nombre: str,
                 raise Exception("El pantallazo parece vacío o muy pequeño.")
 
             # Guardar en BD como éxito
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente=fuente_obj,
                 score=1,
@@ -158,7 +158,7 @@ async def consultar_policia_busqueda_general_shot(consulta_id: int, nombre: str,
 
     # Si después de 3 intentos no funcionó
     if not exito:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
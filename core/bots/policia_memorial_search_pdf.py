@@ -1,10 +1,10 @@
 import os
 import re
 from datetime import datetime
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from core.models import Fuente, Resultado
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 URL = "https://www.policia.es/_es/tupolicia_memorial_timeline_victimas.php"
 NOMBRE_SITIO = "policia_memorial_search"
@@ -27,10 +27,10 @@ PRINT_CLEAN = """
 
 async def consultar_policia_memorial_search_pdf(consulta_id: int, nombre: str, cedula):
     nombre = (nombre or "").strip()
-    fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+    fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
 
     if not nombre:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
@@ -123,7 +123,7 @@ async def consultar_policia_memorial_search_pdf(consulta_id: int, nombre: str, c
                 print(f"Pantallazo guardado en: {screenshot_abs}")
 
                 # Guardar en BD como éxito
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id,
                     fuente=fuente_obj,
                     score=1,
@@ -147,7 +147,7 @@ async def consultar_policia_memorial_search_pdf(consulta_id: int, nombre: str, c
 
     # -------- Si después de 3 intentos falló --------
     if not exito:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
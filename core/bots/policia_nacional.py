@@ -5,11 +5,12 @@ import asyncio
 from datetime import datetime
 from urllib.parse import urlparse, parse_qs
 
-from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
-from asgiref.sync import sync_to_async
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 from core.resolver.captcha_v2 import resolver_captcha_v2
 
 URL = "https://antecedentes.policia.gov.co:7005/WebJudicial/index.xhtml"
@@ -249,8 +250,8 @@ async def consultar_policia_nacional(cedula, tipo_doc, consulta_id, max_intentos
                     await pagina.screenshot(path=absolute_path, full_page=True)
 
                     # Guardar resultado correcto
-                    fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=nombre_sitio)
-                    await sync_to_async(Resultado.objects.create)(
+                    fuente_obj = await aobtener_fuente(nombre_sitio)
+                    await crear_resultado(
                         consulta_id=consulta_id,
                         fuente=fuente_obj,
                         score=score_calculado,
@@ -287,8 +288,8 @@ async def consultar_policia_nacional(cedula, tipo_doc, consulta_id, max_intentos
             except Exception:
                 relative_path = ""
 
-            fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=nombre_sitio)
-            await sync_to_async(Resultado.objects.create)(
+            fuente_obj = await aobtener_fuente(nombre_sitio)
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente=fuente_obj,
                 score=0,
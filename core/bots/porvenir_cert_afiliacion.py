@@ -6,10 +6,10 @@ import random
 from datetime import datetime
 
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import abuscar_fuente
+from core.utils.resultados import crear_resultado
 
 # URLs oficiales
 LANDING_URL = "https://www.porvenir.com.co/certificados-y-extractos"
@@ -40,11 +40,9 @@ async def consultar_porvenir_cert_afiliacion(consulta_id: int, cedula: str, tipo
     """
 
     # Buscar la fuente configurada en BD
-    fuente_obj = await sync_to_async(
-        lambda: Fuente.objects.filter(nombre=NOMBRE_SITIO).first()
-    )()
+    fuente_obj = await abuscar_fuente(NOMBRE_SITIO)
     if not fuente_obj:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=None,
             estado="Sin Validar",
@@ -352,7 +350,7 @@ async def consultar_porvenir_cert_afiliacion(consulta_id: int, cedula: str, tipo
                 print(f"[PORVENIR] PNG del PDF generado: {abs_png_pdf}")
 
             # Guardar en BD
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente=fuente_obj,
                 estado=estado,
@@ -367,7 +365,7 @@ async def consultar_porvenir_cert_afiliacion(consulta_id: int, cedula: str, tipo
         print("[PORVENIR] EXCEPTION:", str(e))
         print(traceback.format_exc())
 
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             estado="Sin Validar",
@@ -6,10 +6,10 @@ from datetime import datetime
 from urllib.parse import quote, urlencode
 
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright, TimeoutError as PWTimeout
-
-from core.models import Resultado, Fuente
+from playwright.async_api import TimeoutError as PWTimeout
+from core.utils.browser_pool import async_playwright
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 NOMBRE_SITIO = "presidencia_gabinete_busqueda"
 BASE_URL = "https://www.presidencia.gov.co/prensa/gabinete"
@@ -41,9 +41,9 @@ async def consultar_presidencia_gabinete_busqueda(
     disable_screenshot = os.environ.get("DISABLE_SCREENSHOT_FULLPAGE", "false").lower() in ["true", "1", "yes"]
 
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=None,
             score=0,
@@ -276,7 +276,7 @@ async def consultar_presidencia_gabinete_busqueda(
                         await page.screenshot(path=abs_png, full_page=full_page)
                         print(f"[presidencia_gabinete] Screenshot guardado")
 
-                        await sync_to_async(Resultado.objects.create)(
+                        await crear_resultado(
                             consulta_id=consulta_id,
                             fuente=fuente_obj,
                             score=1,
@@ -337,7 +337,7 @@ async def consultar_presidencia_gabinete_busqueda(
                 await page.screenshot(path=abs_png, full_page=full_page)
                 print(f"[presidencia_gabinete] Screenshot guardado")
 
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id,
                     fuente=fuente_obj,
                     score=score,
@@ -369,7 +369,7 @@ async def consultar_presidencia_gabinete_busqueda(
 
     # Fallo total después de reintentos
     print(f"[presidencia_gabinete] ❌ Fallo total después de {MAX_INTENTOS} intentos")
-    await sync_to_async(Resultado.objects.create)(
+    await crear_resultado(
         consulta_id=consulta_id,
         fuente=fuente_obj,
         score=0,
@@ -2,10 +2,10 @@ import os
 import re
 import asyncio
 from datetime import datetime
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from core.models import Resultado, Fuente  # ajusta import según tu proyecto
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 PAGE_URL = "https://www.procuraduria.gov.co/Pages/Consulta-de-Antecedentes.aspx"
 nombre_sitio = "procuraduria"
@@ -84,7 +84,7 @@ async def consultar_procuraduria(consulta_id, cedula, tipo_doc):
         if not tipo_doc_val:
             raise ValueError(f"Tipo de documento no válido: {tipo_doc}")
 
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=nombre_sitio)
+        fuente_obj = await aobtener_fuente(nombre_sitio)
 
         # ---------- navegación ----------
         async with async_playwright() as p:
@@ -252,7 +252,7 @@ async def consultar_procuraduria(consulta_id, cedula, tipo_doc):
                     evidencia_rel = ok_png_rel
 
             # Guardar en BD
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente=fuente_obj,
                 score=score,
@@ -269,11 +269,11 @@ async def consultar_procuraduria(consulta_id, cedula, tipo_doc):
             except Exception:
                 evidencia_rel = ""
         try:
-            fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=nombre_sitio)
+            fuente_obj = await aobtener_fuente(nombre_sitio)
         except Exception:
             fuente_obj = None
         if fuente_obj:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente=fuente_obj,
                 score=0,
@@ -6,10 +6,11 @@ import logging
 from datetime import datetime
 from pathlib import Path
 
-from playwright.async_api import async_playwright, TimeoutError as PWTimeout
+from playwright.async_api import TimeoutError as PWTimeout
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 logger = logging.getLogger(__name__)
 
@@ -187,10 +188,10 @@ def _clasificar_certificado(texto: str) -> tuple[str, int]:
 
 async def _crear_resultado_error(consulta_id: int, mensaje: str) -> None:
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception:
         return
-    await sync_to_async(Resultado.objects.create)(
+    await crear_resultado(
         consulta_id=consulta_id,
         fuente=fuente_obj,
         score=1,
@@ -245,7 +246,7 @@ async def generar_certificado_procuraduria(
 
     try:
         try:
-            fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+            fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
         except Exception:
             fuente_obj = None
 
@@ -306,7 +307,7 @@ async def generar_certificado_procuraduria(
                     )
                     if intento == MAX_INTENTOS:
                         if fuente_obj:
-                            await sync_to_async(Resultado.objects.create)(
+                            await crear_resultado(
                                 consulta_id=consulta_id,
                                 fuente=fuente_obj,
                                 score=1,
@@ -374,7 +375,7 @@ async def generar_certificado_procuraduria(
                     )
 
                     if fuente_obj:
-                        await sync_to_async(Resultado.objects.create)(
+                        await crear_resultado(
                             consulta_id=consulta_id,
                             fuente=fuente_obj,
                             score=1,
@@ -457,7 +458,7 @@ async def generar_certificado_procuraduria(
                         )
 
                     if fuente_obj:
-                        await sync_to_async(Resultado.objects.create)(
+                        await crear_resultado(
                             consulta_id=consulta_id,
                             fuente=fuente_obj,
                             score=1,
@@ -681,7 +682,7 @@ async def generar_certificado_procuraduria(
 
                 # Guardar resultado
                 if fuente_obj:
-                    await sync_to_async(Resultado.objects.create)(
+                    await crear_resultado(
                         consulta_id=consulta_id,
                         fuente=fuente_obj,
                         score=score,
@@ -705,7 +706,7 @@ async def generar_certificado_procuraduria(
                     )
                     score = 1  # No pudimos analizar el PDF, score neutro
 
-                    await sync_to_async(Resultado.objects.create)(
+                    await crear_resultado(
                         consulta_id=consulta_id,
                         fuente=fuente_obj,
                         score=score,
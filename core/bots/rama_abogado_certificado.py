@@ -5,10 +5,10 @@ import asyncio
 from datetime import datetime
 
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 # ---------- Config ----------
 URL = "https://vigenciaspublicas.ramajudicial.gov.co/Certificados.aspx"
@@ -24,7 +24,7 @@ XLONG  = 9000
 
 # ---------- Helpers de BD ----------
 async def _guardar_resultado(consulta_id, fuente_obj, estado, mensaje, rel_path, score=1):
-    await sync_to_async(Resultado.objects.create)(
+    await crear_resultado(
         consulta_id=consulta_id,
         fuente=fuente_obj,
         score=score,          # Score fijo = 1
@@ -244,7 +244,7 @@ async def consultar_rama_abogado_certificado(consulta_id: int, cedula: str, tipo
 
     # Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
         await _guardar_resultado(consulta_id, None, "Sin Validar",
                                  f"No se encontró la Fuente '{NOMBRE_SITIO}': {e}", "", score=1)
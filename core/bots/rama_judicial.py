@@ -7,8 +7,7 @@ import asyncio
 from datetime import datetime
 
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 
 import fitz               # PyMuPDF
 from docx import Document # python-docx
@@ -21,7 +20,8 @@ from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib import colors
 from reportlab.lib.units import mm
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import abuscar_fuente
+from core.utils.resultados import crear_resultado
 
 URL = "https://consultaprocesos.ramajudicial.gov.co/Procesos/NombreRazonSocial"
 NOMBRE_SITIO = "rama_judicial"
@@ -485,7 +485,7 @@ async def consultar_rama_judicial(consulta_id: int, cedula: str, nombre_o_razon:
     listado_png_abs = os.path.join(absolute_folder, f"{base}_listado.png")
     listado_png_rel = os.path.join(relative_folder,  f"{base}_listado.png").replace("\\", "/")
 
-    fuente_obj = await sync_to_async(lambda: Fuente.objects.filter(nombre=NOMBRE_SITIO).first())()
+    fuente_obj = await abuscar_fuente(NOMBRE_SITIO)
 
     try:
         async with async_playwright() as p:
@@ -528,7 +528,7 @@ async def consultar_rama_judicial(consulta_id: int, cedula: str, nombre_o_razon:
                 # 0) Network Error
                 if "network error" in alert_norm or "error de red" in alert_norm:
                     if fuente_obj:
-                        await sync_to_async(Resultado.objects.create)(
+                        await crear_resultado(
                             consulta_id=consulta_id,
                             fuente=fuente_obj,
                             score=0,
@@ -542,7 +542,7 @@ async def consultar_rama_judicial(consulta_id: int, cedula: str, nombre_o_razon:
                 # 1) No generó resultados
                 if "no genero resultados" in alert_norm:
                     if fuente_obj:
-                        await sync_to_async(Resultado.objects.create)(
+                        await crear_resultado(
                             consulta_id=consulta_id,
                             fuente=fuente_obj,
                             score=0,
@@ -566,7 +566,7 @@ async def consultar_rama_judicial(consulta_id: int, cedula: str, nombre_o_razon:
                     await _screenshot_full(page, listado_png_abs)
 
                     if fuente_obj:
-                        await sync_to_async(Resultado.objects.create)(
+                        await crear_resultado(
                             consulta_id=consulta_id,
                             fuente=fuente_obj,
                             score=0,
@@ -600,7 +600,7 @@ async def consultar_rama_judicial(consulta_id: int, cedula: str, nombre_o_razon:
 
                 await browser.close()
                 if fuente_obj:
-                    await sync_to_async(Resultado.objects.create)(
+                    await crear_resultado(
                         consulta_id=consulta_id,
                         fuente=fuente_obj,
                         score=score,
@@ -658,7 +658,7 @@ async def consultar_rama_judicial(consulta_id: int, cedula: str, nombre_o_razon:
             except Exception:
                 await _screenshot_full(page, alert_png_abs)
                 if fuente_obj:
-                    await sync_to_async(Resultado.objects.create)(
+                    await crear_resultado(
                         consulta_id=consulta_id,
                         fuente=fuente_obj,
                         score=0,
@@ -674,7 +674,7 @@ async def consultar_rama_judicial(consulta_id: int, cedula: str, nombre_o_razon:
             # ----- Guardar resultado principal -----
             archivo_rel = (page_png_rel or alert_png_rel or doc_rel)
             if fuente_obj:
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id,
                     fuente=fuente_obj,
                     score=score,
@@ -686,9 +686,9 @@ async def consultar_rama_judicial(consulta_id: int, cedula: str, nombre_o_razon:
             return {"mensaje": "ok", "score": score, "archivo": archivo_rel, "doc": doc_rel}
 
     except Exception as e:
-        fuente_obj = await sync_to_async(lambda: Fuente.objects.filter(nombre=NOMBRE_SITIO).first())()
+        fuente_obj = await abuscar_fuente(NOMBRE_SITIO)
         if fuente_obj:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente=fuente_obj,
                 score=0,
@@ -5,11 +5,11 @@ import unicodedata
 from datetime import datetime
 
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 import fitz  # PyMuPDF
 
-from core.models import Resultado, Fuente  # ajusta si tu app cambia
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 URL = "https://vigenciaspublicas.ramajudicial.gov.co/Certificados.aspx"
 NOMBRE_SITIO = "rama_vigencias_pdf"
@@ -92,9 +92,9 @@ async def consultar_rama_vigencias_pdf(consulta_id: int, tipo_doc: str, numero:
     """
     # Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=None,
             score=0,
@@ -168,7 +168,7 @@ async def consultar_rama_vigencias_pdf(consulta_id: int, tipo_doc: str, numero:
         mensaje, score = _decidir_estado(text)
 
         # Guardar resultado apuntando al PNG (evidencia)
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=score,
@@ -192,7 +192,7 @@ async def consultar_rama_vigencias_pdf(consulta_id: int, tipo_doc: str, numero:
                 await browser.close()
         except Exception:
             pass
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
@@ -5,9 +5,10 @@ from datetime import datetime
 
 from django.conf import settings
 from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 
-from core.models import Resultado, Fuente
+from core.models import Fuente
+from core.utils.resultados import crear_resultado
 
 NOMBRE_SITIO = "ramajudicial_corte_constitucional_magistrados"
 SEARCH_BASE  = "https://www.ramajudicial.gov.co/search"
@@ -120,7 +121,7 @@ async def consultar_ramajudicial_corte_constitucional_magistrados(
             await browser.close()
             ctx = browser = None
 
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=score,
@@ -145,7 +146,7 @@ async def consultar_ramajudicial_corte_constitucional_magistrados(
         except Exception:
             pass
 
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
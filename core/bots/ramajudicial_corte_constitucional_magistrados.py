@@ -4,10 +4,10 @@ import asyncio
 from datetime import datetime
 
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 NOMBRE_SITIO = "ramajudicial_corte_constitucional_magistrados"
 URL = "https://www.ramajudicial.gov.co/web/corte-constitucional/portal/corporacion/magistrados/magistrados-actuales"
@@ -30,9 +30,9 @@ async def consultar_ramajudicial_corte_constitucional_magistrados(
     """
     # 1) Obtener fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=0,
             estado="Sin validar",
             mensaje=f"No se encontró la Fuente '{NOMBRE_SITIO}': {e}",
@@ -159,7 +159,7 @@ async def consultar_ramajudicial_corte_constitucional_magistrados(
                 browser = None
 
             # Guardar resultado
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente=fuente_obj,
                 score=score,
@@ -188,7 +188,7 @@ async def consultar_ramajudicial_corte_constitucional_magistrados(
                 continue
 
             # Ya es el tercer intento, registrar error
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente=fuente_obj,
                 score=0,
@@ -4,10 +4,10 @@ import asyncio
 from datetime import datetime
 
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 NOMBRE_SITIO = "ramajudicial_corte_constitucional_magistrados_anteriores"
 URL = "https://www.ramajudicial.gov.co/web/corte-constitucional/portal/corporacion/magistrados/magistrados-anteriores"
@@ -143,9 +143,9 @@ async def consultar_ramajudicial_corte_constitucional_magistrados_anteriores(
     """
     # 1) Buscar fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=0,
             estado="Sin validar",
             mensaje=f"No se encontró la Fuente '{NOMBRE_SITIO}': {e}",
@@ -226,7 +226,7 @@ async def consultar_ramajudicial_corte_constitucional_magistrados_anteriores(
                 raise RuntimeError("No fue posible capturar el pantallazo sin recortes.")
 
             # Éxito
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente=fuente_obj,
                 score=0,
@@ -262,7 +262,7 @@ async def consultar_ramajudicial_corte_constitucional_magistrados_anteriores(
 
     # Si tras 3 intentos no se logró
     if not exito:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
@@ -1,9 +1,10 @@
 import os
 from datetime import datetime
 from django.conf import settings
-from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
-from asgiref.sync import sync_to_async
-from core.models import Resultado, Fuente  # ajusta según tu proyecto
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from core.utils.browser_pool import async_playwright
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 from PIL import Image, ImageDraw, ImageFont
 
 url = "https://consultaprocesos.ramajudicial.gov.co/Procesos/JuezClaseProceso"
@@ -123,8 +124,8 @@ async def consultar_ramajudicial_juzgados(consulta_id, cedula):
                         agregar_marca_agua(absolute_path, ciudad, pagina_juzgado.url)
                         print(f"📸 Captura con marca de agua guardada para {ciudad}: {relative_path}")
 
-                        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=fuente_nombre)
-                        await sync_to_async(Resultado.objects.create)(
+                        fuente_obj = await aobtener_fuente(fuente_nombre)
+                        await crear_resultado(
                             consulta_id=consulta_id,
                             fuente=fuente_obj,
                             score=0,
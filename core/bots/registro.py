@@ -0,0 +1,139 @@
+# core/bots/registro.py
+"""
+Registro perezoso de bots.
+
+`bot_configs.py` declaraba ~170 `from .x import consultar_x`, así que importar
+la lista cargaba playwright, fitz, PIL, pytesseract, etc. en cada worker (y en
+cada reintento) aunque sólo fuera a correr un bot. Ahora cada nombre es un
+`BotPerezoso` que guarda la ruta del módulo y sólo lo importa al llamarse.
+"""
+import copy
+import importlib
+import re
+import sys
+from functools import lru_cache
+
+PAQUETE = "core.bots"
+
+
+class BotPerezoso:
+    """Callable que importa `modulo.funcion` la primera vez que se usa."""
+
+    def __init__(self, modulo, funcion):
+        self.__module__ = modulo if not modulo.startswith(".") else PAQUETE + modulo
+        self.__name__ = self.__qualname__ = funcion
+        self._func = None
+
+    @property
+    def ruta(self) -> str:
+        return f"{self.__module__}.{self.__name__}"
+
+    def cargar(self):
+        if self._func is None:
+            self._func = getattr(importlib.import_module(self.__module__), self.__name__)
+        return self._func
+
+    def __call__(self, *args, **kwargs):
+        return self.cargar()(*args, **kwargs)
+
+    def __repr__(self):
+        return f"<BotPerezoso {self.ruta}>"
+
+
+def perezoso(modulo, funcion):
+    return BotPerezoso(modulo, funcion)
+
+
+def cargar_modulo(func):
+    """Módulo del bot (importándolo si hace falta); None si no se puede."""
+    nombre = getattr(func, "__module__", "") or ""
+    if nombre in sys.modules:
+        return sys.modules[nombre]
+    if isinstance(func, BotPerezoso):
+        try:
+            return importlib.import_module(nombre)
+        except Exception:
+            return None
+    return None
+
+
+# Marcadores con los que se evalúan las configs una sola vez (ver `plantillas`)
+_CONSULTA = object()
+_MARCADOR = re.compile(r"\x00(\w+)\x00")
+
+
+class _DatosPlantilla(dict):
+    """`datos` que responde cada campo con su marcador, para poder rellenarlo después."""
+
+    def __missing__(self, campo):
+        return f"\x00{campo}\x00"
+
+    def get(self, campo, defecto=None):
+        return self[campo]
+
+
+@lru_cache(maxsize=None)
+def plantillas() -> dict:
+    """
+    nombre normalizado -> entrada con marcadores en lugar de la consulta y los
+    datos del candidato. get_bot_configs gana sobre el contratista y, dentro de
+    cada lista, la primera entrada gana (como `indice`).
+    """
+    from .bot_configs import get_bot_configs
+    from .bot_configs_contratista import get_bot_configs_contratista
+
+    tabla = {}
+    for configs in (get_bot_configs(_CONSULTA, _DatosPlantilla()), get_bot_configs_contratista(_CONSULTA, _DatosPlantilla())):
+        for nombre, bot in indice(configs).items():
+            tabla.setdefault(nombre, bot)
+    return tabla
+
+
+@lru_cache(maxsize=None)
+def registro() -> dict:
+    """
+    nombre del bot -> {'ruta': 'core.bots.x.consultar_x', 'argumentos': [...]}
+    sin importar ningún módulo de bot (los argumentos salen de las kwargs de la entrada).
+    """
+    tabla = {}
+    for nombre, bot in plantillas().items():
+        func = bot["func"]
+        tabla[nombre] = {
+            "ruta": getattr(func, "ruta", f"{func.__module__}.{func.__name__}"),
+            "argumentos": sorted((bot.get("kwargs") or {}).keys()),
+        }
+    return tabla
+
+
+def _rellenar(valor, consulta_id, datos):
+    if valor is _CONSULTA:
+        return consulta_id
+    if not isinstance(valor, str) or "\x00" not in valor:
+        return copy.deepcopy(valor)
+    unico = _MARCADOR.fullmatch(valor)
+    if unico:
+        return datos.get(unico.group(1), "")
+    # Compuestos como f"{nombre} {apellido}".strip()
+    return _MARCADOR.sub(lambda m: str(datos.get(m.group(1)) or ""), valor).strip()
+
+
+def construir(nombre: str, consulta_id, datos) -> dict:
+    """
+    La entrada de `nombre` para esta consulta, igual a la de get_bot_configs,
+    sin construir las demás; None si no existe.
+    """
+    plantilla = plantillas().get((nombre or "").strip().lower())
+    if plantilla is None:
+        return None
+    bot = {clave: _rellenar(valor, consulta_id, datos) for clave, valor in plantilla.items() if clave not in ("func", "kwargs")}
+    bot["func"] = plantilla["func"]
+    bot["kwargs"] = {clave: _rellenar(valor, consulta_id, datos) for clave, valor in (plantilla.get("kwargs") or {}).items()}
+    return bot
+
+
+def indice(configs) -> dict:
+    """nombre normalizado -> entrada; la primera gana, como en la búsqueda lineal anterior."""
+    tabla = {}
+    for bot in configs:
+        tabla.setdefault((bot.get("name") or "").strip().lower(), bot)
+    return tabla
@@ -1,77 +1,47 @@
 import os
 import traceback
 from datetime import datetime
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from django.core.files import File as DjangoFile
 from core.resolver.captcha_img2 import resolver_captcha_imagen
-from core.models import Resultado, Fuente
+from core.utils.fuentes import abuscar_fuente
+from core.utils.resultados import crear_resultado
 
 url = "https://consultasrc.registraduria.gov.co:28080/ProyectoSCCRC/"
 nombre_sitio = "registro_civil"
 MAX_INTENTOS = 3
 
-def _crear_resultado_guardando_archivo(absolute_path, screenshot_name, relative_path,
+async def _crear_resultado_guardando_archivo(absolute_path, screenshot_name, relative_path,
                                       consulta_id, fuente_obj, score, mensaje_error):
-    """
-    Crea y guarda un Resultado. Si resultado.archivo es FileField, usa .save().
-    Si es CharField/TextField, guarda la ruta relativa como string.
-    """
-    resultado = Resultado(
+    """Crea el Resultado; la ruta relativa del pantallazo sólo se guarda si quedó en disco."""
+    return await crear_resultado(
         consulta_id=consulta_id,
         fuente=fuente_obj,
         score=score,
         estado="Validado",
-        mensaje=mensaje_error
+        mensaje=mensaje_error,
+        archivo=relative_path if absolute_path and os.path.exists(absolute_path) else "",
     )
 
-    if absolute_path and os.path.exists(absolute_path):
-        archivo_attr = getattr(resultado, 'archivo', None)
-        if archivo_attr is not None and hasattr(archivo_attr, 'save'):
-            with open(absolute_path, "rb") as f:
-                django_file = DjangoFile(f)
-                resultado.archivo.save(screenshot_name, django_file, save=True)
-        else:
-            # Guardar ruta relativa (la app que consuma debe usar MEDIA_URL + resultado.archivo)
-            resultado.archivo = relative_path
-            resultado.save()
-    else:
-        resultado.save()
-
-    return resultado
-
-def _crear_resultado_error(error_screenshot_path, consulta_id, fuente_obj, mensaje_error):
-    resultado = Resultado(
+async def _crear_resultado_error(error_screenshot_path, consulta_id, fuente_obj, mensaje_error):
+    archivo = ""
+    if error_screenshot_path and os.path.exists(error_screenshot_path):
+        archivo = os.path.join('resultados', str(consulta_id), os.path.basename(error_screenshot_path))
+    return await crear_resultado(
         consulta_id=consulta_id,
         fuente=fuente_obj,
         score=0,
         estado="Sin validar",
-        mensaje=mensaje_error
+        mensaje=mensaje_error,
+        archivo=archivo,
     )
 
-    if error_screenshot_path and os.path.exists(error_screenshot_path):
-        archivo_attr = getattr(resultado, 'archivo', None)
-        filename = os.path.basename(error_screenshot_path)
-        if archivo_attr is not None and hasattr(archivo_attr, 'save'):
-            with open(error_screenshot_path, "rb") as f:
-                django_file = DjangoFile(f)
-                resultado.archivo.save(filename, django_file, save=True)
-        else:
-            relative = os.path.join('resultados', str(consulta_id), filename)
-            resultado.archivo = relative
-            resultado.save()
-    else:
-        resultado.save()
-
-    return resultado
-
 async def consultar_registro_civil(cedula, consulta_id, sexo="SIN INFORMACION", headless=True):
     relative_folder = os.path.join('resultados', str(consulta_id))
     absolute_folder = os.path.join(settings.MEDIA_ROOT, relative_folder)
     os.makedirs(absolute_folder, exist_ok=True)
 
-    fuente_obj = await sync_to_async(lambda: Fuente.objects.filter(nombre=nombre_sitio).first())()
+    fuente_obj = await abuscar_fuente(nombre_sitio)
     intento_global = 0
 
     while intento_global < MAX_INTENTOS:
@@ -186,7 +156,7 @@ async def consultar_registro_civil(cedula, consulta_id, sexo="SIN INFORMACION",
                 await page.screenshot(path=absolute_path, full_page=True)
 
                 # Guardar resultado (adaptativo según tipo de campo 'archivo')
-                await sync_to_async(_crear_resultado_guardando_archivo)(
+                await _crear_resultado_guardando_archivo(
                     absolute_path, screenshot_name, relative_path,
                     consulta_id, fuente_obj, score, mensaje_error
                 )
@@ -209,7 +179,7 @@ async def consultar_registro_civil(cedula, consulta_id, sexo="SIN INFORMACION",
                 print("No se pudo tomar screenshot de error:", e2)
 
             if intento_global == MAX_INTENTOS:
-                await sync_to_async(_crear_resultado_error)(
+                await _crear_resultado_error(
                     error_screenshot, consulta_id, fuente_obj,
                     f"Error tras {MAX_INTENTOS} intentos: {str(e)}"
                 )
@@ -1,9 +1,10 @@
 import os
 import asyncio
 from datetime import datetime
-from core.models import Resultado, Fuente 
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
 from core.resolver.captcha_img2 import resolver_captcha_imagen_sync
 
@@ -30,7 +31,7 @@ async def consultar_rethus(consulta_id, cedula, tipo_doc, nombre, apellido):
     absolute_folder = os.path.join(settings.MEDIA_ROOT, relative_folder)
     os.makedirs(absolute_folder, exist_ok=True)
 
-    fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=nombre_sitio)
+    fuente_obj = await aobtener_fuente(nombre_sitio)
     intento_global = 0
 
     while intento_global < MAX_INTENTOS:
@@ -102,7 +103,7 @@ async def consultar_rethus(consulta_id, cedula, tipo_doc, nombre, apellido):
                     score = 10
 
                 # Guardar en BD (archivo principal: contenedor)
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id,
                     fuente=fuente_obj,
                     score=score,
@@ -128,7 +129,7 @@ async def consultar_rethus(consulta_id, cedula, tipo_doc, nombre, apellido):
                 print(f"[Intento {intento_global}] Error: {e}")
 
                 if intento_global == MAX_INTENTOS:
-                    await sync_to_async(Resultado.objects.create)(
+                    await crear_resultado(
                         consulta_id=consulta_id,
                         fuente=fuente_obj,
                         score=0,
@@ -1,9 +1,10 @@
 import os
 from datetime import datetime, date
-from playwright.async_api import async_playwright, TimeoutError as PWTimeoutError
+from playwright.async_api import TimeoutError as PWTimeoutError
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from core.models import Resultado, Fuente  # Ajusta según tu app
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 url = "https://srvcnpc.policia.gov.co/PSC/frm_cnp_consulta.aspx"
 nombre_sitio = "rnmc"
@@ -73,8 +74,6 @@ def _formatear_fecha_ddmmaaaa(fecha_expedicion) -> str:
     raise ValueError(f"Formato de fecha inválido: {s}. Usa DD/MM/YYYY, YYYY-MM-DD, etc.")
 
 import asyncio
-from playwright.async_api import async_playwright, TimeoutError as PWTimeoutError
-
 async def consultar_rnmc(consulta_id, cedula, tipo_doc, fecha_expedicion):
     MAX_INTENTOS = 3
 
@@ -88,9 +87,9 @@ async def consultar_rnmc(consulta_id, cedula, tipo_doc, fecha_expedicion):
 
     # Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=nombre_sitio)
+        fuente_obj = await aobtener_fuente(nombre_sitio)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=0,
             estado="Sin validar",
             mensaje=f"No se encontró la Fuente '{nombre_sitio}': {e}",
@@ -161,7 +160,7 @@ async def consultar_rnmc(consulta_id, cedula, tipo_doc, fecha_expedicion):
                     except Exception:
                         modal_text = "La fecha de expedición de la Cédula de Ciudadanía no es correcta, por favor verifique."
 
-                    await sync_to_async(Resultado.objects.create)(
+                    await crear_resultado(
                         consulta_id=consulta_id,
                         fuente=fuente_obj,
                         score=0,
@@ -199,7 +198,7 @@ async def consultar_rnmc(consulta_id, cedula, tipo_doc, fecha_expedicion):
                         except Exception:
                             pass
 
-                        await sync_to_async(Resultado.objects.create)(
+                        await crear_resultado(
                             consulta_id=consulta_id,
                             fuente=fuente_obj,
                             score=0,
@@ -240,7 +239,7 @@ async def consultar_rnmc(consulta_id, cedula, tipo_doc, fecha_expedicion):
                     score = 10
                     mensaje = "Tiene medidas correctivas pendientes"
 
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id,
                     fuente=fuente_obj,
                     score=score,
@@ -269,7 +268,7 @@ async def consultar_rnmc(consulta_id, cedula, tipo_doc, fecha_expedicion):
                 pass
 
             if intento == MAX_INTENTOS:
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id,
                     fuente=fuente_obj,
                     score=0,
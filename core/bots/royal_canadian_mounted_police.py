@@ -1,10 +1,10 @@
 import os
 import re
 from datetime import datetime
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 from PIL import Image
 
 PAGE_URL = "https://www.state.gov/foreign-terrorist-organizations/"
@@ -43,7 +43,7 @@ async def consultar_plantilla(consulta_id, cedula, nombre: str):
     relative_png = os.path.join(relative_folder, png_name)
 
     # Fuente en BD
-    fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+    fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
 
     intentos = 0
     exito = False
@@ -157,7 +157,7 @@ async def consultar_plantilla(consulta_id, cedula, nombre: str):
                 await browser.close()
 
             # Guardar resultado en la BD
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente=fuente_obj,
                 score=score,
@@ -182,7 +182,7 @@ async def consultar_plantilla(consulta_id, cedula, nombre: str):
 
     # ❌ Si falló tras 3 intentos
     if not exito:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
@@ -3,11 +3,11 @@ import asyncio
 from datetime import datetime
 from django.conf import settings
 
-from playwright.async_api import async_playwright
-from asgiref.sync import sync_to_async
+from core.utils.browser_pool import async_playwright
 
 from core.resolver.captcha_img2 import resolver_captcha_imagen
-from core.models import Resultado, Fuente
+from core.utils.fuentes import abuscar_fuente
+from core.utils.resultados import crear_resultado
 
 import cv2
 import numpy as np
@@ -130,7 +130,7 @@ async def consultar_ruaf(cedula, tipo_doc, consulta_id, fecha_expedicion=None):
 
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
-    fuente_obj = await sync_to_async(Fuente.objects.filter(nombre=NOMBRE_SITIO).first)()
+    fuente_obj = await abuscar_fuente(NOMBRE_SITIO)
 
     # Normalizar fecha de expedición a dd/mm/YYYY
     # Si no se proporciona, usar la fecha de hoy
@@ -282,7 +282,7 @@ async def consultar_ruaf(cedula, tipo_doc, consulta_id, fecha_expedicion=None):
                         imagen_path = pdf_path.replace(".pdf", ".png")
                         pdf_a_imagen(pdf_path, imagen_path)
                         if fuente_obj:
-                            await sync_to_async(Resultado.objects.create)(
+                            await crear_resultado(
                                 consulta_id=consulta_id,
                                 fuente=fuente_obj,
                                 score=0,
@@ -329,7 +329,7 @@ async def consultar_ruaf(cedula, tipo_doc, consulta_id, fecha_expedicion=None):
                     tb_snippet = (tb or '').strip()[:1500]
                     if tb_snippet:
                         mensaje_err = mensaje_err + "\nTraceback:\n" + tb_snippet
-                    await sync_to_async(Resultado.objects.create)(
+                    await crear_resultado(
                         consulta_id=consulta_id,
                         fuente=fuente_obj,
                         score=0,
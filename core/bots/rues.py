@@ -1,9 +1,9 @@
 import os
 from datetime import datetime
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from core.models import Resultado, Fuente
+from core.utils.fuentes import abuscar_fuente
+from core.utils.resultados import crear_resultado
 from PIL import Image
 
 nombre_sitio = "rues"
@@ -20,7 +20,7 @@ async def consultar_rues(cedula, consulta_id):
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     hallazgos_count = 0
 
-    fuente_obj = await sync_to_async(Fuente.objects.filter(nombre=nombre_sitio).first)()
+    fuente_obj = await abuscar_fuente(nombre_sitio)
 
     for intento in range(1, MAX_INTENTOS + 1):
         try:
@@ -62,7 +62,7 @@ async def consultar_rues(cedula, consulta_id):
 
                     # Guardar cada resultado individualmente
                     if fuente_obj:
-                        await sync_to_async(Resultado.objects.create)(
+                        await crear_resultado(
                             consulta_id=consulta_id,
                             fuente=fuente_obj,
                             score=score,
@@ -85,7 +85,7 @@ async def consultar_rues(cedula, consulta_id):
                     error_path = ""
             if intento == MAX_INTENTOS:
                 if fuente_obj:
-                    await sync_to_async(Resultado.objects.create)(
+                    await crear_resultado(
                         consulta_id=consulta_id,
                         fuente=fuente_obj,
                         score=0,
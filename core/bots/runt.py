@@ -16,10 +16,10 @@ from datetime import datetime
 from typing import Optional
 
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright, TimeoutError as PWTimeout
-
-from core.models import Resultado, Fuente
+from playwright.async_api import TimeoutError as PWTimeout
+from core.utils.browser_pool import async_playwright
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 from core.resolver.captcha_img import resolver_captcha_imagen  # tu resolver (async o sync adaptado)
 
 logger = logging.getLogger(__name__)
@@ -51,7 +51,7 @@ DOC_TYPE_MAP = {
 
 
 async def _guardar_resultado(consulta_id, fuente_obj, estado, mensaje, rel_path):
-    await sync_to_async(Resultado.objects.create)(
+    await crear_resultado(
         consulta_id=consulta_id,
         fuente=fuente_obj,
         score=0,
@@ -108,10 +108,10 @@ async def consultar_runt(consulta_id: int, tipo_doc: str, numero: str):
     Flujo robusto para consultar RUNT con manejo de captchas que fallan en el primer intento.
     """
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
         # Si no existe la fuente, registrar y salir
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=None,
             score=0,
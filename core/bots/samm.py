@@ -1,10 +1,10 @@
 # core/bots/samm.py
 import os
 from datetime import datetime
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from core.models import Fuente, Resultado
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 from PIL import Image, ImageDraw
 
 URL = "https://samm.dsca.mil/search/site_search"
@@ -18,9 +18,9 @@ async def consultar_samm(consulta_id: int, nombre_completo: str, cedula):
 
     # Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=0,
             estado="error", mensaje=f"No se encontró la Fuente '{NOMBRE_SITIO}': {e}", archivo=""
         )
@@ -81,7 +81,7 @@ async def consultar_samm(consulta_id: int, nombre_completo: str, cedula):
                 await browser.close()
 
             # Guardar en BD (éxito)
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente=fuente_obj,
                 score=score,
@@ -113,7 +113,7 @@ async def consultar_samm(consulta_id: int, nombre_completo: str, cedula):
         d.text((10, 10), f"Error en consulta SAMM:\n{str(error_final)}", fill=(0, 0, 0))
         img.save(absolute_path)
 
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
@@ -123,7 +123,7 @@ async def consultar_samm(consulta_id: int, nombre_completo: str, cedula):
         )
     except Exception as e2:
         # Fallback si hasta guardar el error falla
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
@@ -1,9 +1,9 @@
 import os
 from datetime import datetime
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 URL = "https://samm.dsca.mil/search/policy_memo?search_api_fulltext"
 NOMBRE_SITIO = "samm_policy_memo"
@@ -12,8 +12,8 @@ MAX_INTENTOS = 3
 async def consultar_samm_policy_memo(consulta_id: int, nombre: str, cedula):
     nombre_limpio = (nombre or "").strip()
     if not nombre_limpio:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
-        await sync_to_async(Resultado.objects.create)(
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
@@ -54,8 +54,8 @@ async def consultar_samm_policy_memo(consulta_id: int, nombre: str, cedula):
                     score = 10
                     mensaje = "Se encontraron hallazgos"
 
-                fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
-                await sync_to_async(Resultado.objects.create)(
+                fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
+                await crear_resultado(
                     consulta_id=consulta_id,
                     fuente=fuente_obj,
                     score=score,
@@ -80,8 +80,8 @@ async def consultar_samm_policy_memo(consulta_id: int, nombre: str, cedula):
                     pass
 
             if intentos >= MAX_INTENTOS:
-                fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
-                await sync_to_async(Resultado.objects.create)(
+                fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
+                await crear_resultado(
                     consulta_id=consulta_id,
                     fuente=fuente_obj,
                     score=0,
@@ -1,9 +1,9 @@
 import os
 from datetime import datetime
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 from PIL import Image 
 from urllib.parse import quote 
 NOMBRE_SITIO = "sanctions_map"
@@ -12,8 +12,8 @@ MAX_INTENTOS = 3
 async def consultar_sanctions_map(consulta_id: int, nombre: str):
     nombre_limpio = (nombre or "").strip()
     if not nombre_limpio:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
-        await sync_to_async(Resultado.objects.create)(
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
@@ -26,8 +26,8 @@ async def consultar_sanctions_map(consulta_id: int, nombre: str):
     # URL-encode del nombre
     nombre_encoded = quote(nombre_limpio)
     if not nombre_limpio:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
-        await sync_to_async(Resultado.objects.create)(
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
@@ -97,8 +97,8 @@ async def consultar_sanctions_map(consulta_id: int, nombre: str):
                     score = 10
                     mensaje = "Se encontró un resultado"
 
-                fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
-                await sync_to_async(Resultado.objects.create)(
+                fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
+                await crear_resultado(
                     consulta_id=consulta_id,
                     fuente=fuente_obj,
                     score=score,
@@ -122,8 +122,8 @@ async def consultar_sanctions_map(consulta_id: int, nombre: str):
                     pass
 
             if intentos >= MAX_INTENTOS:
-                fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
-                await sync_to_async(Resultado.objects.create)(
+                fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
+                await crear_resultado(
                     consulta_id=consulta_id,
                     fuente=fuente_obj,
                     score=0,
@@ -5,11 +5,11 @@ from datetime import datetime
 from urllib.parse import quote_plus
 
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from PyPDF2 import PdfReader, PdfWriter
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 NOMBRE_SITIO = "scj_mas_buscados_pdf"
 
@@ -42,7 +42,7 @@ def _safe_rel(path: str) -> str:
 
 
 async def _guardar_resultado(consulta_id, fuente, estado, mensaje, archivo_rel):
-    await sync_to_async(Resultado.objects.create)(
+    await crear_resultado(
         consulta_id=consulta_id,
         fuente=fuente,
         score=0,
@@ -62,7 +62,7 @@ async def consultar_scj_mas_buscados_pdf(consulta_id: int, nombre: str, apellido
     """
     # 0) Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
         await _guardar_resultado(
             consulta_id, None, "error",
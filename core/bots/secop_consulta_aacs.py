@@ -3,10 +3,10 @@ import re
 import asyncio
 from datetime import datetime
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from PIL import Image
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 NOMBRE_SITIO = "secop_consulta_aacs"
 URL = "https://www.contratos.gov.co/consultas/consultarArchivosAACS.do"
@@ -45,9 +45,9 @@ async def consultar_secop_consulta_aacs(consulta_id: int, nombre: str, tipo_doc:
 
     # Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=None,
             score=0,
@@ -112,7 +112,7 @@ async def consultar_secop_consulta_aacs(consulta_id: int, nombre: str, tipo_doc:
                 browser = None
 
                 # Guardar resultado en BD
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id,
                     fuente=fuente_obj,
                     score=score,
@@ -130,7 +130,7 @@ async def consultar_secop_consulta_aacs(consulta_id: int, nombre: str, tipo_doc:
                 except:
                     pass
             if intentos >= MAX_INTENTOS:
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id,
                     fuente=fuente_obj,
                     score=0,
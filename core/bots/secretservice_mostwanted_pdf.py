@@ -2,10 +2,10 @@ import os
 import re
 import asyncio
 from datetime import datetime
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 URL = "https://www.secretservice.gov/investigations/mostwanted"
 NOMBRE_SITIO = "secretservice_mostwanted"
@@ -31,9 +31,9 @@ async def consultar_secretservice_mostwanted_pdf(consulta_id: int, nombre: str,
 
     # Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=None,
             score=0,
@@ -75,7 +75,7 @@ async def consultar_secretservice_mostwanted_pdf(consulta_id: int, nombre: str,
                 browser = None
 
                 # Guardar en BD
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id,
                     fuente=fuente_obj,
                     score=score,
@@ -93,7 +93,7 @@ async def consultar_secretservice_mostwanted_pdf(consulta_id: int, nombre: str,
                 except:
                     pass
             if intentos >= MAX_INTENTOS:
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id,
                     fuente=fuente_obj,
                     score=0,
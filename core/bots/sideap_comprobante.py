@@ -4,10 +4,10 @@ import re
 import asyncio
 from datetime import datetime, date
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright, TimeoutError as PWTimeout
-
-from core.models import Resultado, Fuente
+from playwright.async_api import TimeoutError as PWTimeout
+from core.utils.browser_pool import async_playwright
+from core.utils.fuentes import abuscar_fuente
+from core.utils.resultados import crear_resultado
 from core.resolver.captcha_v2 import resolver_captcha_v2
 
 NOMBRE_SITIO = "sideap_comprobante"
@@ -107,7 +107,7 @@ def _norm_fecha_ddmmyy(s) -> str:
 
 
 async def _guardar_resultado(consulta_id, fuente_obj, estado, mensaje, rel_png, score=1):
-    await sync_to_async(Resultado.objects.create)(
+    await crear_resultado(
         consulta_id=consulta_id,
         fuente=fuente_obj,
         estado=estado,
@@ -124,7 +124,7 @@ async def consultar_sideap_comprobante(
     fecha_nacimiento: str,  # acepta varios -> se normaliza a dd/mm/yy, ej. "10/07/79"
     correo: str
 ):
-    fuente = await sync_to_async(lambda: Fuente.objects.filter(nombre=NOMBRE_SITIO).first())()
+    fuente = await abuscar_fuente(NOMBRE_SITIO)
     if not fuente:
         await _guardar_resultado(consulta_id, None, "Sin Validar",
                                  f"No existe Fuente con nombre='{NOMBRE_SITIO}'", "", score=0)
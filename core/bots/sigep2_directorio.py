@@ -4,10 +4,10 @@ import asyncio
 from datetime import datetime
 
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 NOMBRE_SITIO = "sigep2_directorio"
 URL = "https://www1.funcionpublica.gov.co/web/sigep2/directorio"
@@ -33,9 +33,9 @@ async def consultar_sigep2_directorio(consulta_id: int, nombre: str, apellido: s
 
     # 1) Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=None,
             score=0,
@@ -113,7 +113,7 @@ async def consultar_sigep2_directorio(consulta_id: int, nombre: str, apellido: s
                     score = 0
                     mensaje = "La busqueda arrojo 0 coincidencias"
 
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id,
                     fuente=fuente_obj,
                     score=score,
@@ -136,7 +136,7 @@ async def consultar_sigep2_directorio(consulta_id: int, nombre: str, apellido: s
                     pass
 
             if intentos >= MAX_INTENTOS:
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id,
                     fuente=fuente_obj,
                     score=0,
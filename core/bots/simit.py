@@ -5,10 +5,10 @@ from datetime import datetime
 from pathlib import Path
 
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import abuscar_fuente
+from core.utils.resultados import crear_resultado
 
 SIMIT_URL = "https://www.fcm.org.co/simit/#/home-public"
 NOMBRE_SITIO = "simit"
@@ -147,10 +147,10 @@ async def consultar_simit(cedula: str, consulta_id: int, tipo_doc: str = "CC"):
     ts = datetime.now().strftime("%Y%m%d_%H%M%S")
 
     # Fuente (resolver antes del loop, para usarla en errores finales)
-    fuente_obj = await sync_to_async(lambda: Fuente.objects.filter(nombre=NOMBRE_SITIO).first())()
+    fuente_obj = await abuscar_fuente(NOMBRE_SITIO)
     if not fuente_obj:
         print(f"[SIMIT] ERROR: No se encontró la fuente '{NOMBRE_SITIO}' en la base de datos.")
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=0,
             estado="Sin validar", mensaje=f"No se encontró la fuente '{NOMBRE_SITIO}' en la base de datos.", archivo=""
         )
@@ -360,7 +360,7 @@ async def consultar_simit(cedula: str, consulta_id: int, tipo_doc: str = "CC"):
 
                 # 6) Guardar resultado (PNG final como evidencia; el PDF queda en carpeta)
                 print(f"[SIMIT] Guardando resultado. Score: {score}, Mensaje: {mensaje}, Evidencia: {final_rel_png}")
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id,
                     fuente=fuente_obj,
                     score=score,
@@ -390,7 +390,7 @@ async def consultar_simit(cedula: str, consulta_id: int, tipo_doc: str = "CC"):
                 print("[SIMIT] No se pudo cerrar el navegador tras error.")
 
     # 7) Error definitivo
-    await sync_to_async(Resultado.objects.create)(
+    await crear_resultado(
         consulta_id=consulta_id,
         fuente=fuente_obj,
         score=0,
@@ -1,10 +1,11 @@
 # core/bots/sisben.py
 import os
 from datetime import datetime
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
 from asgiref.sync import sync_to_async
-from core.models import Resultado, Fuente
+from core.utils.fuentes import buscar_fuente
+from core.utils.resultados import crear_resultado
 
 url = "https://reportes.sisben.gov.co/dnp_sisbenconsulta"
 nombre_sitio = "sisben"
@@ -24,11 +25,10 @@ TIPO_DOC_MAP = {
 
 @sync_to_async
 def get_fuente(nombre):
-    return Fuente.objects.filter(nombre=nombre).first()
+    return buscar_fuente(nombre)
 
-@sync_to_async
-def guardar_resultado(**kwargs):
-    return Resultado.objects.create(**kwargs)
+async def guardar_resultado(**kwargs):
+    return await crear_resultado(**kwargs)
 
 async def tomar_screenshot(pagina, consulta_id, cedula, suffix=""):
     """Crea carpetas y toma screenshot, devuelve ruta relativa"""
@@ -2,10 +2,10 @@ import os
 import datetime
 import aiohttp
 from bs4 import BeautifulSoup
-from asgiref.sync import sync_to_async
 from django.conf import settings
 from PIL import Image, ImageDraw, ImageFont
-from core.models import Resultado, Fuente  # ajusta según tu app
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 NOMBRE_SITIO = "state_designation_cartels"
 
@@ -64,10 +64,10 @@ async def consultar_state_designation_cartels_pdf(consulta_id: int, nombre: str,
     img.save(imagen_path)
 
     # Guardar resultado en BD
-    fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+    fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     archivo_relativo = os.path.join(relative_folder, "resultado.png")
 
-    await sync_to_async(Resultado.objects.create)(
+    await crear_resultado(
         consulta_id=consulta_id,
         fuente=fuente_obj,
         score=score,
@@ -1,9 +1,9 @@
 import os, urllib.parse, random, asyncio
 from datetime import datetime
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 URL = "https://www.state.gov/reports/section-353-corrupt-and-undemocratic-actors-report-2024/"
 NOMBRE_SITIO = "state_section_353"
@@ -84,9 +84,9 @@ async def consultar_state_section_353_pdf(consulta_id: int, nombre: str, cedula:
 
     # Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=0,
             estado="Sin validar",
             mensaje=f"No se encontró la Fuente '{NOMBRE_SITIO}': {e}",
@@ -140,7 +140,7 @@ async def consultar_state_section_353_pdf(consulta_id: int, nombre: str, cedula:
             # 5) CloudFront 403 → Sin validar
             if await _is_cloudfront_block(page):
                 await ctx.close(); await navegador.close()
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id, fuente=fuente_obj,
                     score=0, estado="Sin validar",
                     mensaje="La fuente bloqueó la solicitud (CloudFront 403: Request blocked). Intenta más tarde.",
@@ -187,7 +187,7 @@ async def consultar_state_section_353_pdf(consulta_id: int, nombre: str, cedula:
             await ctx.close(); await navegador.close()
 
         # 7) Guardar en BD
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj,
             score=score, estado="Validada",
             mensaje=mensaje, archivo=out_png_rel
@@ -209,7 +209,7 @@ async def consultar_state_section_353_pdf(consulta_id: int, nombre: str, cedula:
         except Exception:
             pass
 
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj,
             score=0, estado="Sin validar",
             mensaje="La fuente no se ha podido consultar en este momento.",
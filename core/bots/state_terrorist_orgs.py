@@ -1,9 +1,9 @@
 import os, asyncio
 from datetime import datetime
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 URL = "https://www.state.gov/foreign-terrorist-organizations/"
 NOMBRE_SITIO = "state_terrorist_orgs"
@@ -57,9 +57,9 @@ async def consultar_state_terrorist_orgs(consulta_id: int, nombre: str, cedula:
     out_png_rel = os.path.join(rel_dir, os.path.basename(out_png_abs))
 
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=0,
             estado="Sin validar",
             mensaje=f"No se encontró la Fuente '{NOMBRE_SITIO}': {e}",
@@ -113,7 +113,7 @@ async def consultar_state_terrorist_orgs(consulta_id: int, nombre: str, cedula:
             # --- NUEVO: bloqueo CloudFront 403 ---
             if await _is_cloudfront_block(page):
                 await ctx.close(); await navegador.close()
-                await sync_to_async(Resultado.objects.create)(
+                await crear_resultado(
                     consulta_id=consulta_id,
                     fuente=fuente_obj,
                     score=0,
@@ -157,7 +157,7 @@ async def consultar_state_terrorist_orgs(consulta_id: int, nombre: str, cedula:
 
             await ctx.close(); await navegador.close()
 
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=score,
@@ -182,7 +182,7 @@ async def consultar_state_terrorist_orgs(consulta_id: int, nombre: str, cedula:
         except Exception:
             pass
 
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
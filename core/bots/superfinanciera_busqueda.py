@@ -5,10 +5,10 @@ from datetime import datetime
 from PIL import Image, ImageDraw
 
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 NOMBRE_SITIO = "superfinanciera_busqueda_pdf"
 URL = "https://www.superfinanciera.gov.co/buscar/?q=designa&tk=fba5c5ce4c12e71db8908611a99a91cb"
@@ -25,9 +25,9 @@ async def consultar_superfinanciera_busqueda_pdf(consulta_id: int, nombre: str,
 
     # 1. Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=None,
             score=0,
@@ -107,7 +107,7 @@ async def consultar_superfinanciera_busqueda_pdf(consulta_id: int, nombre: str,
                 browser = None
 
             # Guardar resultado
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente=fuente_obj,
                 score=score,
@@ -143,7 +143,7 @@ async def consultar_superfinanciera_busqueda_pdf(consulta_id: int, nombre: str,
         d.text((10, 10), f"Error en consulta Superfinanciera: {str(error_final)}", fill=(0, 0, 0))
         img.save(abs_png)
 
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
@@ -152,7 +152,7 @@ async def consultar_superfinanciera_busqueda_pdf(consulta_id: int, nombre: str,
             archivo=rel_png
         )
     except Exception as e2:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
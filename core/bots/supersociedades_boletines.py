@@ -4,11 +4,11 @@ import asyncio
 from datetime import datetime
 
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from PIL import Image, ImageDraw
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 NOMBRE_SITIO = "supersociedades_boletines_conceptos"
 URL = "https://www.supersociedades.gov.co/boletines-conceptos-juridicos"
@@ -31,9 +31,9 @@ async def consultar_supersociedades_boletines(
 
     # Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=0,
             estado="error",
             mensaje=f"No se encontró la Fuente '{NOMBRE_SITIO}': {e}",
@@ -106,7 +106,7 @@ async def consultar_supersociedades_boletines(
                 browser = None
 
             # Guardar resultado OK
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente=fuente_obj,
                 score=score,
@@ -142,7 +142,7 @@ async def consultar_supersociedades_boletines(
         d.text((10, 10), f"Error en consulta Supersociedades: {str(error_final)}", fill=(0, 0, 0))
         img.save(abs_png)
 
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
@@ -151,7 +151,7 @@ async def consultar_supersociedades_boletines(
             archivo=rel_png,
         )
     except Exception as e2:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
@@ -5,10 +5,10 @@ from datetime import datetime
 from PIL import Image, ImageDraw
 
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 NOMBRE_SITIO = "supersolidaria_noticias"
 URL = "https://www.supersolidaria.gov.co/index.php/es/content/noticias"
@@ -31,9 +31,9 @@ async def consultar_supersolidaria_noticias(consulta_id: int, nombre: str, apell
 
     # 1) Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=None,
             score=0,
@@ -138,7 +138,7 @@ async def consultar_supersolidaria_noticias(consulta_id: int, nombre: str, apell
                 browser = None
 
             # Guardar resultado como VALIDADO
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente=fuente_obj,
                 score=0,
@@ -173,7 +173,7 @@ async def consultar_supersolidaria_noticias(consulta_id: int, nombre: str, apell
         d.text((10, 10), f"Error en consulta Supersolidaria: {str(error_final)}", fill=(0, 0, 0))
         img.save(abs_png)
 
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
@@ -182,7 +182,7 @@ async def consultar_supersolidaria_noticias(consulta_id: int, nombre: str, apell
             archivo=rel_png,
         )
     except Exception as e2:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
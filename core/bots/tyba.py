@@ -8,9 +8,10 @@ from urllib.parse import urlparse, parse_qs
 
 from django.conf import settings
 from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import buscar_fuente
+from core.utils.resultados import crear_resultado
 from core.resolver.captcha_v2 import resolver_captcha_v2
 
 URL = "https://procesojudicial.ramajudicial.gov.co/Justicia21/Administracion/Ciudadanos/frmConsulta.aspx"
@@ -36,12 +37,11 @@ NO_ROWS_RE = re.compile(r"\bno\s+se\s+encontraron\s+registros\b\.?", re.I)
 
 @sync_to_async
 def _get_fuente(nombre):
-    return Fuente.objects.filter(nombre=nombre).first()
+    return buscar_fuente(nombre)
 
 
-@sync_to_async
-def _crear_resultado(consulta_id, fuente, score, estado, mensaje, archivo):
-    return Resultado.objects.create(
+async def _crear_resultado(consulta_id, fuente, score, estado, mensaje, archivo):
+    return await crear_resultado(
         consulta_id=consulta_id,
         fuente=fuente,
         score=score,
@@ -2,9 +2,9 @@ import os
 from datetime import datetime
 from django.conf import settings
 from core.resolver.captcha_v2 import resolver_captcha_v2
-from playwright.async_api import async_playwright
-from asgiref.sync import sync_to_async
-from core.models import Resultado, Fuente
+from core.utils.browser_pool import async_playwright
+from core.utils.fuentes import abuscar_fuente
+from core.utils.resultados import crear_resultado
 
 url = "https://www.ugpp.gov.co/consulte-con-cedula"
 nombre_sitio = "ugpp"
@@ -90,9 +90,9 @@ async def consultar_ugpp(cedula, tipo_doc, consulta_id):
                 await pagina.screenshot(path=absolute_path, full_page=False)
                 screenshot_path = relative_path
                 # guardar en BD
-                fuente_obj = await sync_to_async(Fuente.objects.filter(nombre=nombre_sitio).first)()
+                fuente_obj = await abuscar_fuente(nombre_sitio)
                 if fuente_obj:
-                    await sync_to_async(Resultado.objects.create)(
+                    await crear_resultado(
                         consulta_id=consulta_id,
                         fuente=fuente_obj,
                         score=score,
@@ -118,9 +118,9 @@ async def consultar_ugpp(cedula, tipo_doc, consulta_id):
                     pass
 
     # si falló los 3 intentos → guardar error en BD
-    fuente_obj = await sync_to_async(Fuente.objects.filter(nombre=nombre_sitio).first)()
+    fuente_obj = await abuscar_fuente(nombre_sitio)
     if fuente_obj:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
@@ -1,10 +1,10 @@
 # core/bots/un_consolidated_list.py 
 import os, re, asyncio
 from datetime import datetime
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 URL = "https://main.un.org/securitycouncil/es/content/un-sc-consolidated-list"
 NOMBRE_SITIO = "consolidated_list_onu"
@@ -124,7 +124,7 @@ async def consultar_un_consolidated_list(consulta_id: int, nombre: str, cedula:
     absolute_path = os.path.join(absolute_folder, file_name)
     relative_path = os.path.join(relative_folder, file_name)
 
-    fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+    fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
 
     success = False
     last_exception = None
@@ -140,7 +140,7 @@ async def consultar_un_consolidated_list(consulta_id: int, nombre: str, cedula:
             await asyncio.sleep(2)  # pequeño delay entre intentos
 
     if success:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
@@ -150,7 +150,7 @@ async def consultar_un_consolidated_list(consulta_id: int, nombre: str, cedula:
         )
     else:
         # Guardar error y pantallazo
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
@@ -1,12 +1,14 @@
 # bots/un_sc_consolidated.py
-import os, re, asyncio, urllib.parse, unicodedata
+import os, re, asyncio, urllib.parse
 from datetime import datetime
 
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
+from core.matching import similitud
+from core.matching.normalizar import plegar
 
 NOMBRE_SITIO = "un_sc_consolidated"  # crea/usa esta Fuente en tu tabla
 URL_SEARCH = "https://main.un.org/securitycouncil/en/content/search?p={q}"
@@ -16,13 +18,6 @@ GOTO_TIMEOUT_MS = 180_000
 SEL_NORES  = "div.view-empty"   # contiene "There are no results to show."
 SEL_ITEM   = "div.views-row"    # cada resultado
 
-def _norm(s: str) -> str:
-    """Normaliza: minúsculas, sin diacríticos, espacios comprimidos."""
-    s = (s or "").strip().lower()
-    s = "".join(c for c in unicodedata.normalize("NFD", s) if unicodedata.category(c) != "Mn")
-    s = re.sub(r"\s+", " ", s)
-    return s
-
 async def _clean_page_css(page):
     """Oculta header/footer/banners para screenshots limpios."""
     css = """
@@ -47,9 +42,9 @@ async def consultar_un_sc_consolidated(consulta_id: int, nombre: str, apellido:
 
     # 1) Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=1,
             estado="Sin Validar",
             mensaje=f"No se encontró la Fuente '{NOMBRE_SITIO}': {e}",
@@ -58,7 +53,7 @@ async def consultar_un_sc_consolidated(consulta_id: int, nombre: str, apellido:
         return
 
     if not full_name:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=fuente_obj, score=1,
             estado="Sin Validar",
             mensaje="Nombre y/o apellido vacíos para la consulta.",
@@ -82,7 +77,7 @@ async def consultar_un_sc_consolidated(consulta_id: int, nombre: str, apellido:
     last_error = None
     score_final = 1  # sube a 5 si hay match exacto
 
-    norm_query = _norm(full_name)
+    norm_query = plegar(full_name)
     exact_re = re.compile(rf"(?<!\w){re.escape(norm_query)}(?!\w)")
 
     try:
@@ -132,6 +127,7 @@ async def consultar_un_sc_consolidated(consulta_id: int, nombre: str, apellido:
 
                 n = await items.count()
                 exact_hit = False
+                lineas = []
 
                 for i in range(n):
                     item = items.nth(i)
@@ -139,14 +135,19 @@ async def consultar_un_sc_consolidated(consulta_id: int, nombre: str, apellido:
                         blob = await item.inner_text(timeout=4_000)
                     except Exception:
                         blob = ""
-                    norm_blob = _norm(blob)
+                    norm_blob = plegar(blob)
                     if norm_blob and exact_re.search(norm_blob):
                         exact_hit = True
                         break
+                    lineas.extend(re.split(r"[\r\n]+", blob))
 
-                if exact_hit:
-                    score_final = 5
+                # Sin el nombre literal: el renglón más parecido (orden, transliteración)
+                linea, sim = ("", 1.0) if exact_hit else similitud.mejor(full_name, lineas)
+                score_final = similitud.a_score(sim)
+                if score_final == 5:
                     mensaje_final = f"Coincidencia exacta encontrada en UN SC List para: '{full_name}'."
+                elif score_final == 3:
+                    mensaje_final = f"Posible coincidencia en UN SC List con '{full_name}': '{linea.strip()}' (similitud {sim:.2f})."
                 else:
                     score_final = 1
                     mensaje_final = "Se encontraron resultados, pero no hubo coincidencia exacta del nombre."
@@ -168,7 +169,7 @@ async def consultar_un_sc_consolidated(consulta_id: int, nombre: str, apellido:
 
         # 7) Guardar resultado
         if success:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id, fuente=fuente_obj,
                 score=score_final,
                 estado="Validada",
@@ -176,7 +177,7 @@ async def consultar_un_sc_consolidated(consulta_id: int, nombre: str, apellido:
                 archivo=relative_png
             )
         else:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id, fuente=fuente_obj,
                 score=1, estado="Sin Validar",
                 mensaje=last_error or "No fue posible obtener resultados.",
@@ -185,7 +186,7 @@ async def consultar_un_sc_consolidated(consulta_id: int, nombre: str, apellido:
 
     except Exception as e:
         try:
-            await sync_to_async(Resultado.objects.create)(
+            await crear_resultado(
                 consulta_id=consulta_id, fuente=fuente_obj,
                 score=1, estado="Sin Validar",
                 mensaje=str(e), archivo=""
@@ -2,10 +2,10 @@
 import os
 from datetime import datetime
 from urllib.parse import quote_plus
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 NOMBRE_SITIO = "usa_drug"
 
@@ -50,8 +50,8 @@ async def consultar_usa_drug(consulta_id: int, nombre: str, apellido: str, cedul
             ):
                 mensaje = ("El portal de la DEA bloqueó el acceso automático "
                            "(Access Denied). Intenta nuevamente más tarde.")
-                fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
-                await sync_to_async(Resultado.objects.create)(
+                fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
+                await crear_resultado(
                     consulta_id=consulta_id,
                     fuente=fuente_obj,
                     score=0,
@@ -85,8 +85,8 @@ async def consultar_usa_drug(consulta_id: int, nombre: str, apellido: str, cedul
 
             await navegador.close()
 
-            fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
-            await sync_to_async(Resultado.objects.create)(
+            fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente=fuente_obj,
                 score=score,
@@ -107,8 +107,8 @@ async def consultar_usa_drug(consulta_id: int, nombre: str, apellido: str, cedul
         except Exception:
             pass
 
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
-        await sync_to_async(Resultado.objects.create)(
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
+        await crear_resultado(
             consulta_id=consulta_id,
             fuente=fuente_obj,
             score=0,
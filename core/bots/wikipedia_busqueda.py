@@ -3,10 +3,10 @@ import re
 from datetime import datetime
 
 from django.conf import settings
-from asgiref.sync import sync_to_async
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 
-from core.models import Resultado, Fuente
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 NOMBRE_SITIO = "wikipedia_busqueda"
 URL = "https://es.wikipedia.org/wiki/Wikipedia:Portada"
@@ -21,7 +21,7 @@ WAIT_RESULTS_MS = 15000
 
 
 async def _guardar_resultado(consulta_id, fuente_obj, estado, mensaje, rel_path):
-    await sync_to_async(Resultado.objects.create)(
+    await crear_resultado(
         consulta_id=consulta_id,
         fuente=fuente_obj,
         score=0,
@@ -40,9 +40,9 @@ async def consultar_wikipedia_busqueda(consulta_id: int, nombre: str, apellido:
 
     # Fuente
     try:
-        fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
+        fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
     except Exception as e:
-        await sync_to_async(Resultado.objects.create)(
+        await crear_resultado(
             consulta_id=consulta_id, fuente=None, score=0,
             estado="error", mensaje=f"No se encontró la Fuente '{NOMBRE_SITIO}': {e}", archivo=""
         )
@@ -1,10 +1,10 @@
 import os
 import re
 from datetime import datetime
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
-from core.models import Resultado, Fuente
-from asgiref.sync import sync_to_async
+from core.utils.fuentes import aobtener_fuente
+from core.utils.resultados import crear_resultado
 
 URL = "https://www.worldbank.org/en/projects-operations/procurement/debarred-firms"
 NOMBRE_SITIO = "worldbank_debarred_pdf"
@@ -64,8 +64,8 @@ async def consultar_worldbank_debarred_pdf(consulta_id: int, nombre: str, cedula
                 await page.screenshot(path=out_img_abs, full_page=True)
                 await browser.close()
 
-            fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
-            await sync_to_async(Resultado.objects.create)(
+            fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
+            await crear_resultado(
                 consulta_id=consulta_id,
                 fuente=fuente_obj,
                 score=0,
@@ -99,8 +99,8 @@ async def consultar_worldbank_debarred_pdf(consulta_id: int, nombre: str, cedula
                 await browser.close()
 
     # Registrar resultado con error + pantallazo
-    fuente_obj = await sync_to_async(Fuente.objects.get)(nombre=NOMBRE_SITIO)
-    await sync_to_async(Resultado.objects.create)(
+    fuente_obj = await aobtener_fuente(NOMBRE_SITIO)
+    await crear_resultado(
         consulta_id=consulta_id,
         fuente=fuente_obj,
         score=0,
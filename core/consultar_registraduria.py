@@ -2,7 +2,7 @@
 
 import os
 from datetime import datetime
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 from django.conf import settings
 from core.resolver.captcha_img import resolver_captcha_imagen
 
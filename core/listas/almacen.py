@@ -0,0 +1,195 @@
+# core/listas/almacen.py
+"""
+Almacén local de listas restrictivas (modelos ListaDataset / EntradaLista /
+NombreLista / DocumentoLista y, para los grafos, RelacionLista), particionado
+por dataset.
+
+Cada carga se escribe aparte, en una copia en preparación (`lista` con el
+sufijo PREPARACION), por lotes de `LOTE` en transacciones cortas, así el
+candado de escritura de SQLite nunca queda tomado durante toda la ingesta.
+Al terminar, una sola transacción corta intercambia las filas de
+ListaDataset: la copia nueva pasa a `lista` y la anterior a `lista` + RETIRADA.
+Las consultas ven la versión anterior completa hasta ese commit y la nueva
+completa, con sus relaciones, desde él. La copia retirada se conserva hasta la
+siguiente carga, porque los índices en memoria de otros procesos la siguen
+usando mientras se reconstruyen.
+"""
+import hashlib
+import json
+
+from django.db import transaction
+from django.utils import timezone
+
+from core.models import DocumentoLista, EntradaLista, ListaDataset, NombreLista, RelacionLista
+from . import indice
+from .normalizar import clave, documento
+
+LOTE = 2000
+# Sufijos de `lista` para la copia que se está cargando y la que se reemplazó
+PREPARACION = "@preparacion"
+RETIRADA = "@retirada"
+
+
+def huella(e: dict) -> str:
+    contenido = {k: e.get(k) for k in ("esquema", "nombre", "nombres", "datos", "documentos", "etiquetas")}
+    return hashlib.sha1(json.dumps(contenido, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def _crear(dataset, entradas):
+    for i in range(0, len(entradas), LOTE):
+        lote = entradas[i:i + LOTE]
+        creadas = EntradaLista.objects.bulk_create([
+            EntradaLista(
+                dataset=dataset,
+                id_externo=e["id"],
+                esquema=e.get("esquema") or "",
+                nombre=(e.get("nombre") or "")[:500],
+                datos=e.get("datos") or {},
+                etiquetas=e.get("etiquetas") or [],
+                huella=e["huella"],
+            )
+            for e in lote
+        ])
+        nombres, documentos = [], []
+        for e, obj in zip(lote, creadas):
+            claves = {clave(n) for n in [e.get("nombre")] + list(e.get("nombres") or [])}
+            nombres.extend(NombreLista(entrada=obj, clave=c[:500]) for c in claves if c)
+            for d in e.get("documentos") or []:
+                numero = documento(d.get("numero"))
+                if numero:
+                    documentos.append(DocumentoLista(
+                        entrada=obj, numero=numero[:100],
+                        tipo=(d.get("tipo") or "")[:100], pais=(d.get("pais") or "")[:100],
+                    ))
+        NombreLista.objects.bulk_create(nombres, batch_size=LOTE)
+        DocumentoLista.objects.bulk_create(documentos, batch_size=LOTE)
+
+
+def _crear_relaciones(dataset, relaciones) -> int:
+    total, lote = 0, []
+    for origen, destino, tipo in relaciones:
+        lote.append(RelacionLista(dataset=dataset, origen=origen[:200], destino=destino[:200], tipo=(tipo or "")[:200]))
+        if len(lote) >= LOTE:
+            RelacionLista.objects.bulk_create(lote)
+            total += len(lote)
+            lote = []
+    RelacionLista.objects.bulk_create(lote)
+    return total + len(lote)
+
+
+def _vaciar(lista: str, nombre: str):
+    """Borra una copia que nadie consulta (en preparación o retirada), un lote por transacción."""
+    for dataset in ListaDataset.objects.filter(lista=lista, nombre=nombre):
+        for filas in (dataset.relaciones, dataset.entradas):
+            while True:
+                ids = list(filas.values_list("id", flat=True)[:LOTE])
+                if not ids:
+                    break
+                filas.model.objects.filter(id__in=ids).delete()
+        dataset.delete()
+
+
+def reemplazar_dataset(lista: str, nombre: str, entradas, titulo: str = "", version: str = "", relaciones=None) -> dict:
+    """
+    Reemplaza `lista:nombre` por `entradas`, un iterable (puede ser un
+    generador) de dicts {'id', 'esquema', 'nombre', 'nombres', 'datos',
+    'documentos', 'etiquetas'}. Se recorre una sola vez y se escribe por lotes
+    de `LOTE` en la copia en preparación: en memoria sólo quedan los ids y las
+    huellas. Si un id se repite vale el primero. Sin ninguna entrada no se toca
+    la copia anterior.
+
+    `relaciones(ids)`, si se da, recibe los ids cargados y devuelve las aristas
+    (id_externo origen, id_externo destino, tipo) del dataset; se escriben en la
+    misma copia, así entradas y relaciones se publican juntas.
+
+    Devuelve cuántas entradas quedaron, cuántas eran nuevas, cambiaron o se
+    borraron (y cuántas relaciones, si se dieron).
+    """
+    existentes = dict(
+        EntradaLista.objects.filter(dataset__lista=lista, dataset__nombre=nombre).values_list("id_externo", "huella")
+    )
+    # Restos de una carga interrumpida
+    _vaciar(lista + PREPARACION, nombre)
+    preparado = ListaDataset.objects.create(lista=lista + PREPARACION, nombre=nombre)
+
+    vistos = set()
+    nuevas = cambiadas = 0
+    lote = []
+    for e in entradas:
+        if e["id"] in vistos:
+            continue
+        vistos.add(e["id"])
+        e = dict(e, huella=huella(e))
+        anterior = existentes.get(e["id"])
+        if anterior is None:
+            nuevas += 1
+        elif anterior != e["huella"]:
+            cambiadas += 1
+        lote.append(e)
+        if len(lote) >= LOTE:
+            with transaction.atomic():
+                _crear(preparado, lote)
+            lote.clear()
+
+    if not vistos:
+        _vaciar(lista + PREPARACION, nombre)
+        return {"total": 0, "nuevas": 0, "cambiadas": 0, "eliminadas": 0}
+    with transaction.atomic():
+        _crear(preparado, lote)
+    total_relaciones = None
+    if relaciones is not None:
+        # Cada bulk_create es su propia transacción corta
+        total_relaciones = _crear_relaciones(preparado, relaciones(vistos))
+
+    # La retirada en la carga anterior ya no la usa ningún índice
+    _vaciar(lista + RETIRADA, nombre)
+    with transaction.atomic():
+        vigente = ListaDataset.objects.select_for_update().filter(lista=lista, nombre=nombre).first()
+        if vigente is not None:
+            ListaDataset.objects.filter(id=vigente.id).update(lista=lista + RETIRADA)
+        preparado.lista = lista
+        preparado.titulo = titulo or (vigente.titulo if vigente else "")
+        preparado.version = version
+        preparado.verificado = timezone.now()
+        preparado.total_entradas = len(vistos)
+        preparado.save()
+        transaction.on_commit(lambda: indice.invalidar(lista))
+
+    r = {
+        "total": len(vistos), "nuevas": nuevas, "cambiadas": cambiadas,
+        "eliminadas": len(existentes.keys() - vistos),
+    }
+    if total_relaciones is not None:
+        r["relaciones"] = total_relaciones
+    return r
+
+
+def obtener_dataset(lista: str, nombre: str):
+    """El dataset si ya se cargó alguna vez; None si no existe copia local."""
+    return ListaDataset.objects.filter(lista=lista, nombre=nombre).first()
+
+
+def _edad(segundos: float) -> str:
+    if segundos < 3600:
+        return f"{max(int(segundos // 60), 0)} min"
+    if segundos < 48 * 3600:
+        return f"{int(segundos // 3600)} h"
+    return f"{int(segundos // 86400)} días"
+
+
+def vigencia(dataset) -> str:
+    """Versión y antigüedad de la copia local, para el mensaje de cada Resultado que la usa."""
+    verificado = dataset.verificado or dataset.fecha_carga
+    partes = []
+    if dataset.version:
+        partes.append(f"Publicación de la lista: {dataset.version}.")
+    if verificado:
+        partes.append(
+            f"Copia local verificada hace {_edad((timezone.now() - verificado).total_seconds())} "
+            f"({timezone.localtime(verificado):%Y-%m-%d %H:%M})."
+        )
+    return " ".join(partes)
+
+
+def entradas(ids):
+    return list(EntradaLista.objects.filter(id__in=list(ids)).select_related("dataset"))
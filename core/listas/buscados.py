@@ -0,0 +1,208 @@
+# core/listas/buscados.py
+"""
+Rastreo periódico de las listas de "más buscados" (FBI, DEA, ICE, NCA,
+Europol, Servicio Secreto, RCMP, Guardia Civil, CGFM, SCJ y Policía
+Nacional).
+
+Son páginas pequeñas que cambian poco, así que en vez de abrirlas en cada
+consulta se toma una foto periódica: un pantallazo de página completa de cada
+sitio y, por cada tarjeta de persona, su nombre, foto, enlace y la caja que
+ocupa en el pantallazo. Cada sitio es un dataset de la lista "buscados"; en la
+consulta el nombre se busca en el índice en memoria y la evidencia se recorta
+del pantallazo guardado (core.listas.evidencia), sin abrir el navegador.
+
+Los selectores de cada sitio parten de los que usan sus bots en vivo.
+"""
+import hashlib
+import os
+import re
+from datetime import datetime
+
+from django.conf import settings
+
+from core.matching.normalizar import plegar
+from core.models import EntradaLista
+from core.utils.browser_pool import async_playwright
+
+LISTA = "buscados"
+CARPETA = os.path.join("listas", LISTA)
+MAXIMO_PAGINAS = 20
+
+FUENTES = {
+    "fbi": {
+        "titulo": "FBI Ten Most Wanted Fugitives",
+        "url": "https://www.fbi.gov/wanted/topten",
+        "tarjeta": "ul.full-grid li, ul.wanted-grid-natural li",
+        "nombre": "h3.title a, h3 a, h3",
+    },
+    "dea": {
+        "titulo": "DEA Fugitives",
+        "url": "https://www.dea.gov/fugitives/all",
+        "tarjeta": ".l-view__row, .views-row",
+        "nombre": ".teaser__heading, h3, h2",
+        "siguiente": "a[rel='next'], li.pager__item--next a",
+    },
+    "ice": {
+        "titulo": "ICE Most Wanted",
+        "url": "https://www.ice.gov/most-wanted",
+        "tarjeta": ".views-row, .grid-item",
+        "nombre": ".field--name-title, h3, h2",
+    },
+    "nca": {
+        "titulo": "NCA Most Wanted (Reino Unido)",
+        "url": "https://www.nationalcrimeagency.gov.uk/most-wanted",
+        "tarjeta": ".most-wanted-item, .items-row .item, article",
+        "nombre": "h2, h3, .page-header",
+    },
+    "europol": {
+        "titulo": "Europe's Most Wanted",
+        "url": "https://eumostwanted.eu/es/",
+        "tarjeta": ".wanted_top, .views-row, article",
+        "nombre": ".title .content, .title, h2",
+    },
+    "secretservice": {
+        "titulo": "U.S. Secret Service Most Wanted",
+        "url": "https://www.secretservice.gov/investigations/mostwanted",
+        "tarjeta": ".most-wanted-container .views-row, .most-wanted-container article",
+        "nombre": ".field--name-title, h3, h2",
+    },
+    "rcmp": {
+        "titulo": "RCMP Wanted (Canadá)",
+        "url": "https://www.rcmp-grc.gc.ca/en/wanted",
+        "tarjeta": "main table tbody tr, main .wanted-person, main li.wanted",
+        "nombre": "a, h3, td",
+    },
+    "guardia_civil": {
+        "titulo": "Guardia Civil - Buscados",
+        "url": "https://web.guardiacivil.es/es/colaboracion/Buscados/buscados/",
+        "tarjeta": ".elemento, li:has(h3.nombre-buscado)",
+        "nombre": "h3.nombre-buscado",
+    },
+    "cgfm": {
+        "titulo": "Fuerzas Militares de Colombia - Más buscados",
+        "url": "https://www.cgfm.mil.co/es/taxonomy/term/4070",
+        "tarjeta": "div.view-content .views-row, ol.search-results li",
+        "nombre": ".field--name-title, h2, h3",
+        "siguiente": "li.pager__item--next a",
+    },
+    "scj": {
+        "titulo": "Secretaría de Seguridad de Bogotá - Homicidas más buscados",
+        "url": (
+            "https://scj.gov.co/es/noticias/estos-son-los-homicidas-m%C3%A1s-buscados-bogot%C3%A1-"
+            "hay-recompensa-hasta-50-millones-pesos"
+        ),
+        "tarjeta": "main .view-content .views-row, main article .paragraph",
+        "nombre": "h2, h3, strong",
+    },
+    "policia_colombia": {
+        "titulo": "Policía Nacional de Colombia - Los más buscados",
+        "url": "https://www.policia.gov.co/los-mas-buscados-colombia",
+        "tarjeta": ".buscado, div.view-content .views-row",
+        "nombre": ".nombre, h2, h3",
+        "siguiente": "li.pager__item--next a",
+    },
+}
+
+# Nombre, foto, enlace y caja (x, y, ancho, alto en px de la página) de cada tarjeta
+_TARJETAS_JS = """
+([tarjeta, nombre]) => Array.from(document.querySelectorAll(tarjeta)).map(el => {
+    const n = el.querySelector(nombre) || (el.matches(nombre) ? el : null);
+    const img = el.querySelector('img');
+    const a = (n && n.closest('a')) || el.querySelector('a[href]');
+    const r = el.getBoundingClientRect();
+    return {
+        nombre: n ? n.innerText : '',
+        foto: img ? img.src : '',
+        enlace: a ? a.href : '',
+        caja: [r.left + window.scrollX, r.top + window.scrollY, r.width, r.height],
+    };
+})
+"""
+
+
+def _limpiar(nombre: str) -> str:
+    return re.sub(r"\s+", " ", nombre or "").strip(" -–,;:")
+
+
+def entradas(fuente: str, tarjetas):
+    """Tarjetas rastreadas -> entradas del dataset `fuente`; una por persona."""
+    por_id = {}
+    for t in tarjetas:
+        nombre = _limpiar(t.get("nombre"))
+        if not plegar(nombre) or t.get("caja", [0, 0, 0, 0])[3] <= 0:
+            continue
+        # El enlace a la ficha es estable entre rastreos; si no hay, el nombre
+        id_externo = hashlib.sha1((t.get("enlace") or plegar(nombre)).encode("utf-8")).hexdigest()[:20]
+        if id_externo in por_id:
+            continue
+        datos = {
+            "fuente": FUENTES[fuente]["titulo"],
+            "foto": t.get("foto") or "",
+            "enlace": t.get("enlace") or "",
+            "captura": t["captura"],
+            "recorte": [round(v) for v in t["caja"]],
+        }
+        por_id[id_externo] = {
+            "id": id_externo,
+            "esquema": "Person",
+            "nombre": nombre,
+            "datos": {k: v for k, v in datos.items() if v},
+        }
+    return list(por_id.values())
+
+
+def diferencias(fuente: str, nuevas) -> tuple:
+    """(nombres que entran, nombres que salen) frente a la foto anterior de `fuente`."""
+    anteriores = set(
+        EntradaLista.objects.filter(dataset__lista=LISTA, dataset__nombre=fuente).values_list("nombre", flat=True)
+    )
+    actuales = {e["nombre"] for e in nuevas}
+    return sorted(actuales - anteriores), sorted(anteriores - actuales)
+
+
+def limpiar_capturas(fuente: str):
+    """Borra los pantallazos que ya no usa ninguna entrada guardada de `fuente`."""
+    carpeta = os.path.join(settings.MEDIA_ROOT, CARPETA, fuente)
+    if not os.path.isdir(carpeta):
+        return
+    vigentes = {
+        os.path.basename((datos or {}).get("captura") or "")
+        for datos in EntradaLista.objects.filter(dataset__lista=LISTA, dataset__nombre=fuente).values_list(
+            "datos", flat=True
+        )
+    }
+    for archivo in os.listdir(carpeta):
+        if archivo not in vigentes:
+            os.remove(os.path.join(carpeta, archivo))
+
+
+async def rastrear(fuente: str):
+    """Tarjetas de todas las páginas de `fuente`, cada una con la ruta relativa de su pantallazo."""
+    config = FUENTES[fuente]
+    carpeta_rel = os.path.join(CARPETA, fuente)
+    os.makedirs(os.path.join(settings.MEDIA_ROOT, carpeta_rel), exist_ok=True)
+    ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    tarjetas = []
+    async with async_playwright() as p:
+        navegador = await p.chromium.launch(headless=True)
+        try:
+            page = await navegador.new_page(viewport={"width": 1366, "height": 900}, device_scale_factor=1)
+            url = config["url"]
+            for n in range(MAXIMO_PAGINAS):
+                await page.goto(url, wait_until="domcontentloaded", timeout=120000)
+                try:
+                    await page.wait_for_selector(config["tarjeta"], timeout=20000)
+                except Exception:
+                    pass
+                captura_rel = os.path.join(carpeta_rel, f"{ts}_{n + 1}.png").replace("\\", "/")
+                await page.screenshot(path=os.path.join(settings.MEDIA_ROOT, captura_rel), full_page=True)
+                for t in await page.evaluate(_TARJETAS_JS, [config["tarjeta"], config["nombre"]]):
+                    tarjetas.append(dict(t, captura=captura_rel))
+                siguiente = page.locator(config["siguiente"]).first if config.get("siguiente") else None
+                if siguiente is None or not await siguiente.count():
+                    break
+                url = await siguiente.evaluate("a => a.href")
+        finally:
+            await navegador.close()
+    return tarjetas
@@ -0,0 +1,183 @@
+# core/listas/consulta.py
+"""
+Consulta de un bot contra la copia local de su lista en lugar del navegador.
+
+Una entrada de `get_bot_configs` con `'lista_local': 'opensanctions:us_ofac_sdn'`
+(o una lista de ellas, en orden de preferencia) se resuelve aquí si alguno de
+esos datasets ya está cargado: búsqueda en el índice en memoria por nombre y,
+si la entrada trae cédula, por número de documento; pantallazo sólo si hay
+coincidencias. Si no hay coincidencia exacta también se reportan nombres
+parecidos (score 3): las listas traen transliteraciones y errores de
+digitación; `'lista_aproximada': False` lo desactiva. Un sufijo `#etiqueta`
+('ue:fsf#2014/833') limita la búsqueda a las entradas con esa etiqueta. Las
+listas con grafo (ICIJ) se resuelven en core.listas.grafo. Sin copia local,
+el bot corre como siempre.
+"""
+
+from core.models import ListaDataset, Resultado
+from core.utils import bd
+from core.utils.fuentes import abuscar_fuente
+from core.utils.resultados import crear_resultado
+from . import almacen, evidencia, grafo
+from .indice import obtener_indice
+
+
+def nombre_consultado(kwargs: dict) -> str:
+    """Nombre completo a partir de las kwargs habituales de los bots."""
+    for llave in ("nombre_persona", "nombre_completo"):
+        if kwargs.get(llave):
+            return kwargs[llave].strip()
+    return f"{(kwargs.get('nombre') or '').strip()} {(kwargs.get('apellido') or '').strip()}".strip()
+
+
+def documento_consultado(kwargs: dict) -> str:
+    return str(kwargs.get("cedula") or kwargs.get("documento") or kwargs.get("pasaporte") or "").strip()
+
+
+def especificaciones(bot: dict):
+    """
+    'lista:dataset[#etiqueta,...]' declarados por la entrada, como lista de
+    tuplas (lista, dataset, etiquetas).
+    """
+    valor = bot.get("lista_local") or []
+    if isinstance(valor, str):
+        valor = [valor]
+    tuplas = []
+    for v in valor:
+        if ":" not in v:
+            continue
+        v, _, filtro = v.partition("#")
+        lista, nombre_dataset = v.split(":", 1)
+        tuplas.append((lista, nombre_dataset, [e for e in filtro.split(",") if e]))
+    return tuplas
+
+
+def datasets_por_titulo(lista: str, titulos) -> dict:
+    """título en minúsculas -> ListaDataset cargado de `lista`, en una sola consulta."""
+    buscados = {t.lower() for t in titulos}
+    encontrados = {}
+    for dataset in ListaDataset.objects.filter(lista=lista).exclude(titulo="").order_by("id"):
+        if dataset.titulo.lower() in buscados:
+            encontrados.setdefault(dataset.titulo.lower(), dataset)
+    return encontrados
+
+
+def coincidencias(dataset, consultado: str, numero: str = "", aproximado: bool = False, etiquetas=None):
+    """
+    (entradas por nombre, entradas por documento, entrada -> similitud) de
+    `dataset`. Las aproximadas sólo se buscan si no hubo coincidencia exacta.
+    """
+    indice = obtener_indice(dataset.lista)
+    datasets = [dataset.nombre]
+    por_nombre = indice.buscar_nombre(consultado, datasets, etiquetas) if consultado else set()
+    por_documento = indice.buscar_documento(numero, datasets, etiquetas) if numero else set()
+    similares = {}
+    if aproximado and consultado and not por_nombre and not por_documento:
+        similares = indice.buscar_aproximado(consultado, datasets, etiquetas=etiquetas)
+    if not por_nombre and not por_documento and not similares:
+        return [], [], {}
+    filas = {e.id: e for e in almacen.entradas(por_nombre | por_documento | set(similares))}
+    return (
+        [filas[i] for i in por_nombre if i in filas],
+        [filas[i] for i in por_documento if i in filas],
+        {filas[i]: s for i, s in similares.items() if i in filas},
+    )
+
+
+async def registrar(
+    consulta_id, nombre_fuente: str, consultado: str, dataset, numero: str = "", aproximado: bool = False,
+    etiquetas=None,
+) -> Resultado:
+    """Busca `consultado` (y `numero`) en `dataset` y guarda el Resultado de `nombre_fuente`."""
+    por_nombre, por_documento, similares = await bd.ejecutar(
+        coincidencias, dataset, consultado, numero, aproximado, etiquetas
+    )
+    titulo = dataset.titulo or dataset.nombre
+    if etiquetas:
+        titulo = f"{titulo} ({', '.join(etiquetas)})"
+    encontradas = por_documento + [e for e in por_nombre if e not in por_documento]
+    if por_documento:
+        score = 5
+        mensaje = (
+            f"Coincidencia por número de documento {numero} en {titulo}: "
+            f"{', '.join(e.nombre for e in por_documento[:5])}."
+        )
+    elif por_nombre:
+        score = 5
+        mensaje = (
+            f"Coincidencia exacta con el nombre buscado: '{consultado}' en {titulo} "
+            f"({len(por_nombre)} registro(s): {', '.join(e.nombre for e in por_nombre[:5])})."
+        )
+    elif similares:
+        score = 3
+        encontradas = sorted(similares, key=similares.get, reverse=True)
+        mensaje = (
+            f"Posible coincidencia con '{consultado}' en {titulo}: "
+            f"{', '.join(f'{e.nombre} (similitud {similares[e]:.2f})' for e in encontradas[:5])}."
+        )
+    else:
+        score = 1
+        mensaje = f"No hay coincidencias para '{consultado}' en {titulo}."
+    mensaje = f"{mensaje} {almacen.vigencia(dataset)}".strip()
+    archivo = ""
+    if encontradas:
+        archivo = await evidencia.renderizar(consulta_id, nombre_fuente, consultado or numero, dataset, encontradas)
+
+    fuente = await abuscar_fuente(nombre_fuente)
+    return await crear_resultado(
+        consulta_id=consulta_id,
+        fuente=fuente,
+        score=score,
+        estado="Validada",
+        mensaje=mensaje,
+        archivo=archivo,
+    )
+
+
+def cribar(lista_local, nombres) -> dict:
+    """
+    nombre -> ids de EntradaLista para muchos nombres de una vez contra el
+    primer dataset cargado de `lista_local` (mismo formato que en las configs).
+    Sólo consulta el índice en memoria; None si no hay copia local.
+    """
+    for lista, nombre_dataset, etiquetas in especificaciones({"lista_local": lista_local}):
+        if almacen.obtener_dataset(lista, nombre_dataset) is not None:
+            return obtener_indice(lista).buscar_lote(nombres, [nombre_dataset], etiquetas)
+    return None
+
+
+async def resolver(consulta_id, nombre_fuente: str, lista_local, consultado: str, numero: str = "", aproximado: bool = False) -> bool:
+    """
+    Para usar desde el propio bot: registra el Resultado con el primer dataset
+    de `lista_local` que esté cargado. False si no hay copia local.
+    """
+    if not consultado and not numero:
+        return False
+    for lista, nombre_dataset, etiquetas in especificaciones({"lista_local": lista_local}):
+        dataset = await bd.ejecutar(almacen.obtener_dataset, lista, nombre_dataset)
+        if dataset is None:
+            continue
+        if lista in grafo.LISTAS:
+            if consultado:
+                await grafo.registrar(consulta_id, nombre_fuente, consultado, dataset, etiquetas)
+                return True
+            continue
+        await registrar(consulta_id, nombre_fuente, consultado, dataset, numero, aproximado, etiquetas)
+        return True
+    return False
+
+
+async def consultar_local(bot: dict, nombre_fuente: str) -> bool:
+    """True si el bot quedó resuelto con una lista local; False si debe correr en vivo."""
+    kwargs = bot.get("kwargs") or {}
+    consultado = nombre_consultado(kwargs)
+    if not consultado or kwargs.get("consulta_id") is None:
+        return False
+    return await resolver(
+        kwargs["consulta_id"],
+        nombre_fuente,
+        bot.get("lista_local"),
+        consultado,
+        documento_consultado(kwargs),
+        bool(bot.get("lista_aproximada", True)),
+    )
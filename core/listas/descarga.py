@@ -0,0 +1,32 @@
+# core/listas/descarga.py
+"""Apertura de los archivos fuente de las listas (ruta local o URL, opcionalmente .gz)."""
+import gzip
+import io
+import os
+import tempfile
+
+import httpx
+
+
+def abrir(origen: str, binario: bool = False, headers=None):
+    """Abre `origen`; las URL se descargan primero a un temporal que se borra al cerrar."""
+    if origen.startswith(("http://", "https://")):
+        tmp = tempfile.NamedTemporaryFile(delete=False, suffix=os.path.basename(origen.split("?")[0]))
+        with httpx.stream("GET", origen, timeout=120, follow_redirects=True, headers=headers) as r:
+            r.raise_for_status()
+            for bloque in r.iter_bytes():
+                tmp.write(bloque)
+        tmp.close()
+        try:
+            return _abrir_archivo(tmp.name, binario)
+        finally:
+            # El descriptor abierto sigue siendo legible; así no quedan temporales
+            os.unlink(tmp.name)
+    return _abrir_archivo(origen, binario)
+
+
+def _abrir_archivo(ruta, binario):
+    crudo = gzip.open(ruta, "rb") if ruta.endswith(".gz") else open(ruta, "rb")
+    if binario:
+        return crudo
+    return io.TextIOWrapper(crudo, encoding="utf-8", newline="")
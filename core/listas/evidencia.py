@@ -0,0 +1,108 @@
+# core/listas/evidencia.py
+"""
+Pantallazo de evidencia para un hallazgo en una lista local.
+
+Sólo se genera cuando hay coincidencias: se arma un HTML con las entradas y
+se renderiza con un navegador del pool (`page.set_content`, sin red). Las
+entradas que traen su caja sobre un pantallazo guardado por el rastreo
+(listas de más buscados) se recortan de ese pantallazo, sin navegador.
+"""
+import html
+import os
+import re
+from datetime import datetime
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from PIL import Image
+
+from core.utils.browser_pool import async_playwright
+
+MAXIMO_RECORTES = 10
+
+ESTILO = """
+body { font-family: Arial, sans-serif; margin: 24px; color: #1f2937; }
+h1 { font-size: 20px; margin: 0 0 4px; }
+.meta { color: #6b7280; font-size: 13px; margin-bottom: 16px; }
+.entrada { border: 1px solid #d1d5db; border-radius: 6px; padding: 12px 16px; margin-bottom: 12px; }
+.entrada h2 { font-size: 16px; margin: 0 0 8px; color: #b91c1c; }
+table { border-collapse: collapse; font-size: 13px; }
+td { padding: 2px 12px 2px 0; vertical-align: top; }
+td.k { color: #6b7280; white-space: nowrap; }
+"""
+
+
+def _valor(v):
+    if isinstance(v, (list, tuple)):
+        return "; ".join(str(x) for x in v)
+    return str(v)
+
+
+def armar_html(consultado, dataset, entradas) -> str:
+    bloques = []
+    for e in entradas:
+        filas = "".join(
+            f"<tr><td class='k'>{html.escape(k)}</td><td>{html.escape(_valor(v))[:1500]}</td></tr>"
+            for k, v in [("id", e.id_externo), ("esquema", e.esquema)] + sorted((e.datos or {}).items())
+        )
+        bloques.append(f"<div class='entrada'><h2>{html.escape(e.nombre)}</h2><table>{filas}</table></div>")
+    carga = dataset.fecha_carga.strftime("%Y-%m-%d %H:%M") if dataset.fecha_carga else ""
+    return (
+        f"<html><head><meta charset='utf-8'><style>{ESTILO}</style></head><body>"
+        f"<h1>{html.escape(dataset.titulo or dataset.nombre)}</h1>"
+        f"<div class='meta'>Nombre consultado: <b>{html.escape(consultado)}</b> · "
+        f"{html.escape(dataset.lista)}/{html.escape(dataset.nombre)} · versión {html.escape(dataset.version or '-')} · "
+        f"copia local del {carga}</div>"
+        f"{''.join(bloques)}</body></html>"
+    )
+
+
+def _destino(consulta_id, nombre_sitio, consultado):
+    relative_folder = os.path.join("resultados", str(consulta_id))
+    absolute_folder = os.path.join(settings.MEDIA_ROOT, relative_folder)
+    os.makedirs(absolute_folder, exist_ok=True)
+    ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+    safe_name = re.sub(r"[^\w\.-]+", "_", consultado)
+    return relative_folder, absolute_folder, f"{nombre_sitio}_{safe_name}_{ts}.png"
+
+
+def recortar(consulta_id, nombre_sitio, consultado, entradas) -> str:
+    """Une en un PNG las cajas de cada entrada recortadas de su pantallazo guardado."""
+    recortes = []
+    for e in entradas[:MAXIMO_RECORTES]:
+        x, y, ancho, alto = e.datos["recorte"]
+        with Image.open(os.path.join(settings.MEDIA_ROOT, e.datos["captura"])) as captura:
+            recortes.append(captura.crop((x, y, x + ancho, y + alto)).convert("RGB"))
+    lienzo = Image.new("RGB", (max(r.width for r in recortes), sum(r.height for r in recortes)), "white")
+    arriba = 0
+    for r in recortes:
+        lienzo.paste(r, (0, arriba))
+        arriba += r.height
+    relative_folder, absolute_folder, png_name = _destino(consulta_id, nombre_sitio, consultado)
+    lienzo.save(os.path.join(absolute_folder, png_name))
+    return os.path.join(relative_folder, png_name).replace("\\", "/")
+
+
+async def renderizar(consulta_id, nombre_sitio, consultado, dataset, entradas) -> str:
+    """Ruta relativa del PNG de evidencia, o "" si no se pudo generar."""
+    if entradas and all((e.datos or {}).get("recorte") for e in entradas):
+        try:
+            return await sync_to_async(recortar)(consulta_id, nombre_sitio, consultado, entradas)
+        except Exception as e:
+            # Pantallazo borrado o ilegible: se arma el HTML como con cualquier lista
+            print(f"[listas] No se pudo recortar la evidencia de {nombre_sitio}: {e}")
+    relative_folder, absolute_folder, png_name = _destino(consulta_id, nombre_sitio, consultado)
+
+    try:
+        async with async_playwright() as p:
+            navegador = await p.chromium.launch(headless=True)
+            try:
+                page = await navegador.new_page(viewport={"width": 1200, "height": 800})
+                await page.set_content(armar_html(consultado, dataset, entradas))
+                await page.screenshot(path=os.path.join(absolute_folder, png_name), full_page=True)
+            finally:
+                await navegador.close()
+    except Exception as e:
+        print(f"[listas] No se pudo renderizar la evidencia de {nombre_sitio}: {e}")
+        return ""
+    return os.path.join(relative_folder, png_name).replace("\\", "/")
@@ -0,0 +1,164 @@
+# core/listas/frescura.py
+"""
+Actualización de las listas espejadas con peticiones condicionales.
+
+`REGISTRO` declara, por descarga, la URL, el comando de ingesta que la carga
+y los datasets que alimenta. Cada revisión pide la URL con `If-None-Match` /
+`If-Modified-Since` (los validadores de la descarga anterior, en
+DescargaLista): si la fuente responde 304 sólo se marca la copia como
+verificada; si hay versión nueva se baja a un archivo de staging, el comando
+de ingesta la carga por lotes en una copia aparte que se publica con un
+intercambio corto (core.listas.almacen; las consultas siguen viendo la versión
+anterior hasta entonces) y el índice en memoria de
+cada proceso se reemplaza en segundo plano (core.listas.indice). Los
+validadores sólo se guardan si la ingesta terminó bien, así que una carga
+fallida se reintenta completa en la siguiente revisión.
+
+La tarea periódica revisa cada hora; los exportes masivos (OpenSanctions,
+ICIJ) declaran `intervalo_h` y no se vuelven a revisar antes de ese plazo
+desde la última revisión exitosa.
+"""
+import io
+import os
+import tempfile
+from datetime import timedelta
+from functools import partial
+
+import httpx
+from django.conf import settings
+from django.core.management import call_command
+from django.utils import timezone
+
+from core.models import DescargaLista, ListaDataset
+from . import icij, multilaterales, ofac, ofsi, onu, opensanctions, ue
+
+STAGING = os.path.join("listas", "staging")
+
+REGISTRO = {
+    "onu": {"url": onu.URL, "comando": "ingestar_onu", "datasets": [(onu.LISTA, onu.DATASET)]},
+    "ue": {"url": ue.URL, "comando": "ingestar_ue", "datasets": [(ue.LISTA, ue.DATASET)]},
+    "ofsi": {"url": ofsi.URLS["csv"], "comando": "ingestar_ofsi", "datasets": [(ofsi.LISTA, ofsi.DATASET)]},
+    **{
+        f"ofac-{nombre}": {
+            "url": url, "comando": "ingestar_ofac", "argumentos": (nombre, "--origen", "{ruta}"),
+            "datasets": [(ofac.LISTA, nombre)],
+        }
+        for nombre, url in ofac.URLS.items()
+    },
+    "opensanctions": {
+        "url": opensanctions.URL_ENTIDADES, "comando": "ingestar_opensanctions",
+        "datasets": [(opensanctions.LISTA, None)], "intervalo_h": 24,
+    },
+    "icij": {
+        "url": icij.URL, "comando": "ingestar_icij",
+        "datasets": [(icij.LISTA, icij.DATASET)], "intervalo_h": 24,
+    },
+    **{
+        f"multilaterales-{banco}": {
+            "url": config["url"], "comando": "ingestar_multilaterales", "argumentos": (banco, "--origen", "{ruta}"),
+            "headers": partial(multilaterales.encabezados, banco),
+            "datasets": [(multilaterales.LISTA, banco)],
+        }
+        for banco, config in multilaterales.BANCOS.items()
+    },
+}
+
+
+def _encabezados(config):
+    """Encabezados de la descarga (fijos o calculados); None si le falta una credencial."""
+    headers = config.get("headers") or {}
+    return headers() if callable(headers) else dict(headers)
+
+
+def habilitada(nombre: str) -> bool:
+    """False si la descarga exige una credencial que no está configurada."""
+    return _encabezados(REGISTRO[nombre]) is not None
+
+
+def _datasets(config):
+    filtro = ListaDataset.objects.none()
+    for lista, nombre in config["datasets"]:
+        consulta = ListaDataset.objects.filter(lista=lista)
+        filtro = filtro | (consulta.filter(nombre=nombre) if nombre else consulta)
+    return filtro
+
+
+def _cargados(config) -> bool:
+    """True si todos los datasets de la descarga tienen copia local."""
+    for lista, nombre in config["datasets"]:
+        consulta = ListaDataset.objects.filter(lista=lista)
+        if not (consulta.filter(nombre=nombre) if nombre else consulta).exists():
+            return False
+    return True
+
+
+def _reciente(registro, config) -> bool:
+    """True si la descarga se revisó hace menos de su `intervalo_h`."""
+    intervalo_h = config.get("intervalo_h")
+    return bool(intervalo_h and registro.revisado
+                and timezone.now() - registro.revisado < timedelta(hours=intervalo_h))
+
+
+def _extension(url: str) -> str:
+    """Extensión del archivo remoto: los comandos deducen el formato de ella."""
+    return os.path.splitext(os.path.basename(url.split("?")[0]))[1]
+
+
+def actualizar(nombre: str, forzar: bool = False, salida=None) -> bool:
+    """
+    Revisa la descarga `nombre` del registro. True si se cargó una versión
+    nueva, False si la fuente respondió que no cambió (304) y None si se
+    revisó hace menos de su `intervalo_h` o le falta su credencial (no se pide
+    nada). Los errores se registran en DescargaLista y se propagan.
+    """
+    config = REGISTRO[nombre]
+    headers = _encabezados(config)
+    if headers is None:
+        return None
+    url = config["url"]
+    registro, _ = DescargaLista.objects.get_or_create(nombre=nombre, defaults={"url": url})
+    if registro.url != url:
+        registro.url, registro.etag, registro.ultima_modificacion = url, "", ""
+    elif not forzar and _reciente(registro, config) and _cargados(config):
+        return None
+
+    if not forzar and _cargados(config):
+        if registro.etag:
+            headers["If-None-Match"] = registro.etag
+        if registro.ultima_modificacion:
+            headers["If-Modified-Since"] = registro.ultima_modificacion
+
+    carpeta = os.path.join(settings.MEDIA_ROOT, STAGING)
+    os.makedirs(carpeta, exist_ok=True)
+    descriptor, ruta = tempfile.mkstemp(dir=carpeta, prefix=f"{nombre}-", suffix=_extension(url))
+    os.close(descriptor)
+    ahora = timezone.now()
+    try:
+        with httpx.stream("GET", url, headers=headers, timeout=600, follow_redirects=True) as r:
+            if r.status_code == 304:
+                registro.revisado, registro.error = ahora, ""
+                registro.save()
+                _datasets(config).update(verificado=ahora)
+                return False
+            r.raise_for_status()
+            with open(ruta, "wb") as fh:
+                for bloque in r.iter_bytes():
+                    fh.write(bloque)
+            etag, ultima_modificacion = r.headers.get("ETag", ""), r.headers.get("Last-Modified", "")
+
+        argumentos = [a.format(ruta=ruta) for a in config.get("argumentos", ("{ruta}",))]
+        call_command(config["comando"], *argumentos, stdout=salida or io.StringIO())
+
+        registro.etag, registro.ultima_modificacion = etag[:255], ultima_modificacion[:100]
+        registro.revisado = registro.descargado = ahora
+        registro.error = ""
+        registro.save()
+        _datasets(config).update(verificado=ahora)
+        return True
+    except Exception as e:
+        registro.error = str(e)[:2000]
+        registro.save()
+        raise
+    finally:
+        if os.path.exists(ruta):
+            os.unlink(ruta)
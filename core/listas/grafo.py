@@ -0,0 +1,144 @@
+# core/listas/grafo.py
+"""
+Consulta de datasets con estructura de grafo (nodos EntradaLista + aristas
+RelacionLista), hoy ICIJ Offshore Leaks.
+
+Se buscan los nodos cuyo nombre normalizado coincide (índice de BD sobre
+NombreLista.clave; el grafo es demasiado grande para tenerlo en memoria en
+cada proceso) y se recorren sus relaciones hasta `PROFUNDIDAD` saltos. El
+vecindario se memoriza unos minutos por nombre: los seis bots de Offshore
+Leaks de una consulta se responden con una sola búsqueda y cada uno filtra
+por su filtración (etiqueta).
+"""
+import copy
+import threading
+import time
+
+from django.db.models import Q
+
+from core.models import EntradaLista, NombreLista, RelacionLista, Resultado
+from core.utils import bd
+from core.utils.fuentes import abuscar_fuente
+from core.utils.resultados import crear_resultado
+from . import almacen, evidencia
+from .normalizar import clave
+
+LISTAS = {"icij"}
+PROFUNDIDAD = 2
+# Tope de nodos nuevos por nivel: un intermediario puede tener miles de entidades
+MAXIMO_POR_NIVEL = 200
+MEMORIA_S = 300
+
+_memo = {}
+_locks = {}
+_lock = threading.Lock()
+
+
+def _recorrer(dataset, consultado: str, profundidad: int):
+    """(coincidencias, {id_externo: (nivel, tipo, id vecino)}, {id_externo: EntradaLista})."""
+    inicio = set(
+        NombreLista.objects.filter(clave=clave(consultado), entrada__dataset=dataset)
+        .values_list("entrada__id_externo", flat=True)
+    )
+    niveles = {i: (0, "", "") for i in inicio}
+    frontera = set(inicio)
+    for nivel in range(1, profundidad + 1):
+        if not frontera:
+            break
+        nueva = set()
+        aristas = RelacionLista.objects.filter(dataset=dataset).filter(
+            Q(origen__in=frontera) | Q(destino__in=frontera)
+        ).values_list("origen", "destino", "tipo")
+        for origen, destino, tipo in aristas.iterator(chunk_size=2000):
+            for desde, hacia in ((origen, destino), (destino, origen)):
+                if desde in frontera and hacia not in niveles and len(nueva) < MAXIMO_POR_NIVEL:
+                    niveles[hacia] = (nivel, tipo, desde)
+                    nueva.add(hacia)
+        frontera = nueva
+    nodos = {
+        e.id_externo: e
+        for e in EntradaLista.objects.filter(dataset=dataset, id_externo__in=list(niveles)).select_related("dataset")
+    }
+    return [nodos[i] for i in inicio if i in nodos], niveles, nodos
+
+
+def vecindario(dataset, consultado: str, profundidad: int = PROFUNDIDAD):
+    """`_recorrer` memorizado por (dataset, versión, nombre); una sola búsqueda aunque la pidan varios bots a la vez."""
+    llave = (dataset.id, dataset.version, str(dataset.fecha_carga), clave(consultado), profundidad)
+    with _lock:
+        guardado = _memo.get(llave)
+        if guardado is not None and time.monotonic() - guardado[0] < MEMORIA_S:
+            return guardado[1]
+        lock_llave = _locks.setdefault(llave, threading.Lock())
+    with lock_llave:
+        with _lock:
+            guardado = _memo.get(llave)
+            if guardado is not None and time.monotonic() - guardado[0] < MEMORIA_S:
+                return guardado[1]
+        resultado = _recorrer(dataset, consultado, profundidad)
+        with _lock:
+            ahora = time.monotonic()
+            for k in [k for k, (t, _) in _memo.items() if ahora - t >= MEMORIA_S]:
+                _memo.pop(k, None)
+                _locks.pop(k, None)
+            _memo[llave] = (ahora, resultado)
+        return resultado
+
+
+def filtrar(dataset, consultado: str, etiquetas=None):
+    """(coincidencias, conexiones [(EntradaLista, nivel, descripción)]) de las `etiquetas` pedidas."""
+    coincidencias, niveles, nodos = vecindario(dataset, consultado)
+
+    def visible(e):
+        return not etiquetas or bool(set(e.etiquetas or []) & set(etiquetas))
+
+    encontradas = [e for e in coincidencias if visible(e)]
+    if not encontradas:
+        return [], []
+    conexiones = []
+    for id_externo, (nivel, tipo, vecino) in sorted(niveles.items(), key=lambda par: par[1][0]):
+        e = nodos.get(id_externo)
+        if nivel == 0 or e is None or not visible(e):
+            continue
+        via = nodos.get(vecino)
+        conexiones.append((e, nivel, f"{tipo} · {via.nombre if via else vecino}"))
+    return encontradas, conexiones
+
+
+async def registrar(consulta_id, nombre_fuente: str, consultado: str, dataset, etiquetas=None) -> Resultado:
+    encontradas, conexiones = await bd.ejecutar(filtrar, dataset, consultado, etiquetas)
+    titulo = dataset.titulo or dataset.nombre
+    if etiquetas:
+        titulo = f"{titulo} ({', '.join(etiquetas)})"
+    if encontradas:
+        score = 5
+        mensaje = (
+            f"Coincidencia con '{consultado}' en {titulo}: {len(encontradas)} registro(s) "
+            f"({', '.join(f'{e.nombre} [{e.esquema}]' for e in encontradas[:5])}). "
+            f"{len(conexiones)} conexión(es) hasta {PROFUNDIDAD} niveles"
+            + (f": {'; '.join(f'{e.nombre} (nivel {n}, {d})' for e, n, d in conexiones[:8])}." if conexiones else ".")
+        )
+    else:
+        score = 1
+        mensaje = f"No hay coincidencias para '{consultado}' en {titulo}."
+    mensaje = f"{mensaje} {almacen.vigencia(dataset)}".strip()
+
+    archivo = ""
+    if encontradas:
+        # Copias: los nodos memorizados los comparten los demás bots
+        conectadas = []
+        for e, nivel, descripcion in conexiones:
+            e = copy.copy(e)
+            e.datos = dict(e.datos or {}, relacion=f"nivel {nivel}: {descripcion}")
+            conectadas.append(e)
+        archivo = await evidencia.renderizar(consulta_id, nombre_fuente, consultado, dataset, encontradas + conectadas)
+
+    fuente = await abuscar_fuente(nombre_fuente)
+    return await crear_resultado(
+        consulta_id=consulta_id,
+        fuente=fuente,
+        score=score,
+        estado="Validada",
+        mensaje=mensaje,
+        archivo=archivo,
+    )
@@ -0,0 +1,117 @@
+# core/listas/icij.py
+"""
+Lectura de la base pública Offshore Leaks del ICIJ (exporte CSV masivo).
+
+El zip trae un CSV por tipo de nodo (entidades, oficiales, intermediarios,
+otros) y `relationships.csv` con las aristas. Cada nodo se guarda como
+entrada del dataset; la filtración de origen (`sourceID`: "Panama Papers",
+"Pandora Papers - Alcogal"...) queda como etiqueta para que cada bot vea
+sólo la suya. Las direcciones no se cargan: no se buscan por nombre y
+triplicarían las aristas.
+"""
+import csv
+import io
+import os
+import zipfile
+from datetime import date
+
+LISTA = "icij"
+DATASET = "offshoreleaks"
+TITULO = "ICIJ Offshore Leaks Database"
+URL = "https://offshoreleaks-data.icij.org/offshoreleaks/csv/full-oldb.LATEST.zip"
+
+NODOS = {
+    "nodes-entities.csv": "Entity",
+    "nodes-officers.csv": "Officer",
+    "nodes-intermediaries.csv": "Intermediary",
+    "nodes-others.csv": "Other",
+}
+RELACIONES = "relationships.csv"
+
+# Etiqueta -> prefijo de sourceID
+FILTRACIONES = {
+    "panama": "panama papers",
+    "paradise": "paradise papers",
+    "bahamas": "bahamas leaks",
+    "offshore_leaks": "offshore leaks",
+    "pandora": "pandora papers",
+}
+
+CAMPOS_DATOS = (
+    "jurisdiction_description", "countries", "company_type", "incorporation_date",
+    "inactivation_date", "status", "service_provider", "note", "sourceID",
+)
+
+
+def filtracion(source_id: str) -> str:
+    s = (source_id or "").strip().lower()
+    for etiqueta, prefijo in FILTRACIONES.items():
+        if s.startswith(prefijo):
+            return etiqueta
+    return ""
+
+
+class Archivos:
+    """Los CSV del exporte, desde el zip del ICIJ o desde un directorio ya descomprimido."""
+
+    def __init__(self, origen: str):
+        self.origen = origen
+        self.zip = zipfile.ZipFile(origen) if zipfile.is_zipfile(origen) else None
+
+    def abrir(self, nombre: str):
+        if self.zip is not None:
+            ruta = next((n for n in self.zip.namelist() if os.path.basename(n) == nombre), None)
+            if ruta is None:
+                return None
+            return io.TextIOWrapper(self.zip.open(ruta), encoding="utf-8", newline="")
+        ruta = os.path.join(self.origen, nombre)
+        return open(ruta, encoding="utf-8", newline="") if os.path.exists(ruta) else None
+
+    def fecha(self) -> str:
+        """Fecha del exporte (el CSV más reciente), que se usa como versión."""
+        if self.zip is not None:
+            fechas = [date(*i.date_time[:3]) for i in self.zip.infolist() if i.filename.endswith(".csv")]
+        else:
+            fechas = [
+                date.fromtimestamp(os.path.getmtime(os.path.join(self.origen, n)))
+                for n in list(NODOS) + [RELACIONES] if os.path.exists(os.path.join(self.origen, n))
+            ]
+        return max(fechas).isoformat() if fechas else ""
+
+    def cerrar(self):
+        if self.zip is not None:
+            self.zip.close()
+
+
+def leer_nodos(archivos: Archivos, filtraciones=None):
+    """Genera las entradas de todos los nodos con nombre; `filtraciones` limita a esas etiquetas."""
+    for nombre_archivo, esquema in NODOS.items():
+        fh = archivos.abrir(nombre_archivo)
+        if fh is None:
+            continue
+        with fh:
+            for fila in csv.DictReader(fh):
+                etiqueta = filtracion(fila.get("sourceID"))
+                nombre = (fila.get("name") or "").strip()
+                if not fila.get("node_id") or not nombre or (filtraciones and etiqueta not in filtraciones):
+                    continue
+                yield {
+                    "id": fila["node_id"].strip(),
+                    "esquema": esquema,
+                    "nombre": nombre,
+                    "nombres": [n for n in (fila.get("original_name"), fila.get("former_name")) if n],
+                    "datos": {k: fila[k].strip() for k in CAMPOS_DATOS if (fila.get(k) or "").strip()},
+                    "etiquetas": [etiqueta] if etiqueta else [],
+                }
+
+
+def leer_relaciones(archivos: Archivos, nodos: set):
+    """Aristas (origen, destino, tipo) entre nodos cargados."""
+    fh = archivos.abrir(RELACIONES)
+    if fh is None:
+        return
+    with fh:
+        for fila in csv.DictReader(fh):
+            origen, destino = fila.get("node_id_start"), fila.get("node_id_end")
+            if origen in nodos and destino in nodos:
+                yield origen, destino, fila.get("link") or fila.get("rel_type") or ""
@@ -0,0 +1,164 @@
+# core/listas/indice.py
+"""
+Índice en memoria de las listas locales, uno por lista y por proceso.
+
+Se arma una vez desde NombreLista / DocumentoLista (dict clave -> entradas) y
+las búsquedas son un acceso a diccionario: microsegundos y sin ir a la BD
+cuando no hay coincidencia, que es el caso normal. Cada `REVISION_S` se
+compara el sello de la lista (datasets, totales y fecha de carga) y, si hubo
+una recarga, el índice nuevo se arma en un hilo aparte mientras las consultas
+siguen usando el anterior; al terminar se reemplaza de una vez. Sólo la
+primera consulta de una lista en el proceso espera a que se construya.
+
+Las búsquedas se pueden restringir a datasets y a etiquetas de las entradas
+(acto jurídico, régimen...), de modo que varias fuentes que son vistas de la
+misma lista comparten un único índice.
+"""
+import os
+import threading
+import time
+
+from django.db import connection
+
+from core.matching import similitud
+from core.matching.indice import IndiceNgramas
+from core.models import DocumentoLista, EntradaLista, ListaDataset, NombreLista
+from .normalizar import clave, documento
+
+REVISION_S = float(os.environ.get("LISTAS_INDICE_REVISION_S", "60"))
+UMBRAL_APROXIMADO = similitud.POSIBLE
+
+_indices = {}
+_locks = {}
+_reconstruyendo = set()
+_lock = threading.Lock()
+
+
+def _sello(lista):
+    return tuple(
+        ListaDataset.objects.filter(lista=lista)
+        .order_by("nombre")
+        .values_list("nombre", "total_entradas", "fecha_carga", "version")
+    )
+
+
+class IndiceLista:
+    def __init__(self, lista: str):
+        self.lista = lista
+        self.sello = _sello(lista)
+        self.revisado = time.monotonic()
+        self.por_clave = {}
+        self.por_documento = {}
+        for c, entrada_id, dataset in NombreLista.objects.filter(entrada__dataset__lista=lista).values_list(
+            "clave", "entrada_id", "entrada__dataset__nombre"
+        ).iterator(chunk_size=5000):
+            self.por_clave.setdefault(c, []).append((entrada_id, dataset))
+        # El índice de n-gramas sólo se arma si alguna fuente pide búsqueda aproximada
+        self._ngramas = None
+        self._lock_ngramas = threading.Lock()
+        for n, entrada_id, dataset in DocumentoLista.objects.filter(entrada__dataset__lista=lista).values_list(
+            "numero", "entrada_id", "entrada__dataset__nombre"
+        ).iterator(chunk_size=5000):
+            self.por_documento.setdefault(n, []).append((entrada_id, dataset))
+        self.etiquetas = {
+            entrada_id: frozenset(etiquetas)
+            for entrada_id, etiquetas in EntradaLista.objects.filter(dataset__lista=lista).values_list(
+                "id", "etiquetas"
+            ).iterator(chunk_size=5000)
+            if etiquetas
+        }
+
+    def _filtrar(self, pares, datasets, etiquetas=None):
+        return {
+            e for e, ds in pares
+            if (not datasets or ds in datasets)
+            and (not etiquetas or not self.etiquetas.get(e, frozenset()).isdisjoint(etiquetas))
+        }
+
+    def buscar_nombre(self, nombre: str, datasets=None, etiquetas=None) -> set:
+        """Ids de EntradaLista cuyo nombre o alias coincide sin importar orden ni tildes."""
+        return self._filtrar(self.por_clave.get(clave(nombre), ()), datasets, etiquetas)
+
+    def buscar_documento(self, numero: str, datasets=None, etiquetas=None) -> set:
+        n = documento(numero)
+        return self._filtrar(self.por_documento.get(n, ()), datasets, etiquetas) if n else set()
+
+    def ngramas(self) -> IndiceNgramas:
+        with self._lock_ngramas:
+            if self._ngramas is None:
+                self._ngramas = IndiceNgramas(self.por_clave)
+            return self._ngramas
+
+    def buscar_aproximado(
+        self, nombre: str, datasets=None, umbral: float = UMBRAL_APROXIMADO, etiquetas=None
+    ) -> dict:
+        """
+        Ids de EntradaLista -> similitud (0..1) para nombres parecidos: orden
+        distinto, un apellido de menos, variantes de transliteración o grafía
+        (core.matching).
+        """
+        ngramas = self.ngramas()
+        similares = {}
+        for pos, sim in ngramas.buscar(nombre, umbral):
+            for entrada_id in self._filtrar(self.por_clave[ngramas.textos[pos]], datasets, etiquetas):
+                similares[entrada_id] = max(sim, similares.get(entrada_id, 0.0))
+        return similares
+
+    def buscar_lote(self, nombres, datasets=None, etiquetas=None) -> dict:
+        """nombre -> ids, para cribar muchos nombres de una vez."""
+        return {n: self.buscar_nombre(n, datasets, etiquetas) for n in nombres}
+
+
+def _reconstruir(lista: str, anterior: IndiceLista):
+    try:
+        nuevo = IndiceLista(lista)
+        if anterior._ngramas is not None:
+            # Si la lista se consultaba aproximada, el índice nuevo llega con sus n-gramas
+            nuevo.ngramas()
+        with _lock:
+            if _indices.get(lista) is anterior:
+                _indices[lista] = nuevo
+    except Exception as e:
+        print(f"[listas] No se pudo reconstruir el índice de {lista}: {e}")
+    finally:
+        with _lock:
+            _reconstruyendo.discard(lista)
+        connection.close()
+
+
+def obtener_indice(lista: str) -> IndiceLista:
+    """Índice vigente de `lista`; si cambió en la BD, lo reconstruye sin hacer esperar a nadie."""
+    with _lock:
+        indice = _indices.get(lista)
+        if indice is not None and (time.monotonic() - indice.revisado < REVISION_S or lista in _reconstruyendo):
+            return indice
+        if indice is not None:
+            indice.revisado = time.monotonic()
+        lock_lista = _locks.setdefault(lista, threading.Lock())
+
+    if indice is None:
+        with lock_lista:
+            with _lock:
+                indice = _indices.get(lista)
+            if indice is None:
+                indice = IndiceLista(lista)
+                with _lock:
+                    _indices[lista] = indice
+            return indice
+
+    if _sello(lista) != indice.sello:
+        with _lock:
+            if lista in _reconstruyendo:
+                return indice
+            _reconstruyendo.add(lista)
+        threading.Thread(target=_reconstruir, args=(lista, indice), daemon=True, name=f"indice-{lista}").start()
+    return indice
+
+
+def invalidar(lista: str = None):
+    """Descarta el índice (p.ej. tras una carga en este mismo proceso)."""
+    with _lock:
+        if lista is None:
+            _indices.clear()
+        else:
+            _indices.pop(lista, None)
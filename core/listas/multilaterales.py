@@ -0,0 +1,229 @@
+# core/listas/multilaterales.py
+"""
+Lectura de las listas de inhabilitación publicadas por la banca multilateral
+(Banco Mundial, BID, BAfD, BAsD y BERD).
+
+Cada banco es un dataset de la lista "multilaterales": todos comparten la
+tabla y el índice en memoria, pero se recargan por separado, así que si un
+sitio falla los demás siguen al día. El Banco Mundial se lee de la API JSON
+que alimenta su tabla de firmas inhabilitadas; los demás publican una tabla
+HTML (o un exporte CSV/JSON) con columnas parecidas, que se reconocen por su
+encabezado. De cada fila se guarda el periodo de inhabilitación (desde /
+hasta), el motivo y el país; las inhabilitaciones ya cumplidas se descartan
+para que una coincidencia signifique que la firma o persona sigue inhabilitada.
+"""
+import csv
+import hashlib
+import io
+import json
+import os
+import re
+from datetime import date, datetime
+
+from bs4 import BeautifulSoup
+from django.conf import settings
+
+from core.matching.normalizar import plegar
+
+LISTA = "multilaterales"
+
+BANCOS = {
+    "worldbank": {
+        "titulo": "Banco Mundial - Firmas e individuos inhabilitados",
+        "url": "https://apigwext.worldbank.org/dvsvc/v1.0/json/APPLICATION/ADOBE_EXPRNCE_MGR/FIRM/SANCTIONED_FIRM",
+        "formato": "worldbank",
+    },
+    "idb": {
+        "titulo": "BID - Empresas e individuos sancionados",
+        "url": "https://www.iadb.org/es/quienes-somos/transparencia/sistema-de-sanciones/empresas-e-individuos-sancionados",
+        "formato": "html",
+    },
+    "afdb": {
+        "titulo": "BAfD - Entidades inhabilitadas",
+        "url": "https://www.afdb.org/en/projects-and-operations/procurement/debarment-and-sanctions-procedures",
+        "formato": "html",
+    },
+    "adb": {
+        "titulo": "BAsD - ADB Sanctions List",
+        "url": "https://lnadbg4.adb.org/oga0009p.nsf/sancALL1P?OpenView&count=999",
+        "formato": "html",
+    },
+    "ebrd": {
+        "titulo": "BERD - Entidades inelegibles",
+        "url": "https://www.ebrd.com/ineligible-entities.html",
+        "formato": "html",
+    },
+}
+
+
+def worldbank_apikey() -> str:
+    """Llave de la API del Banco Mundial (settings o entorno); vacía si no se configuró."""
+    return getattr(settings, "WORLDBANK_APIKEY", "") or os.environ.get("WORLDBANK_APIKEY", "")
+
+
+def encabezados(banco: str):
+    """Encabezados para descargar `banco`; None si le falta la credencial que exige."""
+    if banco != "worldbank":
+        return {}
+    llave = worldbank_apikey()
+    return {"apikey": llave} if llave else None
+
+
+# Encabezados reconocidos (sin tildes, espacios ni mayúsculas) por campo
+CAMPOS = {
+    "id": ("suppid", "sanctionid", "id"),
+    "nombre": (
+        "suppname", "firmname", "nameoffirmindividual", "firmindividualname", "firmindividual", "entityname",
+        "sanctionedentity", "sanctionedparty", "nombre", "nombredelaempresaoindividuo", "empresaoindividuo",
+        "name", "entity",
+    ),
+    "tipo": ("entitytype", "type", "tipo", "tipodeentidad"),
+    "pais": ("countryname", "country", "nationality", "pais", "nacionalidad"),
+    "direccion": ("suppaddr", "address", "direccion"),
+    "desde": (
+        "debarfromdate", "ineligibilityperiodfrom", "fromdate", "startdate", "datefrom", "effectivedate", "effectdate",
+        "from", "fechadeinicio", "desde",
+    ),
+    "hasta": (
+        "debartodate", "ineligibilityperiodto", "todate", "enddate", "dateto", "lapsedate", "to", "fechadefinalizacion",
+        "fechadefin", "hasta",
+    ),
+    "motivo": (
+        "debarreason", "grounds", "prohibitedpractice", "prohibitedpractices", "practicaprohibida",
+        "basis", "reason", "sanctiontype", "sanction", "tipodesancion", "motivo",
+    ),
+    "estado": ("ineligiblystatus", "status", "estado"),
+    "observaciones": ("addsuppinfo", "otherinformation", "comments", "notes", "observaciones"),
+}
+
+_ALIAS = re.compile(
+    r"\(\s*(?:a\.?k\.?a\.?|also known as|formerly(?: known as)?|f\.?k\.?a\.?|d\.?b\.?a\.?|tambien conocid[oa] como)"
+    r"\s*:?\s*([^)]+)\)",
+    re.IGNORECASE,
+)
+FORMATOS_FECHA = ("%Y-%m-%d", "%d-%b-%Y", "%d/%m/%Y", "%b %d, %Y", "%B %d, %Y", "%d %b %Y", "%d %B %Y", "%d.%m.%Y")
+
+
+def _llave(encabezado: str) -> str:
+    return re.sub(r"[^a-z0-9]", "", plegar(encabezado or ""))
+
+
+def _campo(fila: dict, nombre: str) -> str:
+    for llave in CAMPOS[nombre]:
+        valor = fila.get(llave)
+        if valor is not None and str(valor).strip():
+            return re.sub(r"\s+", " ", str(valor)).strip()
+    return ""
+
+
+def fecha(valor: str) -> str:
+    """'02-MAY-2019', '2019-05-02T00:00:00' o '05/02/2019' -> ISO; otros valores ('Ongoing', 'Permanent') tal cual."""
+    valor = (valor or "").strip()
+    for formato in FORMATOS_FECHA:
+        try:
+            return datetime.strptime(valor[:10] if formato == "%Y-%m-%d" else valor, formato).date().isoformat()
+        except ValueError:
+            continue
+    return valor
+
+
+def vigente(hasta: str, hoy: date = None) -> bool:
+    """Sin fecha de fin ('Ongoing', 'Permanent', vacío) cuenta como vigente."""
+    try:
+        return date.fromisoformat(hasta) >= (hoy or date.today())
+    except ValueError:
+        return True
+
+
+def separar_alias(nombre: str):
+    """'ACME LTD. (a.k.a. ACME TRADING)*' -> ('ACME LTD.', ['ACME TRADING'])."""
+    alias = [a.strip() for m in _ALIAS.findall(nombre) for a in re.split(r";|\s+and\s+", m) if a.strip()]
+    nombre = _ALIAS.sub("", nombre).strip(" *,;")
+    return re.sub(r"\s+", " ", nombre), alias
+
+
+def entradas(banco: str, filas, hoy: date = None):
+    """Filas (dict llave normalizada -> valor) -> entradas del dataset `banco`, sólo las vigentes."""
+    por_id = {}
+    for fila in filas:
+        nombre, alias = separar_alias(_campo(fila, "nombre"))
+        if not nombre:
+            continue
+        desde, hasta = fecha(_campo(fila, "desde")), fecha(_campo(fila, "hasta"))
+        if not vigente(hasta, hoy):
+            continue
+        datos = {
+            "banco": banco,
+            "pais": _campo(fila, "pais"),
+            "direccion": _campo(fila, "direccion"),
+            "desde": desde,
+            "hasta": hasta,
+            "motivo": _campo(fila, "motivo"),
+            "estado": _campo(fila, "estado"),
+            "observaciones": _campo(fila, "observaciones"),
+        }
+        # Las tablas no traen identificador: el mismo nombre puede estar inhabilitado en dos periodos
+        id_externo = _campo(fila, "id") or hashlib.sha1(
+            f"{plegar(nombre)}|{datos['pais']}|{desde}".encode("utf-8")
+        ).hexdigest()[:20]
+        por_id[id_externo] = {
+            "id": id_externo,
+            "esquema": _campo(fila, "tipo"),
+            "nombre": nombre,
+            "nombres": alias,
+            "datos": {k: v for k, v in datos.items() if v},
+        }
+    return list(por_id.values())
+
+
+def leer_worldbank(fh):
+    """Filas de la respuesta de la API del Banco Mundial ({'response': {'ZPROCSUPP': [...]}})."""
+    datos = json.load(fh)
+    if isinstance(datos, dict):
+        datos = (datos.get("response") or {}).get("ZPROCSUPP") or []
+    return [{_llave(k): v for k, v in fila.items()} for fila in datos]
+
+
+def leer_csv(fh):
+    lector = csv.reader(io.TextIOWrapper(fh, encoding="utf-8-sig", newline=""))
+    encabezados = [_llave(c) for c in next(lector, [])]
+    return [dict(zip(encabezados, fila)) for fila in lector]
+
+
+def leer_json(fh):
+    """Lista de objetos, o un objeto cuyo primer valor lista son las filas."""
+    datos = json.load(fh)
+    if isinstance(datos, dict):
+        datos = next((v for v in datos.values() if isinstance(v, list)), [])
+    return [{_llave(k): v for k, v in fila.items()} for fila in datos if isinstance(fila, dict)]
+
+
+def leer_html(fh):
+    """Filas de todas las tablas de la página cuyo encabezado tiene una columna de nombre."""
+    sopa = BeautifulSoup(fh.read(), "lxml")
+    filas = []
+    for tabla in sopa.find_all("table"):
+        renglones = tabla.find_all("tr")
+        if not renglones:
+            continue
+        encabezados = [_llave(c.get_text(" ")) for c in renglones[0].find_all(["th", "td"])]
+        if not set(encabezados) & set(CAMPOS["nombre"]):
+            continue
+        for tr in renglones[1:]:
+            celdas = [c.get_text(" ", strip=True) for c in tr.find_all(["td", "th"])]
+            if celdas:
+                filas.append(dict(zip(encabezados, celdas)))
+    return filas
+
+
+LECTORES = {"worldbank": leer_worldbank, "csv": leer_csv, "json": leer_json, "html": leer_html}
+
+
+def formato(banco: str, origen: str) -> str:
+    """Formato del origen: por la extensión si es un archivo conocido, si no el del banco."""
+    extension = os.path.splitext(origen.split("?")[0])[1].lower().lstrip(".")
+    if extension in ("csv", "json") and banco != "worldbank":
+        return extension
+    if extension in ("html", "htm"):
+        return "html"
+    return BANCOS[banco]["formato"]
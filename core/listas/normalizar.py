@@ -0,0 +1,14 @@
+# core/listas/normalizar.py
+"""
+Normalización para buscar en las listas locales. Los nombres se pliegan con
+core.matching (la misma clave en la carga y en la consulta); aquí queda lo
+propio de los números de documento.
+"""
+import re
+
+from core.matching.normalizar import clave, plegar as normalizar  # noqa: F401
+
+
+def documento(numero: str) -> str:
+    """Número de documento sin puntos, guiones ni espacios, en mayúsculas."""
+    return re.sub(r"[^0-9A-Z]", "", (numero or "").upper())
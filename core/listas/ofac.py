@@ -0,0 +1,84 @@
+# core/listas/ofac.py
+"""
+Lectura de las listas XML de OFAC (formato `sdnList`, el mismo para SDN y
+para la lista consolidada no-SDN).
+
+Cada `sdnEntry` se convierte en una entrada con sus alias (`akaList`),
+documentos (`idList`), fechas y lugares de nacimiento, nacionalidades y
+programas. `Publish_Date` se usa como versión del dataset.
+"""
+import xml.etree.ElementTree as ET
+
+LISTA = "ofac"
+URLS = {
+    "sdn": "https://sanctionslistservice.ofac.treas.gov/api/PublicationPreview/exports/SDN.XML",
+    "consolidated": "https://sanctionslistservice.ofac.treas.gov/api/PublicationPreview/exports/CONSOLIDATED.XML",
+}
+
+
+def _tag(elem):
+    return elem.tag.rsplit("}", 1)[-1]
+
+
+def _hijo(elem, nombre):
+    for h in elem:
+        if _tag(h) == nombre:
+            return h
+    return None
+
+
+def _texto(elem, nombre):
+    h = _hijo(elem, nombre)
+    return (h.text or "").strip() if h is not None and h.text else ""
+
+
+def _items(elem, lista):
+    contenedor = _hijo(elem, lista)
+    return list(contenedor) if contenedor is not None else []
+
+
+def _nombre(elem):
+    return " ".join(p for p in (_texto(elem, "firstName"), _texto(elem, "lastName")) if p)
+
+
+def entrada(sdn) -> dict:
+    documentos = [
+        {"numero": _texto(i, "idNumber"), "tipo": _texto(i, "idType"), "pais": _texto(i, "idCountry")}
+        for i in _items(sdn, "idList")
+        if _texto(i, "idNumber")
+    ]
+    datos = {
+        "tipo": _texto(sdn, "sdnType"),
+        "programas": [(p.text or "").strip() for p in _items(sdn, "programList") if p.text],
+        "fechas_nacimiento": [_texto(d, "dateOfBirth") for d in _items(sdn, "dateOfBirthList") if _texto(d, "dateOfBirth")],
+        "lugares_nacimiento": [_texto(d, "placeOfBirth") for d in _items(sdn, "placeOfBirthList") if _texto(d, "placeOfBirth")],
+        "nacionalidades": [_texto(n, "country") for n in _items(sdn, "nationalityList") if _texto(n, "country")],
+        "documentos": [f"{d['tipo']} {d['numero']} {d['pais']}".strip() for d in documentos],
+    }
+    if _texto(sdn, "remarks"):
+        datos["observaciones"] = _texto(sdn, "remarks")
+    return {
+        "id": _texto(sdn, "uid"),
+        "esquema": datos["tipo"],
+        "nombre": _nombre(sdn),
+        "nombres": [n for n in (_nombre(a) for a in _items(sdn, "akaList")) if n],
+        "datos": {k: v for k, v in datos.items() if v},
+        "documentos": documentos,
+    }
+
+
+def leer(fh):
+    """(fecha de publicación, entradas) de un archivo XML abierto en modo binario o texto."""
+    publicacion = ""
+    entradas = []
+    for _, elem in ET.iterparse(fh, events=("end",)):
+        nombre = _tag(elem)
+        if nombre == "Publish_Date":
+            publicacion = (elem.text or "").strip()
+        elif nombre == "sdnEntry":
+            e = entrada(elem)
+            if e["id"] and e["nombre"]:
+                entradas.append(e)
+            # iterparse deja el árbol en memoria; la lista SDN pesa ~100 MB
+            elem.clear()
+    return publicacion, entradas
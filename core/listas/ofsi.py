@@ -0,0 +1,140 @@
+# core/listas/ofsi.py
+"""
+Lectura de la lista consolidada de OFSI (HM Treasury), en CSV o XML.
+
+Ambos formatos traen una fila por nombre: el nombre principal y cada alias
+comparten `Group ID`, así que se agrupan en una entrada por grupo. Los
+encabezados se comparan sin espacios ni mayúsculas ("Group ID" en el CSV,
+`GroupID` en el XML). El régimen (`Regime`) queda como etiqueta para poder
+consultar sólo un régimen; la fecha de publicación ("Last Updated" de la
+cabecera del CSV o la más reciente de las filas del XML) es la versión.
+"""
+import csv
+import re
+import xml.etree.ElementTree as ET
+from datetime import datetime
+
+LISTA = "ofsi"
+DATASET = "conlist"
+TITULO = "OFSI Consolidated List of Financial Sanctions Targets (UK)"
+URLS = {
+    "csv": "https://ofsistorage.blob.core.windows.net/publishlive/2022format/ConList.csv",
+    "xml": "https://ofsistorage.blob.core.windows.net/publishlive/2022format/ConList.xml",
+}
+
+# Régimenes de la vista de Ucrania: desde 2020 las designaciones por Ucrania
+# van bajo el régimen "Russia" (Russia (Sanctions) (EU Exit) Regulations 2019)
+REGIMENES_UCRANIA = ("Russia", "Ukraine")
+
+CAMPOS = {
+    "grupo": ("groupid",),
+    "tipo": ("grouptype", "grouptypedescription"),
+    "alias": ("aliastype",),
+    "regimen": ("regime", "regimename"),
+    "pasaporte": ("passportnumber",),
+    "identificacion": ("nationalidentificationnumber", "nationalidnumber", "ninumber"),
+    "nacimiento": ("dob", "individualdateofbirth"),
+    "nacionalidad": ("nationality", "individualnationality"),
+    "inclusion": ("listedon", "datelisted"),
+    "actualizado": ("lastupdated",),
+    "referencia": ("uksanctionslistref",),
+    "observaciones": ("otherinformation",),
+}
+PARTES_NOMBRE = ("name1", "name2", "name3", "name4", "name5", "name6")
+
+
+def _llave(encabezado: str) -> str:
+    return re.sub(r"[^a-z0-9]", "", (encabezado or "").lower())
+
+
+def _fecha(valor: str) -> str:
+    """'28/01/2026' o '2026-01-28T00:00:00' -> '2026-01-28'; '' si no se entiende."""
+    valor = (valor or "").strip()
+    for formato, largo in (("%d/%m/%Y", 10), ("%Y-%m-%d", 10)):
+        try:
+            return datetime.strptime(valor[:largo], formato).date().isoformat()
+        except ValueError:
+            continue
+    return ""
+
+
+def _campo(fila: dict, nombre: str) -> str:
+    for llave in CAMPOS[nombre]:
+        if fila.get(llave):
+            return fila[llave].strip()
+    return ""
+
+
+def agrupar(filas):
+    """Filas normalizadas (dict llave -> valor) -> entradas, una por Group ID."""
+    grupos = {}
+    for fila in filas:
+        grupo = _campo(fila, "grupo")
+        nombre = " ".join(fila[p].strip() for p in PARTES_NOMBRE if (fila.get(p) or "").strip())
+        if not grupo or not nombre:
+            continue
+        e = grupos.get(grupo)
+        if e is None:
+            e = grupos[grupo] = {
+                "id": grupo, "esquema": _campo(fila, "tipo"), "nombre": "", "nombres": [],
+                "datos": {}, "documentos": [], "etiquetas": [],
+            }
+        if not e["nombre"] and _llave(_campo(fila, "alias")) == "primaryname":
+            e["nombre"] = nombre
+            if nombre in e["nombres"]:
+                e["nombres"].remove(nombre)
+        elif nombre != e["nombre"] and nombre not in e["nombres"]:
+            e["nombres"].append(nombre)
+
+        regimen = _campo(fila, "regimen")
+        if regimen and regimen not in e["etiquetas"]:
+            e["etiquetas"].append(regimen)
+        for tipo in ("pasaporte", "identificacion"):
+            numero = _campo(fila, tipo)
+            if numero and numero not in [d["numero"] for d in e["documentos"]]:
+                e["documentos"].append({"numero": numero, "tipo": tipo, "pais": _campo(fila, "nacionalidad")})
+        for clave_datos, campo in (
+            ("referencia", "referencia"), ("fecha_inclusion", "inclusion"), ("observaciones", "observaciones"),
+        ):
+            if _campo(fila, campo) and clave_datos not in e["datos"]:
+                e["datos"][clave_datos] = _campo(fila, campo)
+        for clave_datos, campo in (("fechas_nacimiento", "nacimiento"), ("nacionalidades", "nacionalidad")):
+            valor = _campo(fila, campo)
+            if valor and valor not in e["datos"].setdefault(clave_datos, []):
+                e["datos"][clave_datos].append(valor)
+
+    entradas = []
+    for e in grupos.values():
+        if not e["nombre"]:
+            e["nombre"] = e["nombres"].pop(0)
+        e["datos"]["regimenes"] = list(e["etiquetas"])
+        e["datos"] = {k: v for k, v in e["datos"].items() if v}
+        entradas.append(e)
+    return entradas
+
+
+def leer_csv(fh):
+    """(fecha de publicación, entradas) del ConList.csv abierto en modo texto."""
+    lector = csv.reader(fh)
+    publicacion = ""
+    for fila in lector:
+        if fila and _llave(fila[0]) == "lastupdated":
+            publicacion = _fecha(fila[1] if len(fila) > 1 else "")
+            continue
+        encabezados = [_llave(c) for c in fila]
+        break
+    else:
+        return publicacion, []
+    filas = (dict(zip(encabezados, fila)) for fila in lector)
+    return publicacion, agrupar(filas)
+
+
+def leer_xml(fh):
+    """(fecha de publicación, entradas) del ConList.xml; la fecha es la última actualización."""
+    filas = []
+    for _, elem in ET.iterparse(fh, events=("end",)):
+        if elem.tag.rsplit("}", 1)[-1] == "FinancialSanctionsTarget":
+            filas.append({_llave(h.tag.rsplit("}", 1)[-1]): h.text or "" for h in elem})
+            elem.clear()
+    fechas = [f for f in (_fecha(_campo(fila, "actualizado")) for fila in filas) if f]
+    return max(fechas, default=""), agrupar(filas)
@@ -0,0 +1,82 @@
+# core/listas/onu.py
+"""
+Lectura de la Lista Consolidada del Consejo de Seguridad de la ONU (XML).
+
+Individuos (`INDIVIDUAL`) y entidades (`ENTITY`) con sus alias, nacionalidad,
+fechas de nacimiento y documentos. `dateGenerated` se usa como versión.
+"""
+import xml.etree.ElementTree as ET
+
+LISTA = "onu"
+DATASET = "consolidada"
+TITULO = "Lista Consolidada del Consejo de Seguridad de las Naciones Unidas"
+URL = "https://scsanctions.un.org/resources/xml/sp/consolidated.xml"
+
+PARTES_NOMBRE = ("FIRST_NAME", "SECOND_NAME", "THIRD_NAME", "FOURTH_NAME")
+
+
+def _texto(elem, nombre):
+    h = elem.find(nombre)
+    return (h.text or "").strip() if h is not None and h.text else ""
+
+
+def _valores(elem, contenedor, campo="VALUE"):
+    return [v for v in (_texto(c, campo) for c in elem.findall(contenedor)) if v]
+
+
+def _fechas(elem):
+    fechas = []
+    for f in elem.findall("INDIVIDUAL_DATE_OF_BIRTH"):
+        fecha = _texto(f, "DATE") or _texto(f, "YEAR")
+        if not fecha and _texto(f, "FROM_YEAR"):
+            fecha = f"{_texto(f, 'FROM_YEAR')}-{_texto(f, 'TO_YEAR')}"
+        if fecha:
+            fechas.append(fecha)
+    return fechas
+
+
+def entrada(elem, esquema) -> dict:
+    nombre = " ".join(p for p in (_texto(elem, n) for n in PARTES_NOMBRE) if p)
+    alias_tag = "INDIVIDUAL_ALIAS" if esquema == "Individual" else "ENTITY_ALIAS"
+    nombres = _valores(elem, alias_tag, "ALIAS_NAME")
+    if _texto(elem, "NAME_ORIGINAL_SCRIPT"):
+        nombres.append(_texto(elem, "NAME_ORIGINAL_SCRIPT"))
+    documentos = [
+        {"numero": _texto(d, "NUMBER"), "tipo": _texto(d, "TYPE_OF_DOCUMENT"), "pais": _texto(d, "ISSUING_COUNTRY")}
+        for d in elem.findall("INDIVIDUAL_DOCUMENT")
+        if _texto(d, "NUMBER")
+    ]
+    datos = {
+        "referencia": _texto(elem, "REFERENCE_NUMBER"),
+        "regimen": _texto(elem, "UN_LIST_TYPE"),
+        "fecha_inclusion": _texto(elem, "LISTED_ON"),
+        "nacionalidades": _valores(elem, "NATIONALITY"),
+        "fechas_nacimiento": _fechas(elem),
+        "documentos": [f"{d['tipo']} {d['numero']} {d['pais']}".strip() for d in documentos],
+        "observaciones": _texto(elem, "COMMENTS1"),
+    }
+    return {
+        "id": _texto(elem, "DATAID"),
+        "esquema": esquema,
+        "nombre": nombre,
+        "nombres": nombres,
+        "datos": {k: v for k, v in datos.items() if v},
+        "documentos": documentos,
+    }
+
+
+def leer(fh):
+    """(fecha de generación, entradas) del XML consolidado."""
+    generado = ""
+    entradas = []
+    for evento, elem in ET.iterparse(fh, events=("start", "end")):
+        if evento == "start":
+            if elem.tag == "CONSOLIDATED_LIST":
+                generado = elem.get("dateGenerated", "")
+            continue
+        if elem.tag in ("INDIVIDUAL", "ENTITY"):
+            e = entrada(elem, "Individual" if elem.tag == "INDIVIDUAL" else "Entity")
+            if e["id"] and e["nombre"]:
+                entradas.append(e)
+            elem.clear()
+    return generado, entradas
@@ -0,0 +1,130 @@
+# core/listas/opensanctions.py
+"""
+Lectura de los exportes masivos de OpenSanctions.
+
+- FollowTheMoney (`entities.ftm.json`): una entidad JSON por línea, con
+  `properties` multivaluadas y la lista `datasets` a la que pertenece.
+- CSV simplificado (`targets.simple.csv`): una fila por objetivo, valores
+  múltiples separados por ';'. No trae el id del dataset, así que se asigna
+  el que indique quien lo carga.
+
+Ambos lectores producen dicts {'id', 'esquema', 'nombre', 'nombres', 'datos', 'documentos', 'datasets'}
+listos para `almacen.reemplazar_dataset`.
+"""
+import csv
+import json
+
+import httpx
+
+LISTA = "opensanctions"
+URL_ENTIDADES = "https://data.opensanctions.org/datasets/latest/default/entities.ftm.json"
+URL_INDICE = "https://data.opensanctions.org/datasets/latest/index.json"
+
+# Propiedades FtM que se guardan como evidencia del hallazgo
+PROPIEDADES = (
+    "birthDate", "nationality", "country", "citizenship", "topics", "programId",
+    "position", "idNumber", "passportNumber", "taxNumber", "sourceUrl", "notes",
+)
+PROPIEDADES_NOMBRE = ("name", "alias", "weakAlias", "previousName")
+PROPIEDADES_DOCUMENTO = ("idNumber", "passportNumber", "taxNumber", "registrationNumber")
+
+# Sin la marca `target`, sólo estos esquemas son sujetos que se pueden consultar
+ESQUEMAS_OBJETIVO = {"Person", "Organization", "Company", "LegalEntity", "PublicBody", "Vessel", "Airplane"}
+
+
+def _nombres_persona(props):
+    """Arma 'nombre apellido' cuando la entidad sólo trae las partes."""
+    nombres = []
+    for nombre in props.get("firstName") or []:
+        for apellido in props.get("lastName") or []:
+            nombres.append(f"{nombre} {apellido}")
+    return nombres
+
+
+def leer_ftm(lineas):
+    for linea in lineas:
+        linea = linea.strip()
+        if not linea:
+            continue
+        try:
+            ent = json.loads(linea)
+        except ValueError:
+            continue
+        esquema = ent.get("schema") or ""
+        if not ent.get("target", esquema in ESQUEMAS_OBJETIVO):
+            continue
+        props = ent.get("properties") or {}
+        nombres = [n for p in PROPIEDADES_NOMBRE for n in (props.get(p) or [])] + _nombres_persona(props)
+        nombre = ent.get("caption") or (nombres[0] if nombres else "")
+        if not nombre:
+            continue
+        datos = {p: props[p] for p in PROPIEDADES if props.get(p)}
+        for fecha in ("first_seen", "last_seen", "last_change"):
+            if ent.get(fecha):
+                datos[fecha] = ent[fecha]
+        documentos = [
+            {"numero": n, "tipo": p}
+            for p in PROPIEDADES_DOCUMENTO for n in (props.get(p) or [])
+        ]
+        yield {
+            "id": ent.get("id") or "",
+            "esquema": esquema,
+            "nombre": nombre,
+            "nombres": nombres,
+            "datos": datos,
+            "documentos": documentos,
+            "datasets": ent.get("datasets") or [],
+        }
+
+
+def _multiple(valor):
+    return [v.strip() for v in (valor or "").split(";") if v.strip()]
+
+
+def leer_csv(lineas, dataset: str):
+    for fila in csv.DictReader(lineas):
+        nombre = (fila.get("name") or "").strip()
+        if not nombre:
+            continue
+        datos = {}
+        for columna in ("birth_date", "countries", "identifiers", "sanctions", "program_ids", "addresses"):
+            valores = _multiple(fila.get(columna))
+            if valores:
+                datos[columna] = valores
+        for columna in ("first_seen", "last_seen", "last_change"):
+            if fila.get(columna):
+                datos[columna] = fila[columna]
+        yield {
+            "id": fila.get("id") or "",
+            "esquema": fila.get("schema") or "",
+            "nombre": nombre,
+            "nombres": _multiple(fila.get("aliases")),
+            "datos": datos,
+            "documentos": [{"numero": n, "tipo": "identifier"} for n in _multiple(fila.get("identifiers"))],
+            "datasets": [dataset],
+        }
+
+
+def agrupar_por_dataset(entidades, datasets=None):
+    """dataset -> [entradas]; una entidad en varios datasets queda en cada partición."""
+    grupos = {d: [] for d in (datasets or ())}
+    for ent in entidades:
+        for ds in ent["datasets"]:
+            if datasets and ds not in grupos:
+                continue
+            grupos.setdefault(ds, []).append(ent)
+    return grupos
+
+
+def titulos(url: str = URL_INDICE) -> dict:
+    """dataset -> (título, versión) según el índice publicado; {} si no se puede leer."""
+    try:
+        r = httpx.get(url, timeout=60, follow_redirects=True)
+        r.raise_for_status()
+        return {
+            d["name"]: (d.get("title") or "", d.get("version") or d.get("last_export") or "")
+            for d in r.json().get("datasets", [])
+        }
+    except Exception as e:
+        print(f"[opensanctions] No se pudo leer el índice de datasets: {e}")
+        return {}
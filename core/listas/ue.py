@@ -0,0 +1,99 @@
+# core/listas/ue.py
+"""
+Lectura del archivo consolidado de sanciones financieras de la UE (FSF, XML
+`export` de la Comisión).
+
+Cada `sanctionEntity` se convierte en una entrada con sus alias (`nameAlias`),
+ciudadanías, fechas de nacimiento e identificaciones. Los actos jurídicos que
+la designan (`regulation/@numberTitle`, p.ej. "833/2014 (OJ L229)") se
+normalizan a "2014/833" y, junto con el programa ("UKR", "BLR"...), quedan
+como etiquetas para filtrar el mismo índice por acto. `generationDate` se usa
+como versión.
+"""
+import os
+import re
+import xml.etree.ElementTree as ET
+
+LISTA = "ue"
+DATASET = "fsf"
+TITULO = "Lista consolidada de sanciones financieras de la UE"
+URL = (
+    "https://webgate.ec.europa.eu/fsd/fsf/public/files/xmlFullSanctionsList_1_1/content?token="
+    + os.environ.get("EU_FSF_TOKEN", "dG9rZW4tMjAxNw")
+)
+
+_ACTO = re.compile(r"(\d{1,4})/(\d{1,4})")
+
+
+def _tag(elem):
+    return elem.tag.rsplit("}", 1)[-1]
+
+
+def _hijos(elem, nombre):
+    return [h for h in elem if _tag(h) == nombre]
+
+
+def acto(numero_titulo: str) -> str:
+    """'833/2014 (OJ L229)' -> '2014/833'; '2022/398 (OJ L80)' -> '2022/398'."""
+    m = _ACTO.search(numero_titulo or "")
+    if not m:
+        return ""
+    a, b = m.groups()
+    if len(b) == 4 and len(a) < 4:
+        a, b = b, a
+    return f"{a}/{int(b)}"
+
+
+def entrada(elem) -> dict:
+    alias = [a.get("wholeName", "").strip() for a in _hijos(elem, "nameAlias")]
+    alias = [a for a in alias if a]
+    regulaciones = _hijos(elem, "regulation")
+    actos = sorted({acto(r.get("numberTitle", "")) for r in regulaciones} - {""})
+    programas = sorted({r.get("programme", "") for r in regulaciones} - {""})
+    documentos = [
+        {
+            "numero": i.get("number", ""),
+            "tipo": i.get("identificationTypeDescription", ""),
+            "pais": i.get("countryDescription", ""),
+        }
+        for i in _hijos(elem, "identification")
+        if i.get("number")
+    ]
+    tipo = _hijos(elem, "subjectType")
+    datos = {
+        "referencia": elem.get("euReferenceNumber", ""),
+        "referencia_onu": elem.get("unitedNationId", ""),
+        "actos": actos,
+        "programas": programas,
+        "nacionalidades": sorted({c.get("countryDescription", "") for c in _hijos(elem, "citizenship")} - {""}),
+        "fechas_nacimiento": [b.get("birthdate") or b.get("year", "") for b in _hijos(elem, "birthdate") if b.get("birthdate") or b.get("year")],
+        "documentos": [f"{d['tipo']} {d['numero']} {d['pais']}".strip() for d in documentos],
+        "observaciones": (elem.get("designationDetails") or "").strip(),
+    }
+    return {
+        "id": elem.get("logicalId", ""),
+        "esquema": tipo[0].get("code", "") if tipo else "",
+        "nombre": alias[0] if alias else "",
+        "nombres": alias[1:],
+        "datos": {k: v for k, v in datos.items() if v},
+        "documentos": documentos,
+        "etiquetas": actos + programas,
+    }
+
+
+def leer(fh):
+    """(fecha de generación, entradas) del XML FSF."""
+    generado = ""
+    entradas = []
+    for evento, elem in ET.iterparse(fh, events=("start", "end")):
+        nombre = _tag(elem)
+        if evento == "start":
+            if nombre == "export":
+                generado = elem.get("generationDate", "")
+            continue
+        if nombre == "sanctionEntity":
+            e = entrada(elem)
+            if e["id"] and e["nombre"]:
+                entradas.append(e)
+            elem.clear()
+    return generado, entradas
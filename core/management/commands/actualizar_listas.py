@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.listas import frescura
+
+
+class Command(BaseCommand):
+    help = "Revisa las fuentes de las listas locales y recarga sólo las que publicaron una versión nueva."
+
+    def add_arguments(self, parser):
+        parser.add_argument("nombres", nargs="*",
+                            help=f"Descargas a revisar ({', '.join(frescura.REGISTRO)}); por defecto todas")
+        parser.add_argument("--forzar", action="store_true",
+                            help="Descargar aunque la fuente no haya cambiado")
+
+    def handle(self, *args, **opts):
+        nombres = opts["nombres"] or list(frescura.REGISTRO)
+        desconocidos = set(nombres) - set(frescura.REGISTRO)
+        if desconocidos:
+            raise CommandError(f"Descargas desconocidas: {', '.join(sorted(desconocidos))}")
+
+        fallidos = []
+        for nombre in nombres:
+            if not frescura.habilitada(nombre):
+                self.stdout.write(self.style.WARNING(f"[{nombre}] Falta su credencial, se omite"))
+                continue
+            try:
+                nueva = frescura.actualizar(nombre, forzar=opts["forzar"], salida=self.stdout)
+            except Exception as e:
+                # Una fuente caída no debe impedir que se revisen las demás
+                self.stderr.write(f"[{nombre}] {e}")
+                fallidos.append(nombre)
+                continue
+            if nueva:
+                self.stdout.write(self.style.SUCCESS(f"[{nombre}] Versión nueva cargada"))
+            elif nueva is None:
+                self.stdout.write(f"[{nombre}] Revisada hace menos de {frescura.REGISTRO[nombre]['intervalo_h']} h")
+            else:
+                self.stdout.write(f"[{nombre}] Sin cambios")
+
+        if fallidos:
+            raise CommandError(f"No se actualizaron: {', '.join(fallidos)}")
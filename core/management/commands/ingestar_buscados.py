@@ -0,0 +1,54 @@
+from datetime import datetime
+
+from asgiref.sync import async_to_sync
+from django.core.management.base import BaseCommand, CommandError
+
+from core.listas import almacen, buscados
+
+
+class Command(BaseCommand):
+    help = "Rastrea las listas de más buscados (FBI, DEA, Europol, Policía...) y guarda la foto en las listas locales."
+
+    def add_arguments(self, parser):
+        parser.add_argument("fuentes", nargs="*",
+                            help=f"Sitios a rastrear ({', '.join(buscados.FUENTES)}); por defecto todos")
+
+    def handle(self, *args, **opts):
+        fuentes = opts["fuentes"] or list(buscados.FUENTES)
+        desconocidas = set(fuentes) - set(buscados.FUENTES)
+        if desconocidas:
+            raise CommandError(f"Fuentes desconocidas: {', '.join(sorted(desconocidas))}")
+
+        fallidas = []
+        for fuente in fuentes:
+            self.stdout.write(f"[{fuente}] Rastreando {buscados.FUENTES[fuente]['url']}...")
+            try:
+                tarjetas = async_to_sync(buscados.rastrear)(fuente)
+            except Exception as e:
+                # Un sitio caído no debe impedir que se actualicen los demás
+                self.stderr.write(f"[{fuente}] No se pudo rastrear: {e}")
+                buscados.limpiar_capturas(fuente)
+                fallidas.append(fuente)
+                continue
+            entradas = buscados.entradas(fuente, tarjetas)
+            if not entradas:
+                # Suele ser un cambio de maqueta o un bloqueo: mejor la foto anterior que una lista vacía
+                self.stdout.write(self.style.WARNING(f"[{fuente}] Sin tarjetas, se conserva la foto anterior"))
+                buscados.limpiar_capturas(fuente)
+                continue
+            altas, bajas = buscados.diferencias(fuente, entradas)
+            almacen.reemplazar_dataset(
+                buscados.LISTA, fuente, entradas,
+                titulo=buscados.FUENTES[fuente]["titulo"], version=datetime.now().strftime("%Y-%m-%d %H:%M"),
+            )
+            buscados.limpiar_capturas(fuente)
+            self.stdout.write(self.style.SUCCESS(
+                f"[{fuente}] {len(entradas)} personas ({len(altas)} entran, {len(bajas)} salen)"
+            ))
+            for nombre in altas:
+                self.stdout.write(f"  + {nombre}")
+            for nombre in bajas:
+                self.stdout.write(f"  - {nombre}")
+
+        if fallidas:
+            raise CommandError(f"No se rastrearon: {', '.join(fallidas)}")
@@ -0,0 +1,59 @@
+import os
+import tempfile
+
+import httpx
+from django.core.management.base import BaseCommand, CommandError
+
+from core.listas import almacen, icij
+
+
+class Command(BaseCommand):
+    help = "Carga el exporte CSV de ICIJ Offshore Leaks (nodos y relaciones) en las listas locales."
+
+    def add_arguments(self, parser):
+        parser.add_argument("origen", nargs="?", default=icij.URL,
+                            help="Zip del exporte (ruta o URL) o directorio con los CSV")
+        parser.add_argument("--filtraciones",
+                            help=f"Separadas por comas ({', '.join(icij.FILTRACIONES)}); por defecto todas")
+
+    def handle(self, *args, **opts):
+        filtraciones = None
+        if opts["filtraciones"]:
+            filtraciones = {f.strip() for f in opts["filtraciones"].split(",") if f.strip()}
+            desconocidas = filtraciones - set(icij.FILTRACIONES)
+            if desconocidas:
+                raise CommandError(f"Filtraciones desconocidas: {', '.join(sorted(desconocidas))}")
+
+        origen, temporal = opts["origen"], None
+        if origen.startswith(("http://", "https://")):
+            # El zip se lee con acceso aleatorio: se descarga completo primero
+            temporal = tempfile.NamedTemporaryFile(delete=False, suffix=".zip")
+            self.stdout.write(f"Descargando {origen}...")
+            with httpx.stream("GET", origen, timeout=600, follow_redirects=True) as r:
+                r.raise_for_status()
+                for bloque in r.iter_bytes():
+                    temporal.write(bloque)
+            temporal.close()
+            origen = temporal.name
+
+        archivos = icij.Archivos(origen)
+        try:
+            # Los nodos se leen y se escriben por lotes, sin cargar el exporte completo en
+            # memoria; las relaciones entran en la misma copia y se publican con ellos
+            r = almacen.reemplazar_dataset(
+                icij.LISTA, icij.DATASET, icij.leer_nodos(archivos, filtraciones),
+                titulo=icij.TITULO, version=archivos.fecha(),
+                relaciones=lambda nodos: icij.leer_relaciones(archivos, nodos),
+            )
+            if not r["total"]:
+                self.stdout.write(self.style.WARNING("Exporte sin nodos, se conserva la copia anterior"))
+                return
+        finally:
+            archivos.cerrar()
+            if temporal is not None:
+                os.unlink(temporal.name)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"ICIJ Offshore Leaks: {r['total']} nodos ({r['nuevas']} nuevos, {r['cambiadas']} cambiados, "
+            f"{r['eliminadas']} eliminados), {r['relaciones']} relaciones"
+        ))
@@ -0,0 +1,60 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.listas import almacen, descarga, multilaterales
+
+
+class Command(BaseCommand):
+    help = "Carga las listas de inhabilitación de la banca multilateral (BM, BID, BAfD, BAsD, BERD) en las listas locales."
+
+    def add_arguments(self, parser):
+        parser.add_argument("bancos", nargs="*",
+                            help=f"Bancos a cargar ({', '.join(multilaterales.BANCOS)}); por defecto todos")
+        parser.add_argument("--origen", help="Ruta o URL de la tabla (sólo con un banco)")
+        parser.add_argument("--formato", choices=list(multilaterales.LECTORES),
+                            help="Por defecto se deduce de la extensión o del banco")
+
+    def handle(self, *args, **opts):
+        bancos = opts["bancos"] or list(multilaterales.BANCOS)
+        desconocidos = set(bancos) - set(multilaterales.BANCOS)
+        if desconocidos:
+            raise CommandError(f"Bancos desconocidos: {', '.join(sorted(desconocidos))}")
+        if opts["origen"] and len(bancos) != 1:
+            raise CommandError("--origen requiere indicar un solo banco")
+
+        fallidos = []
+        for banco in bancos:
+            config = multilaterales.BANCOS[banco]
+            origen = opts["origen"] or config["url"]
+            formato = opts["formato"] or multilaterales.formato(banco, origen)
+            headers = multilaterales.encabezados(banco)
+            if headers is None:
+                if not opts["origen"]:
+                    self.stdout.write(self.style.WARNING(f"[{banco}] Sin WORLDBANK_APIKEY configurada, se omite"))
+                    continue
+                # Un exporte ya descargado (--origen) no necesita la llave
+                headers = {}
+            self.stdout.write(f"[{banco}] Leyendo {origen} ({formato})...")
+            try:
+                with descarga.abrir(origen, binario=True, headers=headers) as fh:
+                    filas = multilaterales.LECTORES[formato](fh)
+            except Exception as e:
+                # Un sitio caído no debe impedir que se actualicen los demás
+                self.stderr.write(f"[{banco}] No se pudo leer la tabla: {e}")
+                fallidos.append(banco)
+                continue
+            entradas = multilaterales.entradas(banco, filas)
+            if not entradas:
+                self.stdout.write(self.style.WARNING(f"[{banco}] Tabla sin entradas, se conserva la copia anterior"))
+                continue
+            r = almacen.reemplazar_dataset(
+                multilaterales.LISTA, banco, entradas, titulo=config["titulo"], version=date.today().isoformat()
+            )
+            self.stdout.write(self.style.SUCCESS(
+                f"[{banco}] {config['titulo']}: {r['total']} inhabilitaciones vigentes ({r['nuevas']} nuevas, "
+                f"{r['cambiadas']} cambiadas, {r['eliminadas']} eliminadas)"
+            ))
+
+        if fallidos:
+            raise CommandError(f"No se actualizaron: {', '.join(fallidos)}")
@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.listas import almacen, descarga, ofac
+
+
+class Command(BaseCommand):
+    help = (
+        "Carga las listas XML de OFAC (SDN y consolidada no-SDN) en las listas locales. "
+        "Cada recarga sólo inserta las entradas nuevas o modificadas."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("listas", nargs="*", help="sdn y/o consolidated (por defecto ambas)")
+        parser.add_argument("--origen", help="Ruta o URL alternativa (sólo con una lista)")
+
+    def handle(self, *args, **opts):
+        listas = opts["listas"] or sorted(ofac.URLS)
+        desconocidas = set(listas) - set(ofac.URLS)
+        if desconocidas:
+            raise CommandError(f"Listas desconocidas: {', '.join(sorted(desconocidas))}")
+        if opts["origen"] and len(listas) != 1:
+            raise CommandError("--origen requiere indicar una sola lista (sdn o consolidated)")
+
+        for nombre in listas:
+            origen = opts["origen"] or ofac.URLS[nombre]
+            self.stdout.write(f"Leyendo {origen}...")
+            with descarga.abrir(origen, binario=True) as fh:
+                publicacion, entradas = ofac.leer(fh)
+            if not entradas:
+                self.stdout.write(self.style.WARNING(f"  {nombre}: archivo sin entradas, se conserva la copia anterior"))
+                continue
+            titulo = "OFAC SDN List" if nombre == "sdn" else "OFAC Consolidated (non-SDN) List"
+            r = almacen.reemplazar_dataset(ofac.LISTA, nombre, entradas, titulo=titulo, version=publicacion)
+            self.stdout.write(
+                f"  {nombre} ({publicacion}): {r['total']} entradas ({r['nuevas']} nuevas, "
+                f"{r['cambiadas']} cambiadas, {r['eliminadas']} eliminadas)"
+            )
+
+        self.stdout.write(self.style.SUCCESS("Listas de OFAC actualizadas."))
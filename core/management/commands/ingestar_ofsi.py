@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+
+from core.listas import almacen, descarga, ofsi
+
+
+class Command(BaseCommand):
+    help = "Carga la lista consolidada de OFSI (Reino Unido, CSV o XML) en las listas locales."
+
+    def add_arguments(self, parser):
+        parser.add_argument("origen", nargs="?", default=ofsi.URLS["csv"], help="Ruta o URL del ConList")
+        parser.add_argument("--formato", choices=["csv", "xml"], help="Por defecto se deduce de la extensión")
+
+    def handle(self, *args, **opts):
+        origen = opts["origen"]
+        formato = opts["formato"] or ("xml" if ".xml" in origen.lower() else "csv")
+        self.stdout.write(f"Leyendo {origen} ({formato})...")
+        if formato == "xml":
+            with descarga.abrir(origen, binario=True) as fh:
+                publicacion, entradas = ofsi.leer_xml(fh)
+        else:
+            with descarga.abrir(origen) as fh:
+                publicacion, entradas = ofsi.leer_csv(fh)
+        if not entradas:
+            self.stdout.write(self.style.WARNING("Archivo sin entradas, se conserva la copia anterior"))
+            return
+        r = almacen.reemplazar_dataset(ofsi.LISTA, ofsi.DATASET, entradas, titulo=ofsi.TITULO, version=publicacion)
+        self.stdout.write(self.style.SUCCESS(
+            f"Lista de OFSI ({publicacion}): {r['total']} entradas ({r['nuevas']} nuevas, "
+            f"{r['cambiadas']} cambiadas, {r['eliminadas']} eliminadas)"
+        ))
@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from core.listas import almacen, descarga, onu
+
+
+class Command(BaseCommand):
+    help = "Carga la Lista Consolidada del Consejo de Seguridad de la ONU (XML) en las listas locales."
+
+    def add_arguments(self, parser):
+        parser.add_argument("origen", nargs="?", default=onu.URL, help="Ruta o URL del XML consolidado")
+
+    def handle(self, *args, **opts):
+        self.stdout.write(f"Leyendo {opts['origen']}...")
+        with descarga.abrir(opts["origen"], binario=True) as fh:
+            generado, entradas = onu.leer(fh)
+        if not entradas:
+            self.stdout.write(self.style.WARNING("Archivo sin entradas, se conserva la copia anterior"))
+            return
+        r = almacen.reemplazar_dataset(onu.LISTA, onu.DATASET, entradas, titulo=onu.TITULO, version=generado)
+        self.stdout.write(self.style.SUCCESS(
+            f"Lista de la ONU ({generado}): {r['total']} entradas ({r['nuevas']} nuevas, "
+            f"{r['cambiadas']} cambiadas, {r['eliminadas']} eliminadas)"
+        ))
@@ -0,0 +1,82 @@
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.listas import almacen, descarga, opensanctions
+from core.listas.consulta import especificaciones
+
+
+def datasets_de_bots():
+    """Datasets de OpenSanctions que los bots declaran en 'lista_local'."""
+    from core.bots.bot_configs import get_bot_configs
+    from core.bots.bot_configs_contratista import get_bot_configs_contratista
+
+    nombres = set()
+    for configs in (get_bot_configs(0, defaultdict(str)), get_bot_configs_contratista(0, defaultdict(str))):
+        for bot in configs:
+            for lista, dataset, _ in especificaciones(bot):
+                if lista == opensanctions.LISTA:
+                    nombres.add(dataset)
+    return nombres
+
+
+class Command(BaseCommand):
+    help = (
+        "Carga un exporte masivo de OpenSanctions (FollowTheMoney JSON o CSV simplificado) "
+        "en las listas locales, reemplazando cada dataset de forma atómica."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("origen", nargs="?", default=opensanctions.URL_ENTIDADES,
+                            help="Ruta o URL del exporte (.json, .csv, opcionalmente .gz)")
+        parser.add_argument("--formato", choices=["ftm", "csv"],
+                            help="Por defecto se deduce de la extensión")
+        parser.add_argument("--dataset", help="Dataset al que pertenece un CSV (p.ej. us_ofac_sdn)")
+        parser.add_argument("--datasets", help="Lista separada por comas; por defecto los que usan los bots")
+        parser.add_argument("--todos", action="store_true", help="Cargar todos los datasets del exporte")
+        parser.add_argument("--sin-indice", action="store_true",
+                            help="No descargar títulos y versiones del índice de OpenSanctions")
+
+    def handle(self, *args, **opts):
+        origen = opts["origen"]
+        formato = opts["formato"] or ("csv" if ".csv" in origen.lower() else "ftm")
+        indice = {} if opts["sin_indice"] else opensanctions.titulos()
+
+        if formato == "csv":
+            if not opts["dataset"]:
+                raise CommandError("El CSV simplificado no trae el dataset: indique --dataset")
+            datasets = {opts["dataset"]}
+        elif opts["todos"]:
+            datasets = None
+        elif opts["datasets"]:
+            datasets = {d.strip() for d in opts["datasets"].split(",") if d.strip()}
+        else:
+            # Los que declaran los bots más los que recorre la plantilla por título
+            from core.bots.plantilla import FUENTES
+            titulos_plantilla = {t.lower() for t in FUENTES}
+            datasets = datasets_de_bots() | {
+                nombre for nombre, (titulo, _) in indice.items() if titulo.lower() in titulos_plantilla
+            }
+
+        self.stdout.write(f"Leyendo {origen} ({formato})...")
+        with descarga.abrir(origen) as fh:
+            if formato == "csv":
+                entidades = opensanctions.leer_csv(fh, opts["dataset"])
+            else:
+                entidades = opensanctions.leer_ftm(fh)
+            grupos = opensanctions.agrupar_por_dataset(entidades, datasets)
+
+        cargados = 0
+        for nombre, entradas in sorted(grupos.items()):
+            if not entradas:
+                self.stdout.write(self.style.WARNING(f"  {nombre}: sin entradas en el exporte, se conserva la copia anterior"))
+                continue
+            titulo, version = indice.get(nombre, ("", ""))
+            r = almacen.reemplazar_dataset(opensanctions.LISTA, nombre, entradas, titulo=titulo, version=version)
+            self.stdout.write(
+                f"  {nombre}: {r['total']} entradas ({r['nuevas']} nuevas, {r['cambiadas']} cambiadas, "
+                f"{r['eliminadas']} eliminadas)"
+            )
+            cargados += 1
+
+        self.stdout.write(self.style.SUCCESS(f"{cargados} datasets de OpenSanctions actualizados."))
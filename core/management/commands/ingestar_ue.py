@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from core.listas import almacen, descarga, ue
+
+
+class Command(BaseCommand):
+    help = "Carga la lista consolidada de sanciones financieras de la UE (FSF, XML) en las listas locales."
+
+    def add_arguments(self, parser):
+        parser.add_argument("origen", nargs="?", default=ue.URL, help="Ruta o URL del XML FSF")
+
+    def handle(self, *args, **opts):
+        self.stdout.write(f"Leyendo {opts['origen']}...")
+        with descarga.abrir(opts["origen"], binario=True) as fh:
+            generado, entradas = ue.leer(fh)
+        if not entradas:
+            self.stdout.write(self.style.WARNING("Archivo sin entradas, se conserva la copia anterior"))
+            return
+        r = almacen.reemplazar_dataset(ue.LISTA, ue.DATASET, entradas, titulo=ue.TITULO, version=generado)
+        self.stdout.write(self.style.SUCCESS(
+            f"Lista FSF de la UE ({generado}): {r['total']} entradas ({r['nuevas']} nuevas, "
+            f"{r['cambiadas']} cambiadas, {r['eliminadas']} eliminadas)"
+        ))
@@ -0,0 +1,55 @@
+# core/matching/fonetica.py
+"""
+Claves fonéticas para nombres en español y transliteraciones frecuentes.
+
+Unifica grafías que suenan igual ('Vásquez'/'Basquez', 'Giménez'/'Jiménez',
+'Yésica'/'Llésica', 'Mohamed'/'Muhammad', 'Khalid'/'Jalid'): se aplican las
+equivalencias, se comprimen las letras repetidas y se descartan las vocales
+salvo la inicial.
+"""
+import re
+from functools import lru_cache
+from itertools import groupby
+
+from .normalizar import tokens
+
+# Una sola pasada: en cada posición gana la primera alternativa que encaja
+_EQUIVALENCIAS = [
+    ("X", r"sch|sh|ch"),
+    ("f", r"ph"),
+    ("t", r"th"),
+    ("y", r"ll"),
+    ("g", r"gu(?=[ei])"),
+    ("j", r"kh|g(?=[ei])|x(?=[aeiou])"),
+    ("s", r"c(?=[ei])|z"),
+    ("k", r"qu(?=[ei])|q|c"),
+    ("b", r"v|w"),
+    ("", r"h"),
+    ("i", r"y(?![aeiou])"),
+]
+_GRUPOS = {f"g{i}": reemplazo for i, (reemplazo, _) in enumerate(_EQUIVALENCIAS)}
+_PATRON = re.compile("|".join(f"(?P<g{i}>{patron})" for i, (_, patron) in enumerate(_EQUIVALENCIAS)))
+_SIN_VOCALES = str.maketrans("", "", "aeiou")
+
+
+def _sin_repetidas(s: str) -> str:
+    return "".join(c for c, _ in groupby(s))
+
+
+@lru_cache(maxsize=200_000)
+def fonetica(palabra: str) -> str:
+    """Clave fonética de una palabra ya plegada."""
+    s = _sin_repetidas(_PATRON.sub(lambda m: _GRUPOS[m.lastgroup], palabra))
+    if not s:
+        return ""
+    inicial = "a" if s[0] in "aeiou" else s[0]
+    return _sin_repetidas(inicial + s[1:].translate(_SIN_VOCALES))
+
+
+def clave_tokens(toks) -> str:
+    return " ".join(sorted(f for f in map(fonetica, toks) if f))
+
+
+def clave_fonetica(texto: str) -> str:
+    """Claves fonéticas de los tokens (sin conectores), ordenadas."""
+    return clave_tokens(tokens(texto))
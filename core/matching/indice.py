@@ -0,0 +1,88 @@
+# core/matching/indice.py
+"""
+Índice invertido de n-gramas de caracteres sobre muchos nombres.
+
+Las listas de postings se guardan como arreglos NumPy (formato CSR: `inicio`
+por n-grama y `entradas` concatenadas). Una consulta junta los postings de
+sus n-gramas, cuenta los compartidos por entrada con un `bincount` y calcula
+el coeficiente de Dice contra todas las entradas en una sola pasada
+vectorizada; sólo los mejores candidatos (más los de igual clave fonética,
+que pueden compartir pocos n-gramas: 'Khalid'/'Jalid') se vuelven a puntuar
+con `similitud` (Jaro-Winkler + fonética).
+"""
+from functools import lru_cache
+
+import numpy as np
+
+from .fonetica import clave_fonetica, clave_tokens
+from .normalizar import tokens
+from .similitud import POSIBLE, similitud
+
+N = 3
+CANDIDATOS = 50
+DICE_MINIMO = 0.3
+
+
+@lru_cache(maxsize=200_000)
+def _ngramas_token(t: str) -> frozenset:
+    t = f" {t} "
+    return frozenset(t[i:i + N] for i in range(max(len(t) - N + 1, 1)))
+
+
+def ngramas(texto: str) -> set:
+    """N-gramas de cada token (con bordes) de un nombre plegado y sin conectores."""
+    grams = set()
+    for t in tokens(texto):
+        grams |= _ngramas_token(t)
+    return grams
+
+
+class IndiceNgramas:
+    def __init__(self, textos):
+        self.textos = list(textos)
+        self.vocabulario = {}
+        self.por_fonetica = {}
+        ids_token = {}
+        filas, columnas = [], []
+        for pos, texto in enumerate(self.textos):
+            toks = tokens(texto)
+            self.por_fonetica.setdefault(clave_tokens(toks), []).append(pos)
+            ids = set()
+            for t in toks:
+                if t not in ids_token:
+                    ids_token[t] = [self.vocabulario.setdefault(g, len(self.vocabulario)) for g in _ngramas_token(t)]
+                ids.update(ids_token[t])
+            filas.extend(ids)
+            columnas.extend([pos] * len(ids))
+        filas = np.asarray(filas, dtype=np.int32)
+        columnas = np.asarray(columnas, dtype=np.int32)
+        orden = np.argsort(filas, kind="stable")
+        self.entradas = columnas[orden]
+        self.inicio = np.zeros(len(self.vocabulario) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(filas, minlength=len(self.vocabulario)), out=self.inicio[1:])
+        self.largos = np.bincount(columnas, minlength=len(self.textos)).astype(np.float32)
+
+    def __len__(self):
+        return len(self.textos)
+
+    def candidatos(self, consulta: str, limite: int = CANDIDATOS, minimo: float = DICE_MINIMO):
+        """[(posición, dice)] de las entradas que más n-gramas comparten con `consulta`."""
+        grams = ngramas(consulta)
+        ids = [self.vocabulario[g] for g in grams if g in self.vocabulario]
+        if not ids or not self.textos:
+            return []
+        postings = np.concatenate([self.entradas[self.inicio[i]:self.inicio[i + 1]] for i in ids])
+        compartidos = np.bincount(postings, minlength=len(self.textos))
+        dice = 2.0 * compartidos / (len(grams) + self.largos)
+        posibles = np.flatnonzero(dice >= minimo)
+        if len(posibles) > limite:
+            posibles = posibles[np.argpartition(dice[posibles], -limite)[-limite:]]
+        posibles = posibles[np.argsort(-dice[posibles], kind="stable")]
+        return [(int(p), float(dice[p])) for p in posibles]
+
+    def buscar(self, consulta: str, umbral: float = POSIBLE, limite: int = CANDIDATOS):
+        """[(posición, similitud)] ordenados de mayor a menor, sólo los que superan `umbral`."""
+        posiciones = {p for p, _ in self.candidatos(consulta, limite)}
+        posiciones.update(self.por_fonetica.get(clave_fonetica(consulta), ())[:limite])
+        puntuados = [(p, similitud(consulta, self.textos[p])) for p in posiciones]
+        return sorted((par for par in puntuados if par[1] >= umbral), key=lambda par: par[1], reverse=True)
@@ -0,0 +1,32 @@
+# core/matching/normalizar.py
+"""Plegado de nombres: minúsculas, sin tildes ni signos, en tokens."""
+import re
+import unicodedata
+
+_NO_ALFANUM = re.compile(r"[^0-9a-z]+")
+
+# Conectores de los apellidos compuestos: "Pérez de la Rosa" ~ "Pérez Rosa"
+PARTICULAS = frozenset({"de", "del", "la", "las", "los", "y", "e", "da", "do", "dos", "das", "van", "von"})
+
+
+def plegar(texto: str) -> str:
+    """Minúsculas, sin tildes ni signos, espacios comprimidos."""
+    s = (texto or "").lower()
+    if not s.isascii():
+        s = unicodedata.normalize("NFKD", s)
+        s = "".join(c for c in s if not unicodedata.combining(c))
+    return _NO_ALFANUM.sub(" ", s).strip()
+
+
+def tokens(texto: str, particulas: bool = False) -> list:
+    """Tokens plegados; sin los conectores salvo que `particulas` sea True."""
+    todos = plegar(texto).split()
+    if particulas:
+        return todos
+    utiles = [t for t in todos if t not in PARTICULAS]
+    return utiles or todos
+
+
+def clave(texto: str) -> str:
+    """Tokens plegados y ordenados: 'PEREZ, Juan' y 'Juan Pérez' dan la misma clave."""
+    return " ".join(sorted(plegar(texto).split()))
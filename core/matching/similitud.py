@@ -0,0 +1,90 @@
+# core/matching/similitud.py
+"""
+Similitud entre nombres (0..1) y su traducción a `Resultado.score`.
+
+`similitud` alinea cada token del nombre más corto con el más parecido del
+otro (Jaro-Winkler), así que tolera el orden ('PEREZ GOMEZ, Juan'), las
+variantes de transliteración ('Yasin'/'Yaseen') y el segundo apellido que
+falta ('Juan Pérez' frente a 'Juan Pérez Gómez', con una penalización
+pequeña). Si las claves fonéticas coinciden la similitud no baja de
+`FONETICA`.
+"""
+from .fonetica import clave_fonetica
+from .normalizar import tokens
+
+EXACTA = 0.97
+POSIBLE = 0.85
+FONETICA = 0.9
+# Peso de la cobertura: cuánto resta cada token sin pareja en el nombre largo
+PESO_COBERTURA = 0.15
+
+
+def jaro_winkler(a: str, b: str, prefijo: float = 0.1) -> float:
+    if a == b:
+        return 1.0
+    la, lb = len(a), len(b)
+    if not la or not lb:
+        return 0.0
+    ventana = max(max(la, lb) // 2 - 1, 0)
+    usados_b = [False] * lb
+    coincidentes_a = []
+    for i, c in enumerate(a):
+        for j in range(max(0, i - ventana), min(lb, i + ventana + 1)):
+            if not usados_b[j] and b[j] == c:
+                usados_b[j] = True
+                coincidentes_a.append(c)
+                break
+    m = len(coincidentes_a)
+    if not m:
+        return 0.0
+    coincidentes_b = [b[j] for j in range(lb) if usados_b[j]]
+    transposiciones = sum(x != y for x, y in zip(coincidentes_a, coincidentes_b)) / 2
+    jaro = (m / la + m / lb + (m - transposiciones) / m) / 3
+    comun = 0
+    for x, y in zip(a[:4], b[:4]):
+        if x != y:
+            break
+        comun += 1
+    return jaro + comun * prefijo * (1 - jaro)
+
+
+def token_set(ta, tb) -> float:
+    """Promedio del mejor Jaro-Winkler de cada token del lado corto, con pareja única."""
+    if not ta or not tb:
+        return 0.0
+    corto, largo = (ta, tb) if len(ta) <= len(tb) else (tb, ta)
+    libres = list(largo)
+    total = 0.0
+    for t in sorted(corto, key=len, reverse=True):
+        mejor, pos = max((jaro_winkler(t, u), k) for k, u in enumerate(libres))
+        total += mejor
+        libres.pop(pos)
+    alineado = total / len(corto)
+    cobertura = len(corto) / len(largo)
+    return alineado * (1 - PESO_COBERTURA + PESO_COBERTURA * cobertura)
+
+
+def similitud(a: str, b: str) -> float:
+    ta, tb = tokens(a), tokens(b)
+    if not ta or not tb:
+        return 0.0
+    if sorted(ta) == sorted(tb):
+        return 1.0
+    s = token_set(ta, tb)
+    if s < FONETICA and clave_fonetica(a) == clave_fonetica(b):
+        s = FONETICA
+    return s
+
+
+def mejor(consulta: str, textos):
+    """(texto, similitud) del texto más parecido a `consulta`; ('', 0.0) si no hay."""
+    return max(((t, similitud(consulta, t)) for t in textos if t), key=lambda par: par[1], default=("", 0.0))
+
+
+def a_score(sim: float) -> int:
+    """Escala de los bots: 5 coincidencia, 3 posible coincidencia, 1 sin coincidencia."""
+    if sim >= EXACTA:
+        return 5
+    if sim >= POSIBLE:
+        return 3
+    return 1
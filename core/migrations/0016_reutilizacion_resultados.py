@@ -0,0 +1,38 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+# Búsquedas sólo por nombre, lentas y con datos que cambian poco
+PREFIJOS_REUTILIZABLES = ("opensanctions_", "ofsi_", "eu_", "fbi_news")
+TTL_INICIAL_H = 72
+
+
+def ttl_inicial(apps, schema_editor):
+    Fuente = apps.get_model('core', 'Fuente')
+    for prefijo in PREFIJOS_REUTILIZABLES:
+        Fuente.objects.filter(nombre__startswith=prefijo).update(ttl_reutilizacion_h=TTL_INICIAL_H)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0015_remove_consulta_pdf_path'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='fuente',
+            name='ttl_reutilizacion_h',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='resultado',
+            name='fecha',
+            field=models.DateTimeField(auto_now_add=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='resultado',
+            name='reutilizado_de',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='reutilizaciones', to='core.resultado'),
+        ),
+        migrations.RunPython(ttl_inicial, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 4.2.16 on 2026-10-16 23:59
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0016_reutilizacion_resultados'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EntradaLista',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('id_externo', models.CharField(db_index=True, max_length=200)),
+                ('esquema', models.CharField(blank=True, max_length=50)),
+                ('nombre', models.CharField(max_length=500)),
+                ('datos', models.JSONField(blank=True, default=dict)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='NombreLista',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('clave', models.CharField(db_index=True, max_length=500)),
+                ('entrada', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='nombres', to='core.entradalista')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ListaDataset',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('lista', models.CharField(max_length=50)),
+                ('nombre', models.CharField(max_length=100)),
+                ('titulo', models.CharField(blank=True, max_length=255)),
+                ('version', models.CharField(blank=True, max_length=100)),
+                ('fecha_carga', models.DateTimeField(auto_now=True)),
+                ('total_entradas', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'unique_together': {('lista', 'nombre')},
+            },
+        ),
+        migrations.AddField(
+            model_name='entradalista',
+            name='dataset',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='entradas', to='core.listadataset'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 4.2.16 on 2026-10-17 00:02
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0017_listas_locales'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='entradalista',
+            name='huella',
+            field=models.CharField(blank=True, max_length=40),
+        ),
+        migrations.CreateModel(
+            name='DocumentoLista',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('numero', models.CharField(db_index=True, max_length=100)),
+                ('tipo', models.CharField(blank=True, max_length=100)),
+                ('pais', models.CharField(blank=True, max_length=100)),
+                ('entrada', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='documentos', to='core.entradalista')),
+            ],
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.16 on 2026-10-17 00:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0018_documentos_listas'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='entradalista',
+            name='etiquetas',
+            field=models.JSONField(blank=True, default=list),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 4.2.16 on 2026-10-17 00:17
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0019_etiquetas_listas'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RelacionLista',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('origen', models.CharField(db_index=True, max_length=200)),
+                ('destino', models.CharField(db_index=True, max_length=200)),
+                ('tipo', models.CharField(blank=True, max_length=200)),
+                ('dataset', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='relaciones', to='core.listadataset')),
+            ],
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 4.2.16 on 2026-10-17 00:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0020_relaciones_listas'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DescargaLista',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('nombre', models.CharField(max_length=100, unique=True)),
+                ('url', models.CharField(max_length=1000)),
+                ('etag', models.CharField(blank=True, max_length=255)),
+                ('ultima_modificacion', models.CharField(blank=True, max_length=100)),
+                ('revisado', models.DateTimeField(blank=True, null=True)),
+                ('descargado', models.DateTimeField(blank=True, null=True)),
+                ('error', models.TextField(blank=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='listadataset',
+            name='verificado',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
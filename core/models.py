@@ -33,9 +33,81 @@ class Fuente(models.Model):
     tipo = models.ForeignKey(TipoFuente, on_delete=models.CASCADE, related_name="fuentes")
     nombre = models.CharField(max_length=100)
     nombre_pila = models.CharField(max_length=100)
+    # Horas durante las que un resultado de esta fuente se reutiliza en consultas
+    # posteriores de la misma persona (0 = siempre se consulta en vivo)
+    ttl_reutilizacion_h = models.PositiveIntegerField(default=0)
     def __str__(self):
         return f"{self.nombre} ({self.tipo.nombre})"
 
+class ListaDataset(models.Model):
+    """Copia local de un dataset de una lista restrictiva (p.ej. opensanctions / us_ofac_sdn)."""
+    lista = models.CharField(max_length=50)
+    nombre = models.CharField(max_length=100)
+    titulo = models.CharField(max_length=255, blank=True)
+    version = models.CharField(max_length=100, blank=True)
+    fecha_carga = models.DateTimeField(auto_now=True)
+    # Última vez que se confirmó contra la fuente que la copia sigue al día (recarga o 304)
+    verificado = models.DateTimeField(null=True, blank=True)
+    total_entradas = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = ("lista", "nombre")
+
+    def __str__(self):
+        return f"{self.lista}:{self.nombre} ({self.total_entradas})"
+
+
+class EntradaLista(models.Model):
+    dataset = models.ForeignKey(ListaDataset, on_delete=models.CASCADE, related_name="entradas")
+    id_externo = models.CharField(max_length=200, db_index=True)
+    esquema = models.CharField(max_length=50, blank=True)
+    nombre = models.CharField(max_length=500)
+    datos = models.JSONField(default=dict, blank=True)
+    # Hash del contenido: las recargas sólo tocan las entradas que cambiaron
+    huella = models.CharField(max_length=40, blank=True)
+    # Acto jurídico, programa o régimen, para consultar un subconjunto del dataset
+    etiquetas = models.JSONField(default=list, blank=True)
+
+    def __str__(self):
+        return f"{self.nombre} ({self.dataset.nombre})"
+
+
+class NombreLista(models.Model):
+    """Nombre o alias normalizado de una entrada; es lo que se indexa para buscar."""
+    entrada = models.ForeignKey(EntradaLista, on_delete=models.CASCADE, related_name="nombres")
+    clave = models.CharField(max_length=500, db_index=True)
+
+
+class DocumentoLista(models.Model):
+    """Documento de identidad (cédula, pasaporte, NIT...) de una entrada, normalizado."""
+    entrada = models.ForeignKey(EntradaLista, on_delete=models.CASCADE, related_name="documentos")
+    numero = models.CharField(max_length=100, db_index=True)
+    tipo = models.CharField(max_length=100, blank=True)
+    pais = models.CharField(max_length=100, blank=True)
+
+
+class RelacionLista(models.Model):
+    """Arista entre dos entradas de un dataset con estructura de grafo (p.ej. ICIJ Offshore Leaks)."""
+    dataset = models.ForeignKey(ListaDataset, on_delete=models.CASCADE, related_name="relaciones")
+    origen = models.CharField(max_length=200, db_index=True)
+    destino = models.CharField(max_length=200, db_index=True)
+    tipo = models.CharField(max_length=200, blank=True)
+
+
+class DescargaLista(models.Model):
+    """Validadores HTTP de la última descarga de una lista espejada (core.listas.frescura)."""
+    nombre = models.CharField(max_length=100, unique=True)
+    url = models.CharField(max_length=1000)
+    etag = models.CharField(max_length=255, blank=True)
+    ultima_modificacion = models.CharField(max_length=100, blank=True)
+    revisado = models.DateTimeField(null=True, blank=True)
+    descargado = models.DateTimeField(null=True, blank=True)
+    error = models.TextField(blank=True)
+
+    def __str__(self):
+        return f"{self.nombre} ({self.etag or self.ultima_modificacion or 'sin validadores'})"
+
+
 class Resultado(models.Model):
     consulta = models.ForeignKey("Consulta", on_delete=models.CASCADE)
     fuente = models.ForeignKey(
@@ -50,8 +122,18 @@ class Resultado(models.Model):
     estado = models.CharField(max_length=20, default="pendiente")
     mensaje = models.TextField(blank=True)
     archivo = models.CharField(max_length=255, blank=True)
+    fecha = models.DateTimeField(auto_now_add=True, null=True)
+    # Resultado original cuando este se copió de una consulta anterior
+    reutilizado_de = models.ForeignKey(
+        "self",
+        on_delete=models.SET_NULL,
+        related_name="reutilizaciones",
+        null=True,
+        blank=True
+    )
 
-    def save(self, *args, **kwargs):
+    def normalizar(self):
+        """Estado y score canónicos; lo aplica `save` y también el guardado por lotes (core.utils.resultados)."""
         # estado siempre en minúscula
         if self.estado:
             self.estado = self.estado.lower()
@@ -78,6 +160,8 @@ class Resultado(models.Model):
             # si existe en el mapa lo reemplaza
             self.score = conversion.get(self.score, self.score)
 
+    def save(self, *args, **kwargs):
+        self.normalizar()
         super().save(*args, **kwargs)
 
     def __str__(self):
@@ -1,6 +1,6 @@
 import re
 import asyncio
-from playwright.async_api import async_playwright
+from core.utils.browser_pool import async_playwright
 
 PAGE_URL = "https://www.procuraduria.gov.co/Pages/Consulta-de-Antecedentes.aspx"
 
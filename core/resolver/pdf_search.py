@@ -1,29 +1,27 @@
 import fitz
 import os
 
+from core.utils import pdf_texto
+
 def pdf_search(pdf_path, texto_busqueda, carpeta_salida):
     os.makedirs(carpeta_salida, exist_ok=True)
-    doc = fitz.open(pdf_path)
-    coincidencias_encontradas = False
+    # La búsqueda sale del índice de texto; el PDF sólo se abre si hay algo que recortar.
+    # Como con `search_for`, vale un fragmento (apellido parcial, parte del documento)
+    coincidencias = pdf_texto.buscar(pdf_path, texto_busqueda, parcial=True)
+    if not coincidencias:
+        return "No se encontraron coincidencias"
 
-    for num_pagina, pagina in enumerate(doc, start=1):
-        # Buscar texto (case-insensitive)
-        areas = pagina.search_for(texto_busqueda, quads=True)
-        if areas:
-            coincidencias_encontradas = True
-            for idx, quad in enumerate(areas, start=1):
-                pagina.add_highlight_annot(quad)
+    with fitz.open(pdf_path) as doc:
+        for indice, cajas in coincidencias:
+            pagina = doc[indice]
+            for idx, caja in enumerate(cajas, start=1):
+                rect = fitz.Rect(caja)
+                pagina.add_highlight_annot(rect)
 
-                rect = fitz.Rect(quad.rect)
                 rect = rect + (-20, -20, 20, 20)
 
                 pix = pagina.get_pixmap(clip=rect, dpi=150)
-                nombre_img = os.path.join(carpeta_salida, f"pagina_{num_pagina}_match_{idx}.png")
+                nombre_img = os.path.join(carpeta_salida, f"pagina_{indice + 1}_match_{idx}.png")
                 pix.save(nombre_img)
 
-
-    if coincidencias_encontradas:
-        return "Coincidencia encontrada"
-    else:
-        return "No se encontraron coincidencias"
-
+    return "Coincidencia encontrada"
@@ -48,10 +48,16 @@ class ConsultaSerializer(serializers.ModelSerializer):
 class ResultadoSerializer(serializers.ModelSerializer):
     fuente = serializers.CharField(source="fuente.nombre_pila", default=None)
     tipo_fuente = serializers.CharField(source="fuente.tipo.nombre", default=None)
+    reutilizado = serializers.SerializerMethodField()
+    fecha_origen = serializers.DateTimeField(source="reutilizado_de.fecha", default=None)
 
     class Meta:
         model = Resultado
-        fields = ["id", "consulta_id", "fuente", "tipo_fuente", "estado", "score", "mensaje", "archivo"]
+        fields = ["id", "consulta_id", "fuente", "tipo_fuente", "estado", "score", "mensaje", "archivo",
+                  "reutilizado", "reutilizado_de", "fecha_origen"]
+
+    def get_reutilizado(self, obj):
+        return obj.reutilizado_de_id is not None
 
 
 class CandidatoSerializer(serializers.ModelSerializer):
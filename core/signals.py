@@ -1,7 +1,22 @@
-from django.db.models.signals import post_save
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.contrib.auth.models import User
-from .models import Perfil, Candidato
+from .models import Fuente, Perfil, Candidato, TipoFuente
+from .utils import fuentes, sqlite
+
+
+@receiver(connection_created, dispatch_uid="sqlite_concurrente")
+def configurar_sqlite(sender, connection, **kwargs):
+    """PRAGMAs del modo SQLITE_CONCURRENTE (core.utils.sqlite) en cada conexión nueva."""
+    sqlite.configurar_conexion(connection)
+
+
+@receiver([post_save, post_delete], sender=Fuente)
+@receiver([post_save, post_delete], sender=TipoFuente)
+def invalidar_cache_fuentes(sender, **kwargs):
+    """El mapa de Fuentes en memoria de los bots (core.utils.fuentes) se recarga en cuanto cambia una."""
+    fuentes.invalidar()
 
 # @receiver(post_save, sender=Perfil)
 # def crear_o_actualizar_candidato(sender, instance, created, **kwargs):
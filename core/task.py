@@ -1,56 +1,71 @@
 import os
 import asyncio
-import itertools
 from django.conf import settings
-from celery import shared_task
+from celery import chord, shared_task
 from .models import Consulta, Resultado
 from .bots.bot_configs import get_bot_configs
 from .bots.bot_configs_contratista import get_bot_configs_contratista
+from .bots import registro
 from asgiref.sync import async_to_sync
 import requests
 import httpx
 from time import perf_counter
+from celery.signals import worker_process_init, worker_process_shutdown, worker_shutdown
+from .utils import bd, bloqueo_red, bot_runtime, bot_scheduler
+from .utils.browser_pool import obtener_pool, cerrar_pool
+
+
+@worker_process_init.connect
+def _calentar_pool_navegadores(**kwargs):
+    """
+    En cada proceso hijo del worker arranca el loop de bots y, en segundo
+    plano, el driver persistente de Playwright y los navegadores del pool.
+    No espera: Celery mata al hijo que no termina `worker_process_init` en
+    `worker_proc_alive_timeout` (4 s). Con pools sin hijos (solo, threads) la
+    señal no llega y el pool se arma con el primer préstamo.
+    """
+    async def _calentar():
+        try:
+            pool = await obtener_pool()
+            await pool.calentar()
+        except Exception as e:
+            print(f"[pool] No se pudo calentar el pool de navegadores: {e}")
+
+    bot_runtime.lanzar(_calentar())
 
-async def run_bot(bot):
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def _cerrar_pool_navegadores(**kwargs):
+    if not bot_runtime.activo():
+        return
     try:
-        # El bot ya guarda sus propios resultados en la BD
-        await bot['func'](**bot['kwargs'])
+        bot_runtime.ejecutar(cerrar_pool(), timeout=30)
     except Exception as e:
-        # Guardar error o hacer log
-        print(f"Error en bot {bot['func'].__name__}: {e}")
-  
-def chunked(iterable, size):
-    """Divide un iterable en listas de tamaño 'size'."""
-    it = iter(iterable)
-    while True:
-        chunk = list(itertools.islice(it, size))
-        if not chunk:
-            break
-        yield chunk
+        print(f"[pool] Error cerrando el pool de navegadores: {e}")
+    bot_runtime.detener()
+    bd.detener()
 
-@shared_task
-def procesar_consulta(consulta_id, datos):
 
-    async def run_bot(bot):
-        try:
-            await bot['func'](**bot['kwargs'])
-        except Exception as e:
-            print(f"Error en bot {bot['func'].__name__}: {e}")
+def _shards(total, tamano):
+    """Reparte los índices 0..total-1 en listas de a lo sumo `tamano`."""
+    tamano = max(1, tamano)
+    return [list(range(i, min(i + tamano, total))) for i in range(0, total, tamano)]
 
-    def chunked(iterable, size):
-        it = iter(iterable)
-        while True:
-            chunk = list(itertools.islice(it, size))
-            if not chunk:
-                break
-            yield chunk
 
+@shared_task
+def procesar_consulta(consulta_id, datos):
+    """
+    Prepara la consulta y reparte sus bots en shards (un grupo de Celery que
+    cualquier worker puede tomar). El chord `finalizar_consulta` marca la
+    consulta como completada sólo cuando terminaron todos los shards.
+    """
     consulta = Consulta.objects.get(id=consulta_id)
 
     if not datos:
         # fallback por si algo falla
         from .consultar_registraduria import consultar_registraduria
-        datos = async_to_sync(consultar_registraduria)(consulta.candidato.cedula)
+        datos = bot_runtime.ejecutar(consultar_registraduria(consulta.candidato.cedula))
 
     if not datos:
         consulta.estado = 'no_encontrado'
@@ -62,21 +77,79 @@ def procesar_consulta(consulta_id, datos):
 
     datos.setdefault('rutas', {})
 
+    # Los bots no son serializables: cada shard reconstruye la lista y toma sus índices.
+    # Tamaño configurable vía env `BOT_SHARD_SIZE`.
     bot_configs = get_bot_configs(consulta_id, datos)
+    try:
+        shard_size = int(os.environ.get('BOT_SHARD_SIZE', '40'))
+    except Exception:
+        shard_size = 40
+    shards = [
+        (indices, [bot_configs[i]['name'] for i in indices])
+        for indices in _shards(len(bot_configs), shard_size)
+    ]
+    print(f"[task] Consulta {consulta_id}: {len(bot_configs)} bots en {len(shards)} shards")
 
-    async def main_bots():
-        # Corre en paralelo por lotes. Tamaño configurable vía env `BOT_BATCH_SIZE`.
-        try:
-            batch_size = int(os.environ.get('BOT_BATCH_SIZE', '10'))
-        except Exception:
-            batch_size = 10
-        print(f"[task] Ejecutando bots en lotes de tamaño={batch_size}")
-        for batch in chunked(bot_configs, batch_size):
-            await asyncio.gather(*(run_bot(bot) for bot in batch))
+    chord(
+        procesar_shard.s(consulta_id, datos, indices, nombres)
+        for indices, nombres in shards
+    )(finalizar_consulta.s(consulta_id))
 
-    # Ejecutar bots (paralelo por lotes)
-    async_to_sync(main_bots)()
 
+@shared_task
+def procesar_shard(consulta_id, datos, indices, nombres):
+    """
+    Ejecuta en este worker los bots `indices` de `get_bot_configs`.
+
+    Nunca lanza: un shard que revienta haría fallar el chord y
+    `finalizar_consulta` no correría; en su lugar devuelve stats con sus bots
+    marcados como errores.
+    """
+    etiqueta = f"consulta {consulta_id} shard {indices[0] if indices else 0}"
+    inicio = perf_counter()
+    try:
+        bot_configs = get_bot_configs(consulta_id, datos)
+        bots = []
+        for i, nombre in zip(indices, nombres):
+            if i < len(bot_configs) and bot_configs[i]['name'] == nombre:
+                bots.append(bot_configs[i])
+            else:
+                # La lista cambió entre el reparto y la ejecución (despliegue en medio)
+                bots.extend(b for b in bot_configs if b['name'] == nombre)
+
+        # Ejecutar bots en el loop persistente del worker: cada slot toma el
+        # siguiente bot en cuanto queda libre. Slots configurables vía env `BOT_BATCH_SIZE`.
+        bloqueos = {}
+        stats = bot_runtime.ejecutar(bot_scheduler.ejecutar_bots(
+            bots, bot_scheduler.slots_configurados(10), bloqueos,
+            etiqueta=etiqueta, reutilizar=not datos.get('forzar'),
+        ))
+        bloqueo_red.imprimir_resumen(bloqueos)
+        return stats
+    except Exception as e:
+        print(f"[task] Falló el {etiqueta} ({len(nombres)} bots): {e!r}")
+        return {
+            "bots": len(nombres),
+            "wall_s": round(perf_counter() - inicio, 2),
+            "errores": list(nombres),
+            "error": repr(e),
+        }
+
+
+@shared_task
+def finalizar_consulta(stats_shards, consulta_id):
+    """Callback del chord: todos los shards terminaron."""
+    stats_shards = [s for s in (stats_shards or []) if s]
+    if stats_shards:
+        print(
+            f"[task] Consulta {consulta_id}: {sum(s['bots'] for s in stats_shards)} bots en "
+            f"{len(stats_shards)} shards, shard más largo {max(s['wall_s'] for s in stats_shards)}s"
+        )
+    errores = [nombre for s in stats_shards for nombre in s.get('errores', [])]
+    if errores:
+        print(f"[task] Consulta {consulta_id}: {len(errores)} bots no corrieron por fallo de su shard: {errores}")
+
+    consulta = Consulta.objects.get(id=consulta_id)
     consulta.estado = 'completado'
     consulta.save()
 
@@ -106,29 +179,16 @@ def procesar_consulta(consulta_id, datos):
         async_to_sync(llamar_consolidado)()
     except Exception as e:
         print(f"Error general llamando a las APIs: {e}")
-        
-@shared_task
-def procesar_consulta_por_nombres(consulta_id, datos, lista_nombres):
-    async def run_bot(bot):
-        try:
-            await bot['func'](**bot['kwargs'])
-        except Exception as e:
-            print(f"Error en bot {bot['func'].__name__}: {e}")
 
-    def chunked(iterable, size):
-        it = iter(iterable)
-        while True:
-            chunk = list(itertools.islice(it, size))
-            if not chunk:
-                break
-            yield chunk
 
+@shared_task
+def procesar_consulta_por_nombres(consulta_id, datos, lista_nombres):
     consulta = Consulta.objects.get(id=consulta_id)
 
     if not datos:
         # fallback por si algo falla
         from .consultar_registraduria import consultar_registraduria
-        datos = async_to_sync(consultar_registraduria)(consulta.candidato.cedula)
+        datos = bot_runtime.ejecutar(consultar_registraduria(consulta.candidato.cedula))
 
     if not datos:
         consulta.estado = 'no_encontrado'
@@ -146,12 +206,13 @@ def procesar_consulta_por_nombres(consulta_id, datos, lista_nombres):
     # Filtramos por lista de nombres
     bot_configs = [bot for bot in bot_configs if bot["name"] in lista_nombres]
 
-    async def main_bots():
-        for batch in chunked(bot_configs, 50):
-            await asyncio.gather(*(run_bot(bot) for bot in batch))
-
     # Ejecutar solo los bots filtrados
-    async_to_sync(main_bots)()
+    bloqueos = {}
+    bot_runtime.ejecutar(bot_scheduler.ejecutar_bots(
+        bot_configs, 50, bloqueos, etiqueta=f"consulta {consulta_id}",
+        reutilizar=not (datos or {}).get("forzar"),
+    ))
+    bloqueo_red.imprimir_resumen(bloqueos)
 
     consulta.estado = 'completado'
     consulta.save()
@@ -227,25 +288,12 @@ def reintentar_bot(resultado_id):
         "error": ""
     }
 
-    bot_configs = get_bot_configs(consulta.id, datos)
-
     # ============================
-    # 🔥 FIX 2 — Comparación segura del nombre del bot
+    # 🔥 FIX 2 — Comparación segura del nombre del bot: sólo se construye la
+    # entrada elegida (get_bot_configs y luego el contratista, vía registro)
+    # y su módulo no se importa hasta ejecutarla
     # ============================
-    bot = next((b for b in bot_configs
-                if (b.get("name") or "").strip().lower() == nombre_fuente), None)
-    # ============================
-
-    # ============================
-    # 🔥 FIX 3 — Soporte a bots contratistas (seguro si no existen)
-    # ============================
-    if not bot:
-        try:
-            alt_configs = get_bot_configs_contratista(consulta.id, datos)
-        except NameError:
-            alt_configs = []
-        bot = next((b for b in alt_configs
-                    if (b.get("name") or "").strip().lower() == nombre_fuente), None)
+    bot = registro.construir(nombre_fuente, consulta.id, datos)
     # ============================
 
     # ============================
@@ -269,7 +317,7 @@ def reintentar_bot(resultado_id):
 
     mensaje_final = ""
     try:
-        async_to_sync(bot["func"])(**(bot.get("kwargs") or {}))
+        bot_runtime.ejecutar(bot["func"](**(bot.get("kwargs") or {})))
 
         nuevos_qs = Resultado.objects.filter(
             consulta=consulta,
@@ -331,26 +379,12 @@ async def _llamar_consolidado_async(consulta_id: int):
 
 @shared_task
 def procesar_consulta_contratista_por_nombres(consulta_id, datos, lista_nombres):
-    async def run_bot(bot):
-        try:
-            await bot["func"](**bot["kwargs"])
-        except Exception as e:
-            print(f"Error en bot {bot['func'].__name__}: {e}")
-
-    def chunked(iterable, size):
-        it = iter(iterable)
-        while True:
-            chunk = list(itertools.islice(it, size))
-            if not chunk:
-                break
-            yield chunk
-
     consulta = Consulta.objects.get(id=consulta_id)
 
     # Fallback si no recibimos datos
     if not datos:
         from .consultar_registraduria import consultar_registraduria
-        datos = async_to_sync(consultar_registraduria)(consulta.candidato.cedula)
+        datos = bot_runtime.ejecutar(consultar_registraduria(consulta.candidato.cedula))
 
     if not datos:
         consulta.estado = "no_encontrado"
@@ -370,13 +404,34 @@ def procesar_consulta_contratista_por_nombres(consulta_id, datos, lista_nombres)
     if lista_nombres:
         bot_configs = [b for b in bot_configs if b["name"] in lista_nombres]
 
-    # 3) Ejecutar en lotes (concurrency control)
-    async def main_bots():
-        for batch in chunked(bot_configs, 50):
-            await asyncio.gather(*(run_bot(b) for b in batch))
-
-    async_to_sync(main_bots)()
+    # 3) Ejecutar con a lo sumo 50 bots simultáneos (concurrency control)
+    bloqueos = {}
+    bot_runtime.ejecutar(bot_scheduler.ejecutar_bots(
+        bot_configs, 50, bloqueos, etiqueta=f"consulta {consulta_id}",
+        reutilizar=not (datos or {}).get("forzar"),
+    ))
+    bloqueo_red.imprimir_resumen(bloqueos)
 
     # 4) Marcar consulta como completada
     consulta.estado = "completado"
     consulta.save()
+
+
+@shared_task
+def actualizar_lista_local(comando, *args):
+    """
+    Recarga una lista local (core.listas) con su comando de ingesta; la
+    programa CELERY_BEAT_SCHEDULE. Si falla, los bots siguen con la copia
+    anterior o, sin copia, con el navegador.
+    """
+    from io import StringIO
+    from django.core.management import call_command
+
+    salida = StringIO()
+    inicio = perf_counter()
+    try:
+        call_command(comando, *args, stdout=salida)
+    except Exception as e:
+        print(f"[listas] {comando} falló tras {perf_counter() - inicio:.0f}s: {e}")
+        raise
+    print(f"[listas] {comando} en {perf_counter() - inicio:.0f}s: {salida.getvalue().strip().splitlines()[-1:]}")
@@ -1,5 +1,8 @@
 
-from django.test import TestCase
+import asyncio
+
+import fakeredis
+from django.test import SimpleTestCase, TestCase
 from core.models import Fuente, TipoFuente
 
 class FuenteTestCase(TestCase):
@@ -16,3 +19,1439 @@ class FuenteTestCase(TestCase):
 		with self.assertRaises(Exception):
 			# Intentar crear otra fuente con el mismo nombre y tipo debería fallar si hay restricción de unicidad
 			Fuente.objects.create(nombre="Unica", nombre_pila="Unica", tipo=self.tipo)
+
+
+class _BrowserFalso:
+	"""Navegador mínimo con la interfaz que usa el pool."""
+	def __init__(self):
+		self.conectado = True
+		self.contextos = 0
+
+	def is_connected(self):
+		return self.conectado
+
+	def on(self, evento, callback):
+		pass
+
+	async def new_context(self, **kwargs):
+		self.contextos += 1
+		return _ContextoFalso()
+
+	async def close(self):
+		self.conectado = False
+
+
+class _ContextoFalso:
+	async def close(self):
+		pass
+
+
+class _PlaywrightFalso:
+	def __init__(self):
+		self.lanzados = []
+		self.chromium = self
+
+	async def launch(self, **kwargs):
+		b = _BrowserFalso()
+		self.lanzados.append(b)
+		return b
+
+
+class BrowserPoolTestCase(SimpleTestCase):
+	def test_reutiliza_y_recicla_navegadores(self):
+		from core.utils.browser_pool import BrowserPool, NavegadorPrestado
+
+		async def escenario():
+			pw = _PlaywrightFalso()
+			pool = BrowserPool(pw, tamano=2, max_usos=3, max_rss_mb=0)
+			for _ in range(3):
+				prestado = NavegadorPrestado(pool, await pool.adquirir(headless=True))
+				await prestado.new_context()
+				await prestado.close()
+			# Tres usos secuenciales caben en un solo navegador, que se recicla al llegar a K
+			self.assertEqual(len(pw.lanzados), 1)
+			self.assertFalse(pw.lanzados[0].conectado)
+			prestado = NavegadorPrestado(pool, await pool.adquirir(headless=True))
+			self.assertEqual(len(pw.lanzados), 2)
+			await prestado.close()
+
+		asyncio.run(escenario())
+
+
+
+class _DriverFalso(_PlaywrightFalso):
+	"""Driver de Playwright que se puede 'matar': deja de responder al ping."""
+	def __init__(self):
+		super().__init__()
+		self.vivo = True
+		self.detenido = False
+		self.request = self
+
+	async def new_context(self):
+		if not self.vivo:
+			raise ConnectionError("driver muerto")
+		return _ContextoPing()
+
+	async def stop(self):
+		self.detenido = True
+
+
+class _ContextoPing:
+	async def dispose(self):
+		pass
+
+
+class PlaywrightDriverTestCase(SimpleTestCase):
+	def setUp(self):
+		from unittest import mock
+		from core.utils import browser_pool, playwright_driver
+
+		self.drivers = []
+
+		class Arranque:
+			async def start(arranque):
+				driver = _DriverFalso()
+				self.drivers.append(driver)
+				return driver
+
+		estado = {n: getattr(playwright_driver, n) for n in ("_pw", "_pid", "_generacion", "_arranque", "_vigilante")}
+		self.addCleanup(lambda: [setattr(playwright_driver, n, v) for n, v in estado.items()])
+		self.addCleanup(setattr, browser_pool, "_pool", browser_pool._pool)
+		for n in estado:
+			setattr(playwright_driver, n, 0 if n == "_generacion" else None)
+		browser_pool._pool = None
+		for parche in (
+			mock.patch.object(playwright_driver, "_async_playwright_real", Arranque),
+			# El vigilante revisa en cada vuelta del loop en vez de cada 30 s
+			mock.patch.object(playwright_driver, "PING_INTERVALO_S", 0),
+		):
+			parche.start()
+			self.addCleanup(parche.stop)
+
+	def test_driver_muerto_se_reinicia_y_el_pool_descarta_sus_navegadores(self):
+		from core.utils import browser_pool, playwright_driver
+
+		async def escenario():
+			pool = await browser_pool.obtener_pool()
+			viejo = await pool.adquirir(headless=True)
+			self.assertEqual(playwright_driver.generacion(), 1)
+
+			self.drivers[0].vivo = False
+
+			async def reiniciado():
+				while playwright_driver.generacion() == 1:
+					await asyncio.sleep(0)
+			await asyncio.wait_for(reiniciado(), timeout=10)
+
+			nuevo_pool = await browser_pool.obtener_pool()
+			nuevo = await nuevo_pool.adquirir(headless=True)
+			await playwright_driver.detener()
+			return pool, viejo, nuevo_pool, nuevo
+
+		pool, viejo, nuevo_pool, nuevo = asyncio.run(escenario())
+		self.assertEqual(len(self.drivers), 2)
+		self.assertTrue(self.drivers[0].detenido)
+		# El siguiente préstamo sale del driver nuevo; los navegadores de la generación vieja no vuelven
+		self.assertIsNot(nuevo_pool, pool)
+		self.assertTrue(pool._cerrado)
+		self.assertEqual(nuevo_pool.generacion, 2)
+		self.assertIs(nuevo_pool.playwright, self.drivers[1])
+		self.assertEqual(self.drivers[1].lanzados, [nuevo.browser])
+		self.assertNotIn(viejo, [n for lista in nuevo_pool._navegadores.values() for n in lista])
+
+
+class _ContextoRuteable:
+	def __init__(self):
+		self.rutas = []
+
+	async def route(self, patron, handler):
+		self.rutas.append((patron, handler))
+
+
+class _Ruta:
+	def __init__(self, url, tipo):
+		self.request = type("Peticion", (), {"url": url, "resource_type": tipo})()
+		self.desenlace = None
+
+	async def abort(self, motivo=None):
+		self.desenlace = "abortada"
+
+	async def fallback(self):
+		self.desenlace = "continua"
+
+
+class BloqueoRedTestCase(SimpleTestCase):
+	def _pedir(self, contexto, url, tipo):
+		_, handler = contexto.rutas[-1]
+		ruta = _Ruta(url, tipo)
+		asyncio.run(handler(ruta, ruta.request))
+		return ruta.desenlace
+
+	def test_aborta_lo_bloqueado_y_deja_pasar_lo_demas(self):
+		from core.utils import bloqueo_red
+
+		contexto, estadisticas = _ContextoRuteable(), {}
+		with bloqueo_red.perfil_para({"name": "bot_texto", "block": "texto"}, estadisticas):
+			asyncio.run(bloqueo_red.instalar(contexto))
+		self.assertEqual(self._pedir(contexto, "https://portal.gov.co/logo.png", "image"), "abortada")
+		self.assertEqual(self._pedir(contexto, "https://www.google-analytics.com/g.js", "script"), "abortada")
+		self.assertEqual(self._pedir(contexto, "https://portal.gov.co/consulta", "document"), "continua")
+		self.assertEqual(estadisticas["bot_texto"], {"peticiones": 2, "por_tipo": {"image": 1, "script": 1}})
+
+	def test_contexto_persistente_tambien_bloquea(self):
+		from core.utils import bloqueo_red
+		from core.utils.browser_pool import _ChromiumPool
+
+		contexto = _ContextoRuteable()
+
+		class Chromium:
+			async def launch_persistent_context(self, carpeta, **kwargs):
+				return contexto
+
+		pool = type("Pool", (), {"playwright": type("Pw", (), {"chromium": Chromium()})()})()
+		with bloqueo_red.perfil_para({"name": "bot_perfil", "block": "ligero"}):
+			self.assertIs(asyncio.run(_ChromiumPool(pool, []).launch_persistent_context("/tmp/perfil")), contexto)
+		self.assertEqual(self._pedir(contexto, "https://fonts.example/a.woff2", "font"), "abortada")
+		self.assertEqual(self._pedir(contexto, "https://portal.gov.co/app.js", "script"), "continua")
+
+class BotSchedulerTestCase(SimpleTestCase):
+	def setUp(self):
+		from core.utils import redis_cliente
+		redis_cliente.fijar_redis(fakeredis.FakeAsyncRedis(decode_responses=True))
+		self.addCleanup(redis_cliente.fijar_redis, None)
+
+	def test_slot_libre_toma_el_siguiente_bot(self):
+		from core.utils.bot_scheduler import ejecutar_bots
+
+		orden = []
+
+		async def escenario():
+			# "a" no termina hasta que corran los demás: con lotes de 2, "c" y "d" lo esperarían para siempre
+			rezagado = asyncio.Event()
+
+			def bot(nombre, espera=None, libera=None):
+				async def consultar():
+					if espera:
+						await espera.wait()
+					orden.append(nombre)
+					if libera:
+						libera.set()
+				consultar.__name__ = f"consultar_{nombre}"
+				return {"name": nombre, "func": consultar, "kwargs": {}}
+
+			bots = [bot("a", espera=rezagado), bot("b"), bot("c"), bot("d", libera=rezagado)]
+			return await asyncio.wait_for(ejecutar_bots(bots, slots=2), timeout=10)
+
+		stats = asyncio.run(escenario())
+		self.assertEqual(orden, ["b", "c", "d", "a"])
+		self.assertEqual(stats["bots"], 4)
+
+
+
+class ProcesarShardTestCase(SimpleTestCase):
+	def test_shard_que_revienta_no_tumba_el_chord(self):
+		from unittest import mock
+		from core import task
+
+		def ejecutar(corrutina, **kwargs):
+			corrutina.close()
+			raise RuntimeError("loop caído")
+
+		bots = [{"name": "a"}, {"name": "b"}]
+		with mock.patch.object(task, "get_bot_configs", return_value=bots), \
+				mock.patch.object(task.bot_runtime, "ejecutar", side_effect=ejecutar):
+			stats = task.procesar_shard(1, {}, [0, 1], ["a", "b"])
+		self.assertEqual(stats["bots"], 2)
+		self.assertEqual(stats["errores"], ["a", "b"])
+		self.assertIn("loop caído", stats["error"])
+
+
+class CalentamientoPoolTestCase(SimpleTestCase):
+	def test_calentamiento_no_bloquea_el_arranque_del_hijo(self):
+		import threading
+		from unittest import mock
+		from core import task
+
+		soltar, calentado = threading.Event(), threading.Event()
+
+		class PoolFalso:
+			async def calentar(self):
+				calentado.set()
+
+		async def obtener_pool():
+			# El driver tarda en arrancar: el init del proceso hijo no debe esperarlo
+			await asyncio.get_running_loop().run_in_executor(None, soltar.wait, 10)
+			return PoolFalso()
+
+		with mock.patch.object(task, "obtener_pool", obtener_pool):
+			task._calentar_pool_navegadores()
+			self.assertFalse(calentado.is_set())
+			soltar.set()
+			self.assertTrue(calentado.wait(10))
+
+class ReintentarBotTestCase(TestCase):
+	def test_construir_coincide_con_get_bot_configs(self):
+		from core.bots import registro
+		from core.bots.bot_configs import get_bot_configs
+		from core.bots.bot_configs_contratista import get_bot_configs_contratista
+
+		datos = {"cedula": "123", "tipo_doc": "CC", "nombre": "Juan", "apellido": "", "fecha_nacimiento": "1990-01-01",
+			"fecha_expedicion": "2010-01-01", "tipo_persona": "natural", "sexo": "M", "email": "a@b.co", "error": ""}
+		esperado = {}
+		for configs in (get_bot_configs(7, datos), get_bot_configs_contratista(7, datos)):
+			for nombre, bot in registro.indice(configs).items():
+				esperado.setdefault(nombre, bot)
+		for nombre, bot in esperado.items():
+			self.assertEqual(registro.construir(nombre, 7, datos), bot)
+
+	def test_reintento_no_construye_las_demas_configs(self):
+		from unittest import mock
+		from django.contrib.auth.models import User
+		from core import task
+		from core.bots import registro
+		from core.models import Candidato, Consulta, Resultado
+
+		tipo = TipoFuente.objects.create(nombre="TipoReintento", peso=1, probabilidad=1)
+		fuente = Fuente.objects.create(nombre="Fuente_Reintento", nombre_pila="Fuente reintento", tipo=tipo)
+		candidato = Candidato.objects.create(cedula="321", nombre="Ana", apellido="Ruiz")
+		consulta = Consulta.objects.create(candidato=candidato, usuario=User.objects.create(username="reintento"))
+		original = Resultado.objects.create(consulta=consulta, fuente=fuente, estado="offline")
+		llamadas = []
+
+		async def consultar(**kwargs):
+			llamadas.append(kwargs)
+
+		plantilla = {"fuente_reintento": {
+			"name": "fuente_reintento",
+			"func": consultar,
+			"kwargs": {"consulta_id": registro._CONSULTA, "cedula": "\x00cedula\x00",
+				"nombre": "\x00nombre\x00 \x00apellido\x00"},
+		}}
+		with mock.patch.object(registro, "plantillas", return_value=plantilla), \
+				mock.patch.object(task, "get_bot_configs", side_effect=AssertionError), \
+				mock.patch.object(task, "get_bot_configs_contratista", side_effect=AssertionError):
+			task.reintentar_bot(original.id)
+
+		self.assertEqual(llamadas, [{"consulta_id": consulta.id, "cedula": "321", "nombre": "Ana Ruiz"}])
+
+class BotTimeoutTestCase(TestCase):
+	def setUp(self):
+		from django.contrib.auth.models import User
+		from core.models import Candidato, Consulta
+		from core.utils import redis_cliente
+		redis_cliente.fijar_redis(fakeredis.FakeAsyncRedis(decode_responses=True))
+		self.addCleanup(redis_cliente.fijar_redis, None)
+		tipo = TipoFuente.objects.create(nombre="TipoTimeout", peso=1, probabilidad=1)
+		self.fuente = Fuente.objects.create(nombre="fuente_lenta", nombre_pila="Fuente lenta", tipo=tipo)
+		usuario = User.objects.create(username="timeout")
+		candidato = Candidato.objects.create(cedula="123")
+		self.consulta = Consulta.objects.create(candidato=candidato, usuario=usuario)
+
+	def test_bot_que_excede_su_presupuesto_queda_offline(self):
+		from unittest import mock
+		from asgiref.sync import async_to_sync
+		from core.models import Resultado
+		from core.utils import bot_scheduler, limite_fuente
+
+		cancelado = []
+
+		async def consultar_lento(consulta_id):
+			try:
+				# Nunca termina por sí solo: sólo sale si lo cancelan
+				await asyncio.Event().wait()
+			except asyncio.CancelledError:
+				cancelado.append(True)
+				raise
+
+		limite = {"en_vuelo": 1}
+		bot = {
+			"name": "fuente_lenta",
+			"func": consultar_lento,
+			"kwargs": {"consulta_id": self.consulta.id},
+			"timeout_s": 0.01,
+			"limite": limite,
+		}
+		# La reutilización también cuenta contra el presupuesto: aquí no hay nada que reutilizar
+		with mock.patch.object(bot_scheduler.reutilizacion, "reutilizar", return_value=None):
+			async_to_sync(bot_scheduler.ejecutar_bot)(bot)
+
+		self.assertEqual(cancelado, [True])
+		# El permiso de la fuente quedó libre: otro bot puede tomarlo
+		permiso = async_to_sync(limite_fuente.intentar_adquirir)("fuente_lenta", limite)
+		self.assertIsNotNone(permiso)
+		resultado = Resultado.objects.get(consulta=self.consulta)
+		self.assertEqual(resultado.fuente, self.fuente)
+		self.assertEqual(resultado.estado, "offline")
+		self.assertIn("timeout", resultado.mensaje)
+
+	def test_la_reutilizacion_cuenta_dentro_del_presupuesto(self):
+		from unittest import mock
+		from asgiref.sync import async_to_sync
+		from core.models import Resultado
+		from core.utils import bot_scheduler
+
+		llamado = []
+
+		async def consultar(consulta_id):
+			llamado.append(consulta_id)
+
+		async def reutilizar_colgado(*args, **kwargs):
+			await asyncio.Event().wait()
+
+		bot = {"name": "fuente_lenta", "func": consultar, "kwargs": {"consulta_id": self.consulta.id}, "timeout_s": 0.01}
+		with mock.patch.object(bot_scheduler.reutilizacion, "reutilizar", side_effect=reutilizar_colgado):
+			async_to_sync(bot_scheduler.ejecutar_bot)(bot)
+
+		self.assertEqual(llamado, [])
+		self.assertEqual(Resultado.objects.get(consulta=self.consulta).estado, "offline")
+
+
+class ReutilizacionTestCase(TestCase):
+	def setUp(self):
+		from django.contrib.auth.models import User
+		from core.models import Candidato, Consulta, Resultado
+		from core.utils import redis_cliente
+		redis_cliente.fijar_redis(fakeredis.FakeAsyncRedis(decode_responses=True))
+		self.addCleanup(redis_cliente.fijar_redis, None)
+		tipo = TipoFuente.objects.create(nombre="TipoReuso", peso=1, probabilidad=1)
+		self.fuente = Fuente.objects.create(nombre="fuente_reuso", nombre_pila="Fuente reuso", tipo=tipo, ttl_reutilizacion_h=24)
+		usuario = User.objects.create(username="reuso")
+		candidato = Candidato.objects.create(cedula="456")
+		anterior = Consulta.objects.create(candidato=candidato, usuario=usuario)
+		self.original = Resultado.objects.create(consulta=anterior, fuente=self.fuente, score=1, estado="validado", mensaje="Sin coincidencias")
+		self.consulta = Consulta.objects.create(candidato=candidato, usuario=usuario)
+		self.llamadas = 0
+
+	def _bot(self):
+		async def consultar_reuso(consulta_id):
+			self.llamadas += 1
+		return {"name": "fuente_reuso", "func": consultar_reuso, "kwargs": {"consulta_id": self.consulta.id}}
+
+	def test_copia_resultado_vigente_sin_ejecutar_bot(self):
+		from asgiref.sync import async_to_sync
+		from core.models import Resultado
+		from core.utils import bot_scheduler
+
+		async_to_sync(bot_scheduler.ejecutar_bot)(self._bot())
+
+		copia = Resultado.objects.get(consulta=self.consulta)
+		self.assertEqual(self.llamadas, 0)
+		self.assertEqual(copia.reutilizado_de, self.original)
+		self.assertEqual(copia.mensaje, "Sin coincidencias")
+
+	def test_forzar_y_ttl_vencido_ejecutan_en_vivo(self):
+		from datetime import timedelta
+		from asgiref.sync import async_to_sync
+		from django.utils import timezone
+		from core.models import Resultado
+		from core.utils import bot_scheduler
+
+		async_to_sync(bot_scheduler.ejecutar_bot)(self._bot(), reutilizar=False)
+		self.assertEqual(self.llamadas, 1)
+
+		Resultado.objects.filter(pk=self.original.pk).update(fecha=timezone.now() - timedelta(hours=25))
+		async_to_sync(bot_scheduler.ejecutar_bot)(self._bot())
+		self.assertEqual(self.llamadas, 2)
+		self.assertFalse(Resultado.objects.filter(consulta=self.consulta).exists())
+
+	def test_no_reutiliza_consultas_de_otro_usuario(self):
+		from asgiref.sync import async_to_sync
+		from django.contrib.auth.models import User
+		from core.models import Consulta, Resultado
+		from core.utils import bot_scheduler
+
+		ajeno = User.objects.create(username="ajeno")
+		self.consulta = Consulta.objects.create(candidato=self.consulta.candidato, usuario=ajeno)
+		async_to_sync(bot_scheduler.ejecutar_bot)(self._bot())
+
+		self.assertEqual(self.llamadas, 1)
+		self.assertFalse(Resultado.objects.filter(consulta=self.consulta).exists())
+
+
+class CircuitBreakerTestCase(TestCase):
+	def setUp(self):
+		from django.contrib.auth.models import User
+		from core.models import Candidato
+		from core.utils import redis_cliente
+		redis_cliente.fijar_redis(fakeredis.FakeAsyncRedis(decode_responses=True))
+		self.addCleanup(redis_cliente.fijar_redis, None)
+		tipo = TipoFuente.objects.create(nombre="TipoBreaker", peso=1, probabilidad=1)
+		Fuente.objects.create(nombre="fuente_caida", nombre_pila="Fuente caída", tipo=tipo)
+		self.usuario = User.objects.create(username="breaker")
+		self.candidato = Candidato.objects.create(cedula="789")
+		self.llamadas = 0
+		self.falla = True
+
+	def _correr(self):
+		from asgiref.sync import async_to_sync
+		from core.models import Consulta
+		from core.utils import bot_scheduler
+
+		async def consultar_caida(consulta_id):
+			self.llamadas += 1
+			if self.falla:
+				raise TimeoutError("portal caído")
+
+		consulta = Consulta.objects.create(candidato=self.candidato, usuario=self.usuario)
+		bot = {"name": "fuente_caida", "func": consultar_caida, "kwargs": {"consulta_id": consulta.id}}
+		async_to_sync(bot_scheduler.ejecutar_bot)(bot)
+		return consulta
+
+	def test_abre_tras_fallos_y_cierra_con_sondeo(self):
+		from unittest import mock
+		from core.models import Resultado
+		from core.utils import circuit_breaker
+
+		for _ in range(circuit_breaker.UMBRAL):
+			self._correr()
+		self.assertEqual(self.llamadas, circuit_breaker.UMBRAL)
+
+		# Abierto: offline inmediato sin ejecutar el bot
+		consulta = self._correr()
+		self.assertEqual(self.llamadas, circuit_breaker.UMBRAL)
+		self.assertEqual(Resultado.objects.get(consulta=consulta).estado, "offline")
+
+		# Vencido el enfriamiento, un sondeo exitoso cierra el circuito
+		self.falla = False
+		ahora = circuit_breaker.time.time()
+		with mock.patch.object(circuit_breaker.time, "time", return_value=ahora + circuit_breaker.ENFRIAMIENTO_S + 1):
+			self._correr()
+		self.assertEqual(self.llamadas, circuit_breaker.UMBRAL + 1)
+		self._correr()
+		self.assertEqual(self.llamadas, circuit_breaker.UMBRAL + 2)
+
+	def test_fallos_viejos_vencen(self):
+		from asgiref.sync import async_to_sync
+		from core.utils import circuit_breaker, redis_cliente
+
+		self._correr()
+		ttl = async_to_sync(redis_cliente.obtener_redis().ttl)("breaker:fuente_caida")
+		self.assertGreater(ttl, 0)
+		self.assertLessEqual(ttl, circuit_breaker.ENFRIAMIENTO_S)
+
+
+class LimiteFuenteTestCase(SimpleTestCase):
+	def setUp(self):
+		from core.utils import redis_cliente
+		redis_cliente.fijar_redis(fakeredis.FakeAsyncRedis(decode_responses=True))
+		self.addCleanup(redis_cliente.fijar_redis, None)
+
+	def test_fuente_saturada_no_bloquea_el_slot(self):
+		from core.utils.bot_scheduler import ejecutar_bots
+
+		orden = []
+
+		def bot(nombre, fuente, segundos, limite=None):
+			async def consultar():
+				await asyncio.sleep(segundos)
+				orden.append(nombre)
+			return {"name": nombre, "fuente": fuente, "func": consultar, "kwargs": {}, "limite": limite}
+
+		limite = {"en_vuelo": 1}
+		bots = [
+			bot("lenta_1", "portal", 0.2, limite),
+			bot("lenta_2", "portal", 0.2, limite),
+			bot("otra", "otra_fuente", 0.01),
+		]
+		stats = asyncio.run(ejecutar_bots(bots, slots=2))
+		# El segundo slot no se queda esperando al portal: corre "otra" mientras tanto
+		self.assertEqual(orden, ["otra", "lenta_1", "lenta_2"])
+		self.assertGreater(stats["reencolados"], 0)
+
+	def test_reencolado_no_repite_la_reutilizacion(self):
+		from unittest import mock
+		from core.utils import bot_scheduler, limite_fuente
+
+		async def consultar(consulta_id):
+			pass
+
+		bot = {"name": "portal", "func": consultar, "kwargs": {"consulta_id": 1}, "limite": {"en_vuelo": 1}}
+		claves = set(bot)
+		revisados = {}
+		with mock.patch.object(bot_scheduler.reutilizacion, "reutilizar", return_value=None) as reutilizar, \
+				mock.patch.object(limite_fuente, "intentar_adquirir", return_value=None):
+			for _ in range(3):
+				desenlace = asyncio.run(bot_scheduler.ejecutar_bot(bot, revisados=revisados))
+				self.assertEqual(desenlace, bot_scheduler.SATURADA)
+		reutilizar.assert_called_once()
+		# El estado lo lleva el planificador, no la configuración del bot
+		self.assertEqual(set(bot), claves)
+
+
+class ListaLocalTestCase(TestCase):
+	def setUp(self):
+		import io
+		import json
+		import tempfile
+		from django.contrib.auth.models import User
+		from django.core.management import call_command
+		from core.models import Candidato, Consulta
+
+		entidades = [
+			{"id": "NK-1", "schema": "Person", "target": True, "caption": "PEREZ GOMEZ, Juan",
+				"properties": {"name": ["PEREZ GOMEZ, Juan"], "alias": ["El Flaco"], "birthDate": ["1970-01-01"]},
+				"datasets": ["us_ofac_sdn"]},
+			{"id": "NK-2", "schema": "Sanction", "properties": {"program": ["SDGT"]}, "datasets": ["us_ofac_sdn"]},
+		]
+		with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as fh:
+			fh.write("\n".join(json.dumps(e) for e in entidades))
+		with self.captureOnCommitCallbacks(execute=True):
+			call_command("ingestar_opensanctions", fh.name, "--datasets", "us_ofac_sdn", "--sin-indice", stdout=io.StringIO())
+
+		tipo = TipoFuente.objects.create(nombre="TipoListas", peso=1, probabilidad=1)
+		Fuente.objects.create(nombre="opensanctions_us_ofac_sdn", nombre_pila="OFAC SDN", tipo=tipo)
+		usuario = User.objects.create(username="listas")
+		self.consulta = Consulta.objects.create(candidato=Candidato.objects.create(cedula="321"), usuario=usuario)
+		self.llamadas = 0
+
+	def _correr(self, nombre, apellido, **opciones):
+		from unittest import mock
+		from asgiref.sync import async_to_sync
+		from core.models import Resultado
+		from core.utils import bot_scheduler
+
+		async def consultar_opensanctions_us_ofac_sdn(consulta_id, nombre, apellido):
+			self.llamadas += 1
+
+		async def sin_pantallazo(*args):
+			return "resultados/evidencia.png"
+
+		bot = {
+			"name": "opensanctions_us_ofac_sdn",
+			"lista_local": "opensanctions:us_ofac_sdn",
+			"func": consultar_opensanctions_us_ofac_sdn,
+			"kwargs": {"consulta_id": self.consulta.id, "nombre": nombre, "apellido": apellido},
+			**opciones,
+		}
+		with mock.patch("core.listas.evidencia.renderizar", sin_pantallazo):
+			async_to_sync(bot_scheduler.ejecutar_bot)(bot)
+		return Resultado.objects.filter(consulta=self.consulta).latest("id")
+
+	def test_coincidencia_local_sin_navegador(self):
+		from core.models import EntradaLista
+		self.assertEqual(EntradaLista.objects.count(), 1)
+
+		resultado = self._correr("Juan", "Pérez Gómez")
+		self.assertEqual(self.llamadas, 0)
+		self.assertEqual(resultado.score, 5)
+		self.assertEqual(resultado.archivo, "resultados/evidencia.png")
+
+		resultado = self._correr("Maria", "Lopez")
+		self.assertEqual(self.llamadas, 0)
+		self.assertEqual(resultado.score, 1)
+		self.assertEqual(resultado.archivo, "")
+
+	def test_variantes_de_orden_y_ortografia(self):
+		# El orden de los nombres no importa para la coincidencia exacta
+		self.assertEqual(self._correr("Gomez Perez", "Juan").score, 5)
+		# Un error de digitación queda como posible coincidencia, salvo que la fuente lo desactive
+		resultado = self._correr("Juan", "Peres Gomes")
+		self.assertEqual(resultado.score, 3)
+		self.assertIn("PEREZ GOMEZ, Juan", resultado.mensaje)
+		self.assertEqual(self._correr("Juan", "Peres Gomes", lista_aproximada=False).score, 1)
+		self.assertEqual(self.llamadas, 0)
+
+
+OFAC_XML = """<?xml version="1.0" standalone="yes"?>
+<sdnList xmlns="https://sanctionslistservice.ofac.treas.gov/api/PublicationPreview/exports/XML">
+	<publshInformation><Publish_Date>01/15/2026</Publish_Date><Record_Count>2</Record_Count></publshInformation>
+	<sdnEntry>
+		<uid>100</uid><firstName>Pedro</firstName><lastName>RAMIREZ TORRES</lastName><sdnType>Individual</sdnType>
+		<programList><program>SDNTK</program></programList>
+		<idList><id><uid>1</uid><idType>Cedula No.</idType><idNumber>79.123.456</idNumber><idCountry>Colombia</idCountry></id></idList>
+		<akaList><aka><uid>2</uid><type>a.k.a.</type><category>strong</category><lastName>EL MONO</lastName></aka></akaList>
+		<dateOfBirthList><dateOfBirthItem><uid>3</uid><dateOfBirth>{nacimiento}</dateOfBirth></dateOfBirthItem></dateOfBirthList>
+	</sdnEntry>
+	<sdnEntry>
+		<uid>200</uid><lastName>INVERSIONES EJEMPLO S.A.S.</lastName><sdnType>Entity</sdnType>
+	</sdnEntry>
+</sdnList>
+"""
+
+
+class OfacTestCase(TestCase):
+	def _cargar(self, nacimiento):
+		import io
+		import tempfile
+		from django.core.management import call_command
+
+		with tempfile.NamedTemporaryFile("w", suffix=".xml", delete=False) as fh:
+			fh.write(OFAC_XML.format(nacimiento=nacimiento))
+		salida = io.StringIO()
+		with self.captureOnCommitCallbacks(execute=True):
+			call_command("ingestar_ofac", "sdn", "--origen", fh.name, stdout=salida)
+		return salida.getvalue()
+
+	def test_busqueda_por_nombre_alias_y_documento(self):
+		from core.listas import almacen
+		from core.listas.consulta import coincidencias
+
+		self.assertIn("2 nuevas", self._cargar("1970"))
+		dataset = almacen.obtener_dataset("ofac", "sdn")
+		self.assertEqual(dataset.version, "01/15/2026")
+
+		por_nombre, _, _ = coincidencias(dataset, "Pedro Ramírez Torres")
+		self.assertEqual([e.id_externo for e in por_nombre], ["100"])
+		por_nombre, _, _ = coincidencias(dataset, "el mono")
+		self.assertEqual(len(por_nombre), 1)
+		_, por_documento, _ = coincidencias(dataset, "", "79123456")
+		self.assertEqual(por_documento[0].datos["programas"], ["SDNTK"])
+
+		# Recarga incremental: sólo cambia la entrada modificada
+		self.assertIn("0 nuevas, 1 cambiadas, 0 eliminadas", self._cargar("1971"))
+		por_nombre, _, _ = coincidencias(almacen.obtener_dataset("ofac", "sdn"), "Pedro Ramirez Torres")
+		self.assertEqual(por_nombre[0].datos["fechas_nacimiento"], ["1971"])
+
+
+ONU_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<CONSOLIDATED_LIST dateGenerated="2026-01-20T10:00:00.000Z">
+<INDIVIDUALS><INDIVIDUAL>
+	<DATAID>6908555</DATAID><FIRST_NAME>ABDUL</FIRST_NAME><SECOND_NAME>RAHMAN</SECOND_NAME><THIRD_NAME>YASIN</THIRD_NAME>
+	<UN_LIST_TYPE>Al-Qaida</UN_LIST_TYPE><REFERENCE_NUMBER>QDi.298</REFERENCE_NUMBER><LISTED_ON>2011-07-13</LISTED_ON>
+	<NATIONALITY><VALUE>Iraq</VALUE></NATIONALITY>
+	<INDIVIDUAL_ALIAS><QUALITY>Good</QUALITY><ALIAS_NAME>Abdul Rahman Said Yasin</ALIAS_NAME></INDIVIDUAL_ALIAS>
+	<INDIVIDUAL_DATE_OF_BIRTH><TYPE_OF_DATE>EXACT</TYPE_OF_DATE><DATE>1960-04-10</DATE></INDIVIDUAL_DATE_OF_BIRTH>
+	<INDIVIDUAL_DOCUMENT><TYPE_OF_DOCUMENT>Passport</TYPE_OF_DOCUMENT><NUMBER>M-0412</NUMBER><ISSUING_COUNTRY>Iraq</ISSUING_COUNTRY></INDIVIDUAL_DOCUMENT>
+</INDIVIDUAL></INDIVIDUALS>
+<ENTITIES><ENTITY>
+	<DATAID>110438</DATAID><FIRST_NAME>AL-NUR FOUNDATION</FIRST_NAME><UN_LIST_TYPE>Al-Qaida</UN_LIST_TYPE>
+	<ENTITY_ALIAS><ALIAS_NAME>Nur Charitable Society</ALIAS_NAME></ENTITY_ALIAS>
+</ENTITY></ENTITIES>
+</CONSOLIDATED_LIST>"""
+
+
+class OnuTestCase(TestCase):
+	def test_busqueda_exacta_y_aproximada(self):
+		import io
+		import tempfile
+		from django.core.management import call_command
+		from core.listas import almacen
+		from core.listas.consulta import coincidencias
+
+		with tempfile.NamedTemporaryFile("w", suffix=".xml", delete=False) as fh:
+			fh.write(ONU_XML)
+		with self.captureOnCommitCallbacks(execute=True):
+			call_command("ingestar_onu", fh.name, stdout=io.StringIO())
+		dataset = almacen.obtener_dataset("onu", "consolidada")
+		self.assertEqual(dataset.total_entradas, 2)
+
+		por_nombre, _, _ = coincidencias(dataset, "Yasin Abdul Rahman")
+		self.assertEqual(por_nombre[0].datos["nacionalidades"], ["Iraq"])
+		_, por_documento, _ = coincidencias(dataset, "", "M0412")
+		self.assertEqual(por_documento[0].esquema, "Individual")
+
+		# Transliteración distinta: sin coincidencia exacta, pero sí aproximada
+		por_nombre, _, similares = coincidencias(dataset, "Abdul Rahman Yaseen", aproximado=True)
+		self.assertEqual(por_nombre, [])
+		self.assertEqual([e.id_externo for e in similares], ["6908555"])
+		_, _, similares = coincidencias(dataset, "Nur Charity Society", aproximado=False)
+		self.assertEqual(similares, {})
+
+
+FSF_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<export xmlns="http://eu.europa.ec/fpi/fsd/export" generationDate="2026-02-01T09:00:00.000+01:00">
+<sanctionEntity logicalId="13" euReferenceNumber="EU.27.28" designationDetails="">
+	<regulation programme="UKR" numberTitle="269/2014 (OJ L78)"/>
+	<regulation programme="UKR" numberTitle="833/2014 (OJ L229)"/>
+	<subjectType code="person"/>
+	<nameAlias wholeName="Viktor Fedorovych Yanukovych"/>
+	<nameAlias wholeName="Віктор Федорович Янукович"/>
+	<identification number="EC 000001" identificationTypeDescription="National passport" countryDescription="UKRAINE"/>
+</sanctionEntity>
+<sanctionEntity logicalId="14" euReferenceNumber="EU.28.29">
+	<regulation programme="BLR" numberTitle="2022/398 (OJ L80)"/>
+	<subjectType code="enterprise"/>
+	<nameAlias wholeName="Belaruskali OAO"/>
+</sanctionEntity>
+</export>"""
+
+
+class UeTestCase(TestCase):
+	def test_filtro_por_acto_juridico(self):
+		import io
+		import tempfile
+		from django.core.management import call_command
+		from core.listas import almacen, ue
+		from core.listas.consulta import coincidencias, especificaciones
+
+		self.assertEqual(ue.acto("833/2014 (OJ L229)"), "2014/833")
+		self.assertEqual(ue.acto("2022/0398"), "2022/398")
+		with tempfile.NamedTemporaryFile("w", suffix=".xml", delete=False) as fh:
+			fh.write(FSF_XML)
+		with self.captureOnCommitCallbacks(execute=True):
+			call_command("ingestar_ue", fh.name, stdout=io.StringIO())
+		dataset = almacen.obtener_dataset("ue", "fsf")
+		self.assertEqual(dataset.version, "2026-02-01T09:00:00.000+01:00")
+
+		[(_, _, acto)] = especificaciones({"lista_local": "ue:fsf#2014/833"})
+		por_nombre, _, _ = coincidencias(dataset, "Viktor Fedorovych Yanukovych", etiquetas=acto)
+		self.assertEqual(por_nombre[0].datos["actos"], ["2014/269", "2014/833"])
+		por_nombre, _, _ = coincidencias(dataset, "Belaruskali OAO", etiquetas=acto)
+		self.assertEqual(por_nombre, [])
+		por_nombre, _, _ = coincidencias(dataset, "Belaruskali OAO", etiquetas=["2022/398"])
+		self.assertEqual(len(por_nombre), 1)
+		_, por_documento, _ = coincidencias(dataset, "", "EC000001")
+		self.assertEqual(por_documento[0].esquema, "person")
+
+
+OFSI_CSV = """﻿Last Updated,28/01/2026
+Name 6,Name 1,Name 2,Name 3,Name 4,Name 5,Title,DOB,Nationality,Passport Number,National Identification Number,Regime,Listed On,Group Type,Alias Type,Group ID
+IVANOV,Sergei,Borisovich,,,,,01/02/1965,Russia,7201234,,Russia,16/03/2022,Individual,Primary name,14001
+IVANOFF,Sergey,,,,,,01/02/1965,Russia,,,Russia,16/03/2022,Individual,AKA,14001
+KIM,Jong,Su,,,,,,North Korea,,,Democratic People's Republic of Korea,02/05/2017,Individual,Primary name,13500
+"""
+
+
+class OfsiTestCase(TestCase):
+	def setUp(self):
+		import io
+		import tempfile
+		from django.core.management import call_command
+
+		with tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False, encoding="utf-8") as fh:
+			fh.write(OFSI_CSV)
+		with self.captureOnCommitCallbacks(execute=True):
+			call_command("ingestar_ofsi", fh.name, stdout=io.StringIO())
+
+	def test_vista_por_regimen_y_lote(self):
+		from core.listas import almacen
+		from core.listas.consulta import cribar
+
+		dataset = almacen.obtener_dataset("ofsi", "conlist")
+		self.assertEqual((dataset.version, dataset.total_entradas), ("2026-01-28", 2))
+		self.assertIsNone(cribar("ofsi:otra", ["Kim Jong Su"]))
+
+		todos = cribar("ofsi:conlist", ["Sergey Ivanoff", "Kim Jong Su", "Ana Perez"])
+		self.assertEqual([len(todos[n]) for n in ("Sergey Ivanoff", "Kim Jong Su", "Ana Perez")], [1, 1, 0])
+		ucrania = cribar("ofsi:conlist#Russia,Ukraine", ["Sergei Borisovich Ivanov", "Kim Jong Su"])
+		self.assertEqual((len(ucrania["Sergei Borisovich Ivanov"]), len(ucrania["Kim Jong Su"])), (1, 0))
+
+	def test_resultado_con_fecha_de_publicacion(self):
+		from asgiref.sync import async_to_sync
+		from django.contrib.auth.models import User
+		from core.listas.consulta import resolver
+		from core.models import Candidato, Consulta, Resultado
+
+		consulta = Consulta.objects.create(
+			candidato=Candidato.objects.create(cedula="1"), usuario=User.objects.create(username="ofsi"),
+		)
+		self.assertTrue(async_to_sync(resolver)(consulta.id, "ofsi_govuk", "ofsi:conlist", "Ana Perez"))
+		resultado = Resultado.objects.get(consulta=consulta)
+		self.assertEqual(resultado.score, 1)
+		self.assertIn("Publicación de la lista: 2026-01-28", resultado.mensaje)
+
+
+class MatchingTestCase(SimpleTestCase):
+	def test_similitud_y_score(self):
+		from core.matching.fonetica import clave_fonetica
+		from core.matching.similitud import a_score, similitud
+
+		self.assertEqual(similitud("PÉREZ GÓMEZ, Juan", "juan perez gomez"), 1.0)
+		self.assertEqual(a_score(similitud("Juan Pérez de la Rosa", "Juan Perez Rosa")), 5)
+		self.assertEqual(a_score(similitud("Juan Pérez", "Juan Pérez Gómez")), 3)
+		self.assertEqual(a_score(similitud("Juan Perez", "Pedro Perez")), 1)
+		self.assertEqual(clave_fonetica("Khalid Vásquez"), clave_fonetica("Jalid Basquez"))
+		self.assertGreaterEqual(similitud("Mohamed Yasin", "Muhammad Yaseen"), 0.85)
+
+	def test_indice_ngramas(self):
+		from core.matching.indice import IndiceNgramas
+
+		textos = ["maria lopez", "khalid abdul rahman yasin", "juan perez gomez", "jose perez"]
+		indice = IndiceNgramas(textos)
+		posiciones = [p for p, _ in indice.buscar("Yasin Abdul Rahman")]
+		self.assertEqual(posiciones, [1])
+		self.assertEqual(indice.buscar("Jalid Abdul Rahman Yaseen")[0][0], 1)
+		self.assertEqual(indice.buscar("Ana Torres"), [])
+		self.assertEqual(IndiceNgramas([]).candidatos("juan"), [])
+
+
+class IcijTestCase(TestCase):
+	def setUp(self):
+		import io
+		import os
+		import tempfile
+		from django.core.management import call_command
+
+		carpeta = tempfile.mkdtemp()
+		archivos = {
+			"nodes-officers.csv": "node_id,name,countries,sourceID\n"
+				"1,Juan Perez Gomez,Colombia,Panama Papers\n"
+				"2,Maria Lopez,Colombia,Panama Papers\n"
+				"5,Juan Perez Gomez,Colombia,Pandora Papers - Alcogal\n",
+			"nodes-entities.csv": "node_id,name,jurisdiction_description,sourceID\n"
+				"3,Andes Holdings Ltd.,Panama,Panama Papers\n",
+			"nodes-intermediaries.csv": "node_id,name,sourceID\n4,Mossack Fonseca,Panama Papers\n",
+			"relationships.csv": "node_id_start,node_id_end,rel_type,link,sourceID\n"
+				"1,3,officer_of,shareholder of,Panama Papers\n"
+				"2,3,officer_of,director of,Panama Papers\n"
+				"4,3,intermediary_of,intermediary of,Panama Papers\n"
+				"9,3,registered_address,registered address,Panama Papers\n",
+		}
+		for nombre, contenido in archivos.items():
+			with open(os.path.join(carpeta, nombre), "w", encoding="utf-8") as fh:
+				fh.write(contenido)
+		salida = io.StringIO()
+		call_command("ingestar_icij", carpeta, stdout=salida)
+		self.assertIn("5 nodos", salida.getvalue())
+		self.assertIn("3 relaciones", salida.getvalue())
+
+	def test_una_busqueda_para_todas_las_filtraciones(self):
+		from unittest import mock
+		from asgiref.sync import async_to_sync
+		from django.contrib.auth.models import User
+		from core.listas import consulta, grafo
+		from core.models import Candidato, Consulta, Resultado
+
+		consulta_obj = Consulta.objects.create(
+			candidato=Candidato.objects.create(cedula="9"), usuario=User.objects.create(username="icij"),
+		)
+
+		async def sin_pantallazo(*args):
+			return "resultados/icij.png"
+
+		recorrer = mock.Mock(wraps=grafo._recorrer)
+		fuentes = {"offshore": "", "offshore_panama": "#panama", "offshore_bahamas": "#bahamas", "pandora_papers": "#pandora"}
+		with mock.patch("core.listas.evidencia.renderizar", sin_pantallazo), mock.patch.object(grafo, "_recorrer", recorrer):
+			for fuente, filtro in fuentes.items():
+				self.assertTrue(async_to_sync(consulta.resolver)(
+					consulta_obj.id, fuente, f"icij:offshoreleaks{filtro}", "Juan Pérez Gómez",
+				))
+		self.assertEqual(recorrer.call_count, 1)
+
+		scores = dict(Resultado.objects.filter(consulta=consulta_obj).values_list("mensaje", "score"))
+		panama = next(m for m in scores if "(panama)" in m)
+		self.assertEqual(scores[panama], 5)
+		# Nivel 1: la sociedad; nivel 2: el otro oficial y el intermediario
+		self.assertIn("Andes Holdings Ltd. (nivel 1", panama)
+		self.assertIn("Maria Lopez (nivel 2", panama)
+		self.assertIn("Mossack Fonseca (nivel 2", panama)
+		self.assertEqual(scores[next(m for m in scores if "(bahamas)" in m)], 1)
+		self.assertEqual(scores[next(m for m in scores if "(pandora)" in m)], 5)
+
+
+WORLDBANK_JSON = """{"response": {"ZPROCSUPP": [
+	{"SUPP_ID": "101", "SUPP_NAME": "CONSTRUCTORA ANDINA S.A.S. (a.k.a. ANDINA OBRAS)*", "COUNTRY_NAME": "Colombia",
+	 "DEBAR_FROM_DATE": "2024-03-01T00:00:00", "DEBAR_TO_DATE": "Ongoing", "DEBAR_REASON": "Fraudulent Practice"},
+	{"SUPP_ID": "102", "SUPP_NAME": "Pedro Ramirez", "COUNTRY_NAME": "Peru",
+	 "DEBAR_FROM_DATE": "2015-01-10T00:00:00", "DEBAR_TO_DATE": "2018-01-10T00:00:00", "DEBAR_REASON": "Collusive Practice"}
+]}}"""
+
+EBRD_HTML = """<html><body><table>
+<tr><th>Entity name</th><th>Type</th><th>Country</th><th>Date from</th><th>Date to</th><th>Prohibited practice</th></tr>
+<tr><td>Juan Carlos Mendoza Rojas</td><td>Individual</td><td>Colombia</td><td>15/06/2023</td><td>15/06/2099</td><td>Corrupt practice</td></tr>
+</table></body></html>"""
+
+
+class MultilateralesTestCase(TestCase):
+	def test_carga_por_banco_y_consulta(self):
+		import io
+		import tempfile
+		from unittest import mock
+		from asgiref.sync import async_to_sync
+		from django.contrib.auth.models import User
+		from django.core.management import call_command
+		from core.listas import almacen, consulta
+		from core.models import Candidato, Consulta, Resultado
+
+		for banco, sufijo, contenido in (("worldbank", ".json", WORLDBANK_JSON), ("ebrd", ".html", EBRD_HTML)):
+			with tempfile.NamedTemporaryFile("w", suffix=sufijo, delete=False, encoding="utf-8") as fh:
+				fh.write(contenido)
+			with self.captureOnCommitCallbacks(execute=True):
+				call_command("ingestar_multilaterales", banco, "--origen", fh.name, stdout=io.StringIO())
+
+		# La inhabilitación cumplida no se carga
+		self.assertEqual(almacen.obtener_dataset("multilaterales", "worldbank").total_entradas, 1)
+		ebrd = almacen.obtener_dataset("multilaterales", "ebrd")
+		[entrada], _, _ = consulta.coincidencias(ebrd, "Mendoza Rojas Juan Carlos")
+		self.assertEqual(
+			(entrada.datos["desde"], entrada.datos["hasta"], entrada.datos["motivo"]),
+			("2023-06-15", "2099-06-15", "Corrupt practice"),
+		)
+
+		consulta_obj = Consulta.objects.create(
+			candidato=Candidato.objects.create(cedula="18"), usuario=User.objects.create(username="bancos"),
+		)
+
+		async def sin_pantallazo(*args):
+			return ""
+
+		with mock.patch("core.listas.evidencia.renderizar", sin_pantallazo):
+			for fuente, lista_local, nombre in (
+				("worldbank_debarred_pdf", "multilaterales:worldbank", "Andina Obras"),
+				("idb_sanctioned_png", "multilaterales:idb", "Andina Obras"),
+				("opensanctions_ebrd_ineligible", ["multilaterales:ebrd", "opensanctions:ebrd_ineligible"], "Juan Carlos Mendosa Rojas"),
+				("ebrd", "multilaterales:ebrd", "Pedro Ramirez"),
+			):
+				async_to_sync(consulta.resolver)(consulta_obj.id, fuente, lista_local, nombre, aproximado=True)
+		scores = [r.score for r in Resultado.objects.filter(consulta=consulta_obj).order_by("id")]
+		# Sin tabla del BID cargada, ese bot sigue en vivo
+		self.assertEqual(scores, [5, 3, 1])
+
+	def test_sin_llave_del_banco_mundial_se_omite(self):
+		import io
+		from unittest import mock
+		from django.core.management import call_command
+		from django.test import override_settings
+		from core.listas import descarga, frescura
+
+		with override_settings(WORLDBANK_APIKEY=""), mock.patch.dict("os.environ", {"WORLDBANK_APIKEY": ""}), \
+				mock.patch.object(descarga, "abrir", side_effect=AssertionError("no debe descargar")):
+			self.assertFalse(frescura.habilitada("multilaterales-worldbank"))
+			self.assertTrue(frescura.habilitada("multilaterales-ebrd"))
+			self.assertIsNone(frescura.actualizar("multilaterales-worldbank"))
+			salida = io.StringIO()
+			call_command("ingestar_multilaterales", "worldbank", stdout=salida)
+		self.assertIn("se omite", salida.getvalue())
+		with override_settings(WORLDBANK_APIKEY="llave"):
+			self.assertEqual(frescura.REGISTRO["multilaterales-worldbank"]["headers"](), {"apikey": "llave"})
+
+
+class BuscadosTestCase(TestCase):
+	def test_foto_local_y_recorte(self):
+		import os
+		import tempfile
+		from unittest import mock
+		from asgiref.sync import async_to_sync
+		from django.contrib.auth.models import User
+		from django.test import override_settings
+		from PIL import Image
+		from core.listas import almacen, buscados, consulta
+		from core.models import Candidato, Consulta, Resultado
+
+		media = tempfile.mkdtemp()
+		with override_settings(MEDIA_ROOT=media):
+			captura = "listas/buscados/fbi/20260101_000000_1.png"
+			os.makedirs(os.path.join(media, "listas/buscados/fbi"))
+			Image.new("RGB", (800, 600), "white").save(os.path.join(media, captura))
+			open(os.path.join(media, "listas/buscados/fbi/viejo.png"), "wb").close()
+			tarjetas = [
+				{"nombre": " RUJA  IGNATOVA ", "foto": "https://fbi.gov/r.jpg", "enlace": "https://fbi.gov/ruja", "caja": [10, 20, 200, 300]},
+				{"nombre": "Ruja Ignatova", "enlace": "https://fbi.gov/ruja", "caja": [10, 20, 200, 300]},
+				{"nombre": "", "caja": [0, 0, 10, 10]},
+				{"nombre": "Oculto", "caja": [0, 0, 0, 0]},
+			]
+			entradas = buscados.entradas("fbi", [dict(t, captura=captura) for t in tarjetas])
+			self.assertEqual([e["nombre"] for e in entradas], ["RUJA IGNATOVA"])
+			self.assertEqual(buscados.diferencias("fbi", entradas), (["RUJA IGNATOVA"], []))
+			with self.captureOnCommitCallbacks(execute=True):
+				almacen.reemplazar_dataset("buscados", "fbi", entradas, titulo="FBI", version="2026-01-01 00:00")
+			buscados.limpiar_capturas("fbi")
+			self.assertEqual(os.listdir(os.path.join(media, "listas/buscados/fbi")), ["20260101_000000_1.png"])
+
+			consulta_obj = Consulta.objects.create(
+				candidato=Candidato.objects.create(cedula="19"), usuario=User.objects.create(username="buscados"),
+			)
+			with mock.patch("core.listas.evidencia.async_playwright", side_effect=AssertionError("sin navegador")):
+				self.assertTrue(async_to_sync(consulta.resolver)(consulta_obj.id, "fbi", "buscados:fbi", "Ignatova Ruja"))
+			resultado = Resultado.objects.get(consulta=consulta_obj)
+			self.assertEqual(resultado.score, 5)
+			with Image.open(os.path.join(media, resultado.archivo)) as evidencia:
+				self.assertEqual(evidencia.size, (200, 300))
+
+
+class PdfTextoTestCase(SimpleTestCase):
+	def test_extrae_una_vez_y_pinta_solo_paginas_con_match(self):
+		import os
+		import tempfile
+		from unittest import mock
+		import fitz
+		from core.utils import pdf_texto
+
+		carpeta = tempfile.mkdtemp()
+		ruta = os.path.join(carpeta, "lista.pdf")
+		doc = fitz.open()
+		for texto in ("Sin nombres en esta pagina", "Designado: José PÉREZ\nGómez, Colombia", "Otro: Pedro Gomez"):
+			doc.new_page().insert_text((72, 72), texto)
+		doc.save(ruta)
+		doc.close()
+
+		extraer = mock.Mock(wraps=pdf_texto.extraer)
+		with mock.patch.dict(os.environ, {"PDF_TEXTO_CACHE": os.path.join(carpeta, "cache")}), \
+				mock.patch.object(pdf_texto, "extraer", extraer):
+			self.assertEqual([i for i, _ in pdf_texto.buscar(ruta, "Jose Perez Gomez")], [1])
+			self.assertEqual([i for i, _ in pdf_texto.buscar(ruta, "Juan Gomez", por_tokens=True)], [1, 2])
+			pdf_texto._memo.clear()
+			self.assertEqual(pdf_texto.buscar(ruta, "Ana Torres"), [])
+			self.assertEqual(extraer.call_count, 1)
+
+			pngs = pdf_texto.resaltar(ruta, pdf_texto.buscar(ruta, "jose perez gomez"), os.path.join(carpeta, "out"))
+		self.assertEqual([os.path.basename(p) for p in pngs], ["lista_match_p2.png"])
+
+	def test_fragmentos_como_search_for(self):
+		import os
+		import tempfile
+		from unittest import mock
+		import fitz
+		from core.resolver.pdf_search import pdf_search
+		from core.utils import pdf_texto
+
+		carpeta = tempfile.mkdtemp()
+		ruta = os.path.join(carpeta, "sancionados.pdf")
+		doc = fitz.open()
+		doc.new_page().insert_text((72, 72), "Sancionado: José PÉREZ Gómez, CC 80123456")
+		doc.new_page().insert_text((72, 72), "Sin registros")
+		doc.save(ruta)
+		doc.close()
+
+		with mock.patch.dict(os.environ, {"PDF_TEXTO_CACHE": os.path.join(carpeta, "cache")}):
+			for fragmento in ("perez", "Pére", "23456", "ez Gom", "Jose Perez Go"):
+				self.assertEqual([i for i, _ in pdf_texto.buscar(ruta, fragmento, parcial=True)], [0], fragmento)
+			# Sin `parcial` sólo valen palabras completas
+			self.assertEqual(pdf_texto.buscar(ruta, "Pere"), [])
+			self.assertEqual(pdf_texto.buscar(ruta, "Perez Gomez CC 8", parcial=True)[0][0], 0)
+			self.assertEqual(pdf_texto.buscar(ruta, "Lopez", parcial=True), [])
+			self.assertEqual(pdf_search(ruta, "Pérez Gó", os.path.join(carpeta, "out")), "Coincidencia encontrada")
+
+
+class FrescuraTestCase(TestCase):
+	def setUp(self):
+		import threading
+		from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+		servidor = self
+
+		class Publicacion(BaseHTTPRequestHandler):
+			def do_GET(self):
+				servidor.peticiones.append(dict(self.headers))
+				etag = f'"{len(servidor.contenido)}"'
+				if self.headers.get("If-None-Match") == etag:
+					self.send_response(304)
+					self.end_headers()
+					return
+				cuerpo = servidor.contenido.encode("utf-8")
+				self.send_response(200)
+				self.send_header("ETag", etag)
+				self.send_header("Content-Length", str(len(cuerpo)))
+				self.end_headers()
+				self.wfile.write(cuerpo)
+
+			def log_message(self, *args):
+				pass
+
+		self.contenido = ONU_XML
+		self.peticiones = []
+		self.http = ThreadingHTTPServer(("127.0.0.1", 0), Publicacion)
+		threading.Thread(target=self.http.serve_forever, daemon=True).start()
+		self.addCleanup(self.http.server_close)
+		self.addCleanup(self.http.shutdown)
+
+	def test_descarga_condicional(self):
+		import os
+		import tempfile
+		from unittest import mock
+		from django.test import override_settings
+		from core.listas import almacen, frescura
+		from core.listas.consulta import coincidencias
+		from core.models import DescargaLista
+
+		registro = {"onu": dict(frescura.REGISTRO["onu"], url=f"http://127.0.0.1:{self.http.server_port}/consolidated.xml")}
+		with tempfile.TemporaryDirectory() as media, override_settings(MEDIA_ROOT=media), \
+				mock.patch.dict(frescura.REGISTRO, registro, clear=True), \
+				mock.patch.object(frescura, "call_command", wraps=frescura.call_command) as ingesta:
+			with self.captureOnCommitCallbacks(execute=True):
+				self.assertTrue(frescura.actualizar("onu"))
+			self.assertEqual(DescargaLista.objects.get(nombre="onu").etag, f'"{len(ONU_XML)}"')
+
+			# Sin cambios en la fuente: 304, no se vuelve a ingerir y la copia queda verificada
+			self.assertFalse(frescura.actualizar("onu"))
+			self.assertEqual(self.peticiones[-1]["If-None-Match"], f'"{len(ONU_XML)}"')
+			self.assertEqual(ingesta.call_count, 1)
+
+			self.contenido = ONU_XML.replace("2026-01-20", "2026-02-03").replace("AL-NUR FOUNDATION", "AL-NOOR FOUNDATION")
+			with self.captureOnCommitCallbacks(execute=True):
+				self.assertTrue(frescura.actualizar("onu"))
+			self.assertEqual(ingesta.call_count, 2)
+			self.assertEqual(os.listdir(os.path.join(media, frescura.STAGING)), [])
+
+		dataset = almacen.obtener_dataset("onu", "consolidada")
+		self.assertTrue(dataset.version.startswith("2026-02-03"))
+		por_nombre, _, _ = coincidencias(dataset, "Al-Noor Foundation")
+		self.assertEqual(len(por_nombre), 1)
+		vigencia = almacen.vigencia(dataset)
+		self.assertIn(f"Publicación de la lista: {dataset.version}.", vigencia)
+		self.assertIn("Copia local verificada hace", vigencia)
+
+	def test_exporte_masivo_no_se_revisa_antes_de_su_intervalo(self):
+		import tempfile
+		from datetime import timedelta
+		from unittest import mock
+		from django.test import override_settings
+		from django.utils import timezone
+		from core.listas import frescura
+		from core.models import DescargaLista
+
+		registro = {"onu": dict(
+			frescura.REGISTRO["onu"], url=f"http://127.0.0.1:{self.http.server_port}/consolidated.xml", intervalo_h=24,
+		)}
+		with tempfile.TemporaryDirectory() as media, override_settings(MEDIA_ROOT=media), \
+				mock.patch.dict(frescura.REGISTRO, registro, clear=True):
+			with self.captureOnCommitCallbacks(execute=True):
+				self.assertTrue(frescura.actualizar("onu"))
+			self.assertIsNone(frescura.actualizar("onu"))
+			self.assertEqual(len(self.peticiones), 1)
+
+			DescargaLista.objects.filter(nombre="onu").update(revisado=timezone.now() - timedelta(hours=25))
+			self.assertFalse(frescura.actualizar("onu"))
+			self.assertEqual(len(self.peticiones), 2)
+
+
+class AlmacenTestCase(TestCase):
+	def test_reemplazo_por_lotes_desde_un_generador(self):
+		from unittest import mock
+		from core.listas import almacen
+
+		def entradas(nombres):
+			for i, nombre in enumerate(nombres):
+				yield {"id": str(i), "nombre": nombre}
+
+		with mock.patch.object(almacen, "LOTE", 2):
+			r = almacen.reemplazar_dataset("prueba", "lotes", entradas(["Ana", "Beto", "Carla", "Dora", "Eva"]))
+			self.assertEqual(r, {"total": 5, "nuevas": 5, "cambiadas": 0, "eliminadas": 0})
+			r = almacen.reemplazar_dataset("prueba", "lotes", entradas(["Ana", "Bruno", "Carla"]))
+			self.assertEqual(r, {"total": 3, "nuevas": 0, "cambiadas": 1, "eliminadas": 2})
+			# Un exporte vacío no borra la copia anterior
+			self.assertEqual(almacen.reemplazar_dataset("prueba", "lotes", entradas([]))["total"], 0)
+
+		dataset = almacen.obtener_dataset("prueba", "lotes")
+		self.assertEqual(dataset.total_entradas, 3)
+		self.assertEqual(
+			sorted(dataset.entradas.values_list("nombre", flat=True)), ["Ana", "Bruno", "Carla"],
+		)
+
+	def test_la_copia_nueva_se_publica_de_una_vez_con_sus_relaciones(self):
+		from unittest import mock
+		from core.listas import almacen
+		from core.models import ListaDataset
+
+		vistas = []
+
+		def entradas(nombres):
+			for i, nombre in enumerate(nombres):
+				# A mitad de la carga las consultas siguen viendo la copia anterior completa
+				vigente = almacen.obtener_dataset("grafo", "red")
+				if vigente is not None:
+					vistas.append((vigente.entradas.count(), vigente.relaciones.count()))
+				yield {"id": str(i), "nombre": nombre}
+
+		def relaciones(ids):
+			return [(a, b, "socio") for a, b in zip(sorted(ids), sorted(ids)[1:])]
+
+		with mock.patch.object(almacen, "LOTE", 2):
+			almacen.reemplazar_dataset("grafo", "red", entradas(["Ana", "Beto"]), relaciones=relaciones)
+			r = almacen.reemplazar_dataset("grafo", "red", entradas(["Ana", "Beto", "Carla", "Dora"]), relaciones=relaciones)
+
+		self.assertEqual(vistas, [(2, 1)] * 4)
+		self.assertEqual((r["total"], r["nuevas"], r["relaciones"]), (4, 2, 3))
+		dataset = almacen.obtener_dataset("grafo", "red")
+		self.assertEqual((dataset.entradas.count(), dataset.relaciones.count()), (4, 3))
+		# La copia reemplazada queda retirada hasta la siguiente carga; no queda nada en preparación
+		listas = sorted(ListaDataset.objects.filter(nombre="red").values_list("lista", flat=True))
+		self.assertEqual(listas, ["grafo", "grafo" + almacen.RETIRADA])
+
+
+class FuentesCacheTestCase(TestCase):
+	def setUp(self):
+		tipo = TipoFuente.objects.create(nombre="TipoCache", peso=1, probabilidad=1)
+		self.fuente = Fuente.objects.create(nombre="fuente_cache", nombre_pila="Fuente cache", tipo=tipo)
+
+	def test_sin_consultas_tras_cargar_e_invalida_por_senal(self):
+		from asgiref.sync import async_to_sync
+		from core.utils.fuentes import abuscar_fuente, buscar_fuente, obtener_fuente
+
+		self.assertEqual(buscar_fuente("fuente_cache"), self.fuente)
+		with self.assertNumQueries(0):
+			self.assertEqual(async_to_sync(abuscar_fuente)("fuente_cache").tipo.nombre, "TipoCache")
+
+		self.fuente.nombre_pila = "Fuente renombrada"
+		self.fuente.save()
+		self.assertEqual(buscar_fuente("fuente_cache").nombre_pila, "Fuente renombrada")
+
+		self.fuente.delete()
+		with self.assertRaises(Fuente.DoesNotExist):
+			obtener_fuente("fuente_cache")
+
+
+class SumideroResultadosTestCase(TestCase):
+	def setUp(self):
+		from django.contrib.auth.models import User
+		from core.models import Candidato, Consulta
+		tipo = TipoFuente.objects.create(nombre="TipoSumidero", peso=1, probabilidad=1)
+		self.fuente = Fuente.objects.create(nombre="fuente_sumidero", nombre_pila="Fuente sumidero", tipo=tipo)
+		usuario = User.objects.create(username="sumidero")
+		self.consulta = Consulta.objects.create(candidato=Candidato.objects.create(cedula="777"), usuario=usuario)
+
+	def test_lotes_normalizados_y_vaciado_al_cancelar(self):
+		from asgiref.sync import async_to_sync, sync_to_async
+		from core.models import Resultado
+		from core.utils import resultados
+
+		contar = sync_to_async(Resultado.objects.filter(consulta=self.consulta).count)
+		vistos = {}
+
+		async def escenario():
+			async def bots():
+				async with resultados.SumideroResultados(lote=3, intervalo_s=60) as sumidero:
+					for score in (10, 0):
+						await resultados.crear_resultado(
+							consulta_id=self.consulta.id, fuente=self.fuente, score=score, estado="Validada", mensaje="",
+						)
+					vistos["encolados"] = await contar()
+					self.assertEqual((await resultados.pendiente(self.consulta.id, "fuente_sumidero")).score, 1)
+					await resultados.crear_resultado(consulta_id=self.consulta.id, fuente=self.fuente, score=8, estado="OK")
+					await asyncio.sleep(0.1)
+					vistos["lote"] = sumidero.escritos
+					await resultados.crear_resultado(consulta_id=self.consulta.id, fuente=self.fuente, score=6, estado="error")
+					await asyncio.sleep(30)
+
+			tarea = asyncio.ensure_future(bots())
+			await asyncio.sleep(0.3)
+			tarea.cancel()
+			await asyncio.wait({tarea})
+
+		async_to_sync(escenario)()
+		self.assertEqual(vistos, {"encolados": 0, "lote": 3})
+		filas = list(Resultado.objects.filter(consulta=self.consulta).order_by("id").values_list("score", "estado"))
+		self.assertEqual(filas, [(5, "validado"), (1, "validado"), (4, "validado"), (3, "offline")])
+
+	def test_los_bots_no_escriben_resultados_directo(self):
+		import glob
+		import os
+		import re
+
+		directo = re.compile(r"Resultado\.objects\.create|\bResultado\(|resultado\.save\(")
+		carpeta = os.path.join(os.path.dirname(__file__), "bots")
+		infractores = []
+		for ruta in glob.glob(os.path.join(carpeta, "*.py")):
+			with open(ruta, encoding="utf-8", errors="ignore") as fh:
+				for n, linea in enumerate(fh, 1):
+					codigo = linea.split("#", 1)[0]
+					if directo.search(codigo) and not codigo.lstrip().startswith(("-", "'", '"')):
+						infractores.append(f"{os.path.basename(ruta)}:{n}")
+		# Todo Resultado de un bot pasa por core.utils.resultados.crear_resultado
+		self.assertEqual(infractores, [])
+
+
+class BdBotsTestCase(SimpleTestCase):
+	def test_pool_propio_en_paralelo(self):
+		import threading
+		from unittest import mock
+		from core.utils import bd
+
+		# Cada llamada espera a la otra: sólo pasan si corren a la vez en hilos distintos
+		encuentro = threading.Barrier(2, timeout=10)
+
+		def llamada():
+			encuentro.wait()
+			return threading.current_thread().name
+
+		async def escenario():
+			return await asyncio.gather(bd.ejecutar(llamada), bd.ejecutar(llamada))
+
+		# Con el SQLite en memoria de los tests se usaría el hilo compartido
+		with mock.patch.object(bd, "compartido", return_value=False), mock.patch.object(bd, "HILOS", 2):
+			nombres = asyncio.run(escenario())
+			bd.detener()
+		self.assertTrue(all(n.startswith("bot-bd") for n in nombres))
+		self.assertEqual(len(set(nombres)), 2)
+
+	def test_detener_cierra_las_conexiones_de_cada_hilo(self):
+		import threading
+		from unittest import mock
+		from core.utils import bd
+
+		encuentro = threading.Barrier(2, timeout=10)
+		cerradas = []
+
+		def llamada():
+			encuentro.wait()
+			return threading.current_thread().name
+
+		def llamada_escritor():
+			return threading.current_thread().name
+
+		async def escenario():
+			return await asyncio.gather(bd.ejecutar(llamada), bd.ejecutar(llamada), bd.escribir(llamada_escritor))
+
+		with mock.patch.object(bd, "compartido", return_value=False), mock.patch.object(bd, "HILOS", 2), \
+				mock.patch.object(bd.connections, "close_all", side_effect=lambda: cerradas.append(threading.current_thread().name)):
+			nombres = asyncio.run(escenario())
+			bd.detener()
+		# Django sólo deja cerrar una conexión desde el hilo que la abrió
+		self.assertEqual(sorted(cerradas), sorted(set(nombres)))
+
+	def test_escrituras_sqlite_en_fila_sin_modo_concurrente(self):
+		import os
+		import sqlite3
+		import tempfile
+		import threading
+		import time
+		from unittest import mock
+		from django.test import override_settings
+		from core.utils import bd
+
+		activos, maximo, hilos = [0], [0], set()
+		candado = threading.Lock()
+
+		with tempfile.TemporaryDirectory() as carpeta:
+			ruta = os.path.join(carpeta, "db.sqlite3")
+			with sqlite3.connect(ruta) as conexion:
+				conexion.execute("CREATE TABLE resultado (n INTEGER)")
+
+			def guardar(n):
+				with candado:
+					activos[0] += 1
+					maximo[0] = max(maximo[0], activos[0])
+					hilos.add(threading.current_thread().name)
+				# Sin busy timeout: otro escritor a la vez fallaría con "database is locked"
+				conexion = sqlite3.connect(ruta, timeout=0, isolation_level=None)
+				try:
+					conexion.execute("BEGIN IMMEDIATE")
+					conexion.execute("INSERT INTO resultado VALUES (?)", (n,))
+					time.sleep(0.005)
+					conexion.execute("COMMIT")
+				finally:
+					conexion.close()
+					with candado:
+						activos[0] -= 1
+
+			async def escenario():
+				await asyncio.gather(*(bd.escribir(guardar, n) for n in range(20)))
+
+			with override_settings(SQLITE_CONCURRENTE=False), mock.patch.object(bd, "compartido", return_value=False):
+				asyncio.run(escenario())
+				bd.detener()
+			with sqlite3.connect(ruta) as conexion:
+				self.assertEqual(conexion.execute("SELECT COUNT(*) FROM resultado").fetchone()[0], 20)
+			conexion.close()
+		self.assertEqual(maximo[0], 1)
+		self.assertEqual(len(hilos), 1)
+		self.assertTrue(hilos.pop().startswith("bot-escritor"))
+
+
+class SqliteConcurrenteTestCase(SimpleTestCase):
+	def test_pragmas_y_un_solo_escritor(self):
+		import os
+		import sqlite3
+		import tempfile
+		import threading
+		from unittest import mock
+		from django.test import override_settings
+		from core.utils import bd, sqlite
+
+		with tempfile.TemporaryDirectory() as carpeta:
+			conexion = sqlite3.connect(os.path.join(carpeta, "db.sqlite3"))
+			sqlite.aplicar_pragmas(conexion.cursor(), busy_timeout_s=12)
+			cursor = conexion.cursor()
+			self.assertEqual(cursor.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+			self.assertEqual(cursor.execute("PRAGMA synchronous").fetchone()[0], 1)
+			self.assertEqual(cursor.execute("PRAGMA busy_timeout").fetchone()[0], 12000)
+			conexion.close()
+
+		async def escenario():
+			return set(await asyncio.gather(*(bd.escribir(lambda: threading.current_thread().name) for _ in range(5))))
+
+		with override_settings(SQLITE_CONCURRENTE=True), mock.patch.object(bd, "compartido", return_value=False):
+			hilos = asyncio.run(escenario())
+			bd.detener()
+		self.assertEqual(len(hilos), 1)
+		self.assertTrue(hilos.pop().startswith("bot-escritor"))
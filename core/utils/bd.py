@@ -0,0 +1,107 @@
+# core/utils/bd.py
+"""
+Pool de hilos propio para el acceso a la BD de los bots.
+
+`sync_to_async` usa por defecto `thread_sensitive=True`: fuera de un request
+todas las llamadas al ORM de los bots del proceso corren, una detrás de otra,
+en el mismo hilo, y una escritura lenta de un bot demora a los otros 149. La
+persistencia de los bots (Fuentes, Resultados, las comprobaciones del
+planificador y las listas locales) pasa por `ejecutar`, que la corre en un
+ThreadPoolExecutor de `HILOS` hilos. Django abre una conexión por hilo, así
+que cada hilo del pool tiene la suya y la conserva entre llamadas.
+
+Las escrituras de alto volumen (los Resultados) usan `escribir`: con SQLite
+van en fila por un único hilo escritor, así los hilos del proceso no compiten
+entre sí por el candado de escritura ("database is locked"); con
+`SQLITE_CONCURRENTE` además sólo esperan (busy timeout) a los otros procesos.
+
+Al apagar (`detener`) cada hilo de los pools cierra sus propias conexiones
+antes de terminar: Django no deja cerrarlas desde otro hilo.
+
+Con `BOT_BD_HILOS=0`, o si la BD es un SQLite en memoria (la de los tests:
+otra conexión no vería la transacción abierta del test), se usa el hilo
+compartido de `sync_to_async` como antes.
+"""
+import asyncio
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import sync_to_async
+from django.db import connection, connections
+
+HILOS = int(os.environ.get("BOT_BD_HILOS", "4"))
+
+_pools = {}
+_hilos = {}
+_pid = None
+_lock = threading.Lock()
+
+
+def _obtener_pool(nombre: str = "bot-bd", hilos: int = None) -> ThreadPoolExecutor:
+    global _pid
+    with _lock:
+        # Tras un fork (prefork de Celery) los hilos del padre no existen en el hijo
+        if _pid != os.getpid():
+            _pools.clear()
+            _hilos.clear()
+            _pid = os.getpid()
+        if nombre not in _pools:
+            _hilos[nombre] = hilos or HILOS
+            _pools[nombre] = ThreadPoolExecutor(max_workers=_hilos[nombre], thread_name_prefix=nombre)
+        return _pools[nombre]
+
+
+def compartido() -> bool:
+    """True si las llamadas van al hilo compartido de `sync_to_async` en vez del pool."""
+    return HILOS <= 0 or (connection.vendor == "sqlite" and connection.is_in_memory_db())
+
+
+def _en_hilo(func, args, kwargs):
+    try:
+        return func(*args, **kwargs)
+    except Exception:
+        # Una conexión que quedó en mal estado no debe heredarla la siguiente llamada del hilo
+        connection.close_if_unusable_or_obsolete()
+        raise
+
+
+async def ejecutar(func, *args, **kwargs):
+    """`await ejecutar(f, ...)` corre `f(...)` (código síncrono con ORM) en el pool y devuelve su resultado."""
+    if compartido():
+        return await sync_to_async(func)(*args, **kwargs)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_obtener_pool(), functools.partial(_en_hilo, func, args, kwargs))
+
+
+async def escribir(func, *args, **kwargs):
+    """Como `ejecutar`, para escrituras de alto volumen; con SQLite, en fila por el hilo escritor."""
+    if compartido() or connection.vendor != "sqlite":
+        return await ejecutar(func, *args, **kwargs)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _obtener_pool("bot-escritor", 1), functools.partial(_en_hilo, func, args, kwargs)
+    )
+
+
+def _cerrar_conexiones(barrera: threading.Barrier):
+    try:
+        # Cada tarea retiene su hilo hasta que todas empezaron: así cada hilo del pool corre exactamente una
+        barrera.wait(timeout=30)
+    except threading.BrokenBarrierError:
+        pass
+    connections.close_all()
+
+
+def detener():
+    """Cierra los pools (apagado del worker); las llamadas en curso terminan y cada hilo cierra sus conexiones."""
+    with _lock:
+        if _pid == os.getpid():
+            for nombre, pool in _pools.items():
+                barrera = threading.Barrier(_hilos[nombre])
+                for _ in range(_hilos[nombre]):
+                    pool.submit(_cerrar_conexiones, barrera)
+                pool.shutdown(wait=True)
+        _pools.clear()
+        _hilos.clear()
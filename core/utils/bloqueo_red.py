@@ -0,0 +1,147 @@
+# core/utils/bloqueo_red.py
+"""
+Perfiles declarativos de bloqueo de red para los bots.
+
+Cada entrada de `get_bot_configs` puede llevar una clave `block` con el nombre
+de un perfil de `PERFILES` (o un dict `{"tipos": [...], "dominios": [...]}`).
+El runner marca el bot en curso con `perfil_para(bot)` y el pool de
+navegadores instala `instalar(contexto)` en cada `BrowserContext` nuevo, así
+que ningún bot necesita tocar su código. Los contextos persistentes
+(`launch_persistent_context`) también lo reciben.
+
+Playwright no expone el tamaño de una petición abortada (nunca llega la
+respuesta), así que se reporta cuántas peticiones se bloquearon, por tipo de
+recurso, y no una estimación de bytes.
+"""
+import contextvars
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+# Analítica, publicidad y widgets sociales: nunca aportan nada a una consulta
+DOMINIOS_RASTREO = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googlesyndication.com",
+    "googleadservices.com",
+    "doubleclick.net",
+    "adservice.google.com",
+    "facebook.net",
+    "connect.facebook.net",
+    "hotjar.com",
+    "clarity.ms",
+    "scorecardresearch.com",
+    "nr-data.net",
+    "newrelic.com",
+    "segment.io",
+    "cdn.segment.com",
+    "addthis.com",
+    "sharethis.com",
+    "platform.twitter.com",
+    "siteimproveanalytics.com",
+    "crazyegg.com",
+    "quantserve.com",
+    "adsrvr.org",
+    "taboola.com",
+    "outbrain.com",
+)
+
+# Vídeo embebido: pesado y nunca sale en un pantallazo útil
+DOMINIOS_VIDEO = ("youtube.com", "youtube-nocookie.com", "ytimg.com", "vimeo.com", "brightcove.net")
+
+PERFILES = {
+    "ninguno": {"tipos": (), "dominios": ()},
+    # Por defecto: sólo rastreadores y publicidad, seguro incluso con captchas
+    "rastreo": {"tipos": (), "dominios": DOMINIOS_RASTREO},
+    # DOM + pantallazo: fuera fuentes web, audio/vídeo y rastreadores
+    "ligero": {"tipos": ("font", "media"), "dominios": DOMINIOS_RASTREO + DOMINIOS_VIDEO},
+    # Bots que sólo leen texto: además fuera imágenes
+    "texto": {"tipos": ("font", "media", "image"), "dominios": DOMINIOS_RASTREO + DOMINIOS_VIDEO},
+}
+PERFIL_DEFECTO = "rastreo"
+
+_bot_actual = contextvars.ContextVar("bot_actual", default=None)
+
+# nombre del bot -> contadores acumulados en el proceso
+ESTADISTICAS = {}
+
+
+def resolver_perfil(block):
+    """Normaliza el valor de `block` a (tipos, dominios) en forma de sets/tuplas."""
+    if block is None:
+        block = PERFIL_DEFECTO
+    if isinstance(block, str):
+        perfil = PERFILES.get(block)
+        if perfil is None:
+            print(f"[bloqueo] Perfil desconocido '{block}', se usa '{PERFIL_DEFECTO}'")
+            perfil = PERFILES[PERFIL_DEFECTO]
+    else:
+        perfil = block
+    tipos = frozenset(perfil.get("tipos") or ())
+    dominios = tuple(d.lower().lstrip(".") for d in (perfil.get("dominios") or ()))
+    return tipos, dominios
+
+
+@contextmanager
+def perfil_para(bot: dict, estadisticas: dict = None):
+    """
+    Marca `bot` como el bot en curso de la tarea asyncio actual. Si se pasa
+    `estadisticas`, los contadores también se acumulan ahí (p.ej. por consulta).
+    """
+    tipos, dominios = resolver_perfil(bot.get("block"))
+    token = _bot_actual.set((bot.get("name") or "?", tipos, dominios, estadisticas))
+    try:
+        yield
+    finally:
+        _bot_actual.reset(token)
+
+
+def _dominio_bloqueado(url: str, dominios) -> bool:
+    host = (urlsplit(url).hostname or "").lower()
+    return any(host == d or host.endswith("." + d) for d in dominios)
+
+
+def _contar(destino, nombre, tipo):
+    st = destino.setdefault(nombre, {"peticiones": 0, "por_tipo": {}})
+    st["peticiones"] += 1
+    st["por_tipo"][tipo] = st["por_tipo"].get(tipo, 0) + 1
+
+
+async def instalar(contexto):
+    """Instala el route handler del bot en curso sobre `contexto` (si bloquea algo)."""
+    actual = _bot_actual.get()
+    if actual is None:
+        return
+    nombre, tipos, dominios, estadisticas = actual
+    if not tipos and not dominios:
+        return
+
+    async def _handler(route, request):
+        tipo = request.resource_type
+        if tipo in tipos or (dominios and _dominio_bloqueado(request.url, dominios)):
+            _contar(ESTADISTICAS, nombre, tipo)
+            if estadisticas is not None:
+                _contar(estadisticas, nombre, tipo)
+            try:
+                await route.abort("blockedbyclient")
+            except Exception:
+                pass
+            return
+        # Sigue con las rutas que el bot registró antes o directo a la red
+        await route.fallback()
+
+    if tipos:
+        await contexto.route("**/*", _handler)
+    else:
+        # Sólo dominios: el filtro por URL evita un viaje al handler por cada petición
+        await contexto.route(lambda url: _dominio_bloqueado(url, dominios), _handler)
+
+
+def imprimir_resumen(datos=None):
+    """Imprime los contadores de `datos` (por defecto, los acumulados del proceso)."""
+    datos = ESTADISTICAS if datos is None else datos
+    if not datos:
+        return
+    total_req = sum(d["peticiones"] for d in datos.values())
+    print(f"[bloqueo] {total_req} peticiones bloqueadas en {len(datos)} bots")
+    for nombre, d in sorted(datos.items(), key=lambda x: -x[1]["peticiones"])[:10]:
+        print(f"[bloqueo]   {nombre}: {d['peticiones']} peticiones {d['por_tipo']}")
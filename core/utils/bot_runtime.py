@@ -0,0 +1,83 @@
+# core/utils/bot_runtime.py
+"""
+Event loop de larga vida para los bots de un proceso (worker Celery o gunicorn).
+
+`async_to_sync` crea un loop nuevo en cada llamada, así que nada que dependa
+del loop (navegadores de Playwright, el pool, etc.) puede sobrevivir entre
+tareas. Aquí mantenemos un único loop en un hilo de fondo por proceso y las
+tareas síncronas le envían sus corrutinas con `ejecutar()`.
+"""
+import asyncio
+import os
+import threading
+
+_loop = None
+_hilo = None
+_pid = None
+_lock = threading.Lock()
+
+
+def _correr_loop(loop):
+    asyncio.set_event_loop(loop)
+    loop.run_forever()
+
+
+def obtener_loop():
+    """Devuelve el loop del runtime, arrancándolo si no existe en este proceso."""
+    global _loop, _hilo, _pid
+    with _lock:
+        # Tras un fork (prefork de Celery) el hilo del padre no existe en el hijo
+        if _loop is None or _pid != os.getpid() or not _hilo.is_alive():
+            _loop = asyncio.new_event_loop()
+            _hilo = threading.Thread(
+                target=_correr_loop, args=(_loop,), name="bot-runtime", daemon=True
+            )
+            _hilo.start()
+            _pid = os.getpid()
+        return _loop
+
+
+def activo() -> bool:
+    """True si el loop del runtime ya está corriendo en este proceso."""
+    return _loop is not None and _pid == os.getpid() and _hilo.is_alive()
+
+
+def en_runtime() -> bool:
+    """True si el código corre dentro del loop del runtime."""
+    try:
+        return asyncio.get_running_loop() is _loop
+    except RuntimeError:
+        return False
+
+
+def ejecutar(coro, timeout=None):
+    """
+    Ejecuta `coro` en el loop del runtime y bloquea hasta obtener el resultado.
+    Si el hilo que espera es interrumpido (p.ej. límite de tiempo de Celery),
+    la corrutina se cancela en lugar de quedar huérfana.
+    """
+    if en_runtime():
+        raise RuntimeError("ejecutar() no puede llamarse desde el propio loop del runtime")
+    futuro = asyncio.run_coroutine_threadsafe(coro, obtener_loop())
+    try:
+        return futuro.result(timeout=timeout)
+    except BaseException:
+        futuro.cancel()
+        raise
+
+
+def lanzar(coro):
+    """Envía `coro` al loop del runtime sin esperarla; devuelve su `concurrent.futures.Future`."""
+    return asyncio.run_coroutine_threadsafe(coro, obtener_loop())
+
+
+def detener():
+    """Detiene el loop del runtime (apagado del worker)."""
+    global _loop, _hilo
+    with _lock:
+        if _loop is None or _pid != os.getpid():
+            return
+        _loop.call_soon_threadsafe(_loop.stop)
+        _hilo.join(timeout=10)
+        _loop = None
+        _hilo = None
@@ -0,0 +1,297 @@
+# core/utils/bot_scheduler.py
+"""
+Planificador de bots con slots fijos y cola compartida.
+
+Antes los bots corrían en lotes de `BOT_BATCH_SIZE` con `asyncio.gather`, y
+cada lote esperaba a su bot más lento (a menudo uno de 180 s) mientras el
+resto de slots quedaba ocioso. Aquí cada slot toma el siguiente bot de la
+cola en cuanto termina el anterior.
+"""
+import asyncio
+import itertools
+import os
+from collections import deque
+from time import perf_counter
+
+from core.bots import registro
+from core.listas import consulta as listas_locales
+from core.models import Resultado
+from . import bd, bloqueo_red, browser_pool, circuit_breaker, limite_fuente, resultados, reutilizacion
+from .fuentes import abuscar_fuente
+
+TIMEOUT_DEFECTO_S = float(os.environ.get("BOT_TIMEOUT_S", "150"))
+GRACIA_CANCELACION_S = 10
+# Pausa de un slot cuando todos los bots pendientes apuntan a fuentes saturadas
+ESPERA_SATURADA_S = 0.5
+
+# Lo devuelve `ejecutar_bot` cuando la fuente no admite más carga por ahora
+SATURADA = "saturada"
+
+
+def slots_configurados(defecto: int = 10) -> int:
+    """Número de bots simultáneos (env `BOT_BATCH_SIZE`, se mantiene el nombre histórico)."""
+    try:
+        return max(1, int(os.environ.get("BOT_BATCH_SIZE", defecto)))
+    except Exception:
+        return defecto
+
+
+async def ejecutar_bot(bot: dict, bloqueos: dict = None, reutilizar: bool = True, revisados: dict = None):
+    """
+    Corre un bot con su presupuesto `timeout_s`, que cubre también la lista
+    local y la reutilización; los errores se registran y no detienen al
+    resto. Si se agota el tiempo, el bot se cancela, se cierran sus contextos
+    de navegador y se guarda un Resultado offline.
+
+    Si la entrada declara 'lista_local' y ese dataset está cargado, se resuelve
+    contra la copia local (core.listas) sin abrir navegador.
+
+    Con `reutilizar`, si la fuente tiene un resultado vigente de otra consulta
+    de la misma persona, se copia ese y el bot no se ejecuta. Si el circuit
+    breaker de la fuente está abierto, se guarda offline sin ejecutarlo.
+
+    Si la entrada declara 'limite' y la fuente está saturada en el clúster,
+    devuelve SATURADA para que el planificador lo reencole. `revisados`
+    (id del bot -> segundos gastados) lo lleva el planificador: la lista local
+    y la reutilización ya revisadas no se repiten al reintentarlo.
+    """
+    fuente = nombre_fuente(bot)
+    timeout_s = bot.get("timeout_s") or TIMEOUT_DEFECTO_S
+    if revisados is None:
+        revisados = {}
+    if id(bot) not in revisados:
+        t0 = perf_counter()
+        try:
+            resuelto = await asyncio.wait_for(_resolver_sin_correr(bot, fuente, reutilizar), timeout_s)
+        except asyncio.TimeoutError:
+            print(f"[timeout] {bot.get('name')} superó {timeout_s:.0f}s en la lista local o la reutilización")
+            try:
+                await registrar_timeout(bot, timeout_s)
+            except Exception as e:
+                print(f"[timeout] No se pudo registrar el timeout de {bot.get('name')}: {e}")
+            return
+        if resuelto:
+            return
+        revisados[id(bot)] = perf_counter() - t0
+
+    permiso = await limite_fuente.intentar_adquirir(fuente, bot.get("limite"))
+    if permiso is None:
+        return SATURADA
+    try:
+        estado_circuito = await circuit_breaker.permitir(fuente)
+        if estado_circuito == circuit_breaker.ABIERTO:
+            print(f"[breaker] {bot.get('name')}: circuito abierto para {fuente}, offline inmediato")
+            try:
+                await _registrar_offline(bot, "La fuente no está disponible en este momento (varios fallos recientes).")
+            except Exception as e:
+                print(f"[breaker] No se pudo registrar el offline de {bot.get('name')}: {e}")
+            return
+
+        ok = await _correr_con_timeout(bot, bloqueos, timeout_s - revisados[id(bot)])
+        if ok:
+            # El bot terminó, pero pudo haber guardado su propio offline
+            try:
+                ok = await _resultado_valido(bot, fuente)
+            except Exception:
+                pass
+        await circuit_breaker.registrar(fuente, ok, estado_circuito)
+    finally:
+        await limite_fuente.liberar(fuente, permiso)
+
+
+async def _resolver_sin_correr(bot: dict, fuente: str, reutilizar: bool) -> bool:
+    """True si el bot quedó resuelto con la lista local o reutilizando un resultado."""
+    if bot.get("lista_local"):
+        # Listas con copia local: búsqueda en la BD, sin navegador
+        try:
+            if await listas_locales.consultar_local(bot, fuente):
+                return True
+        except Exception as e:
+            print(f"[listas] {bot.get('name')}: fallo en la lista local, se consulta en vivo: {e}")
+
+    if reutilizar:
+        consulta_id = (bot.get("kwargs") or {}).get("consulta_id")
+        try:
+            copia = await reutilizacion.reutilizar(consulta_id, fuente)
+        except Exception as e:
+            print(f"[reutilizacion] {bot.get('name')}: {e}")
+            copia = None
+        if copia is not None:
+            print(f"[reutilizacion] {bot.get('name')}: se reutiliza el resultado {copia.reutilizado_de_id}")
+            return True
+    return False
+
+
+async def _correr_con_timeout(bot: dict, bloqueos: dict = None, restante_s: float = None) -> bool:
+    """
+    Ejecuta el bot; False si lanzó una excepción o se agotó su tiempo.
+    `restante_s` es lo que queda del presupuesto tras la lista local y la reutilización.
+    """
+    timeout_s = bot.get("timeout_s") or TIMEOUT_DEFECTO_S
+    with bloqueo_red.perfil_para(bot, bloqueos), browser_pool.rastrear_prestamos() as prestamos:
+        # El bot ya guarda sus propios resultados en la BD
+        tarea = asyncio.ensure_future(bot["func"](**bot["kwargs"]))
+        try:
+            hechas, _ = await asyncio.wait({tarea}, timeout=max(0.0, timeout_s if restante_s is None else restante_s))
+        except asyncio.CancelledError:
+            tarea.cancel()
+            raise
+
+        if tarea in hechas:
+            if not tarea.cancelled() and tarea.exception() is not None:
+                print(f"Error en bot {bot['func'].__name__}: {tarea.exception()}")
+                return False
+            return not tarea.cancelled()
+
+        print(f"[timeout] {bot.get('name')} superó {timeout_s:.0f}s, cancelando")
+        tarea.cancel()
+        # Hay bots con `except:` desnudo que se tragan la cancelación: no los esperamos indefinidamente
+        await asyncio.wait({tarea}, timeout=GRACIA_CANCELACION_S)
+        if not tarea.done():
+            print(f"[timeout] {bot.get('name')} no respondió a la cancelación; se abandona")
+        await browser_pool.cerrar_prestamos(prestamos)
+
+    try:
+        await registrar_timeout(bot, timeout_s)
+    except Exception as e:
+        print(f"[timeout] No se pudo registrar el timeout de {bot.get('name')}: {e}")
+    return False
+
+
+async def _resultado_valido(bot: dict, fuente: str) -> bool:
+    consulta_id = (bot.get("kwargs") or {}).get("consulta_id")
+    if consulta_id is None:
+        return True
+    # Lo más probable es que el resultado siga en el sumidero, sin escribir
+    pendiente = await resultados.pendiente(consulta_id, fuente)
+    if pendiente is not None:
+        return pendiente.estado != "offline"
+    estado = await bd.ejecutar(
+        Resultado.objects
+        .filter(consulta_id=consulta_id, fuente__nombre=fuente)
+        .order_by("-id")
+        .values_list("estado", flat=True)
+        .first
+    )
+    return estado != "offline"
+
+
+def nombre_fuente(bot: dict) -> str:
+    """
+    Nombre de la Fuente con la que el bot guarda sus resultados: clave 'fuente'
+    de la entrada, `NOMBRE_SITIO` del módulo del bot o, en último caso, 'name'.
+    """
+    if bot.get("fuente"):
+        return bot["fuente"]
+    # Con el registro perezoso el módulo se importa aquí, justo antes de correr el bot
+    modulo = registro.cargar_modulo(bot.get("func"))
+    return getattr(modulo, "NOMBRE_SITIO", None) or bot.get("name") or ""
+
+
+async def registrar_timeout(bot: dict, timeout_s: float):
+    await _registrar_offline(
+        bot, f"La fuente no respondió dentro del límite de {timeout_s:.0f} segundos (timeout)."
+    )
+
+
+async def _registrar_offline(bot: dict, mensaje: str):
+    consulta_id = (bot.get("kwargs") or {}).get("consulta_id")
+    if consulta_id is None:
+        return
+
+    nombre = nombre_fuente(bot)
+    fuente = await abuscar_fuente(nombre)
+    # Si el bot alcanzó a guardar algo antes de colgarse, no lo duplicamos
+    if await resultados.pendiente(consulta_id, nombre) is not None:
+        return
+    if await bd.ejecutar(Resultado.objects.filter(consulta_id=consulta_id, fuente=fuente).exists):
+        return
+    await resultados.crear_resultado(
+        consulta_id=consulta_id,
+        fuente=fuente,
+        score=0,
+        estado="offline",
+        mensaje=mensaje,
+        archivo="",
+    )
+
+
+def _tiempo_por_lotes(duraciones, tamano):
+    """Wall-clock que habría tomado el esquema anterior de lotes con las mismas duraciones."""
+    it = iter(duraciones)
+    total = 0.0
+    while True:
+        lote = list(itertools.islice(it, tamano))
+        if not lote:
+            return total
+        total += max(lote)
+
+
+async def ejecutar_bots(bots, slots: int, bloqueos: dict = None, etiqueta: str = "task",
+                        reutilizar: bool = True) -> dict:
+    """
+    Ejecuta `bots` con a lo sumo `slots` simultáneos y devuelve estadísticas de
+    uso de los slots (utilización, wall-clock y estimación del esquema por lotes).
+    `reutilizar=False` fuerza a que todos los bots consulten en vivo.
+    """
+    bots = list(bots)
+    pendientes = deque(bots)
+    n_slots = max(1, min(slots, len(bots)))
+    ocupado = [0.0] * n_slots
+    duraciones = {}
+    # Bots cuya lista local y reutilización ya se revisaron (id -> segundos gastados)
+    revisados = {}
+    reencolados = 0
+    inicio = perf_counter()
+
+    async def slot(i):
+        nonlocal reencolados
+        rechazos = 0
+        while pendientes:
+            bot = pendientes.popleft()
+            t0 = perf_counter()
+            try:
+                desenlace = await ejecutar_bot(bot, bloqueos, reutilizar, revisados)
+            finally:
+                dt = perf_counter() - t0
+            if desenlace == SATURADA:
+                # Fuente saturada: al final de la cola y el slot sigue con otro bot
+                pendientes.append(bot)
+                reencolados += 1
+                rechazos += 1
+                if rechazos >= len(pendientes):
+                    await asyncio.sleep(ESPERA_SATURADA_S)
+                    rechazos = 0
+                continue
+            rechazos = 0
+            ocupado[i] += dt
+            duraciones[id(bot)] = dt
+
+    print(f"[{etiqueta}] Ejecutando {len(bots)} bots con {n_slots} slots")
+    if bots:
+        # Los Resultados de los bots se escriben por lotes; al salir (aun cancelados) no queda ninguno pendiente
+        async with resultados.SumideroResultados():
+            await asyncio.gather(*(slot(i) for i in range(n_slots)))
+
+    wall = perf_counter() - inicio
+    en_orden = [duraciones.get(id(b), 0.0) for b in bots]
+    stats = {
+        "bots": len(bots),
+        "slots": n_slots,
+        "wall_s": round(wall, 2),
+        "ocupado_s": round(sum(ocupado), 2),
+        "utilizacion": round(sum(ocupado) / (n_slots * wall), 3) if wall > 0 else 0.0,
+        "lotes_estimado_s": round(_tiempo_por_lotes(en_orden, n_slots), 2),
+        "reencolados": reencolados,
+        "mas_lentos": sorted(
+            ((b.get("name"), round(duraciones.get(id(b), 0.0), 1)) for b in bots),
+            key=lambda x: -x[1],
+        )[:5],
+    }
+    print(
+        f"[{etiqueta}] {stats['bots']} bots en {stats['wall_s']}s "
+        f"(por lotes habría sido ~{stats['lotes_estimado_s']}s), "
+        f"utilización de slots {stats['utilizacion']:.0%}, reencolados por límite {reencolados}, "
+        f"más lentos: {stats['mas_lentos']}"
+    )
+    return stats
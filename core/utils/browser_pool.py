@@ -0,0 +1,362 @@
+# core/utils/browser_pool.py
+"""
+Pool de navegadores Chromium compartido por todos los bots de un worker.
+
+Cada bot hacía `async with async_playwright()` + `p.chromium.launch()` por
+llamada, así que una consulta arrancaba 150+ procesos de Chromium. El pool
+mantiene N navegadores calientes por combinación de opciones de lanzamiento y
+entrega a cada bot un `BrowserContext` nuevo y aislado (cookies, storage y
+caché propios). Los navegadores se reciclan tras K usos o si superan un techo
+de memoria RSS.
+
+Los bots no necesitan cambios de lógica: basta con importar `async_playwright`
+desde este módulo. Dentro del loop del runtime (`core.utils.bot_runtime`)
+`p.chromium.launch()` devuelve un préstamo del pool y el resto de `p` es el
+driver persistente de `core.utils.playwright_driver`; fuera de él (scripts,
+pruebas manuales) se comporta exactamente como Playwright.
+"""
+import asyncio
+import contextvars
+import itertools
+import json
+import os
+import time
+import uuid
+from contextlib import contextmanager
+
+from playwright.async_api import async_playwright as _async_playwright_real
+
+from . import bloqueo_red, bot_runtime, playwright_driver
+
+POOL_SIZE = int(os.environ.get("BROWSER_POOL_SIZE", "4"))
+POOL_MAX_USOS = int(os.environ.get("BROWSER_POOL_MAX_USOS", "40"))
+POOL_MAX_RSS_MB = int(os.environ.get("BROWSER_POOL_MAX_RSS_MB", "1500"))
+# Revisar el RSS es una llamada CDP; no hace falta en cada préstamo
+POOL_RSS_CADA = int(os.environ.get("BROWSER_POOL_RSS_CADA", "5"))
+
+_PAGINA_BYTES = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def _clave(launch_kwargs: dict) -> str:
+    """Clave estable para agrupar navegadores lanzados con las mismas opciones."""
+    return json.dumps(launch_kwargs, sort_keys=True, default=str)
+
+
+def _rss_pid_mb(pid: int) -> float:
+    try:
+        with open(f"/proc/{pid}/statm") as f:
+            return int(f.read().split()[1]) * _PAGINA_BYTES / (1024 * 1024)
+    except Exception:
+        return 0.0
+
+
+class _Navegador:
+    """Un navegador del pool con su contabilidad de uso."""
+
+    _ids = itertools.count(1)
+
+    def __init__(self, browser, clave):
+        self.id = next(self._ids)
+        self.browser = browser
+        self.clave = clave
+        self.usos = 0
+        self.activos = 0
+        self.retirado = False
+        self.creado = time.monotonic()
+
+    @property
+    def vivo(self) -> bool:
+        return not self.retirado and self.browser.is_connected()
+
+    async def rss_mb(self):
+        """RSS total (proceso browser + renderers + gpu) vía CDP. None si no se puede medir."""
+        try:
+            cdp = await self.browser.new_browser_cdp_session()
+            try:
+                info = await cdp.send("SystemInfo.getProcessInfo")
+            finally:
+                await cdp.detach()
+            return sum(_rss_pid_mb(p["id"]) for p in info.get("processInfo", []))
+        except Exception:
+            return None
+
+
+class BrowserPool:
+    """
+    Mantiene hasta `tamano` navegadores por clave de lanzamiento. Los contextos
+    se reparten al navegador menos cargado; un navegador retirado deja de
+    recibir contextos y se cierra cuando termina el último que tenía abierto.
+    """
+
+    def __init__(self, playwright, tamano=POOL_SIZE, max_usos=POOL_MAX_USOS, max_rss_mb=POOL_MAX_RSS_MB, generacion=0):
+        self.playwright = playwright
+        self.generacion = generacion
+        self.tamano = max(1, tamano)
+        self.max_usos = max_usos
+        self.max_rss_mb = max_rss_mb
+        self._navegadores = {}  # clave -> [_Navegador]
+        self._lock = asyncio.Lock()
+        self._cerrado = False
+        self.stats = {"lanzados": 0, "reciclados": 0, "prestamos": 0, "contextos": 0}
+
+    async def _lanzar(self, launch_kwargs, clave):
+        try:
+            browser = await self.playwright.chromium.launch(**launch_kwargs)
+        except Exception:
+            # Si el fallo es del driver y no del navegador, lo reiniciamos para el siguiente bot
+            if self.generacion and self.generacion == playwright_driver.generacion() and not await playwright_driver.ping():
+                await playwright_driver.reiniciar("fallo al lanzar navegador")
+            raise
+        nav = _Navegador(browser, clave)
+        browser.on("disconnected", lambda _b: self._descartar(nav))
+        self._navegadores.setdefault(clave, []).append(nav)
+        self.stats["lanzados"] += 1
+        print(f"[pool] Navegador #{nav.id} lanzado ({len(self._navegadores[clave])}/{self.tamano})")
+        return nav
+
+    def _descartar(self, nav):
+        nav.retirado = True
+        lista = self._navegadores.get(nav.clave, [])
+        if nav in lista:
+            lista.remove(nav)
+
+    async def adquirir(self, **launch_kwargs) -> _Navegador:
+        """Reserva un navegador compatible con `launch_kwargs`, lanzándolo si hace falta."""
+        if self._cerrado:
+            raise RuntimeError("El pool de navegadores está cerrado")
+        clave = _clave(launch_kwargs)
+        async with self._lock:
+            vivos = [n for n in self._navegadores.get(clave, []) if n.vivo]
+            if len(vivos) < self.tamano:
+                # Preferimos calentar un navegador nuevo antes que apilar contextos
+                libres = [n for n in vivos if n.activos == 0]
+                nav = libres[0] if libres else await self._lanzar(launch_kwargs, clave)
+            else:
+                nav = min(vivos, key=lambda n: n.activos)
+            nav.usos += 1
+            nav.activos += 1
+            self.stats["prestamos"] += 1
+            return nav
+
+    async def liberar(self, nav: _Navegador):
+        """Devuelve un navegador al pool y decide si hay que reciclarlo."""
+        nav.activos = max(0, nav.activos - 1)
+        if not nav.retirado:
+            motivo = None
+            if self.max_usos and nav.usos >= self.max_usos:
+                motivo = f"{nav.usos} usos"
+            elif self.max_rss_mb and POOL_RSS_CADA and nav.usos % POOL_RSS_CADA == 0:
+                rss = await nav.rss_mb()
+                if rss is not None and rss > self.max_rss_mb:
+                    motivo = f"RSS {rss:.0f} MB"
+            if motivo:
+                print(f"[pool] Reciclando navegador #{nav.id} ({motivo})")
+                self.stats["reciclados"] += 1
+                self._descartar(nav)
+        if nav.retirado and nav.activos == 0:
+            try:
+                await nav.browser.close()
+            except Exception:
+                pass
+
+    async def calentar(self, n=None, **launch_kwargs):
+        """Lanza por adelantado `n` navegadores (por defecto el tamaño del pool)."""
+        launch_kwargs.setdefault("headless", True)
+        clave = _clave(launch_kwargs)
+        async with self._lock:
+            faltan = (n or self.tamano) - len([x for x in self._navegadores.get(clave, []) if x.vivo])
+            for _ in range(max(0, faltan)):
+                await self._lanzar(launch_kwargs, clave)
+
+    async def cerrar(self):
+        self._cerrado = True
+        for lista in list(self._navegadores.values()):
+            for nav in list(lista):
+                self._descartar(nav)
+                try:
+                    await nav.browser.close()
+                except Exception:
+                    pass
+        self._navegadores.clear()
+
+    def estadisticas(self) -> dict:
+        return {
+            **self.stats,
+            "navegadores": sum(len(l) for l in self._navegadores.values()),
+            "contextos_activos": sum(n.activos for l in self._navegadores.values() for n in l),
+        }
+
+
+# ---------------------------------------------------------------------------
+# Pool del runtime (uno por proceso)
+# ---------------------------------------------------------------------------
+
+_pool = None
+
+
+async def obtener_pool() -> BrowserPool:
+    """
+    Pool del proceso; sólo válido dentro del loop de `bot_runtime`. Si el
+    driver de Playwright se reinició, los navegadores anteriores murieron con
+    él y se arma un pool nuevo sobre el driver actual.
+    """
+    global _pool
+    pw = await playwright_driver.obtener_playwright()
+    if _pool is None or _pool.generacion != playwright_driver.generacion():
+        if _pool is not None:
+            _pool._cerrado = True
+            _pool._navegadores.clear()
+        _pool = BrowserPool(pw, generacion=playwright_driver.generacion())
+    return _pool
+
+
+async def cerrar_pool():
+    global _pool
+    if _pool is not None:
+        await _pool.cerrar()
+        _pool = None
+    await playwright_driver.detener()
+
+
+# ---------------------------------------------------------------------------
+# Reemplazo de `async_playwright` para los bots
+# ---------------------------------------------------------------------------
+
+# Préstamos abiertos por el bot en curso, para poder cerrarlos si el runner lo cancela
+_prestamos_bot = contextvars.ContextVar("prestamos_bot", default=None)
+
+
+@contextmanager
+def rastrear_prestamos():
+    """Registra en la lista devuelta cada navegador que preste el bot en curso."""
+    prestamos = []
+    token = _prestamos_bot.set(prestamos)
+    try:
+        yield prestamos
+    finally:
+        _prestamos_bot.reset(token)
+
+
+async def cerrar_prestamos(prestamos):
+    """Cierra los préstamos que sigan abiertos (bot cancelado o que no limpió)."""
+    for prestado in list(prestamos):
+        try:
+            await prestado.close()
+        except Exception:
+            pass
+
+class NavegadorPrestado:
+    """
+    Se comporta como un `Browser` de Playwright, pero cada `new_context()` /
+    `new_page()` crea un contexto aislado en un navegador del pool, y `close()`
+    sólo cierra esos contextos y devuelve el navegador.
+    """
+
+    def __init__(self, pool: BrowserPool, nav: _Navegador):
+        self._pool = pool
+        self._nav = nav
+        self._contextos = []
+        self._cerrado = False
+        self.id = uuid.uuid4().hex[:8]
+        rastreo = _prestamos_bot.get()
+        if rastreo is not None:
+            rastreo.append(self)
+
+    async def new_context(self, **kwargs):
+        if self._cerrado:
+            raise RuntimeError("El navegador prestado ya fue cerrado")
+        ctx = await self._nav.browser.new_context(**kwargs)
+        self._contextos.append(ctx)
+        await bloqueo_red.instalar(ctx)
+        self._pool.stats["contextos"] += 1
+        return ctx
+
+    async def new_page(self, **kwargs):
+        ctx = await self.new_context(**kwargs)
+        return await ctx.new_page()
+
+    @property
+    def contexts(self):
+        return list(self._contextos)
+
+    def is_connected(self) -> bool:
+        return not self._cerrado and self._nav.browser.is_connected()
+
+    async def close(self, **_kwargs):
+        if self._cerrado:
+            return
+        self._cerrado = True
+        for ctx in self._contextos:
+            try:
+                await ctx.close()
+            except Exception:
+                pass
+        self._contextos.clear()
+        await self._pool.liberar(self._nav)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    def __getattr__(self, nombre):
+        return getattr(self._nav.browser, nombre)
+
+
+class _ChromiumPool:
+    def __init__(self, pool: BrowserPool, prestamos: list):
+        self._pool = pool
+        self._prestamos = prestamos
+
+    async def launch(self, **kwargs):
+        nav = await self._pool.adquirir(**kwargs)
+        prestado = NavegadorPrestado(self._pool, nav)
+        self._prestamos.append(prestado)
+        return prestado
+
+    async def launch_persistent_context(self, *args, **kwargs):
+        # Fuera del pool (el perfil en disco es del bot), pero con el bloqueo de red del bot
+        ctx = await self._pool.playwright.chromium.launch_persistent_context(*args, **kwargs)
+        await bloqueo_red.instalar(ctx)
+        return ctx
+
+    def __getattr__(self, nombre):
+        # connect_over_cdp, etc. van directo a Playwright
+        return getattr(self._pool.playwright.chromium, nombre)
+
+
+class _PlaywrightPool:
+    def __init__(self, pool: BrowserPool, prestamos: list):
+        self._pool = pool
+        self.chromium = _ChromiumPool(pool, prestamos)
+
+    def __getattr__(self, nombre):
+        return getattr(self._pool.playwright, nombre)
+
+
+class async_playwright:
+    """
+    Reemplazo directo de `playwright.async_api.async_playwright`.
+
+    Al salir del `async with` se cierran los préstamos que el bot haya dejado
+    abiertos, igual que Playwright mataba sus navegadores al terminar.
+    """
+
+    def __init__(self):
+        self._real = None
+        self._prestamos = []
+
+    async def __aenter__(self):
+        if not bot_runtime.en_runtime():
+            self._real = _async_playwright_real()
+            return await self._real.__aenter__()
+        pool = await obtener_pool()
+        return _PlaywrightPool(pool, self._prestamos)
+
+    async def __aexit__(self, *exc):
+        if self._real is not None:
+            return await self._real.__aexit__(*exc)
+        for prestado in self._prestamos:
+            await prestado.close()
+        self._prestamos.clear()
@@ -0,0 +1,86 @@
+# core/utils/circuit_breaker.py
+"""
+Circuit breaker por fuente (`Fuente.nombre`), compartido entre workers vía Redis.
+
+- cerrado: el bot corre normal; cada fallo seguido suma uno.
+- abierto: tras `BREAKER_UMBRAL` fallos seguidos la fuente se da por caída
+  durante `BREAKER_ENFRIAMIENTO_S` y los bots responden offline al instante.
+- semiabierto: vencido el enfriamiento, un solo bot del clúster (el que gana el
+  lock `sondeo`) corre de prueba. Si funciona el circuito se cierra; si falla,
+  se vuelve a abrir.
+
+La cuenta de fallos vence a los `BREAKER_ENFRIAMIENTO_S` sin fallos nuevos:
+fallos sueltos espaciados en el tiempo no abren el circuito.
+
+Si Redis no responde el breaker no estorba: se comporta como cerrado.
+"""
+import os
+import time
+
+from .redis_cliente import obtener_redis
+
+UMBRAL = int(os.environ.get("BREAKER_UMBRAL", "3"))
+ENFRIAMIENTO_S = int(os.environ.get("BREAKER_ENFRIAMIENTO_S", "300"))
+# Lo que puede durar un sondeo antes de que otro worker lo intente de nuevo
+SONDEO_TTL_S = int(os.environ.get("BREAKER_SONDEO_TTL_S", "600"))
+
+CERRADO = "cerrado"
+ABIERTO = "abierto"
+SONDEO = "sondeo"
+
+
+def _clave(nombre: str) -> str:
+    return f"breaker:{nombre}"
+
+
+async def permitir(nombre: str) -> str:
+    """Devuelve CERRADO (correr), SONDEO (correr como prueba) o ABIERTO (no correr)."""
+    if not nombre:
+        return CERRADO
+    try:
+        r = obtener_redis()
+        abierto_hasta = await r.hget(_clave(nombre), "abierto_hasta")
+        if abierto_hasta is None:
+            return CERRADO
+        if time.time() < float(abierto_hasta):
+            return ABIERTO
+        if await r.set(_clave(nombre) + ":sondeo", "1", nx=True, ex=SONDEO_TTL_S):
+            return SONDEO
+        return ABIERTO
+    except Exception as e:
+        print(f"[breaker] Redis no disponible ({e}); {nombre} se ejecuta")
+        return CERRADO
+
+
+async def registrar(nombre: str, ok: bool, estado: str = CERRADO):
+    """Anota el desenlace de una ejecución (la de sondeo incluida)."""
+    if not nombre:
+        return
+    try:
+        r = obtener_redis()
+        clave = _clave(nombre)
+        if ok:
+            await r.delete(clave, clave + ":sondeo")
+            if estado == SONDEO:
+                print(f"[breaker] {nombre}: sondeo exitoso, circuito cerrado")
+            return
+        fallos = await r.hincrby(clave, "fallos", 1)
+        if estado == SONDEO or fallos >= UMBRAL:
+            await r.hset(clave, "abierto_hasta", time.time() + ENFRIAMIENTO_S)
+            # Vencido el enfriamiento la clave debe seguir ahí para que haya sondeo
+            await r.expire(clave, ENFRIAMIENTO_S + SONDEO_TTL_S)
+            await r.delete(clave + ":sondeo")
+            print(f"[breaker] {nombre}: {fallos} fallos seguidos, circuito abierto {ENFRIAMIENTO_S}s")
+        else:
+            await r.expire(clave, ENFRIAMIENTO_S)
+    except Exception as e:
+        print(f"[breaker] No se pudo registrar el resultado de {nombre}: {e}")
+
+
+async def estado(nombre: str) -> dict:
+    r = obtener_redis()
+    datos = await r.hgetall(_clave(nombre))
+    return {
+        "fallos": int(datos.get("fallos", 0)),
+        "abierto_hasta": float(datos["abierto_hasta"]) if "abierto_hasta" in datos else None,
+    }
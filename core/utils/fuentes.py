@@ -0,0 +1,88 @@
+# core/utils/fuentes.py
+"""
+Caché de las Fuentes del proceso, compartida por todos los bots.
+
+Cada bot buscaba su Fuente (`Fuente.objects.get(nombre=NOMBRE_SITIO)`) antes
+de guardar el Resultado, a veces dos veces, y cada búsqueda pasaba por el
+único hilo en el que `sync_to_async` serializa el ORM: 150+ consultas iguales
+por consulta. Aquí la tabla se carga completa una vez en un dict por
+`nombre` y los bots la leen sin tocar la BD ni cambiar de hilo.
+
+Guardar o borrar una Fuente (o un TipoFuente) invalida el mapa por señal
+(core.signals); como otros procesos no reciben esa señal, el mapa además se
+recarga cada `VIGENCIA_S` segundos. Un nombre que no está en el mapa se busca
+en la BD (puede ser una Fuente recién creada) y, si existe, se agrega.
+"""
+import os
+import threading
+import time
+
+from core.models import Fuente
+from . import bd
+
+VIGENCIA_S = float(os.environ.get("FUENTES_CACHE_S", "300"))
+
+_fuentes = {}
+_cargado = None
+_generacion = 0
+_lock = threading.Lock()
+
+
+def _vigente() -> bool:
+    return _cargado is not None and time.monotonic() - _cargado < VIGENCIA_S
+
+
+def cargar() -> dict:
+    """Recarga el mapa nombre -> Fuente desde la BD."""
+    global _fuentes, _cargado
+    generacion = _generacion
+    fuentes = {f.nombre: f for f in Fuente.objects.select_related("tipo")}
+    with _lock:
+        # Si se invalidó mientras se leía, el mapa sirve para esta llamada pero no queda vigente
+        if generacion == _generacion:
+            _fuentes, _cargado = fuentes, time.monotonic()
+    return fuentes
+
+
+def invalidar():
+    """La siguiente búsqueda recarga el mapa (core.signals lo llama al guardar o borrar)."""
+    global _cargado, _generacion
+    with _lock:
+        _cargado = None
+        _generacion += 1
+
+
+def buscar_fuente(nombre: str):
+    """Fuente con `nombre`, o None si no está registrada."""
+    fuentes = _fuentes if _vigente() else cargar()
+    fuente = fuentes.get(nombre)
+    if fuente is None:
+        fuente = Fuente.objects.select_related("tipo").filter(nombre=nombre).first()
+        if fuente is not None:
+            with _lock:
+                _fuentes[nombre] = fuente
+    return fuente
+
+
+def obtener_fuente(nombre: str):
+    """Como `Fuente.objects.get(nombre=...)`: lanza Fuente.DoesNotExist si no está registrada."""
+    fuente = buscar_fuente(nombre)
+    if fuente is None:
+        raise Fuente.DoesNotExist(f"No hay Fuente con nombre '{nombre}'")
+    return fuente
+
+
+async def abuscar_fuente(nombre: str):
+    """`buscar_fuente` para los bots; con el mapa vigente no sale del event loop."""
+    if _vigente():
+        fuente = _fuentes.get(nombre)
+        if fuente is not None:
+            return fuente
+    return await bd.ejecutar(buscar_fuente, nombre)
+
+
+async def aobtener_fuente(nombre: str):
+    fuente = await abuscar_fuente(nombre)
+    if fuente is None:
+        raise Fuente.DoesNotExist(f"No hay Fuente con nombre '{nombre}'")
+    return fuente
@@ -0,0 +1,89 @@
+# core/utils/limite_fuente.py
+"""
+Límite de carga por fuente para todo el clúster, guardado en el Redis del broker.
+
+Una entrada de `get_bot_configs` puede declarar
+`'limite': {'en_vuelo': 4, 'por_minuto': 20}`:
+
+- en_vuelo: sesiones simultáneas contra la fuente entre todos los workers
+  (sorted set de permisos con vencimiento, por si un worker muere con uno tomado).
+- por_minuto: token bucket que se rellena de forma continua; admite ráfagas de
+  hasta `rafaga` (por defecto, el mismo valor de `en_vuelo`).
+
+`intentar_adquirir` nunca espera: si la fuente está saturada devuelve None y
+el planificador usa el slot para otro bot. Se usa WATCH/MULTI en lugar de un
+script Lua para que también funcione contra Redis sin scripting.
+"""
+import time
+import uuid
+
+from .redis_cliente import obtener_redis
+
+# Vida máxima de un permiso en vuelo si nunca se libera
+PERMISO_TTL_S = 900
+REINTENTOS_WATCH = 5
+
+
+def _claves(nombre):
+    return f"limite:{nombre}:vuelo", f"limite:{nombre}:bucket"
+
+
+async def intentar_adquirir(nombre: str, limite: dict):
+    """Devuelve un permiso (str) o None si la fuente está saturada. Sin `limite`, siempre hay permiso."""
+    if not limite or not nombre:
+        return ""
+    en_vuelo = int(limite.get("en_vuelo") or 0)
+    por_minuto = float(limite.get("por_minuto") or 0)
+    rafaga = float(limite.get("rafaga") or en_vuelo or 1)
+    k_vuelo, k_bucket = _claves(nombre)
+    permiso = uuid.uuid4().hex
+
+    try:
+        from redis.exceptions import WatchError
+        r = obtener_redis()
+        async with r.pipeline(transaction=True) as pipe:
+            for _ in range(REINTENTOS_WATCH):
+                try:
+                    await pipe.watch(k_vuelo, k_bucket)
+                    ahora = time.time()
+
+                    if en_vuelo:
+                        await pipe.zremrangebyscore(k_vuelo, "-inf", ahora)
+                        if await pipe.zcard(k_vuelo) >= en_vuelo:
+                            await pipe.unwatch()
+                            return None
+
+                    if por_minuto:
+                        bucket = await pipe.hgetall(k_bucket)
+                        tokens = float(bucket.get("tokens", rafaga))
+                        ts = float(bucket.get("ts", ahora))
+                        tokens = min(rafaga, tokens + (ahora - ts) * por_minuto / 60.0)
+                        if tokens < 1:
+                            await pipe.unwatch()
+                            return None
+
+                    pipe.multi()
+                    if en_vuelo:
+                        pipe.zadd(k_vuelo, {permiso: ahora + PERMISO_TTL_S})
+                        pipe.expire(k_vuelo, PERMISO_TTL_S)
+                    if por_minuto:
+                        pipe.hset(k_bucket, mapping={"tokens": tokens - 1, "ts": ahora})
+                        pipe.expire(k_bucket, int(60 * rafaga / por_minuto) + 60)
+                    await pipe.execute()
+                    return permiso
+                except WatchError:
+                    continue
+        # Mucha contención: se trata como saturada y se reintenta luego
+        return None
+    except Exception as e:
+        print(f"[limite] Redis no disponible ({e}); {nombre} corre sin límite")
+        return ""
+
+
+async def liberar(nombre: str, permiso: str):
+    if not permiso:
+        return
+    try:
+        await obtener_redis().zrem(_claves(nombre)[0], permiso)
+    except Exception as e:
+        print(f"[limite] No se pudo liberar el permiso de {nombre}: {e}")
@@ -0,0 +1,160 @@
+# core/utils/pdf_texto.py
+"""
+Índice de texto de PDFs estáticos, extraído una sola vez por contenido.
+
+Buscar con `page.search_for` página por página vuelve a leer y a maquetar
+todo el PDF en cada consulta. Aquí el texto se extrae una vez por PDF (la
+clave es el sha256 de sus bytes, así que una nueva publicación del mismo
+archivo se reindexa sola) a palabras plegadas con su caja por página, y se
+guarda en memoria y en disco (MEDIA_ROOT/cache_pdf/<sha256>.json.gz) para
+compartirlo entre procesos y reinicios. Las búsquedas se responden desde ese
+índice; el PDF sólo se vuelve a abrir para pintar las páginas que coinciden.
+"""
+import gzip
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+import fitz  # PyMuPDF
+from django.conf import settings
+
+from core.matching.normalizar import plegar
+
+MEMORIA = int(os.environ.get("PDF_TEXTO_MEMORIA", "32"))
+# Largo mínimo de los tokens que se resaltan sueltos cuando no aparece el nombre completo
+MINIMO_TOKEN = 3
+
+_memo = OrderedDict()
+_lock = threading.Lock()
+
+
+def _carpeta() -> str:
+    return os.environ.get("PDF_TEXTO_CACHE") or os.path.join(settings.MEDIA_ROOT, "cache_pdf")
+
+
+def huella(ruta: str) -> str:
+    h = hashlib.sha256()
+    with open(ruta, "rb") as fh:
+        for bloque in iter(lambda: fh.read(1 << 20), b""):
+            h.update(bloque)
+    return h.hexdigest()
+
+
+def extraer(ruta: str) -> list:
+    """Por página, las palabras plegadas [texto, x0, y0, x1, y1] en orden de lectura."""
+    paginas = []
+    with fitz.open(ruta) as doc:
+        for pagina in doc:
+            palabras = []
+            for x0, y0, x1, y1, texto, *_ in pagina.get_text("words", sort=True):
+                # 'O'Brien' se pliega a dos tokens: ambos quedan con la caja de la palabra
+                for t in plegar(texto).split():
+                    palabras.append([t, round(x0, 2), round(y0, 2), round(x1, 2), round(y1, 2)])
+            paginas.append(palabras)
+    return paginas
+
+
+def indexar(ruta: str) -> list:
+    """Páginas indexadas de `ruta`, desde la memoria, el disco o extrayéndolas ahora."""
+    clave = huella(ruta)
+    with _lock:
+        if clave in _memo:
+            _memo.move_to_end(clave)
+            return _memo[clave]
+    archivo = os.path.join(_carpeta(), f"{clave}.json.gz")
+    paginas = None
+    if os.path.exists(archivo):
+        try:
+            with gzip.open(archivo, "rt", encoding="utf-8") as fh:
+                paginas = json.load(fh)
+        except (OSError, ValueError) as e:
+            print(f"[pdf_texto] Cache ilegible {archivo}, se vuelve a extraer: {e}")
+    if paginas is None:
+        paginas = extraer(ruta)
+        os.makedirs(_carpeta(), exist_ok=True)
+        temporal = f"{archivo}.{os.getpid()}.tmp"
+        with gzip.open(temporal, "wt", encoding="utf-8") as fh:
+            json.dump(paginas, fh)
+        os.replace(temporal, archivo)
+    with _lock:
+        _memo[clave] = paginas
+        while len(_memo) > MEMORIA:
+            _memo.popitem(last=False)
+    return paginas
+
+
+def _coincide(palabra: str, token: str, k: int, n: int, parcial: bool) -> bool:
+    if not parcial or 0 < k < n - 1:
+        return palabra == token
+    # Como `search_for`: la frase puede empezar y terminar a mitad de palabra
+    if n == 1:
+        return token in palabra
+    return palabra.endswith(token) if k == 0 else palabra.startswith(token)
+
+
+def _frase(palabras, tokens, parcial=False):
+    n = len(tokens)
+    return [
+        palabras[i:i + n]
+        for i in range(len(palabras) - n + 1)
+        if all(_coincide(palabras[i + k][0], tokens[k], k, n, parcial) for k in range(n))
+    ]
+
+
+def _unir(grupo):
+    """Cajas de una aparición: una por renglón, como los quads de `search_for`."""
+    cajas = []
+    for _, x0, y0, x1, y1 in grupo:
+        if cajas and abs(cajas[-1][3] - y1) < 1:
+            a0, b0, a1, b1 = cajas[-1]
+            cajas[-1] = (min(a0, x0), min(b0, y0), max(a1, x1), max(b1, y1))
+        else:
+            cajas.append((x0, y0, x1, y1))
+    return cajas
+
+
+def buscar(ruta: str, consulta: str, por_tokens: bool = False, limite_paginas: int = None,
+           parcial: bool = False):
+    """
+    [(índice de página, [cajas (x0, y0, x1, y1)])] de las páginas donde aparece
+    `consulta` completa (sin tildes ni mayúsculas, tolerando saltos de línea).
+    Con `parcial` también vale como parte de una palabra, igual que
+    `page.search_for` ('Pere' encuentra 'PÉREZ', '45678' un documento). Con
+    `por_tokens`, en las páginas sin la frase completa cuentan también sus
+    tokens de `MINIMO_TOKEN`+ letras sueltos.
+    """
+    tokens = plegar(consulta).split()
+    if not tokens:
+        return []
+    sueltos = {t for t in tokens if len(t) >= MINIMO_TOKEN} if por_tokens else set()
+    coincidencias = []
+    for i, palabras in enumerate(indexar(ruta)[:limite_paginas]):
+        cajas = [caja for grupo in _frase(palabras, tokens, parcial) for caja in _unir(grupo)]
+        if not cajas and sueltos:
+            cajas = [tuple(p[1:]) for p in palabras if p[0] in sueltos]
+        if cajas:
+            coincidencias.append((i, cajas))
+    return coincidencias
+
+
+def resaltar(ruta: str, coincidencias, carpeta: str, dpi: int = 150, prefijo: str = "") -> list:
+    """PNG (ruta absoluta) de cada página con coincidencias, con las cajas resaltadas."""
+    if not coincidencias:
+        return []
+    os.makedirs(carpeta, exist_ok=True)
+    prefijo = prefijo or os.path.splitext(os.path.basename(ruta))[0]
+    salidas = []
+    with fitz.open(ruta) as doc:
+        for i, cajas in coincidencias:
+            pagina = doc[i]
+            for caja in cajas:
+                try:
+                    pagina.add_highlight_annot(fitz.Rect(caja))
+                except Exception:
+                    pass
+            salida = os.path.join(carpeta, f"{prefijo}_match_p{i + 1}.png")
+            pagina.get_pixmap(dpi=dpi, annots=True).save(salida)
+            salidas.append(salida)
+    return salidas
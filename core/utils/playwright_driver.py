@@ -0,0 +1,111 @@
+# core/utils/playwright_driver.py
+"""
+Conexión Playwright persistente por proceso.
+
+Cada `async_playwright()` arranca un subproceso Node (el driver) y lo mata al
+salir del bloque. Aquí se arranca una sola vez en el loop de
+`core.utils.bot_runtime` y la comparten todas las corrutinas de bots. Un
+vigilante hace ping periódico al driver y lo reinicia si murió; cada reinicio
+incrementa `generacion` para que el pool de navegadores sepa que los suyos
+quedaron huérfanos.
+"""
+import asyncio
+import os
+
+from playwright.async_api import async_playwright as _async_playwright_real
+
+PING_INTERVALO_S = float(os.environ.get("PLAYWRIGHT_PING_INTERVALO_S", "30"))
+PING_TIMEOUT_S = float(os.environ.get("PLAYWRIGHT_PING_TIMEOUT_S", "10"))
+
+_pw = None
+_pid = None
+_generacion = 0
+_arranque = None
+_vigilante = None
+_reinicios = 0
+
+
+def generacion() -> int:
+    """Número de veces que se ha (re)arrancado el driver en este proceso."""
+    return _generacion
+
+
+async def _arrancar():
+    global _pw, _pid, _generacion, _vigilante
+    _pw = await _async_playwright_real().start()
+    _pid = os.getpid()
+    _generacion += 1
+    print(f"[playwright] Driver arrancado (generación {_generacion})")
+    if _vigilante is None or _vigilante.done():
+        _vigilante = asyncio.ensure_future(_vigilar())
+    return _pw
+
+
+async def obtener_playwright():
+    """Instancia Playwright compartida; sólo válida dentro del loop de `bot_runtime`."""
+    global _arranque
+    if _pw is not None and _pid == os.getpid():
+        return _pw
+    # Tras un fork, el driver del padre no es utilizable desde el hijo
+    if _arranque is None or _arranque.done():
+        _arranque = asyncio.ensure_future(_arrancar())
+    try:
+        return await asyncio.shield(_arranque)
+    except Exception:
+        _arranque = None
+        raise
+
+
+async def ping() -> bool:
+    """Ida y vuelta barata al driver: crea y descarta un APIRequestContext."""
+    if _pw is None:
+        return False
+    try:
+        ctx = await asyncio.wait_for(_pw.request.new_context(), PING_TIMEOUT_S)
+        await ctx.dispose()
+        return True
+    except Exception:
+        return False
+
+
+async def reiniciar(motivo: str = ""):
+    """Descarta el driver actual (vivo o no) y arranca uno nuevo."""
+    global _pw, _arranque, _reinicios
+    viejo, _pw, _arranque = _pw, None, None
+    _reinicios += 1
+    print(f"[playwright] Reiniciando driver {('(' + motivo + ')') if motivo else ''}")
+    if viejo is not None:
+        try:
+            await asyncio.wait_for(viejo.stop(), PING_TIMEOUT_S)
+        except Exception:
+            pass
+    return await obtener_playwright()
+
+
+async def _vigilar():
+    while True:
+        await asyncio.sleep(PING_INTERVALO_S)
+        if _pw is None:
+            continue
+        if not await ping():
+            try:
+                await reiniciar("sin respuesta al ping")
+            except Exception as e:
+                print(f"[playwright] No se pudo reiniciar el driver: {e}")
+
+
+async def detener():
+    global _pw, _arranque, _vigilante
+    if _vigilante is not None:
+        _vigilante.cancel()
+        _vigilante = None
+    viejo, _pw, _arranque = _pw, None, None
+    if viejo is not None:
+        try:
+            await viejo.stop()
+        except Exception:
+            pass
+
+
+def estado() -> dict:
+    return {"activo": _pw is not None, "generacion": _generacion, "reinicios": _reinicios}
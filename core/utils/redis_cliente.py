@@ -0,0 +1,37 @@
+# core/utils/redis_cliente.py
+"""
+Cliente Redis asíncrono compartido por los bots de un proceso.
+
+Usa el mismo Redis del broker de Celery (env `REDIS_URL` para apuntar a
+otro). El cliente queda atado al loop de `core.utils.bot_runtime`, así que se
+crea perezosamente la primera vez que se pide dentro de ese loop.
+"""
+import os
+
+from django.conf import settings
+
+_cliente = None
+_pid = None
+
+
+def url_redis() -> str:
+    return os.environ.get("REDIS_URL") or getattr(settings, "CELERY_BROKER_URL", "redis://localhost:6379/0")
+
+
+def obtener_redis():
+    """Cliente `redis.asyncio` del proceso."""
+    global _cliente, _pid
+    if _cliente is None or _pid != os.getpid():
+        import redis.asyncio as redis_async
+        _cliente = redis_async.Redis.from_url(
+            url_redis(), decode_responses=True, socket_timeout=2, socket_connect_timeout=2
+        )
+        _pid = os.getpid()
+    return _cliente
+
+
+def fijar_redis(cliente):
+    """Sustituye el cliente del proceso (p.ej. fakeredis en pruebas)."""
+    global _cliente, _pid
+    _cliente = cliente
+    _pid = os.getpid()
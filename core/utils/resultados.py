@@ -0,0 +1,142 @@
+# core/utils/resultados.py
+"""
+Guardado por lotes de los Resultados que producen los bots de una consulta.
+
+Cada bot guardaba su Resultado con `sync_to_async(Resultado.objects.create)`:
+con SQLite y `thread_sensitive`, 150 bots simultáneos hacían fila detrás del
+único hilo del ORM y del único candado de escritura de la BD. Mientras corre
+`ejecutar_bots`, un SumideroResultados junta los Resultados (normalizados con
+`Resultado.normalizar`, igual que en `save`) y los escribe con `bulk_create`
+cada `INTERVALO_S` segundos o en cuanto hay `LOTE` pendientes. Al salir del
+bloque, también si la tarea se cancela o algo revienta, se escribe lo que
+quede.
+
+Los bots llaman `crear_resultado(...)` con los mismos argumentos que
+`Resultado.objects.create`. Fuera de un sumidero (reintentos, shell) o si el
+bot termina después de cerrado, el Resultado se guarda de inmediato.
+"""
+import asyncio
+import contextvars
+import os
+
+from django.db import transaction
+
+from core.models import Resultado
+from . import bd
+from .fuentes import abuscar_fuente
+
+LOTE = int(os.environ.get("RESULTADOS_LOTE", "25"))
+INTERVALO_S = float(os.environ.get("RESULTADOS_INTERVALO_S", "1"))
+
+_sumidero = contextvars.ContextVar("sumidero_resultados", default=None)
+
+
+def _guardar(resultados):
+    try:
+        with transaction.atomic():
+            Resultado.objects.bulk_create(resultados)
+    except Exception as e:
+        # Un resultado inválido (p.ej. de una consulta ya borrada) no debe hacer perder el lote
+        print(f"[resultados] bulk_create de {len(resultados)} falló ({e}); se guardan uno a uno")
+        for r in resultados:
+            try:
+                r.save()
+            except Exception as e:
+                print(f"[resultados] No se guardó el resultado de la fuente {r.fuente_id} "
+                      f"para la consulta {r.consulta_id}: {e}")
+
+
+class SumideroResultados:
+    """Contexto asíncrono que junta los Resultados de los bots y los escribe por lotes."""
+
+    def __init__(self, lote: int = LOTE, intervalo_s: float = INTERVALO_S):
+        self.lote = max(1, lote)
+        self.intervalo_s = intervalo_s
+        self.cerrado = False
+        self.escritos = 0
+        self._pendientes = []
+        self._escribiendo = []
+        self._lleno = asyncio.Event()
+        self._escritura = asyncio.Lock()
+        self._ciclo = None
+        self._token = None
+
+    def agregar(self, resultado: Resultado):
+        self._pendientes.append(resultado)
+        if len(self._pendientes) >= self.lote:
+            self._lleno.set()
+
+    def pendiente(self, consulta_id, fuente_id):
+        """Último Resultado aún sin escribir de esa consulta y fuente, o None."""
+        for r in reversed(self._escribiendo + self._pendientes):
+            if str(r.consulta_id) == str(consulta_id) and r.fuente_id == fuente_id:
+                return r
+        return None
+
+    async def vaciar(self):
+        async with self._escritura:
+            if not self._pendientes:
+                return
+            lote, self._pendientes = self._pendientes, []
+            self._lleno.clear()
+            self._escribiendo = lote
+            escritura = asyncio.ensure_future(bd.escribir(_guardar, lote))
+            try:
+                await asyncio.shield(escritura)
+            except asyncio.CancelledError:
+                # El hilo sigue escribiendo: quien espere el candado no debe adelantarse a este lote
+                await asyncio.wait({escritura})
+                raise
+            finally:
+                self._escribiendo = []
+            self.escritos += len(lote)
+
+    async def _vaciar_periodicamente(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._lleno.wait(), timeout=self.intervalo_s)
+            except asyncio.TimeoutError:
+                pass
+            try:
+                await self.vaciar()
+            except Exception as e:
+                print(f"[resultados] Falló el guardado por lotes, se reintenta: {e}")
+
+    async def __aenter__(self):
+        self._token = _sumidero.set(self)
+        self._ciclo = asyncio.ensure_future(self._vaciar_periodicamente())
+        return self
+
+    async def _cerrar(self):
+        self._ciclo.cancel()
+        # `wait` no propaga la cancelación del ciclo
+        await asyncio.wait({self._ciclo})
+        await self.vaciar()
+
+    async def __aexit__(self, tipo, error, traza):
+        self.cerrado = True
+        _sumidero.reset(self._token)
+        # Si cancelan la tarea durante el cierre, el `shield` deja terminar la escritura
+        await asyncio.shield(self._cerrar())
+        return False
+
+
+async def crear_resultado(**campos) -> Resultado:
+    """Como `Resultado.objects.create`, pero dentro de un sumidero sólo lo encola."""
+    resultado = Resultado(**campos)
+    resultado.normalizar()
+    sumidero = _sumidero.get()
+    if sumidero is None or sumidero.cerrado:
+        await bd.escribir(resultado.save)
+    else:
+        sumidero.agregar(resultado)
+    return resultado
+
+
+async def pendiente(consulta_id, nombre_fuente: str):
+    """Resultado de `nombre_fuente` para `consulta_id` que el sumidero activo aún no escribe."""
+    sumidero = _sumidero.get()
+    if sumidero is None:
+        return None
+    fuente = await abuscar_fuente(nombre_fuente)
+    return sumidero.pendiente(consulta_id, fuente.id if fuente else None)
@@ -0,0 +1,91 @@
+# core/utils/reutilizacion.py
+"""
+Reutilización de resultados entre consultas.
+
+Si el mismo usuario consultó hace poco a la misma persona (cédula del
+candidato), el Resultado de una fuente con `ttl_reutilizacion_h > 0` se copia
+a la consulta nueva en lugar de volver a correr el bot. La copia apunta al
+original con `reutilizado_de`, su pantallazo se duplica en la carpeta de la
+consulta nueva y se escribe con `resultados.crear_resultado`, como la de
+cualquier bot. Un usuario nunca recibe resultados de consultas ajenas.
+"""
+import os
+import shutil
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+from core.models import Consulta, Resultado
+from . import bd, resultados
+from .fuentes import buscar_fuente
+
+
+def buscar_previo(consulta, fuente):
+    """Resultado original más reciente y aún vigente de `fuente` para el candidato y el usuario de `consulta`."""
+    if fuente is None or not fuente.ttl_reutilizacion_h:
+        return None
+    limite = timezone.now() - timedelta(hours=fuente.ttl_reutilizacion_h)
+    return (
+        Resultado.objects
+        .filter(
+            fuente=fuente,
+            consulta__candidato_id=consulta.candidato_id,
+            consulta__usuario_id=consulta.usuario_id,
+            fecha__gte=limite,
+            reutilizado_de__isnull=True,
+        )
+        .exclude(consulta_id=consulta.id)
+        # Un offline no dice nada de la persona: mejor reintentar en vivo
+        .exclude(estado="offline")
+        .order_by("-fecha")
+        .first()
+    )
+
+
+def _copiar_archivo(archivo, consulta_id):
+    """Copia el pantallazo a `resultados/<consulta_id>/`; si no existe, se deja la ruta original."""
+    origen = os.path.join(settings.MEDIA_ROOT, archivo)
+    if not archivo or not os.path.isfile(origen):
+        return archivo
+    relativo = os.path.join("resultados", str(consulta_id), os.path.basename(archivo))
+    destino = os.path.join(settings.MEDIA_ROOT, relativo)
+    if os.path.abspath(destino) != os.path.abspath(origen):
+        os.makedirs(os.path.dirname(destino), exist_ok=True)
+        shutil.copy2(origen, destino)
+    return relativo
+
+
+def _preparar_sincrono(consulta_id, nombre_fuente):
+    """(previo, archivo copiado) o None si no hay nada vigente que reutilizar."""
+    consulta = Consulta.objects.filter(id=consulta_id).first()
+    fuente = buscar_fuente(nombre_fuente)
+    if consulta is None:
+        return None
+    previo = buscar_previo(consulta, fuente)
+    if previo is None:
+        return None
+    return previo, _copiar_archivo(previo.archivo, consulta_id)
+
+
+async def copiar(previo, consulta_id, archivo):
+    return await resultados.crear_resultado(
+        consulta_id=consulta_id,
+        fuente_id=previo.fuente_id,
+        score=previo.score,
+        estado=previo.estado,
+        mensaje=previo.mensaje,
+        archivo=archivo,
+        reutilizado_de=previo,
+    )
+
+
+async def reutilizar(consulta_id, nombre_fuente):
+    """Copia un resultado vigente a `consulta_id`; devuelve el nuevo Resultado o None."""
+    if consulta_id is None or not nombre_fuente:
+        return None
+    preparado = await bd.ejecutar(_preparar_sincrono, consulta_id, nombre_fuente)
+    if preparado is None:
+        return None
+    previo, archivo = preparado
+    return await copiar(previo, consulta_id, archivo)
@@ -0,0 +1,30 @@
+# core/utils/sqlite.py
+"""
+Modo de escritura concurrente de SQLite (opt-in con `SQLITE_CONCURRENTE`).
+
+En producción la API (gunicorn), varios workers de Celery y los bots escriben
+en el mismo /data/db.sqlite3. Con el journal por defecto un escritor bloquea
+también a los lectores y, sin espera, el resto falla con "database is locked".
+Con el modo activo cada conexión nueva pasa a journal WAL (los lectores no
+esperan al escritor) con los PRAGMAs de `settings.SQLITE_PRAGMAS`, y espera
+hasta `SQLITE_BUSY_TIMEOUT_S` a que se libere el candado en vez de fallar.
+"""
+from django.conf import settings
+
+
+def aplicar_pragmas(cursor, pragmas: dict = None, busy_timeout_s: float = None):
+    for nombre, valor in (settings.SQLITE_PRAGMAS if pragmas is None else pragmas).items():
+        cursor.execute(f"PRAGMA {nombre} = {valor}")
+    espera = settings.SQLITE_BUSY_TIMEOUT_S if busy_timeout_s is None else busy_timeout_s
+    cursor.execute(f"PRAGMA busy_timeout = {int(espera * 1000)}")
+
+
+def configurar_conexion(connection):
+    """Se llama al crear cada conexión de Django (core.signals)."""
+    if connection.vendor != "sqlite" or not settings.SQLITE_CONCURRENTE:
+        return
+    # En memoria (tests) no hay journal que cambiar
+    if connection.is_in_memory_db():
+        return
+    with connection.cursor() as cursor:
+        aplicar_pragmas(cursor)
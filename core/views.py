@@ -22,8 +22,8 @@ from rest_framework.permissions import IsAuthenticated
 from .serializers import ConsultaDetalleSerializer, ResultadoSerializer
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny
-from asgiref.sync import async_to_sync
 from .consultar_registraduria import consultar_registraduria
+from .utils import bot_runtime
 from django.template.loader import render_to_string
 from django.http import HttpResponse
 from weasyprint import HTML
@@ -270,7 +270,6 @@ def activate(request, uidb64, token):
     return Response({"error": "Token inválido o expirado"}, status=status.HTTP_400_BAD_REQUEST)
 
 
-from asgiref.sync import async_to_sync
 import asyncio
 
 
@@ -467,6 +466,8 @@ def api_consultar(request):
     tipo_doc_req = request.data.get("tipo_doc")
     fecha_expedicion_req = request.data.get("fecha_expedicion")
     lista_nombres = request.data.get("lista_nombres")
+    # Fuerza a consultar todas las fuentes en vivo, sin reutilizar resultados recientes
+    forzar = str(request.data.get("forzar", "")).strip().lower() in ("1", "true", "si", "sí")
 
     # parámetros opcionales que activan lógica de contratista (NUEVO)
     email_param = (request.data.get("email") or "").strip()
@@ -586,7 +587,8 @@ def api_consultar(request):
                     if restos:
                         await asyncio.gather(*restos, return_exceptions=True)
 
-            datos = async_to_sync(obtener_datos)() or {}
+            # En el loop persistente del proceso, así los bots base reutilizan el driver de Playwright
+            datos = bot_runtime.ejecutar(obtener_datos()) or {}
 
             if fecha_expedicion_req:
                 datos["fecha_expedicion"] = fecha_expedicion_req
@@ -642,6 +644,7 @@ def api_consultar(request):
             }
         else:
             datos = {"duenio_token": duenio_token, "plan": perfil.plan}
+        datos["forzar"] = forzar
 
         # Backfill de BOTS_CONTRATISTA_FIJOS si no existe
         try:
@@ -1148,7 +1151,7 @@ def listar_resultados_interno(consulta_id):
 
     qs = (
         Resultado.objects
-        .select_related("fuente", "fuente__tipo", "consulta")
+        .select_related("fuente", "fuente__tipo", "consulta", "reutilizado_de")
         .filter(consulta_id=consulta_id)
         .annotate(prioridad_tipo=prioridad)
         .order_by("prioridad_tipo", "fuente__tipo__nombre", "fuente__nombre")
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+"""
+Compara el arranque de un worker con la lista de bots perezosa frente a la
+importación completa de antes (todos los módulos de core/bots cargados al
+importar bot_configs).
+
+Cada modo corre en un subproceso limpio y mide tiempo de importación y RSS.
+
+    python scripts/benchmark_arranque_bots.py [--repeticiones 3]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+HIJO = r"""
+import json, os, sys, time
+sys.path.insert(0, {root!r})
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+
+def rss_mb():
+    with open('/proc/self/statm') as fh:
+        return int(fh.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1048576
+
+import django
+django.setup()
+base = rss_mb()
+t0 = time.perf_counter()
+
+from core.bots import registro
+from core.bots.bot_configs import get_bot_configs
+errores = 0
+if {modo!r} == 'antes':
+    # Lo que hacían los `from .x import consultar_x` al importar bot_configs
+    import importlib
+    for entrada in registro.registro().values():
+        try:
+            importlib.import_module(entrada['ruta'].rpartition('.')[0])
+        except Exception:
+            errores += 1
+# Lo que hace reintentar_bot para encontrar un bot
+bot = registro.indice(get_bot_configs(0, registro._datos_vacios())).get('policia_nacional')
+
+print(json.dumps({{
+    'segundos': time.perf_counter() - t0,
+    'rss_mb': rss_mb(),
+    'rss_extra_mb': rss_mb() - base,
+    'modulos': len(sys.modules),
+    'errores': errores,
+}}))
+"""
+
+
+def medir(modo):
+    salida = subprocess.run(
+        [sys.executable, '-c', HIJO.format(root=PROJECT_ROOT, modo=modo)],
+        capture_output=True, text=True, cwd=PROJECT_ROOT,
+    )
+    if salida.returncode != 0:
+        raise SystemExit(f"Falló el modo {modo}:\n{salida.stderr}")
+    return json.loads(salida.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeticiones', type=int, default=3)
+    args = parser.parse_args()
+
+    resultados = {}
+    for modo in ('antes', 'despues'):
+        medidas = [medir(modo) for _ in range(args.repeticiones)]
+        resultados[modo] = {
+            'segundos': min(m['segundos'] for m in medidas),
+            'rss_mb': min(m['rss_mb'] for m in medidas),
+            'rss_extra_mb': min(m['rss_extra_mb'] for m in medidas),
+            'modulos': medidas[0]['modulos'],
+            'errores': medidas[0]['errores'],
+        }
+
+    print(f"{'modo':<10}{'importación (s)':>18}{'RSS (MB)':>12}{'RSS extra':>12}{'módulos':>10}")
+    for modo, r in resultados.items():
+        print(f"{modo:<10}{r['segundos']:>18.3f}{r['rss_mb']:>12.1f}{r['rss_extra_mb']:>12.1f}{r['modulos']:>10}")
+    if resultados['antes']['errores']:
+        print(f"({resultados['antes']['errores']} módulos de bots no se pudieron importar en este entorno)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+"""
+Mide cuánto esperan los bots a la BD durante una consulta completa simulada,
+con la persistencia de antes (`sync_to_async` con su hilo compartido: Fuente
+con `objects.get` y Resultado con `objects.create`) frente a la de ahora
+(caché de Fuentes, sumidero por lotes y el pool de core.utils.bd).
+
+Cada bot "navega" (un sleep), busca su Fuente, hace una lectura, uno de cada
+diez una escritura lenta, y guarda su Resultado. Se reporta el retraso del
+event loop (un tic de 5 ms que llega tarde) y la espera de BD por bot. Cada
+modo corre en un subproceso con un SQLite temporal recién migrado.
+
+    python scripts/benchmark_bd_bots.py [--bots 150] [--slots 50] [--hilos 4]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+HIJO = r"""
+import asyncio, json, os, random, sys, tempfile, time
+sys.path.insert(0, {root!r})
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+import django
+django.setup()
+from django.db import connections
+connections['default'].settings_dict['NAME'] = os.path.join(tempfile.mkdtemp(), 'bench.sqlite3')
+from django.core.management import call_command
+call_command('migrate', verbosity=0)
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import User
+from core.models import Candidato, Consulta, Fuente, Resultado, TipoFuente
+from core.utils import bd, resultados
+from core.utils.fuentes import aobtener_fuente
+
+MODO, BOTS, SLOTS = {modo!r}, {bots}, {slots}
+tipo = TipoFuente.objects.create(nombre='bench', peso=1, probabilidad=1)
+Fuente.objects.bulk_create([Fuente(nombre=f'bot_{{i}}', nombre_pila=f'bot_{{i}}', tipo=tipo) for i in range(BOTS)])
+consulta = Consulta.objects.create(candidato=Candidato.objects.create(cedula='1'), usuario=User.objects.create(username='bench'))
+
+def escritura_lenta():
+    # Un bot que guarda algo pesado: mantiene ocupado el hilo que le toque
+    Consulta.objects.filter(id=consulta.id).update(estado='en_proceso')
+    time.sleep(0.05)
+
+def lectura():
+    return Consulta.objects.filter(id=consulta.id).exists()
+
+async def bot(i, rnd, esperas):
+    await asyncio.sleep(rnd.uniform(0.05, 0.4))
+    t0 = time.perf_counter()
+    if MODO == 'antes':
+        fuente = await sync_to_async(Fuente.objects.get)(nombre=f'bot_{{i}}')
+        await sync_to_async(lectura)()
+        if i % 10 == 0:
+            await sync_to_async(escritura_lenta)()
+        await sync_to_async(Resultado.objects.create)(consulta_id=consulta.id, fuente=fuente, score=0, estado='Validada')
+    else:
+        fuente = await aobtener_fuente(f'bot_{{i}}')
+        await bd.ejecutar(lectura)
+        if i % 10 == 0:
+            await bd.ejecutar(escritura_lenta)
+        await resultados.crear_resultado(consulta_id=consulta.id, fuente=fuente, score=0, estado='Validada')
+    esperas.append(time.perf_counter() - t0)
+
+async def consulta_completa():
+    rnd, esperas, retrasos = random.Random(7), [], []
+    corriendo = True
+
+    async def tic():
+        while corriendo:
+            t = time.perf_counter()
+            await asyncio.sleep(0.005)
+            retrasos.append(max(0.0, time.perf_counter() - t - 0.005))
+
+    monitor = asyncio.ensure_future(tic())
+    cupo = asyncio.Semaphore(SLOTS)
+
+    async def en_slot(i):
+        async with cupo:
+            await bot(i, rnd, esperas)
+
+    t0 = time.perf_counter()
+    if MODO == 'antes':
+        await asyncio.gather(*(en_slot(i) for i in range(BOTS)))
+    else:
+        async with resultados.SumideroResultados():
+            await asyncio.gather(*(en_slot(i) for i in range(BOTS)))
+    wall = time.perf_counter() - t0
+    corriendo = False
+    await monitor
+    return wall, esperas, retrasos
+
+wall, esperas, retrasos = asyncio.run(consulta_completa())
+assert Resultado.objects.filter(consulta=consulta).count() == BOTS
+esperas.sort(); retrasos.sort()
+p = lambda xs, q: xs[min(len(xs) - 1, int(q * len(xs)))]
+print(json.dumps({{
+    'wall_s': wall,
+    'espera_p50_ms': p(esperas, 0.5) * 1000,
+    'espera_p95_ms': p(esperas, 0.95) * 1000,
+    'espera_max_ms': esperas[-1] * 1000,
+    'loop_total_ms': sum(retrasos) * 1000,
+    'loop_p99_ms': p(retrasos, 0.99) * 1000,
+    'loop_max_ms': retrasos[-1] * 1000,
+}}))
+"""
+
+
+def medir(modo, args):
+    entorno = dict(os.environ, BOT_BD_HILOS=str(args.hilos))
+    salida = subprocess.run(
+        [sys.executable, '-c', HIJO.format(root=PROJECT_ROOT, modo=modo, bots=args.bots, slots=args.slots)],
+        capture_output=True, text=True, cwd=PROJECT_ROOT, env=entorno,
+    )
+    if salida.returncode != 0:
+        raise SystemExit(f"Falló el modo {modo}:\n{salida.stderr}")
+    return json.loads(salida.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--bots', type=int, default=150)
+    parser.add_argument('--slots', type=int, default=50)
+    parser.add_argument('--hilos', type=int, default=4, help='BOT_BD_HILOS del modo "despues"')
+    args = parser.parse_args()
+
+    columnas = [
+        ('wall_s', 'wall (s)', 1), ('espera_p50_ms', 'BD p50 ms', 1000), ('espera_p95_ms', 'BD p95 ms', 1000),
+        ('espera_max_ms', 'BD max ms', 1000), ('loop_total_ms', 'loop total ms', 1000),
+        ('loop_p99_ms', 'loop p99 ms', 1000), ('loop_max_ms', 'loop max ms', 1000),
+    ]
+    print(f"{'modo':<10}" + "".join(f"{titulo:>15}" for _, titulo, _ in columnas))
+    for modo in ('antes', 'despues'):
+        r = medir(modo, args)
+        print(f"{modo:<10}" + "".join(f"{r[clave]:>15.{3 if escala == 1 else 1}f}" for clave, _, escala in columnas))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+"""
+Prueba de estrés de escritura concurrente sobre SQLite: N consultas a la vez,
+cada una en su propio proceso (como los workers de Celery), con sus bots
+guardando Resultados por el sumidero (core.utils.resultados), otros hilos
+actualizando la Consulta y un lector haciendo de API.
+
+Corre con el modo por defecto y con SQLITE_CONCURRENTE (WAL, PRAGMAs y busy
+timeout) sobre un SQLite temporal recién migrado, y
+reporta filas perdidas y errores "database is locked". Sale con código 1 si
+el modo concurrente pierde filas o tiene errores.
+
+    python scripts/estres_sqlite.py [--consultas 8] [--bots 150]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+PREPARAR = r"""
+import os, sys
+sys.path.insert(0, {root!r})
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+import django
+django.setup()
+from django.db import connections
+connections['default'].settings_dict['NAME'] = {db!r}
+from django.core.management import call_command
+call_command('migrate', verbosity=0)
+from django.contrib.auth.models import User
+from core.models import Fuente, TipoFuente
+tipo = TipoFuente.objects.create(nombre='estres', peso=1, probabilidad=1)
+Fuente.objects.bulk_create([Fuente(nombre=f'bot_{{i}}', nombre_pila=f'bot_{{i}}', tipo=tipo) for i in range({bots})])
+User.objects.create(username='estres')
+"""
+
+CONSULTA = r"""
+import asyncio, json, os, random, sys, threading, time
+sys.path.insert(0, {root!r})
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+import django
+django.setup()
+from django.db import connections
+connections['default'].settings_dict['NAME'] = {db!r}
+from django.contrib.auth.models import User
+from core.models import Candidato, Consulta, Resultado
+from core.utils import bd, resultados
+from core.utils.fuentes import aobtener_fuente
+
+consulta = Consulta.objects.create(
+    candidato=Candidato.objects.create(cedula=str({n})), usuario=User.objects.get(username='estres')
+)
+errores = []
+leyendo = True
+
+def lector():
+    # La API consultando el avance mientras tanto
+    while leyendo:
+        try:
+            list(Resultado.objects.filter(consulta=consulta).values_list('estado', flat=True))
+        except Exception as e:
+            errores.append(str(e))
+        time.sleep(0.01)
+
+def avance():
+    Consulta.objects.filter(id=consulta.id).update(estado='en_proceso')
+
+async def bot(i, rnd):
+    await asyncio.sleep(rnd.uniform(0, 0.5))
+    fuente = await aobtener_fuente(f'bot_{{i}}')
+    if i % 5 == 0:
+        try:
+            await bd.ejecutar(avance)
+        except Exception as e:
+            errores.append(str(e))
+    await resultados.crear_resultado(consulta_id=consulta.id, fuente=fuente, score=0, estado='Validada')
+
+async def correr():
+    rnd = random.Random({n})
+    async with resultados.SumideroResultados(lote=10, intervalo_s=0.1):
+        await asyncio.gather(*(bot(i, rnd) for i in range({bots})))
+
+time.sleep(max(0.0, {inicio} - time.time()))
+hilo = threading.Thread(target=lector)
+hilo.start()
+t0 = time.perf_counter()
+asyncio.run(correr())
+segundos = time.perf_counter() - t0
+leyendo = False
+hilo.join()
+print(json.dumps({{
+    'escritas': Resultado.objects.filter(consulta=consulta).count(),
+    'errores': errores,
+    'segundos': segundos,
+}}))
+"""
+
+
+def _python(codigo, entorno):
+    return subprocess.Popen(
+        [sys.executable, '-c', codigo], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+        cwd=PROJECT_ROOT, env=entorno,
+    )
+
+
+def correr(modo, args):
+    entorno = dict(os.environ, SQLITE_CONCURRENTE='1' if modo == 'concurrente' else '0')
+    db = os.path.join(tempfile.mkdtemp(), 'estres.sqlite3')
+    preparar = _python(PREPARAR.format(root=PROJECT_ROOT, db=db, bots=args.bots), entorno)
+    _, err = preparar.communicate()
+    if preparar.returncode != 0:
+        raise SystemExit(f"No se pudo preparar la BD:\n{err}")
+
+    # Todas las consultas arrancan a la vez, ya con Django cargado
+    inicio = time.time() + 3
+    procesos = [
+        _python(CONSULTA.format(root=PROJECT_ROOT, db=db, bots=args.bots, n=n, inicio=inicio), entorno)
+        for n in range(args.consultas)
+    ]
+    resultados = []
+    for p in procesos:
+        out, err = p.communicate()
+        lineas = out.strip().splitlines()
+        if p.returncode != 0 or not lineas:
+            # El proceso entero cayó (p.ej. "database is locked" al crear la Consulta)
+            resultados.append({'escritas': 0, 'errores': [err.strip().splitlines()[-1] if err.strip() else '?'],
+                               'segundos': 0.0})
+        else:
+            r = json.loads(lineas[-1])
+            # Los errores del guardado por lotes se imprimen, no se lanzan
+            r['errores'] += [linea for linea in lineas if 'No se guardó' in linea or 'falló' in linea]
+            resultados.append(r)
+
+    esperadas = args.consultas * args.bots
+    escritas = sum(r['escritas'] for r in resultados)
+    errores = [e for r in resultados for e in r['errores']]
+    return {
+        'esperadas': esperadas,
+        'escritas': escritas,
+        'errores': len(errores),
+        'bloqueos': sum('locked' in e for e in errores),
+        'segundos': max(r['segundos'] for r in resultados),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--consultas', type=int, default=8)
+    parser.add_argument('--bots', type=int, default=150)
+    args = parser.parse_args()
+
+    print(f"{'modo':<13}{'esperadas':>11}{'escritas':>10}{'errores':>9}{'locked':>8}{'segundos':>10}")
+    salida = 0
+    for modo in ('defecto', 'concurrente'):
+        r = correr(modo, args)
+        print(f"{modo:<13}{r['esperadas']:>11}{r['escritas']:>10}{r['errores']:>9}{r['bloqueos']:>8}{r['segundos']:>10.2f}")
+        if modo == 'concurrente' and (r['escritas'] != r['esperadas'] or r['errores']):
+            salida = 1
+    sys.exit(salida)
+
+
+if __name__ == '__main__':
+    main()